@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare the indexed list merges of AnsibleMixin.object_from_params() with the nested loop merges
+used before, for a DeploymentConfig with large env and port lists.
+
+The request matches half of the existing env vars and ports, changes some of them, and adds as
+many again. Env vars are matched by name, ports by all of their given values. Results are checked
+for equality before timing.
+
+Usage: python benchmarks/bench_ansible_merge.py [items]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import copy
+import sys
+import timeit
+
+from openshift.client import ApiClient, ConfigurationObject, serializer
+from openshift.helper.ansible import OpenShiftAnsibleModuleHelper
+
+
+class Helper(OpenShiftAnsibleModuleHelper):
+    @staticmethod
+    def client_from_config(config_file, context):
+        config = ConfigurationObject()
+        config.host = 'http://127.0.0.1:8443'
+        return ApiClient(config=config)
+
+
+class LegacyHelper(Helper):
+    """ The object list merge as it was, comparing every request item with every existing item """
+
+    def _AnsibleMixin__compare_obj_list(self, src_value, request_value, obj_class, param_name):
+        if not request_value:
+            return
+        sample_obj = self.model_class_from_name(obj_class)()
+        key_name = 'name' if hasattr(sample_obj, 'name') else 'type' if hasattr(sample_obj, 'type') else None
+        if key_name and not all(item.get(key_name) for item in request_value):
+            key_name = None
+        for item in request_value:
+            found = False
+            for obj in src_value:
+                if key_name:
+                    if getattr(obj, key_name) == item[key_name]:
+                        found = True
+                        self._AnsibleMixin__update_obj_list_item(obj, item, sample_obj, obj_class, param_name)
+                elif all(getattr(obj, self.attribute_to_snake(k)) == v for k, v in item.items()):
+                    found = True
+                    break
+            if not found:
+                obj = self.model_class_from_name(obj_class)()
+                src_value.append(self._AnsibleMixin__update_object_properties(obj, item))
+
+
+def deployment_config(items):
+    return {
+        'apiVersion': 'v1',
+        'kind': 'DeploymentConfig',
+        'metadata': {'name': 'web', 'namespace': 'test'},
+        'spec': {'template': {'spec': {'containers': [{
+            'name': 'web',
+            'image': 'web:1',
+            'env': [{'name': 'VAR_{}'.format(i), 'value': str(i)} for i in range(items)],
+            'ports': [{'containerPort': 1000 + i, 'protocol': 'TCP'} for i in range(items)],
+        }]}}},
+    }
+
+
+def params(items):
+    start = items // 2
+    return {'spec_template_spec_containers': [{
+        'name': 'web',
+        'env': [{'name': 'VAR_{}'.format(i), 'value': str(i % 7)} for i in range(start, start + items)],
+        'ports': [{'containerPort': 1000 + i, 'protocol': 'TCP'} for i in range(start, start + items)],
+    }]}
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [10, 100, 500, 1000]
+    legacy = LegacyHelper('v1', 'deployment_config')
+    current = Helper('v1', 'deployment_config')
+
+    print("{:>8} {:>16} {:>14} {:>10}".format('items', 'nested (ms)', 'indexed (ms)', 'speedup'))
+    for items in sizes:
+        live = serializer.from_api_dict(deployment_config(items), current.model)
+        request = params(items)
+
+        def merge(helper):
+            return helper.object_from_params(copy.deepcopy(request), obj=copy.deepcopy(live))
+
+        assert serializer.to_api_dict(merge(current)) == serializer.to_api_dict(merge(legacy))
+        number = max(1, 200 // items)
+        legacy_time = best(lambda: merge(legacy), number)
+        current_time = best(lambda: merge(current), number)
+        print("{:>8} {:>16.2f} {:>14.2f} {:>9.1f}x".format(
+            items, legacy_time * 1e3, current_time * 1e3, legacy_time / current_time))
+
+
+if __name__ == '__main__':
+    main()
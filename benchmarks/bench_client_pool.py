@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare creating helpers for many kinds with an ApiClient loaded from the kubeconfig for each,
+as before, with lazily created clients shared through the client pool. Each helper makes a call
+needing its client, here the lookup of its read method. No requests are sent.
+
+Usage: python benchmarks/bench_client_pool.py [helpers]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from openshift.helper.openshift import OpenShiftObjectHelper
+from openshift.helper.pool import ClientPool
+
+KUBECONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- cluster: {server: 'https://127.0.0.1:8443', insecure-skip-tls-verify: true}
+  name: local
+users:
+- name: developer
+  user: {token: secret}
+contexts:
+- context: {cluster: local, user: developer, namespace: test}
+  name: local
+current-context: local
+"""
+
+KINDS = ('route', 'service', 'deployment_config', 'build_config', 'image_stream', 'config_map')
+
+
+class PooledHelper(OpenShiftObjectHelper):
+    client_pool = ClientPool()
+
+
+class EagerHelper(OpenShiftObjectHelper):
+    """ A client loaded from the kubeconfig by each helper, when created """
+    client_pool = None
+
+    def __init__(self, *args, **kwargs):
+        super(EagerHelper, self).__init__(*args, **kwargs)
+        self.api_client
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    path = tempfile.mkdtemp()
+    kubeconfig = os.path.join(path, 'config')
+    with open(kubeconfig, 'w') as config:
+        config.write(KUBECONFIG)
+
+    def create(helper_class):
+        for i in range(count):
+            helper = helper_class('v1', KINDS[i % len(KINDS)], kubeconfig=kubeconfig)
+            helper.lookup_method('read', 'test')
+
+    try:
+        eager_time = best(lambda: create(EagerHelper), 1)
+        pooled_time = best(lambda: create(PooledHelper), 1)
+    finally:
+        shutil.rmtree(path)
+    print("{:>8} {:>12} {:>13} {:>10}".format('helpers', 'eager (ms)', 'pooled (ms)', 'speedup'))
+    print("{:>8} {:>12.2f} {:>13.2f} {:>9.1f}x".format(count, eager_time * 1e3, pooled_time * 1e3,
+                                                         eager_time / pooled_time))
+
+
+if __name__ == '__main__':
+    main()
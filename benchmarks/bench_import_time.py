@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure the import time of the openshift package with lazy loading, compared to resolving every
+model and API up front, which is what the eagerly importing package used to do.
+
+Each case runs in a fresh interpreter. The best of N runs is reported.
+
+Usage: python benchmarks/bench_import_time.py [runs]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+CASES = [
+    ('import openshift', 'import openshift'),
+    ('import openshift (eager)',
+     'import openshift.client as c, openshift.client.models as m, openshift.client.apis as a\n'
+     'for mod in (c, m, a):\n'
+     '    [getattr(mod, name) for name in dir(mod)]'),
+    ('from openshift.client import V1Route', 'from openshift.client import V1Route'),
+    ('import openshift.helper.ansible', 'import openshift.helper.ansible'),
+]
+
+TIMER = """
+import time
+start = time.time()
+{statement}
+print(time.time() - start)
+"""
+
+
+def time_statement(statement, runs):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.join(os.path.dirname(__file__), '..'),
+                                                      env.get('PYTHONPATH')]))
+    best = None
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', TIMER.format(statement=statement)],
+                                         env=env)
+        elapsed = float(output.decode('utf8').strip().splitlines()[-1])
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("{:<40} {:>10}".format('statement', 'best (ms)'))
+    for label, statement in CASES:
+        print("{:<40} {:>10.1f}".format(label, time_statement(statement, runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
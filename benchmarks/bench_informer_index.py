@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare informer store index lookups against a linear scan of the cached objects, and measure
+the cost of maintaining the indexes as objects are added and modified.
+
+The store is filled with ReplicationController-like API dicts spread over 100 namespaces, each
+labelled with the DeploymentConfig that owns it.
+
+Usage: python benchmarks/bench_informer_index.py [objects]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import timeit
+
+from openshift.helper.informer import LABEL_INDEX, NAMESPACE_INDEX, OWNER_INDEX, Store
+
+
+def replication_controller(i):
+    dc = 'app-{}'.format(i // 10)
+    return {
+        'kind': 'ReplicationController',
+        'metadata': {
+            'name': '{}-{}'.format(dc, i % 10),
+            'namespace': 'ns-{}'.format(i % 100),
+            'resourceVersion': str(i),
+            'labels': {'app': dc, 'openshift.io/deployment-config.name': dc, 'tier': 'tier-{}'.format(i % 3)},
+            'ownerReferences': [{'kind': 'DeploymentConfig', 'name': dc, 'uid': 'uid-{}'.format(dc)}],
+        },
+        'spec': {'replicas': 1},
+    }
+
+
+def scan_label(store, key, value):
+    result = []
+    for obj in store.list():
+        labels = obj['metadata'].get('labels') or {}
+        if labels.get(key) == value:
+            result.append(obj)
+    return result
+
+
+def scan_owner(store, uid):
+    return [obj for obj in store.list()
+            if any(x.get('uid') == uid for x in obj['metadata'].get('ownerReferences') or [])]
+
+
+def scan_namespace(store, namespace):
+    return [obj for obj in store.list() if obj['metadata'].get('namespace') == namespace]
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    objects = [replication_controller(i) for i in range(count)]
+
+    for label, store in (('no indexes', Store(indexers={})), ('indexed', Store())):
+        start = time.time()
+        for obj in objects:
+            store.update(obj)
+        print("fill {} objects, {:<10}: {:8.1f} us/object".format(count, label, (time.time() - start) / count * 1e6))
+    print()
+
+    dc = 'app-{}'.format(count // 20)
+    cases = [
+        ('label app=' + dc,
+         lambda: scan_label(store, 'app', dc),
+         lambda: store.by_index(LABEL_INDEX, 'app=' + dc)),
+        ('owner uid-' + dc,
+         lambda: scan_owner(store, 'uid-' + dc),
+         lambda: store.by_index(OWNER_INDEX, 'uid-' + dc)),
+        ('namespace ns-7',
+         lambda: scan_namespace(store, 'ns-7'),
+         lambda: store.by_index(NAMESPACE_INDEX, 'ns-7')),
+    ]
+    print("{:<22} {:>8} {:>14} {:>14} {:>10}".format('lookup', 'matches', 'scan (us)', 'index (us)', 'speedup'))
+    for label, scan, lookup in cases:
+        assert sorted(x['metadata']['name'] for x in scan()) == sorted(x['metadata']['name'] for x in lookup())
+        scan_time = best(scan, 3)
+        index_time = best(lookup, 1000)
+        print("{:<22} {:>8} {:>14.1f} {:>14.1f} {:>9.0f}x".format(
+            label, len(lookup()), scan_time * 1e6, index_time * 1e6, scan_time / index_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare the cost of BaseObjectHelper.lookup_method with the dispatch index against the previous
+implementation, which scanned available_apis() and instantiated API classes on every call.
+
+Usage: python benchmarks/bench_lookup_method.py [iterations]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import timeit
+
+from openshift.client import ApiClient, ConfigurationObject
+from openshift.helper.openshift import OpenShiftObjectHelper
+
+
+class BenchHelper(OpenShiftObjectHelper):
+    @staticmethod
+    def client_from_config(config_file, context):
+        return ApiClient(config=ConfigurationObject())
+
+
+def legacy_lookup_method(helper, operation, namespace):
+    method_name = operation
+    method_name += '_namespaced_' if namespace else '_'
+    method_name += helper.kind
+    for api in helper.available_apis():
+        method = getattr(helper.api_class_from_name(api)(helper.api_client), method_name, None)
+        if method is not None:
+            return method
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cases = [('v1', 'route', 'read'), ('v1', 'deployment_config', 'patch'), ('v1', 'service', 'read')]
+
+    print("{:<20} {:<8} {:>14} {:>14} {:>9}".format('kind', 'op', 'legacy (us)', 'indexed (us)', 'speedup'))
+    for api_version, kind, operation in cases:
+        helper = BenchHelper(api_version, kind)
+        legacy = timeit.timeit(lambda: legacy_lookup_method(helper, operation, 'ns'), number=iterations)
+        indexed = timeit.timeit(lambda: helper.lookup_method(operation, 'ns'), number=iterations)
+        print("{:<20} {:<8} {:>14.2f} {:>14.2f} {:>8.0f}x".format(
+            kind, operation, legacy / iterations * 1e6, indexed / iterations * 1e6, legacy / indexed))
+
+
+if __name__ == '__main__':
+    main()
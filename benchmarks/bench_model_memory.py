@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure the memory held by a large deserialized V1BuildList and V1ImageList.
+
+The compact models keep swagger_types and attribute_map on the class and use __slots__. For
+comparison, each OpenShift model is also wrapped in a subclass that restores the previous layout:
+an instance __dict__ holding its own copies of both type maps.
+
+Usage: python benchmarks/bench_model_memory.py [items]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import gc
+import inspect
+import sys
+import tracemalloc
+
+from kubernetes.client import models as k8s_models
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+
+from openshift.client import ApiClient, models
+
+
+def per_instance_maps_class(model_class):
+    """ Return a subclass of model_class with per-instance type maps and a __dict__ """
+
+    def __init__(self, *args, **kwargs):
+        model_class.__init__(self, *args, **kwargs)
+        self.swagger_types = dict(model_class.swagger_types)
+        self.attribute_map = dict(model_class.attribute_map)
+
+    return type(model_class.__name__, (model_class,), {'__init__': __init__})
+
+
+PER_INSTANCE_MODELS = dict(
+    (name, per_instance_maps_class(cls)) for name, cls in inspect.getmembers(models, inspect.isclass)
+)
+
+
+class PerInstanceMapsApiClient(K8sApiClient):
+    def _ApiClient__deserialize(self, data, klass):
+        if isinstance(klass, str) and klass in PER_INSTANCE_MODELS:
+            return K8sApiClient._ApiClient__deserialize_model(self, data, PER_INSTANCE_MODELS[klass])
+        if isinstance(klass, str) and hasattr(k8s_models, klass):
+            return K8sApiClient._ApiClient__deserialize_model(self, data, getattr(k8s_models, klass))
+        return K8sApiClient._ApiClient__deserialize(self, data, klass)
+
+
+def build_list(count):
+    return {
+        'kind': 'BuildList',
+        'apiVersion': 'v1',
+        'metadata': {'resourceVersion': '1000'},
+        'items': [{
+            'metadata': {'name': 'app-{}'.format(i), 'namespace': 'test', 'uid': 'uid-{}'.format(i),
+                         'resourceVersion': str(i), 'labels': {'app': 'app', 'buildconfig': 'app'}},
+            'spec': {
+                'serviceAccount': 'builder',
+                'source': {'type': 'Git', 'git': {'uri': 'https://example.com/app.git', 'ref': 'master'}},
+                'strategy': {'type': 'Source', 'sourceStrategy': {
+                    'from': {'kind': 'ImageStreamTag', 'name': 'python:3.5', 'namespace': 'openshift'}}},
+                'output': {'to': {'kind': 'ImageStreamTag', 'name': 'app:latest'}},
+                'triggeredBy': [{'message': 'Image change'}],
+            },
+            'status': {'phase': 'Complete', 'duration': 1000, 'outputDockerImageReference': 'app:latest',
+                       'config': {'kind': 'BuildConfig', 'name': 'app', 'namespace': 'test'}},
+        } for i in range(count)]
+    }
+
+
+def image_list(count):
+    return {
+        'kind': 'ImageList',
+        'apiVersion': 'v1',
+        'metadata': {'resourceVersion': '1000'},
+        'items': [{
+            'metadata': {'name': 'sha256:{:064x}'.format(i)},
+            'dockerImageReference': 'registry/app@sha256:{:064x}'.format(i),
+            'dockerImageLayers': [
+                {'name': 'sha256:{:064x}'.format(i * 10 + layer), 'size': 1024 * layer,
+                 'mediaType': 'application/vnd.docker.image.rootfs.diff.tar.gzip'}
+                for layer in range(6)
+            ],
+            'dockerImageSignatures': [],
+        } for i in range(count)]
+    }
+
+
+def measure(client, data, response_type):
+    gc.collect()
+    tracemalloc.start()
+    result = client._ApiClient__deserialize(data, response_type)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("{:<14} {:>8} {:>22} {:>14} {:>8}".format('list', 'items', 'per-instance maps (MB)', 'compact (MB)',
+                                                       'saved'))
+    for response_type, data in (('V1BuildList', build_list(count)), ('V1ImageList', image_list(count))):
+        before = measure(PerInstanceMapsApiClient(), data, response_type)
+        after = measure(ApiClient(), data, response_type)
+        print("{:<14} {:>8} {:>22.1f} {:>14.1f} {:>7.0f}%".format(
+            response_type, count, before / 1e6, after / 1e6, (1 - float(after) / before) * 100))
+
+
+if __name__ == '__main__':
+    main()
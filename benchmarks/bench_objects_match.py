@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare objects_match() with the to_dict() and dictdiffer comparison it used before
+openshift.helper.diff, for a DeploymentConfig with many containers, as models and as API dicts.
+
+Each case is timed with equal objects and with a single change deep in the last container.
+Results are checked for equality before timing.
+
+Usage: python benchmarks/bench_objects_match.py [containers]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import copy
+import sys
+import timeit
+
+import dictdiffer
+
+from openshift.client import models, serializer
+from openshift.helper.base import BaseObjectHelper
+
+
+def legacy_objects_match(obj_a, obj_b):
+    """ objects_match() as it was with dictdiffer """
+    if isinstance(obj_a, dict) or isinstance(obj_b, dict):
+        dict_a = obj_a if isinstance(obj_a, dict) else serializer.to_api_dict(obj_a)
+        dict_b = obj_b if isinstance(obj_b, dict) else serializer.to_api_dict(obj_b)
+    else:
+        dict_a, dict_b = obj_a.to_dict(), obj_b.to_dict()
+    diffs = list(dictdiffer.diff(dict_a, dict_b))
+    return len(diffs) == 0, diffs
+
+
+def deployment_config(containers):
+    return {
+        'apiVersion': 'v1',
+        'kind': 'DeploymentConfig',
+        'metadata': {'name': 'web', 'namespace': 'test', 'labels': {'app': 'web', 'tier': 'frontend'}},
+        'spec': {
+            'replicas': 3,
+            'selector': {'app': 'web'},
+            'triggers': [{'type': 'ConfigChange'}],
+            'template': {
+                'metadata': {'labels': {'app': 'web'}},
+                'spec': {'containers': [{
+                    'name': 'container-{}'.format(i),
+                    'image': 'registry.example.com/web:{}'.format(i),
+                    'args': ['--port', str(8080 + i), '--verbose'],
+                    'env': [{'name': 'VAR_{}'.format(j), 'value': str(j)} for j in range(20)],
+                    'ports': [{'containerPort': 8080 + i, 'protocol': 'TCP'}],
+                    'resources': {'limits': {'cpu': '500m', 'memory': '256Mi'}},
+                } for i in range(containers)]},
+            },
+        },
+    }
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    containers = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    dc = deployment_config(containers)
+    changed = copy.deepcopy(dc)
+    changed['spec']['template']['spec']['containers'][-1]['env'][-1]['value'] = 'changed'
+
+    model = serializer.from_api_dict(dc, models.V1DeploymentConfig)
+    cases = [
+        ('dicts, equal', dc, copy.deepcopy(dc)),
+        ('dicts, one change', dc, changed),
+        ('models, equal', model, serializer.from_api_dict(dc, models.V1DeploymentConfig)),
+        ('models, one change', model, serializer.from_api_dict(changed, models.V1DeploymentConfig)),
+    ]
+    print("{} containers".format(containers))
+    print("{:<22} {:>16} {:>14} {:>10}".format('case', 'dictdiffer (ms)', 'diff (ms)', 'speedup'))
+    for label, obj_a, obj_b in cases:
+        assert BaseObjectHelper.objects_match(obj_a, obj_b) == legacy_objects_match(obj_a, obj_b)
+        legacy = best(lambda: legacy_objects_match(obj_a, obj_b), 5)
+        current = best(lambda: BaseObjectHelper.objects_match(obj_a, obj_b), 5)
+        print("{:<22} {:>16.2f} {:>14.2f} {:>9.1f}x".format(label, legacy * 1e3, current * 1e3, legacy / current))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare AnsibleMixin.object_from_params() and find_arg_spec() using the compiled ParamPlan with the
+argspec scan and property_path walk used before, for a DeploymentConfig module invocation.
+
+Results are checked for equality before timing.
+
+Usage: python benchmarks/bench_param_plan.py [iterations]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import copy
+import sys
+import timeit
+
+from openshift.client import ApiClient, ConfigurationObject, serializer
+from openshift.helper.ansible import OpenShiftAnsibleModuleHelper
+
+PARAMS = {
+    'name': 'web',
+    'namespace': 'test',
+    'labels': {'app': 'web', 'tier': 'frontend'},
+    'replicas': 3,
+    'selector': {'app': 'web'},
+    'spec_template_metadata_labels': {'app': 'web'},
+    'spec_template_spec_service_account_name': 'web',
+    'spec_template_spec_restart_policy': 'Always',
+    'spec_template_spec_dns_policy': 'ClusterFirst',
+    'spec_strategy_type': 'Rolling',
+    'spec_strategy_active_deadline_seconds': 600,
+    'containers': [{'name': 'web', 'image': 'web:1', 'ports': [{'containerPort': 8080}]}],
+    'triggers': [{'type': 'ConfigChange'}],
+}
+
+
+class Helper(OpenShiftAnsibleModuleHelper):
+    @staticmethod
+    def client_from_config(config_file, context):
+        config = ConfigurationObject()
+        config.host = 'http://127.0.0.1:8443'
+        return ApiClient(config=config)
+
+
+class LegacyHelper(Helper):
+    """ Scans the argspec for aliases, and walks each property_path through __set_obj_attribute() """
+
+    def find_arg_spec(self, module_param_name):
+        if self.argspec.get(module_param_name):
+            return self.argspec[module_param_name]
+        for key, value in self.argspec.items():
+            if module_param_name in (value.get('aliases') or ()):
+                return value
+        raise self.get_exception_class()(module_param_name)
+
+    def object_from_params(self, module_params, obj=None):
+        obj = self.model()
+        obj.kind = 'deploymentConfig'
+        obj.api_version = self.api_version.lower()
+        for param_name, param_value in module_params.items():
+            spec = self.find_arg_spec(param_name)
+            if param_value is not None and spec.get('property_path'):
+                self._AnsibleMixin__set_obj_attribute(obj, copy.copy(spec['property_path']), param_value, param_name)
+        return obj
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    legacy = LegacyHelper('v1', 'deployment_config')
+    current = Helper('v1', 'deployment_config')
+    assert serializer.to_dict(legacy.object_from_params(copy.deepcopy(PARAMS))) == \
+        serializer.to_dict(current.object_from_params(copy.deepcopy(PARAMS)))
+
+    aliases = [x for x in PARAMS if x not in current.argspec]
+    cases = [
+        ('find_arg_spec (aliases)',
+         lambda: [legacy.find_arg_spec(x) for x in aliases],
+         lambda: [current.find_arg_spec(x) for x in aliases]),
+        ('object_from_params',
+         lambda: legacy.object_from_params(copy.deepcopy(PARAMS)),
+         lambda: current.object_from_params(copy.deepcopy(PARAMS))),
+    ]
+    print("{:<26} {:>14} {:>14} {:>10}".format('case', 'legacy (us)', 'plan (us)', 'speedup'))
+    for label, old, new in cases:
+        legacy_time = best(old, iterations)
+        current_time = best(new, iterations)
+        print("{:<26} {:>14.1f} {:>14.1f} {:>9.1f}x".format(
+            label, legacy_time * 1e6, current_time * 1e6, legacy_time / current_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare the compiled server field stripping of openshift.helper.sanitize with the recursive passes
+used before, for a DeploymentConfig with many containers: the creation timestamp walk over model
+objects done on replace, and the copy of API dicts done before patching.
+
+Usage: python benchmarks/bench_sanitize.py [containers]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import copy
+import sys
+import timeit
+
+from openshift.client import models, serializer
+from openshift.helper.sanitize import sanitize
+
+
+def legacy_remove_creation_timestamps(obj):
+    if hasattr(obj, 'swagger_types'):
+        for key, value in obj.swagger_types.items():
+            if key == 'creation_timestamp':
+                obj.creation_timestamp = None
+                continue
+            if value.startswith('dict(') or value.startswith('list['):
+                continue
+            if value in ('str', 'int', 'bool'):
+                continue
+            if getattr(obj, key) is not None:
+                legacy_remove_creation_timestamps(getattr(obj, key))
+
+
+def legacy_remove_from_dict(value):
+    if isinstance(value, dict):
+        return dict((k, legacy_remove_from_dict(v)) for k, v in value.items() if k != 'creationTimestamp')
+    if isinstance(value, list):
+        return [legacy_remove_from_dict(x) for x in value]
+    return value
+
+
+def legacy_without_server_fields(obj):
+    result = dict((k, legacy_remove_from_dict(v)) for k, v in obj.items() if k != 'status')
+    metadata = result.get('metadata')
+    if isinstance(metadata, dict):
+        result['metadata'] = dict((k, v) for k, v in metadata.items()
+                                  if k not in ('resourceVersion', 'creationTimestamp'))
+    return result
+
+
+def deployment_config(containers):
+    return {
+        'apiVersion': 'v1',
+        'kind': 'DeploymentConfig',
+        'metadata': {'name': 'web', 'namespace': 'test', 'resourceVersion': '7',
+                     'creationTimestamp': '2017-05-01T00:00:00Z'},
+        'spec': {'template': {
+            'metadata': {'labels': {'app': 'web'}},
+            'spec': {'containers': [{
+                'name': 'web-{}'.format(i),
+                'image': 'web:1',
+                'env': [{'name': 'VAR_{}'.format(j), 'value': str(j)} for j in range(20)],
+                'ports': [{'containerPort': 8080 + j, 'protocol': 'TCP'} for j in range(5)],
+                'resources': {'limits': {'cpu': '1'}},
+            } for i in range(containers)]},
+        }},
+        'status': {'latestVersion': 3},
+    }
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [1, 10, 100]
+    print("{:>11} {:>8} {:>14} {:>15} {:>10}".format('containers', 'input', 'legacy (ms)', 'compiled (ms)',
+                                                        'speedup'))
+    for containers in sizes:
+        data = deployment_config(containers)
+        obj = serializer.from_api_dict(data, models.V1DeploymentConfig)
+        number = max(1, 1000 // containers)
+
+        legacy_obj = copy.deepcopy(obj)
+        legacy_remove_creation_timestamps(legacy_obj)
+        legacy_obj._status = None
+        legacy_obj.metadata.resource_version = None
+        assert serializer.to_api_dict(legacy_obj) == serializer.to_api_dict(sanitize(copy.deepcopy(obj)))
+        assert legacy_without_server_fields(data) == sanitize(data, models.V1DeploymentConfig)
+
+        cases = (
+            ('model', lambda: legacy_remove_creation_timestamps(obj), lambda: sanitize(obj)),
+            ('dict', lambda: legacy_without_server_fields(data), lambda: sanitize(data, models.V1DeploymentConfig)),
+        )
+        for name, legacy, compiled in cases:
+            legacy_time = best(legacy, number)
+            compiled_time = best(compiled, number)
+            print("{:>11} {:>8} {:>14.3f} {:>15.3f} {:>9.1f}x".format(
+                containers, name, legacy_time * 1e3, compiled_time * 1e3, legacy_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
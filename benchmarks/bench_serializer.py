@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare the compiled model serializers in openshift.client.serializer with the generated to_dict(),
+ApiClient.sanitize_for_serialization() and the ApiClient model deserializer, for every model in
+openshift.client.models.
+
+Sample API data is generated from each model's swagger_types. Results are checked for equality
+before timing.
+
+Usage: python benchmarks/bench_serializer.py [iterations] [-v]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import inspect
+import sys
+import timeit
+
+from kubernetes.client import models as k8s_models
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+
+from openshift.client import models, serializer
+from openshift.client.api_client import NATIVE_TYPES
+from openshift.client.registry import type_registry
+
+SAMPLE_VALUES = {'str': 'value', 'int': 3, 'long': 3, 'float': 1.5, 'bool': True, 'object': {'key': 'value'}}
+
+
+class LegacyApiClient(K8sApiClient):
+    """ The exception driven deserializer openshift.client.ApiClient used before the type registry """
+
+    def _ApiClient__deserialize(self, data, klass):
+        try:
+            return K8sApiClient._ApiClient__deserialize(self, data, klass)
+        except AttributeError:
+            try:
+                klass = getattr(models, klass)
+            except AttributeError:
+                klass = getattr(k8s_models, klass)
+            return K8sApiClient._ApiClient__deserialize_model(self, data, klass)
+
+
+def sample_data(type_name, depth=0):
+    """ Return API data for a swagger type, with two items per list and dict """
+    if type_name.startswith('list['):
+        item_type = type_name[len('list['):-1]
+        return [sample_data(item_type, depth) for _ in range(2)]
+    if type_name.startswith('dict('):
+        value_type = type_name.split(', ', 1)[1][:-1]
+        return dict(('key{}'.format(i), sample_data(value_type, depth)) for i in range(2))
+    if type_name in SAMPLE_VALUES:
+        return SAMPLE_VALUES[type_name]
+    if type_name in NATIVE_TYPES:
+        return None
+    model_class = type_registry.kubernetes_model(type_name) or type_registry.model(type_name)
+    sample = model_class()
+    if depth > 3:
+        return {}
+    return dict(
+        (sample.attribute_map[attr], sample_data(attr_type, depth + 1))
+        for attr, attr_type in sample.swagger_types.items()
+    )
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 100
+    verbose = '-v' in sys.argv
+    legacy_client = LegacyApiClient()
+    totals = dict.fromkeys(('from_api', 'from_api_compiled', 'to_dict', 'to_dict_compiled',
+                            'to_api', 'to_api_compiled'), 0.0)
+
+    model_classes = [cls for _, cls in inspect.getmembers(models, inspect.isclass)]
+    if verbose:
+        print("{:<45} {:>18} {:>18} {:>18}".format('model (us per call)', 'deserialize', 'to_dict', 'to_api_dict'))
+    for model_class in model_classes:
+        data = sample_data(model_class.__name__)
+        legacy_obj = legacy_client._ApiClient__deserialize_model(data, model_class)
+        obj = serializer.from_api_dict(data, model_class)
+        assert obj.to_dict() == legacy_obj.to_dict(), model_class.__name__
+        assert serializer.to_dict(obj) == obj.to_dict(), model_class.__name__
+        assert serializer.to_api_dict(obj) == legacy_client.sanitize_for_serialization(obj), model_class.__name__
+
+        timings = {
+            'from_api': timeit.timeit(lambda: legacy_client._ApiClient__deserialize_model(data, model_class),
+                                      number=iterations),
+            'from_api_compiled': timeit.timeit(lambda: serializer.from_api_dict(data, model_class), number=iterations),
+            'to_dict': timeit.timeit(obj.to_dict, number=iterations),
+            'to_dict_compiled': timeit.timeit(lambda: serializer.to_dict(obj), number=iterations),
+            'to_api': timeit.timeit(lambda: legacy_client.sanitize_for_serialization(obj), number=iterations),
+            'to_api_compiled': timeit.timeit(lambda: serializer.to_api_dict(obj), number=iterations),
+        }
+        for key, value in timings.items():
+            totals[key] += value
+        if verbose:
+            print("{:<45} {:>8.1f} / {:>7.1f} {:>8.1f} / {:>7.1f} {:>8.1f} / {:>7.1f}".format(
+                model_class.__name__,
+                *[timings[x] / iterations * 1e6 for x in ('from_api', 'from_api_compiled', 'to_dict',
+                                                          'to_dict_compiled', 'to_api', 'to_api_compiled')]
+            ))
+
+    print("{} models, {} iterations each".format(len(model_classes), iterations))
+    print("{:<14} {:>12} {:>12} {:>9}".format('operation', 'legacy (s)', 'compiled (s)', 'speedup'))
+    for label, key in (('deserialize', 'from_api'), ('to_dict', 'to_dict'), ('to_api_dict', 'to_api')):
+        print("{:<14} {:>12.3f} {:>12.3f} {:>8.1f}x".format(
+            label, totals[key], totals[key + '_compiled'], totals[key] / totals[key + '_compiled']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare concurrent identical reads with and without request coalescing, as when many waiters poll the
+same object. Each thread reads the same Route repeatedly, against a stand-in server answering after a
+fixed latency and serving one request at a time. No network requests are made.
+
+Usage: python benchmarks/bench_singleflight.py [threads]
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import json
+import sys
+import threading
+import time
+
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+from openshift.client import ApiClient, ConfigurationObject, OapiApi
+
+LATENCY = 0.005
+READS = 20
+
+ROUTE = {
+    'apiVersion': 'v1',
+    'kind': 'Route',
+    'metadata': {'name': 'web', 'namespace': 'test', 'resourceVersion': '1'},
+    'spec': {'host': 'web.example.com', 'to': {'kind': 'Service', 'name': 'web'}},
+}
+
+
+class Response(object):
+    status = 200
+    reason = 'OK'
+    data = json.dumps(ROUTE).encode('utf8')
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+
+class Server(object):
+    def __init__(self):
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def request(self, *args, **kwargs):
+        with self._lock:
+            self.requests += 1
+            time.sleep(LATENCY)
+        return Response()
+
+
+def run(threads, coalesce):
+    server = Server()
+    K8sApiClient.request = lambda self, *args, **kwargs: server.request()
+    config = ConfigurationObject()
+    config.host = 'http://127.0.0.1:8443'
+    client = ApiClient(config=config)
+    client.coalesce_reads = coalesce
+    api = OapiApi(client)
+
+    def reads():
+        for _ in range(READS):
+            api.read_namespaced_route('web', 'test')
+
+    workers = [threading.Thread(target=reads) for _ in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.time() - start, server.requests
+
+
+def main():
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [1, 4, 16]
+    print("{:>8} {:>16} {:>16} {:>12} {:>10}".format('threads', 'separate (ms)', 'coalesced (ms)', 'requests',
+                                                      'speedup'))
+    for threads in sizes:
+        separate_time, separate_requests = run(threads, False)
+        coalesced_time, coalesced_requests = run(threads, True)
+        print("{:>8} {:>16.1f} {:>16.1f} {:>12} {:>9.1f}x".format(
+            threads, separate_time * 1e3, coalesced_time * 1e3,
+            '{}/{}'.format(coalesced_requests, separate_requests), separate_time / coalesced_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import openshift.client
-import kubernetes.config
-import kubernetes.watch
+from openshift.lazy import lazy_module
 
 # Do not edit these constants. They will be updated automatically
 # by scripts/update-client.sh.
 __version__ = "1.0.0-snapshot"
 __k8s_client_version__ = "1.0.0"
+
+# openshift.client is imported on first use, so the helper modules that do not need it stay light
+lazy_module(__name__, {'client': 'openshift.client'})
@@ -9,6 +9,7 @@ import sys
 from logging import config
 
 from .. import __version__
+from ..helper.argspec import ARGSPEC_PATH
 from ..helper.exceptions import KubernetesException
 
 from .docstrings import KubernetesDocStrings, OpenShiftDocStrings
@@ -47,6 +48,7 @@ AVAILABLE_COMMANDS = {
     'version':    'Display version information',
     'modules':    'Generates and writes to the filesystem one or more Ansible modules.',
     'docstrings': 'Displays Ansible module doc strings for one or more models.',
+    'argspecs':   'Writes the precompiled argspecs of one or more Ansible modules to the filesystem.',
 }
 
 
@@ -69,6 +71,22 @@ def subcmd_modules_parser(_, subparser):
                            dest='suppress_stdout', default=False)
 
 
+def subcmd_argspecs_parser(_, subparser):
+    subparser.add_argument('models', action='store',
+                           help=u'Optional list of models for which to generate argspecs. Specify '
+                                u'the model Kind using either CamelCase or snake_case.',
+                           nargs='*', )
+    subparser.add_argument('-v', '--api-version', action='store',
+                           help=u'When specified, argspecs will only be generated for models '
+                                u'that are part of API version.',
+                           dest='api_version', default=None)
+    subparser.add_argument('-o', '--output-path', action='store',
+                           help=u'Specify a path to a directory where argspecs will be written. '
+                                u'Defaults to the argspecs directory of the installed openshift.helper '
+                                u'package.',
+                           dest='output_path', default=ARGSPEC_PATH)
+
+
 def subcmd_docstrings_parser(_, subparser):
     subparser.add_argument('models', action='store',
                            help=u'List of models for which doc strings will be generated. Specify '
@@ -128,6 +146,16 @@ def run_modules_cmd(**kwargs):
     modules.generate_modules()
 
 
+def run_argspecs_cmd(**kwargs):
+    """
+    Generate precompiled argspecs
+    :param kwargs: parser arguments
+    :return: None
+    """
+    modules = Modules(**kwargs)
+    modules.generate_argspecs()
+
+
 def commandline():
     """
     Entrypoint for openshift-ansible-gen
@@ -12,8 +12,11 @@ import tempfile
 from jinja2 import Environment, FileSystemLoader
 from kubernetes.client import models as k8s_models
 
+from ..client import ApiClient, ConfigurationObject
 from ..client import models as openshift_models
 from ..helper import VERSION_RX
+from ..helper.ansible import KubernetesAnsibleModuleHelper, OpenShiftAnsibleModuleHelper
+from ..helper.argspec import write_argspec
 from ..helper.exceptions import OpenShiftException
 
 from .docstrings import KubernetesDocStrings, OpenShiftDocStrings
@@ -90,6 +93,30 @@ class Modules(object):
         if len(self._openshift_models):
             print("Generated {} openshift modules".format(len(self._openshift_models)))
 
+    def generate_argspecs(self):
+        """
+        Write the precompiled argspec of each requested module to self.output_path. See
+        openshift.helper.argspec.
+
+        :return: None
+        """
+        self.__create_output_path(self.output_path)
+        for models, helper_class in ((self._k8s_models, KubernetesAnsibleModuleHelper),
+                                     (self._openshift_models, OpenShiftAnsibleModuleHelper)):
+            offline_class = type('Offline' + helper_class.__name__, (helper_class,),
+                                 {'client_from_config': staticmethod(self.__offline_client)})
+            for model in models:
+                helper = offline_class(model['model_api'].lower(), model['model_name_snake'])
+                write_argspec(helper_class.module_prefix, model['model_api'], model['model_name_snake'],
+                              helper.introspect_argspec(), self.output_path)
+            if len(models):
+                print("Generated {} {} argspecs".format(len(models), helper_class.module_prefix))
+
+    @staticmethod
+    def __offline_client(config_file, context):
+        """ Argspecs do not depend on the cluster, so are built without reading a kubeconfig """
+        return ApiClient(config=ConfigurationObject())
+
     @classmethod
     def __generate_modules_impl(cls, models, prefix, output_path):
         """
@@ -10,247 +10,247 @@
     Generated by: https://github.com/swagger-api/swagger-codegen.git
 """
 
-
 from __future__ import absolute_import
 
-# import models into sdk package
-from .models.unversioned_server_address_by_client_cidr import UnversionedServerAddressByClientCIDR
-from .models.v1_applied_cluster_resource_quota import V1AppliedClusterResourceQuota
-from .models.v1_applied_cluster_resource_quota_list import V1AppliedClusterResourceQuotaList
-from .models.v1_binary_build_source import V1BinaryBuildSource
-from .models.v1_build import V1Build
-from .models.v1_build_config import V1BuildConfig
-from .models.v1_build_config_list import V1BuildConfigList
-from .models.v1_build_config_spec import V1BuildConfigSpec
-from .models.v1_build_config_status import V1BuildConfigStatus
-from .models.v1_build_list import V1BuildList
-from .models.v1_build_log import V1BuildLog
-from .models.v1_build_output import V1BuildOutput
-from .models.v1_build_post_commit_spec import V1BuildPostCommitSpec
-from .models.v1_build_request import V1BuildRequest
-from .models.v1_build_source import V1BuildSource
-from .models.v1_build_spec import V1BuildSpec
-from .models.v1_build_status import V1BuildStatus
-from .models.v1_build_status_output import V1BuildStatusOutput
-from .models.v1_build_status_output_to import V1BuildStatusOutputTo
-from .models.v1_build_strategy import V1BuildStrategy
-from .models.v1_build_trigger_cause import V1BuildTriggerCause
-from .models.v1_build_trigger_policy import V1BuildTriggerPolicy
-from .models.v1_cluster_network import V1ClusterNetwork
-from .models.v1_cluster_network_list import V1ClusterNetworkList
-from .models.v1_cluster_policy import V1ClusterPolicy
-from .models.v1_cluster_policy_binding import V1ClusterPolicyBinding
-from .models.v1_cluster_policy_binding_list import V1ClusterPolicyBindingList
-from .models.v1_cluster_policy_list import V1ClusterPolicyList
-from .models.v1_cluster_resource_quota import V1ClusterResourceQuota
-from .models.v1_cluster_resource_quota_list import V1ClusterResourceQuotaList
-from .models.v1_cluster_resource_quota_selector import V1ClusterResourceQuotaSelector
-from .models.v1_cluster_resource_quota_spec import V1ClusterResourceQuotaSpec
-from .models.v1_cluster_resource_quota_status import V1ClusterResourceQuotaStatus
-from .models.v1_cluster_role import V1ClusterRole
-from .models.v1_cluster_role_binding import V1ClusterRoleBinding
-from .models.v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from .models.v1_cluster_role_list import V1ClusterRoleList
-from .models.v1_cluster_role_scope_restriction import V1ClusterRoleScopeRestriction
-from .models.v1_custom_build_strategy import V1CustomBuildStrategy
-from .models.v1_custom_deployment_strategy_params import V1CustomDeploymentStrategyParams
-from .models.v1_deployment_cause import V1DeploymentCause
-from .models.v1_deployment_cause_image_trigger import V1DeploymentCauseImageTrigger
-from .models.v1_deployment_condition import V1DeploymentCondition
-from .models.v1_deployment_config import V1DeploymentConfig
-from .models.v1_deployment_config_list import V1DeploymentConfigList
-from .models.v1_deployment_config_rollback import V1DeploymentConfigRollback
-from .models.v1_deployment_config_rollback_spec import V1DeploymentConfigRollbackSpec
-from .models.v1_deployment_config_spec import V1DeploymentConfigSpec
-from .models.v1_deployment_config_status import V1DeploymentConfigStatus
-from .models.v1_deployment_details import V1DeploymentDetails
-from .models.v1_deployment_log import V1DeploymentLog
-from .models.v1_deployment_request import V1DeploymentRequest
-from .models.v1_deployment_strategy import V1DeploymentStrategy
-from .models.v1_deployment_trigger_image_change_params import V1DeploymentTriggerImageChangeParams
-from .models.v1_deployment_trigger_policy import V1DeploymentTriggerPolicy
-from .models.v1_deprecated_downward_api_volume_file import V1DeprecatedDownwardAPIVolumeFile
-from .models.v1_deprecated_downward_api_volume_source import V1DeprecatedDownwardAPIVolumeSource
-from .models.v1_docker_build_strategy import V1DockerBuildStrategy
-from .models.v1_docker_strategy_options import V1DockerStrategyOptions
-from .models.v1_egress_network_policy import V1EgressNetworkPolicy
-from .models.v1_egress_network_policy_list import V1EgressNetworkPolicyList
-from .models.v1_egress_network_policy_peer import V1EgressNetworkPolicyPeer
-from .models.v1_egress_network_policy_rule import V1EgressNetworkPolicyRule
-from .models.v1_egress_network_policy_spec import V1EgressNetworkPolicySpec
-from .models.v1_exec_new_pod_hook import V1ExecNewPodHook
-from .models.v1_fs_group_strategy_options import V1FSGroupStrategyOptions
-from .models.v1_generic_web_hook_cause import V1GenericWebHookCause
-from .models.v1_git_build_source import V1GitBuildSource
-from .models.v1_git_hub_web_hook_cause import V1GitHubWebHookCause
-from .models.v1_git_source_revision import V1GitSourceRevision
-from .models.v1_group import V1Group
-from .models.v1_group_list import V1GroupList
-from .models.v1_group_restriction import V1GroupRestriction
-from .models.v1_host_subnet import V1HostSubnet
-from .models.v1_host_subnet_list import V1HostSubnetList
-from .models.v1_id_range import V1IDRange
-from .models.v1_identity import V1Identity
-from .models.v1_identity_list import V1IdentityList
-from .models.v1_image import V1Image
-from .models.v1_image_change_cause import V1ImageChangeCause
-from .models.v1_image_change_trigger import V1ImageChangeTrigger
-from .models.v1_image_import_spec import V1ImageImportSpec
-from .models.v1_image_import_status import V1ImageImportStatus
-from .models.v1_image_label import V1ImageLabel
-from .models.v1_image_layer import V1ImageLayer
-from .models.v1_image_list import V1ImageList
-from .models.v1_image_signature import V1ImageSignature
-from .models.v1_image_source import V1ImageSource
-from .models.v1_image_source_path import V1ImageSourcePath
-from .models.v1_image_stream import V1ImageStream
-from .models.v1_image_stream_image import V1ImageStreamImage
-from .models.v1_image_stream_import import V1ImageStreamImport
-from .models.v1_image_stream_import_spec import V1ImageStreamImportSpec
-from .models.v1_image_stream_import_status import V1ImageStreamImportStatus
-from .models.v1_image_stream_list import V1ImageStreamList
-from .models.v1_image_stream_mapping import V1ImageStreamMapping
-from .models.v1_image_stream_spec import V1ImageStreamSpec
-from .models.v1_image_stream_status import V1ImageStreamStatus
-from .models.v1_image_stream_tag import V1ImageStreamTag
-from .models.v1_image_stream_tag_list import V1ImageStreamTagList
-from .models.v1_jenkins_pipeline_build_strategy import V1JenkinsPipelineBuildStrategy
-from .models.v1_lifecycle_hook import V1LifecycleHook
-from .models.v1_local_resource_access_review import V1LocalResourceAccessReview
-from .models.v1_local_subject_access_review import V1LocalSubjectAccessReview
-from .models.v1_named_cluster_role import V1NamedClusterRole
-from .models.v1_named_cluster_role_binding import V1NamedClusterRoleBinding
-from .models.v1_named_role import V1NamedRole
-from .models.v1_named_role_binding import V1NamedRoleBinding
-from .models.v1_named_tag_event_list import V1NamedTagEventList
-from .models.v1_net_namespace import V1NetNamespace
-from .models.v1_net_namespace_list import V1NetNamespaceList
-from .models.v1_o_auth_access_token import V1OAuthAccessToken
-from .models.v1_o_auth_access_token_list import V1OAuthAccessTokenList
-from .models.v1_o_auth_authorize_token import V1OAuthAuthorizeToken
-from .models.v1_o_auth_authorize_token_list import V1OAuthAuthorizeTokenList
-from .models.v1_o_auth_client import V1OAuthClient
-from .models.v1_o_auth_client_authorization import V1OAuthClientAuthorization
-from .models.v1_o_auth_client_authorization_list import V1OAuthClientAuthorizationList
-from .models.v1_o_auth_client_list import V1OAuthClientList
-from .models.v1_parameter import V1Parameter
-from .models.v1_pod_security_policy_review import V1PodSecurityPolicyReview
-from .models.v1_pod_security_policy_review_spec import V1PodSecurityPolicyReviewSpec
-from .models.v1_pod_security_policy_review_status import V1PodSecurityPolicyReviewStatus
-from .models.v1_pod_security_policy_self_subject_review import V1PodSecurityPolicySelfSubjectReview
-from .models.v1_pod_security_policy_self_subject_review_spec import V1PodSecurityPolicySelfSubjectReviewSpec
-from .models.v1_pod_security_policy_subject_review import V1PodSecurityPolicySubjectReview
-from .models.v1_pod_security_policy_subject_review_spec import V1PodSecurityPolicySubjectReviewSpec
-from .models.v1_pod_security_policy_subject_review_status import V1PodSecurityPolicySubjectReviewStatus
-from .models.v1_policy import V1Policy
-from .models.v1_policy_binding import V1PolicyBinding
-from .models.v1_policy_binding_list import V1PolicyBindingList
-from .models.v1_policy_list import V1PolicyList
-from .models.v1_policy_rule import V1PolicyRule
-from .models.v1_project import V1Project
-from .models.v1_project_list import V1ProjectList
-from .models.v1_project_request import V1ProjectRequest
-from .models.v1_project_spec import V1ProjectSpec
-from .models.v1_project_status import V1ProjectStatus
-from .models.v1_recreate_deployment_strategy_params import V1RecreateDeploymentStrategyParams
-from .models.v1_repository_import_spec import V1RepositoryImportSpec
-from .models.v1_repository_import_status import V1RepositoryImportStatus
-from .models.v1_resource_access_review import V1ResourceAccessReview
-from .models.v1_resource_quota_status_by_namespace import V1ResourceQuotaStatusByNamespace
-from .models.v1_role import V1Role
-from .models.v1_role_binding import V1RoleBinding
-from .models.v1_role_binding_list import V1RoleBindingList
-from .models.v1_role_binding_restriction import V1RoleBindingRestriction
-from .models.v1_role_binding_restriction_list import V1RoleBindingRestrictionList
-from .models.v1_role_binding_restriction_spec import V1RoleBindingRestrictionSpec
-from .models.v1_role_list import V1RoleList
-from .models.v1_rolling_deployment_strategy_params import V1RollingDeploymentStrategyParams
-from .models.v1_route import V1Route
-from .models.v1_route_ingress import V1RouteIngress
-from .models.v1_route_ingress_condition import V1RouteIngressCondition
-from .models.v1_route_list import V1RouteList
-from .models.v1_route_port import V1RoutePort
-from .models.v1_route_spec import V1RouteSpec
-from .models.v1_route_status import V1RouteStatus
-from .models.v1_route_target_reference import V1RouteTargetReference
-from .models.v1_run_as_user_strategy_options import V1RunAsUserStrategyOptions
-from .models.v1_se_linux_context_strategy_options import V1SELinuxContextStrategyOptions
-from .models.v1_scope_restriction import V1ScopeRestriction
-from .models.v1_secret_build_source import V1SecretBuildSource
-from .models.v1_secret_spec import V1SecretSpec
-from .models.v1_security_context_constraints import V1SecurityContextConstraints
-from .models.v1_security_context_constraints_list import V1SecurityContextConstraintsList
-from .models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from .models.v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from .models.v1_service_account_pod_security_policy_review_status import V1ServiceAccountPodSecurityPolicyReviewStatus
-from .models.v1_service_account_reference import V1ServiceAccountReference
-from .models.v1_service_account_restriction import V1ServiceAccountRestriction
-from .models.v1_signature_condition import V1SignatureCondition
-from .models.v1_signature_issuer import V1SignatureIssuer
-from .models.v1_signature_subject import V1SignatureSubject
-from .models.v1_source_build_strategy import V1SourceBuildStrategy
-from .models.v1_source_control_user import V1SourceControlUser
-from .models.v1_source_revision import V1SourceRevision
-from .models.v1_subject_access_review import V1SubjectAccessReview
-from .models.v1_subject_rules_review import V1SubjectRulesReview
-from .models.v1_subject_rules_review_spec import V1SubjectRulesReviewSpec
-from .models.v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from .models.v1_supplemental_groups_strategy_options import V1SupplementalGroupsStrategyOptions
-from .models.v1_tls_config import V1TLSConfig
-from .models.v1_tag_event import V1TagEvent
-from .models.v1_tag_event_condition import V1TagEventCondition
-from .models.v1_tag_image_hook import V1TagImageHook
-from .models.v1_tag_import_policy import V1TagImportPolicy
-from .models.v1_tag_reference import V1TagReference
-from .models.v1_tag_reference_policy import V1TagReferencePolicy
-from .models.v1_template import V1Template
-from .models.v1_template_list import V1TemplateList
-from .models.v1_user import V1User
-from .models.v1_user_identity_mapping import V1UserIdentityMapping
-from .models.v1_user_list import V1UserList
-from .models.v1_user_restriction import V1UserRestriction
-from .models.v1_web_hook_trigger import V1WebHookTrigger
-from .models.v1beta1_fs_group_strategy_options import V1beta1FSGroupStrategyOptions
-from .models.v1beta1_host_port_range import V1beta1HostPortRange
-from .models.v1beta1_id_range import V1beta1IDRange
-from .models.v1beta1_ingress_tls import V1beta1IngressTLS
-from .models.v1beta1_pod_security_policy import V1beta1PodSecurityPolicy
-from .models.v1beta1_pod_security_policy_list import V1beta1PodSecurityPolicyList
-from .models.v1beta1_pod_security_policy_spec import V1beta1PodSecurityPolicySpec
-from .models.v1beta1_run_as_user_strategy_options import V1beta1RunAsUserStrategyOptions
-from .models.v1beta1_se_linux_strategy_options import V1beta1SELinuxStrategyOptions
-from .models.v1beta1_supplemental_groups_strategy_options import V1beta1SupplementalGroupsStrategyOptions
-
-# import apis into sdk package
-from .apis.apps_openshift_io_api import AppsOpenshiftIoApi
-from .apis.apps_openshift_io_v1_api import AppsOpenshiftIoV1Api
-from .apis.authorization_openshift_io_api import AuthorizationOpenshiftIoApi
-from .apis.authorization_openshift_io_v1_api import AuthorizationOpenshiftIoV1Api
-from .apis.build_openshift_io_api import BuildOpenshiftIoApi
-from .apis.build_openshift_io_v1_api import BuildOpenshiftIoV1Api
-from .apis.image_openshift_io_api import ImageOpenshiftIoApi
-from .apis.image_openshift_io_v1_api import ImageOpenshiftIoV1Api
-from .apis.network_openshift_io_api import NetworkOpenshiftIoApi
-from .apis.network_openshift_io_v1_api import NetworkOpenshiftIoV1Api
-from .apis.oapi_api import OapiApi
-from .apis.oauth_openshift_io_api import OauthOpenshiftIoApi
-from .apis.oauth_openshift_io_v1_api import OauthOpenshiftIoV1Api
-from .apis.osapi_api import OsapiApi
-from .apis.project_openshift_io_api import ProjectOpenshiftIoApi
-from .apis.project_openshift_io_v1_api import ProjectOpenshiftIoV1Api
-from .apis.quota_openshift_io_api import QuotaOpenshiftIoApi
-from .apis.quota_openshift_io_v1_api import QuotaOpenshiftIoV1Api
-from .apis.route_openshift_io_api import RouteOpenshiftIoApi
-from .apis.route_openshift_io_v1_api import RouteOpenshiftIoV1Api
-from .apis.security_openshift_io_api import SecurityOpenshiftIoApi
-from .apis.security_openshift_io_v1_api import SecurityOpenshiftIoV1Api
-from .apis.template_openshift_io_api import TemplateOpenshiftIoApi
-from .apis.template_openshift_io_v1_api import TemplateOpenshiftIoV1Api
-from .apis.template_openshift_io_api import TemplateOpenshiftIoApi
-from .apis.user_openshift_io_api import UserOpenshiftIoApi
-from .apis.user_openshift_io_v1_api import UserOpenshiftIoV1Api
-
-# import ApiClient
-from .api_client import ApiClient
+from .lazy import lazy_module
 
-from kubernetes.client.configuration import Configuration, ConfigurationObject, configuration
\ No newline at end of file
+lazy_module(__name__, {
+    'ApiClient': '.api_client',
+    'AppsOpenshiftIoApi': '.apis.apps_openshift_io_api',
+    'AppsOpenshiftIoV1Api': '.apis.apps_openshift_io_v1_api',
+    'AuthorizationOpenshiftIoApi': '.apis.authorization_openshift_io_api',
+    'AuthorizationOpenshiftIoV1Api': '.apis.authorization_openshift_io_v1_api',
+    'BuildOpenshiftIoApi': '.apis.build_openshift_io_api',
+    'BuildOpenshiftIoV1Api': '.apis.build_openshift_io_v1_api',
+    'Configuration': 'kubernetes.client.configuration',
+    'ConfigurationObject': 'kubernetes.client.configuration',
+    'ImageOpenshiftIoApi': '.apis.image_openshift_io_api',
+    'ImageOpenshiftIoV1Api': '.apis.image_openshift_io_v1_api',
+    'NetworkOpenshiftIoApi': '.apis.network_openshift_io_api',
+    'NetworkOpenshiftIoV1Api': '.apis.network_openshift_io_v1_api',
+    'OapiApi': '.apis.oapi_api',
+    'OauthOpenshiftIoApi': '.apis.oauth_openshift_io_api',
+    'OauthOpenshiftIoV1Api': '.apis.oauth_openshift_io_v1_api',
+    'OsapiApi': '.apis.osapi_api',
+    'ProjectOpenshiftIoApi': '.apis.project_openshift_io_api',
+    'ProjectOpenshiftIoV1Api': '.apis.project_openshift_io_v1_api',
+    'QuotaOpenshiftIoApi': '.apis.quota_openshift_io_api',
+    'QuotaOpenshiftIoV1Api': '.apis.quota_openshift_io_v1_api',
+    'RouteOpenshiftIoApi': '.apis.route_openshift_io_api',
+    'RouteOpenshiftIoV1Api': '.apis.route_openshift_io_v1_api',
+    'SecurityOpenshiftIoApi': '.apis.security_openshift_io_api',
+    'SecurityOpenshiftIoV1Api': '.apis.security_openshift_io_v1_api',
+    'TemplateOpenshiftIoApi': '.apis.template_openshift_io_api',
+    'TemplateOpenshiftIoV1Api': '.apis.template_openshift_io_v1_api',
+    'UnversionedServerAddressByClientCIDR': '.models.unversioned_server_address_by_client_cidr',
+    'UserOpenshiftIoApi': '.apis.user_openshift_io_api',
+    'UserOpenshiftIoV1Api': '.apis.user_openshift_io_v1_api',
+    'V1AppliedClusterResourceQuota': '.models.v1_applied_cluster_resource_quota',
+    'V1AppliedClusterResourceQuotaList': '.models.v1_applied_cluster_resource_quota_list',
+    'V1BinaryBuildSource': '.models.v1_binary_build_source',
+    'V1Build': '.models.v1_build',
+    'V1BuildConfig': '.models.v1_build_config',
+    'V1BuildConfigList': '.models.v1_build_config_list',
+    'V1BuildConfigSpec': '.models.v1_build_config_spec',
+    'V1BuildConfigStatus': '.models.v1_build_config_status',
+    'V1BuildList': '.models.v1_build_list',
+    'V1BuildLog': '.models.v1_build_log',
+    'V1BuildOutput': '.models.v1_build_output',
+    'V1BuildPostCommitSpec': '.models.v1_build_post_commit_spec',
+    'V1BuildRequest': '.models.v1_build_request',
+    'V1BuildSource': '.models.v1_build_source',
+    'V1BuildSpec': '.models.v1_build_spec',
+    'V1BuildStatus': '.models.v1_build_status',
+    'V1BuildStatusOutput': '.models.v1_build_status_output',
+    'V1BuildStatusOutputTo': '.models.v1_build_status_output_to',
+    'V1BuildStrategy': '.models.v1_build_strategy',
+    'V1BuildTriggerCause': '.models.v1_build_trigger_cause',
+    'V1BuildTriggerPolicy': '.models.v1_build_trigger_policy',
+    'V1ClusterNetwork': '.models.v1_cluster_network',
+    'V1ClusterNetworkList': '.models.v1_cluster_network_list',
+    'V1ClusterPolicy': '.models.v1_cluster_policy',
+    'V1ClusterPolicyBinding': '.models.v1_cluster_policy_binding',
+    'V1ClusterPolicyBindingList': '.models.v1_cluster_policy_binding_list',
+    'V1ClusterPolicyList': '.models.v1_cluster_policy_list',
+    'V1ClusterResourceQuota': '.models.v1_cluster_resource_quota',
+    'V1ClusterResourceQuotaList': '.models.v1_cluster_resource_quota_list',
+    'V1ClusterResourceQuotaSelector': '.models.v1_cluster_resource_quota_selector',
+    'V1ClusterResourceQuotaSpec': '.models.v1_cluster_resource_quota_spec',
+    'V1ClusterResourceQuotaStatus': '.models.v1_cluster_resource_quota_status',
+    'V1ClusterRole': '.models.v1_cluster_role',
+    'V1ClusterRoleBinding': '.models.v1_cluster_role_binding',
+    'V1ClusterRoleBindingList': '.models.v1_cluster_role_binding_list',
+    'V1ClusterRoleList': '.models.v1_cluster_role_list',
+    'V1ClusterRoleScopeRestriction': '.models.v1_cluster_role_scope_restriction',
+    'V1CustomBuildStrategy': '.models.v1_custom_build_strategy',
+    'V1CustomDeploymentStrategyParams': '.models.v1_custom_deployment_strategy_params',
+    'V1DeploymentCause': '.models.v1_deployment_cause',
+    'V1DeploymentCauseImageTrigger': '.models.v1_deployment_cause_image_trigger',
+    'V1DeploymentCondition': '.models.v1_deployment_condition',
+    'V1DeploymentConfig': '.models.v1_deployment_config',
+    'V1DeploymentConfigList': '.models.v1_deployment_config_list',
+    'V1DeploymentConfigRollback': '.models.v1_deployment_config_rollback',
+    'V1DeploymentConfigRollbackSpec': '.models.v1_deployment_config_rollback_spec',
+    'V1DeploymentConfigSpec': '.models.v1_deployment_config_spec',
+    'V1DeploymentConfigStatus': '.models.v1_deployment_config_status',
+    'V1DeploymentDetails': '.models.v1_deployment_details',
+    'V1DeploymentLog': '.models.v1_deployment_log',
+    'V1DeploymentRequest': '.models.v1_deployment_request',
+    'V1DeploymentStrategy': '.models.v1_deployment_strategy',
+    'V1DeploymentTriggerImageChangeParams': '.models.v1_deployment_trigger_image_change_params',
+    'V1DeploymentTriggerPolicy': '.models.v1_deployment_trigger_policy',
+    'V1DeprecatedDownwardAPIVolumeFile': '.models.v1_deprecated_downward_api_volume_file',
+    'V1DeprecatedDownwardAPIVolumeSource': '.models.v1_deprecated_downward_api_volume_source',
+    'V1DockerBuildStrategy': '.models.v1_docker_build_strategy',
+    'V1DockerStrategyOptions': '.models.v1_docker_strategy_options',
+    'V1EgressNetworkPolicy': '.models.v1_egress_network_policy',
+    'V1EgressNetworkPolicyList': '.models.v1_egress_network_policy_list',
+    'V1EgressNetworkPolicyPeer': '.models.v1_egress_network_policy_peer',
+    'V1EgressNetworkPolicyRule': '.models.v1_egress_network_policy_rule',
+    'V1EgressNetworkPolicySpec': '.models.v1_egress_network_policy_spec',
+    'V1ExecNewPodHook': '.models.v1_exec_new_pod_hook',
+    'V1FSGroupStrategyOptions': '.models.v1_fs_group_strategy_options',
+    'V1GenericWebHookCause': '.models.v1_generic_web_hook_cause',
+    'V1GitBuildSource': '.models.v1_git_build_source',
+    'V1GitHubWebHookCause': '.models.v1_git_hub_web_hook_cause',
+    'V1GitSourceRevision': '.models.v1_git_source_revision',
+    'V1Group': '.models.v1_group',
+    'V1GroupList': '.models.v1_group_list',
+    'V1GroupRestriction': '.models.v1_group_restriction',
+    'V1HostSubnet': '.models.v1_host_subnet',
+    'V1HostSubnetList': '.models.v1_host_subnet_list',
+    'V1IDRange': '.models.v1_id_range',
+    'V1Identity': '.models.v1_identity',
+    'V1IdentityList': '.models.v1_identity_list',
+    'V1Image': '.models.v1_image',
+    'V1ImageChangeCause': '.models.v1_image_change_cause',
+    'V1ImageChangeTrigger': '.models.v1_image_change_trigger',
+    'V1ImageImportSpec': '.models.v1_image_import_spec',
+    'V1ImageImportStatus': '.models.v1_image_import_status',
+    'V1ImageLabel': '.models.v1_image_label',
+    'V1ImageLayer': '.models.v1_image_layer',
+    'V1ImageList': '.models.v1_image_list',
+    'V1ImageSignature': '.models.v1_image_signature',
+    'V1ImageSource': '.models.v1_image_source',
+    'V1ImageSourcePath': '.models.v1_image_source_path',
+    'V1ImageStream': '.models.v1_image_stream',
+    'V1ImageStreamImage': '.models.v1_image_stream_image',
+    'V1ImageStreamImport': '.models.v1_image_stream_import',
+    'V1ImageStreamImportSpec': '.models.v1_image_stream_import_spec',
+    'V1ImageStreamImportStatus': '.models.v1_image_stream_import_status',
+    'V1ImageStreamList': '.models.v1_image_stream_list',
+    'V1ImageStreamMapping': '.models.v1_image_stream_mapping',
+    'V1ImageStreamSpec': '.models.v1_image_stream_spec',
+    'V1ImageStreamStatus': '.models.v1_image_stream_status',
+    'V1ImageStreamTag': '.models.v1_image_stream_tag',
+    'V1ImageStreamTagList': '.models.v1_image_stream_tag_list',
+    'V1JenkinsPipelineBuildStrategy': '.models.v1_jenkins_pipeline_build_strategy',
+    'V1LifecycleHook': '.models.v1_lifecycle_hook',
+    'V1LocalResourceAccessReview': '.models.v1_local_resource_access_review',
+    'V1LocalSubjectAccessReview': '.models.v1_local_subject_access_review',
+    'V1NamedClusterRole': '.models.v1_named_cluster_role',
+    'V1NamedClusterRoleBinding': '.models.v1_named_cluster_role_binding',
+    'V1NamedRole': '.models.v1_named_role',
+    'V1NamedRoleBinding': '.models.v1_named_role_binding',
+    'V1NamedTagEventList': '.models.v1_named_tag_event_list',
+    'V1NetNamespace': '.models.v1_net_namespace',
+    'V1NetNamespaceList': '.models.v1_net_namespace_list',
+    'V1OAuthAccessToken': '.models.v1_o_auth_access_token',
+    'V1OAuthAccessTokenList': '.models.v1_o_auth_access_token_list',
+    'V1OAuthAuthorizeToken': '.models.v1_o_auth_authorize_token',
+    'V1OAuthAuthorizeTokenList': '.models.v1_o_auth_authorize_token_list',
+    'V1OAuthClient': '.models.v1_o_auth_client',
+    'V1OAuthClientAuthorization': '.models.v1_o_auth_client_authorization',
+    'V1OAuthClientAuthorizationList': '.models.v1_o_auth_client_authorization_list',
+    'V1OAuthClientList': '.models.v1_o_auth_client_list',
+    'V1Parameter': '.models.v1_parameter',
+    'V1PodSecurityPolicyReview': '.models.v1_pod_security_policy_review',
+    'V1PodSecurityPolicyReviewSpec': '.models.v1_pod_security_policy_review_spec',
+    'V1PodSecurityPolicyReviewStatus': '.models.v1_pod_security_policy_review_status',
+    'V1PodSecurityPolicySelfSubjectReview': '.models.v1_pod_security_policy_self_subject_review',
+    'V1PodSecurityPolicySelfSubjectReviewSpec': '.models.v1_pod_security_policy_self_subject_review_spec',
+    'V1PodSecurityPolicySubjectReview': '.models.v1_pod_security_policy_subject_review',
+    'V1PodSecurityPolicySubjectReviewSpec': '.models.v1_pod_security_policy_subject_review_spec',
+    'V1PodSecurityPolicySubjectReviewStatus': '.models.v1_pod_security_policy_subject_review_status',
+    'V1Policy': '.models.v1_policy',
+    'V1PolicyBinding': '.models.v1_policy_binding',
+    'V1PolicyBindingList': '.models.v1_policy_binding_list',
+    'V1PolicyList': '.models.v1_policy_list',
+    'V1PolicyRule': '.models.v1_policy_rule',
+    'V1Project': '.models.v1_project',
+    'V1ProjectList': '.models.v1_project_list',
+    'V1ProjectRequest': '.models.v1_project_request',
+    'V1ProjectSpec': '.models.v1_project_spec',
+    'V1ProjectStatus': '.models.v1_project_status',
+    'V1RecreateDeploymentStrategyParams': '.models.v1_recreate_deployment_strategy_params',
+    'V1RepositoryImportSpec': '.models.v1_repository_import_spec',
+    'V1RepositoryImportStatus': '.models.v1_repository_import_status',
+    'V1ResourceAccessReview': '.models.v1_resource_access_review',
+    'V1ResourceQuotaStatusByNamespace': '.models.v1_resource_quota_status_by_namespace',
+    'V1Role': '.models.v1_role',
+    'V1RoleBinding': '.models.v1_role_binding',
+    'V1RoleBindingList': '.models.v1_role_binding_list',
+    'V1RoleBindingRestriction': '.models.v1_role_binding_restriction',
+    'V1RoleBindingRestrictionList': '.models.v1_role_binding_restriction_list',
+    'V1RoleBindingRestrictionSpec': '.models.v1_role_binding_restriction_spec',
+    'V1RoleList': '.models.v1_role_list',
+    'V1RollingDeploymentStrategyParams': '.models.v1_rolling_deployment_strategy_params',
+    'V1Route': '.models.v1_route',
+    'V1RouteIngress': '.models.v1_route_ingress',
+    'V1RouteIngressCondition': '.models.v1_route_ingress_condition',
+    'V1RouteList': '.models.v1_route_list',
+    'V1RoutePort': '.models.v1_route_port',
+    'V1RouteSpec': '.models.v1_route_spec',
+    'V1RouteStatus': '.models.v1_route_status',
+    'V1RouteTargetReference': '.models.v1_route_target_reference',
+    'V1RunAsUserStrategyOptions': '.models.v1_run_as_user_strategy_options',
+    'V1SELinuxContextStrategyOptions': '.models.v1_se_linux_context_strategy_options',
+    'V1ScopeRestriction': '.models.v1_scope_restriction',
+    'V1SecretBuildSource': '.models.v1_secret_build_source',
+    'V1SecretSpec': '.models.v1_secret_spec',
+    'V1SecurityContextConstraints': '.models.v1_security_context_constraints',
+    'V1SecurityContextConstraintsList': '.models.v1_security_context_constraints_list',
+    'V1SelfSubjectRulesReview': '.models.v1_self_subject_rules_review',
+    'V1SelfSubjectRulesReviewSpec': '.models.v1_self_subject_rules_review_spec',
+    'V1ServiceAccountPodSecurityPolicyReviewStatus': '.models.v1_service_account_pod_security_policy_review_status',
+    'V1ServiceAccountReference': '.models.v1_service_account_reference',
+    'V1ServiceAccountRestriction': '.models.v1_service_account_restriction',
+    'V1SignatureCondition': '.models.v1_signature_condition',
+    'V1SignatureIssuer': '.models.v1_signature_issuer',
+    'V1SignatureSubject': '.models.v1_signature_subject',
+    'V1SourceBuildStrategy': '.models.v1_source_build_strategy',
+    'V1SourceControlUser': '.models.v1_source_control_user',
+    'V1SourceRevision': '.models.v1_source_revision',
+    'V1SubjectAccessReview': '.models.v1_subject_access_review',
+    'V1SubjectRulesReview': '.models.v1_subject_rules_review',
+    'V1SubjectRulesReviewSpec': '.models.v1_subject_rules_review_spec',
+    'V1SubjectRulesReviewStatus': '.models.v1_subject_rules_review_status',
+    'V1SupplementalGroupsStrategyOptions': '.models.v1_supplemental_groups_strategy_options',
+    'V1TLSConfig': '.models.v1_tls_config',
+    'V1TagEvent': '.models.v1_tag_event',
+    'V1TagEventCondition': '.models.v1_tag_event_condition',
+    'V1TagImageHook': '.models.v1_tag_image_hook',
+    'V1TagImportPolicy': '.models.v1_tag_import_policy',
+    'V1TagReference': '.models.v1_tag_reference',
+    'V1TagReferencePolicy': '.models.v1_tag_reference_policy',
+    'V1Template': '.models.v1_template',
+    'V1TemplateList': '.models.v1_template_list',
+    'V1User': '.models.v1_user',
+    'V1UserIdentityMapping': '.models.v1_user_identity_mapping',
+    'V1UserList': '.models.v1_user_list',
+    'V1UserRestriction': '.models.v1_user_restriction',
+    'V1WebHookTrigger': '.models.v1_web_hook_trigger',
+    'V1beta1FSGroupStrategyOptions': '.models.v1beta1_fs_group_strategy_options',
+    'V1beta1HostPortRange': '.models.v1beta1_host_port_range',
+    'V1beta1IDRange': '.models.v1beta1_id_range',
+    'V1beta1IngressTLS': '.models.v1beta1_ingress_tls',
+    'V1beta1PodSecurityPolicy': '.models.v1beta1_pod_security_policy',
+    'V1beta1PodSecurityPolicyList': '.models.v1beta1_pod_security_policy_list',
+    'V1beta1PodSecurityPolicySpec': '.models.v1beta1_pod_security_policy_spec',
+    'V1beta1RunAsUserStrategyOptions': '.models.v1beta1_run_as_user_strategy_options',
+    'V1beta1SELinuxStrategyOptions': '.models.v1beta1_se_linux_strategy_options',
+    'V1beta1SupplementalGroupsStrategyOptions': '.models.v1beta1_supplemental_groups_strategy_options',
+    'apis': '.apis',
+    'configuration': 'kubernetes.client.configuration',
+    'models': '.models',
+})
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio transport for the generated API classes. Requires Python 3.5+ and aiohttp.
+"""
+from __future__ import absolute_import
+
+import json
+import logging
+import re
+import ssl
+
+import aiohttp
+
+from kubernetes.client.rest import ApiException
+
+from .api_client import ApiClient
+
+logger = logging.getLogger(__name__)
+
+JSON_RX = re.compile('json', re.IGNORECASE)
+
+
+class AsyncResponse(object):
+    """
+    Response from AsyncApiClient.request(), with the attributes ApiClient.deserialize() and
+    ApiException expect. When content is not preloaded, read the body with read() or readline().
+    """
+
+    def __init__(self, response, data=None):
+        self.response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.data = data
+        self._buffer = bytearray()
+
+    def getheaders(self):
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        return self.response.headers.get(name, default)
+
+    async def read(self):
+        """ Read and return the whole body as text """
+        if self.data is None:
+            self.data = (await self.response.read()).decode('utf8')
+        return self.data
+
+    async def readline(self):
+        """ Return the next line of the body as bytes, or b'' at the end. Lines may be of any length. """
+        buffer = self._buffer
+        while True:
+            end = buffer.find(b'\n')
+            if end >= 0:
+                line = bytes(buffer[:end + 1])
+                del buffer[:end + 1]
+                return line
+            chunk = await self.response.content.readany()
+            if not chunk:
+                line = bytes(buffer)
+                del buffer[:]
+                return line
+            buffer.extend(chunk)
+
+    def close(self):
+        self.response.close()
+
+    def release_conn(self):
+        self.response.release()
+
+
+class AsyncApiClient(ApiClient):
+    """
+    ApiClient whose call_api() returns a coroutine, so every generated API method called through it
+    returns an awaitable. Models, serialization and deserialization are those of ApiClient.
+
+    Requests share one aiohttp session. Its connection pool keeps connections alive between requests,
+    and holds at most connection_limit at once. The session is created on first use, inside the
+    running event loop. Call close() when done with the client.
+    """
+
+    def __init__(self, host=None, header_name=None, header_value=None, cookie=None, config=None,
+                 connection_limit=100):
+        if config is None:
+            super(AsyncApiClient, self).__init__(host, header_name, header_value, cookie)
+        else:
+            super(AsyncApiClient, self).__init__(host, header_name, header_value, cookie, config=config)
+        self.connection_limit = connection_limit
+        self._session = None
+
+    @property
+    def session(self):
+        """ The aiohttp.ClientSession, created on first use """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, ssl=self._ssl_context())
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """ Close the session and its pooled connections """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def call_api(self, resource_path, method, path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None, response_type=None, auth_settings=None, callback=None,
+                 _return_http_data_only=None, collection_formats=None, _preload_content=True,
+                 _request_timeout=None):
+        """ Return a coroutine making the API call. See ApiClient.call_api(). """
+        if callback is not None:
+            raise ValueError('callback is not supported by AsyncApiClient, await the result instead')
+        return self._call_api(resource_path, method, path_params, query_params, header_params, body, post_params,
+                              files, response_type, auth_settings, _return_http_data_only, collection_formats,
+                              _preload_content, _request_timeout)
+
+    async def _call_api(self, resource_path, method, path_params, query_params, header_params, body, post_params,
+                        files, response_type, auth_settings, _return_http_data_only, collection_formats,
+                        _preload_content, _request_timeout):
+        url, query_params, header_params, post_params, body = self.prepare_request(
+            resource_path, path_params, query_params, header_params, body, post_params, files, auth_settings,
+            collection_formats
+        )
+        response_data = await self.request(method, url, query_params=query_params, headers=header_params,
+                                           post_params=post_params, body=body, _preload_content=_preload_content,
+                                           _request_timeout=_request_timeout)
+        return self.handle_response(response_data, response_type, None, _return_http_data_only, _preload_content)
+
+    async def request(self, method, url, query_params=None, headers=None, post_params=None, body=None,
+                      _preload_content=True, _request_timeout=None):
+        """
+        Send a request, following RESTClientObject.request(). Returns an AsyncResponse, with data read
+        unless _preload_content is False, and raises ApiException for error responses.
+        """
+        method = method.upper()
+        if post_params and body:
+            raise ValueError("body parameter cannot be used with post_params parameter.")
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', 'application/json')
+        content_type = headers['Content-Type']
+
+        kwargs = {
+            'params': [(k, _query_value(v)) for k, v in query_params or []],
+            'headers': headers,
+            'timeout': _client_timeout(_request_timeout, _preload_content),
+        }
+        proxy = getattr(self.config, 'proxy', None)
+        if proxy:
+            kwargs['proxy'] = proxy
+        if method in ('POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE'):
+            if content_type == 'application/json-patch+json' and not isinstance(body, list):
+                headers['Content-Type'] = 'application/strategic-merge-patch+json'
+            if JSON_RX.search(content_type):
+                kwargs['data'] = json.dumps(body) if body else None
+            elif content_type == 'application/x-www-form-urlencoded':
+                kwargs['data'] = post_params or []
+            elif content_type == 'multipart/form-data':
+                del headers['Content-Type']
+                form = aiohttp.FormData()
+                for name, value in post_params or []:
+                    if isinstance(value, tuple):
+                        form.add_field(name, value[1], filename=value[0], content_type=value[2])
+                    else:
+                        form.add_field(name, value)
+                kwargs['data'] = form
+            elif isinstance(body, str):
+                kwargs['data'] = body
+            else:
+                raise ApiException(status=0, reason="Cannot prepare a request message for provided arguments. "
+                                                    "Please check that your arguments match declared content type.")
+
+        try:
+            response = await self.session.request(method, url, **kwargs)
+        except aiohttp.ClientSSLError as exc:
+            raise ApiException(status=0, reason="{0}\n{1}".format(type(exc).__name__, str(exc)))
+
+        result = AsyncResponse(response)
+        if _preload_content or not 200 <= response.status <= 205:
+            try:
+                await result.read()
+            finally:
+                response.release()
+            logger.debug("response body: %s", result.data)
+        if not 200 <= result.status <= 205:
+            raise ApiException(http_resp=result)
+        return result
+
+    def _ssl_context(self):
+        config = self.config
+        if not config.verify_ssl:
+            return False
+        context = ssl.create_default_context(cafile=config.ssl_ca_cert)
+        if config.cert_file:
+            context.load_cert_chain(config.cert_file, config.key_file)
+        if not config.assert_hostname:
+            context.check_hostname = False
+        return context
+
+
+def _query_value(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _client_timeout(request_timeout, preload_content):
+    """ Convert a _request_timeout to an aiohttp.ClientTimeout. Streams have no total timeout by default. """
+    if isinstance(request_timeout, tuple) and len(request_timeout) == 2:
+        return aiohttp.ClientTimeout(total=None, sock_connect=request_timeout[0], sock_read=request_timeout[1])
+    if request_timeout:
+        return aiohttp.ClientTimeout(total=request_timeout)
+    if preload_content:
+        return aiohttp.ClientTimeout(total=5 * 60)
+    return aiohttp.ClientTimeout(total=None)
@@ -1,18 +1,228 @@
 from __future__ import absolute_import
 
+import logging
+import threading
+
+from contextlib import contextmanager
+
+from six import string_types
+from six.moves.urllib.parse import quote
+
 from kubernetes.client.api_client import ApiClient as K8sApiClient
-from kubernetes.client import models as k8s_models
 
-from . import models
+from . import serializer
+from .registry import type_registry
+
+NATIVE_TYPES = frozenset(['int', 'long', 'float', 'str', 'bool', 'date', 'datetime', 'object', 'file'])
+
+logger = logging.getLogger(__name__)
+
+_executor_lock = threading.Lock()
+_singleflight_lock = threading.Lock()
+
 
 class ApiClient(K8sApiClient):
-    def _ApiClient__deserialize(self, data, klass):
+    # Most background calls of one client running at once; see ClientExecutor
+    max_concurrency = 8
+    _executor = None
+    # RateLimiter pacing the client's requests, or None for no limit; see openshift.client.ratelimit
+    rate_limiter = None
+    # Share one request between concurrent identical GET calls; see singleflight. A GET that joins a call
+    # already in flight gets the state the server returned to that call, which may be from before the
+    # caller's own preceding write. Reads that must see the caller's writes are made within fresh_reads().
+    coalesce_reads = True
+    _singleflight = None
+    _fresh_reads = None
+
+    @property
+    def executor(self):
+        """
+        The ClientExecutor running this client's background calls on the shared thread pool, created
+        on first use with max_concurrency.
+        """
+        if self._executor is None:
+            from .executor import ClientExecutor
+            with _executor_lock:
+                if self._executor is None:
+                    self._executor = ClientExecutor(max_concurrency=self.max_concurrency)
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor):
+        self._executor = executor
+
+    @property
+    def singleflight(self):
+        """ The SingleFlight coalescing this client's concurrent identical GET calls, created on first use """
+        if self._singleflight is None:
+            from .singleflight import SingleFlight
+            with _singleflight_lock:
+                if self._singleflight is None:
+                    self._singleflight = SingleFlight()
+        return self._singleflight
+
+    def submit(self, method, *args, **kwargs):
+        """
+        Call a generated API method, or any function, on the client's executor.
+
+        :return: concurrent.futures.Future for the method's result
+        """
+        return self.executor.submit(method, *args, **kwargs)
+
+    @contextmanager
+    def fresh_reads(self):
+        """
+        Within the block, the GET calls of the current thread are sent on their own rather than joining a
+        call in flight, so they see the thread's earlier writes.
+        """
+        if self._fresh_reads is None:
+            with _singleflight_lock:
+                if self._fresh_reads is None:
+                    self._fresh_reads = threading.local()
+        local = self._fresh_reads
+        local.depth = getattr(local, 'depth', 0) + 1
         try:
-            return super(ApiClient, self).__deserialize(data, klass)
-        except AttributeError:
+            yield
+        finally:
+            local.depth -= 1
+
+    def _coalescing(self):
+        """ True if the current thread's GET calls may join a call in flight """
+        return self.coalesce_reads and not (self._fresh_reads is not None and getattr(self._fresh_reads, 'depth', 0))
+
+    def call_api(self, resource_path, method, path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None, response_type=None, auth_settings=None, callback=None,
+                 _return_http_data_only=None, collection_formats=None, _preload_content=True,
+                 _request_timeout=None):
+        """
+        Make an API call. With a callback, the call runs on the client's executor rather than a new
+        thread, and a Future is returned; the callback is called with the result when it succeeds.
+        """
+        args = (resource_path, method, path_params, query_params, header_params, body, post_params, files,
+                response_type, auth_settings, None, _return_http_data_only, collection_formats, _preload_content,
+                _request_timeout)
+        if callback is None:
+            return self._ApiClient__call_api(*args)
+        return self.submit(_run_callback, callback, self._ApiClient__call_api, *args)
+
+    def request(self, method, url, query_params=None, headers=None, post_params=None, body=None,
+                _preload_content=True, _request_timeout=None):
+        """ Send a request, within the budget of the client's rate_limiter if it has one """
+        def send():
+            return super(ApiClient, self).request(method, url, query_params=query_params, headers=headers,
+                                                  post_params=post_params, body=body,
+                                                  _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+        if self.rate_limiter is None:
+            return send()
+        return self.rate_limiter.call(method, query_params, send)
+
+    def sanitize_for_serialization(self, obj):
+        return serializer.to_api_dict(obj)
+
+    def _ApiClient__deserialize(self, data, klass):
+        if data is not None and isinstance(klass, string_types) and klass not in NATIVE_TYPES \
+           and not klass.startswith('list[') and not klass.startswith('dict('):
+            model_class = type_registry.kubernetes_model(klass) or type_registry.model(klass)
+            if model_class is None:
+                raise AttributeError("Unable to find a model for {}".format(klass))
+            return serializer.from_api_dict(data, model_class)
+        return super(ApiClient, self).__deserialize(data, klass)
+
+    def _ApiClient__deserialize_model(self, data, klass):
+        return serializer.from_api_dict(data, klass)
+
+    def _ApiClient__call_api(self, resource_path, method, path_params=None, query_params=None, header_params=None,
+                             body=None, post_params=None, files=None, response_type=None, auth_settings=None,
+                             callback=None, _return_http_data_only=None, collection_formats=None,
+                             _preload_content=True, _request_timeout=None):
+        url, query_params, header_params, post_params, body = self.prepare_request(
+            resource_path, path_params, query_params, header_params, body, post_params, files, auth_settings,
+            collection_formats
+        )
+
+        def call():
+            response_data = self.request(method, url, query_params=query_params, headers=header_params,
+                                         post_params=post_params, body=body, _preload_content=_preload_content,
+                                         _request_timeout=_request_timeout)
+            return self.handle_response(response_data, response_type, callback, _return_http_data_only,
+                                        _preload_content)
+
+        # Streamed responses, as for watches and raw mode, cannot be shared
+        if method == 'GET' and _preload_content and callback is None and self._coalescing():
+            # A caller only waits for a call with the same timeout, never past its own
+            timeout = tuple(_request_timeout) if isinstance(_request_timeout, list) else _request_timeout
+            key = (url, tuple(query_params or ()), tuple(sorted((header_params or {}).items())), response_type,
+                   _return_http_data_only, timeout)
             try:
-                klass = getattr(models, klass)
-            except AttributeError:
-                klass = getattr(k8s_models, klass)
-            return super(ApiClient, self).__deserialize_model(data, klass)
+                hash(key)
+            except TypeError:
+                return call()
+            return self.singleflight.do(key, call)
+        return call()
+
+    def prepare_request(self, resource_path, path_params=None, query_params=None, header_params=None, body=None,
+                        post_params=None, files=None, auth_settings=None, collection_formats=None):
+        """
+        Serialize the parameters of an API call, as ApiClient.call_api() does before sending the request.
+
+        :return: tuple of url, query_params, header_params, post_params and body, ready to pass to request()
+        """
+        header_params = header_params or {}
+        header_params.update(self.default_headers)
+        if self.cookie:
+            header_params['Cookie'] = self.cookie
+        if header_params:
+            header_params = self.sanitize_for_serialization(header_params)
+            header_params = dict(self.parameters_to_tuples(header_params, collection_formats))
+
+        if path_params:
+            path_params = self.sanitize_for_serialization(path_params)
+            path_params = self.parameters_to_tuples(path_params, collection_formats)
+            for k, v in path_params:
+                resource_path = resource_path.replace('{%s}' % k, quote(str(v)))
+
+        if query_params:
+            query_params = self.sanitize_for_serialization(query_params)
+            query_params = self.parameters_to_tuples(query_params, collection_formats)
+
+        if post_params or files:
+            post_params = self.prepare_post_parameters(post_params, files)
+            post_params = self.sanitize_for_serialization(post_params)
+            post_params = self.parameters_to_tuples(post_params, collection_formats)
+
+        self.update_params_for_auth(header_params, query_params, auth_settings)
+
+        if body:
+            body = self.sanitize_for_serialization(body)
+
+        return self.host + resource_path, query_params, header_params, post_params, body
+
+    def handle_response(self, response_data, response_type=None, callback=None, _return_http_data_only=None,
+                        _preload_content=True):
+        """ Deserialize the response to an API call, returning what ApiClient.call_api() returns """
+        self.last_response = response_data
+
+        return_data = response_data
+        if _preload_content:
+            return_data = self.deserialize(response_data, response_type) if response_type else None
+
+        if _return_http_data_only:
+            result = return_data
+        else:
+            result = (return_data, response_data.status, response_data.getheaders())
+        if callback:
+            callback(result)
+        else:
+            return result
+
 
+def _run_callback(callback, call, *args):
+    """ Make an API call and pass its result to callback, on the calling executor thread """
+    try:
+        result = call(*args)
+    except Exception as exc:
+        logger.error('API call failed: {}'.format(exc))
+        raise
+    callback(result)
+    return result
@@ -1,30 +1,32 @@
 from __future__ import absolute_import
 
-# import apis into api package
-from .apps_openshift_io_api import AppsOpenshiftIoApi
-from .apps_openshift_io_v1_api import AppsOpenshiftIoV1Api
-from .authorization_openshift_io_api import AuthorizationOpenshiftIoApi
-from .authorization_openshift_io_v1_api import AuthorizationOpenshiftIoV1Api
-from .build_openshift_io_api import BuildOpenshiftIoApi
-from .build_openshift_io_v1_api import BuildOpenshiftIoV1Api
-from .image_openshift_io_api import ImageOpenshiftIoApi
-from .image_openshift_io_v1_api import ImageOpenshiftIoV1Api
-from .network_openshift_io_api import NetworkOpenshiftIoApi
-from .network_openshift_io_v1_api import NetworkOpenshiftIoV1Api
-from .oapi_api import OapiApi
-from .oauth_openshift_io_api import OauthOpenshiftIoApi
-from .oauth_openshift_io_v1_api import OauthOpenshiftIoV1Api
-from .osapi_api import OsapiApi
-from .project_openshift_io_api import ProjectOpenshiftIoApi
-from .project_openshift_io_v1_api import ProjectOpenshiftIoV1Api
-from .quota_openshift_io_api import QuotaOpenshiftIoApi
-from .quota_openshift_io_v1_api import QuotaOpenshiftIoV1Api
-from .route_openshift_io_api import RouteOpenshiftIoApi
-from .route_openshift_io_v1_api import RouteOpenshiftIoV1Api
-from .security_openshift_io_api import SecurityOpenshiftIoApi
-from .security_openshift_io_v1_api import SecurityOpenshiftIoV1Api
-from .template_openshift_io_api import TemplateOpenshiftIoApi
-from .template_openshift_io_v1_api import TemplateOpenshiftIoV1Api
-from .template_openshift_io_api import TemplateOpenshiftIoApi
-from .user_openshift_io_api import UserOpenshiftIoApi
-from .user_openshift_io_v1_api import UserOpenshiftIoV1Api
\ No newline at end of file
+from ..lazy import lazy_module
+
+lazy_module(__name__, {
+    'AppsOpenshiftIoApi': '.apps_openshift_io_api',
+    'AppsOpenshiftIoV1Api': '.apps_openshift_io_v1_api',
+    'AuthorizationOpenshiftIoApi': '.authorization_openshift_io_api',
+    'AuthorizationOpenshiftIoV1Api': '.authorization_openshift_io_v1_api',
+    'BuildOpenshiftIoApi': '.build_openshift_io_api',
+    'BuildOpenshiftIoV1Api': '.build_openshift_io_v1_api',
+    'ImageOpenshiftIoApi': '.image_openshift_io_api',
+    'ImageOpenshiftIoV1Api': '.image_openshift_io_v1_api',
+    'NetworkOpenshiftIoApi': '.network_openshift_io_api',
+    'NetworkOpenshiftIoV1Api': '.network_openshift_io_v1_api',
+    'OapiApi': '.oapi_api',
+    'OauthOpenshiftIoApi': '.oauth_openshift_io_api',
+    'OauthOpenshiftIoV1Api': '.oauth_openshift_io_v1_api',
+    'OsapiApi': '.osapi_api',
+    'ProjectOpenshiftIoApi': '.project_openshift_io_api',
+    'ProjectOpenshiftIoV1Api': '.project_openshift_io_v1_api',
+    'QuotaOpenshiftIoApi': '.quota_openshift_io_api',
+    'QuotaOpenshiftIoV1Api': '.quota_openshift_io_v1_api',
+    'RouteOpenshiftIoApi': '.route_openshift_io_api',
+    'RouteOpenshiftIoV1Api': '.route_openshift_io_v1_api',
+    'SecurityOpenshiftIoApi': '.security_openshift_io_api',
+    'SecurityOpenshiftIoV1Api': '.security_openshift_io_v1_api',
+    'TemplateOpenshiftIoApi': '.template_openshift_io_api',
+    'TemplateOpenshiftIoV1Api': '.template_openshift_io_v1_api',
+    'UserOpenshiftIoApi': '.user_openshift_io_api',
+    'UserOpenshiftIoV1Api': '.user_openshift_io_v1_api',
+})
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_CONCURRENCY = 8
+
+_shared_executor = None
+_shared_lock = threading.Lock()
+
+
+def shared_executor(max_workers=None):
+    """
+    Return the process-wide thread pool that runs API calls made in the background, creating it on
+    first use with max_workers threads, DEFAULT_MAX_WORKERS by default.
+    """
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS)
+        return _shared_executor
+
+
+def shutdown_shared_executor(wait=True):
+    """ Shut down the shared thread pool. The next shared_executor() call creates a new one. """
+    global _shared_executor
+    with _shared_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown(wait)
+
+
+class ClientExecutor(object):
+    """
+    Runs one client's calls on a shared thread pool, at most max_concurrency at a time.
+
+    Calls beyond the limit wait in the client's own queue, so one busy client cannot occupy every
+    thread of the pool. submit() returns a concurrent.futures.Future straight away. A call still
+    queued can be cancelled.
+    """
+
+    def __init__(self, executor=None, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param executor: thread pool the calls run on. The default is the shared pool.
+        :param max_concurrency: most calls running on the pool at once
+        """
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'max_queued': 0}
+        self._queue = deque()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """ Schedule fn(*args, **kwargs), returning a Future for its result """
+        future = Future()
+        item = (future, fn, args, kwargs)
+        with self._lock:
+            self.counters['submitted'] += 1
+            if self._running >= self.max_concurrency:
+                self._queue.append(item)
+                self.counters['max_queued'] = max(self.counters['max_queued'], len(self._queue))
+                return future
+            self._running += 1
+        self._start(item)
+        return future
+
+    def stats(self):
+        """
+        Return a dict of counters, plus the current queue depth: 'queued' calls waiting for this
+        client's limit, 'running' calls, and 'pool_queued' calls of every client waiting for a thread.
+        """
+        with self._lock:
+            result = dict(self.counters, queued=len(self._queue), running=self._running)
+        work_queue = getattr(self._pool(), '_work_queue', None)
+        result['pool_queued'] = work_queue.qsize() if work_queue is not None else 0
+        return result
+
+    def _pool(self):
+        return self.executor if self.executor is not None else shared_executor()
+
+    def _start(self, item):
+        try:
+            self._pool().submit(self._run, item)
+        except Exception as exc:
+            # The pool is shut down; fail this call and move on to the next
+            item[0].set_exception(exc)
+            self._finished('failed')
+
+    def _run(self, item):
+        future, fn, args, kwargs = item
+        if not future.set_running_or_notify_cancel():
+            self._finished('cancelled')
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            # Count before resolving the future, so stats() is current for whoever waits on it
+            self._finished('failed')
+            future.set_exception(exc)
+        else:
+            self._finished('completed')
+            future.set_result(result)
+
+    def _finished(self, outcome):
+        with self._lock:
+            self.counters[outcome] += 1
+            if not self._queue:
+                self._running -= 1
+                return
+            item = self._queue.popleft()
+        self._start(item)
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+from ..lazy import LazyModule, lazy_module  # noqa: F401
@@ -10,213 +10,215 @@
     Generated by: https://github.com/swagger-api/swagger-codegen.git
 """
 
-
 from __future__ import absolute_import
 
-# import models into model package
-from .unversioned_server_address_by_client_cidr import UnversionedServerAddressByClientCIDR
-from .v1_applied_cluster_resource_quota import V1AppliedClusterResourceQuota
-from .v1_applied_cluster_resource_quota_list import V1AppliedClusterResourceQuotaList
-from .v1_binary_build_source import V1BinaryBuildSource
-from .v1_build import V1Build
-from .v1_build_config import V1BuildConfig
-from .v1_build_config_list import V1BuildConfigList
-from .v1_build_config_spec import V1BuildConfigSpec
-from .v1_build_config_status import V1BuildConfigStatus
-from .v1_build_list import V1BuildList
-from .v1_build_log import V1BuildLog
-from .v1_build_output import V1BuildOutput
-from .v1_build_post_commit_spec import V1BuildPostCommitSpec
-from .v1_build_request import V1BuildRequest
-from .v1_build_source import V1BuildSource
-from .v1_build_spec import V1BuildSpec
-from .v1_build_status import V1BuildStatus
-from .v1_build_status_output import V1BuildStatusOutput
-from .v1_build_status_output_to import V1BuildStatusOutputTo
-from .v1_build_strategy import V1BuildStrategy
-from .v1_build_trigger_cause import V1BuildTriggerCause
-from .v1_build_trigger_policy import V1BuildTriggerPolicy
-from .v1_cluster_network import V1ClusterNetwork
-from .v1_cluster_network_list import V1ClusterNetworkList
-from .v1_cluster_policy import V1ClusterPolicy
-from .v1_cluster_policy_binding import V1ClusterPolicyBinding
-from .v1_cluster_policy_binding_list import V1ClusterPolicyBindingList
-from .v1_cluster_policy_list import V1ClusterPolicyList
-from .v1_cluster_resource_quota import V1ClusterResourceQuota
-from .v1_cluster_resource_quota_list import V1ClusterResourceQuotaList
-from .v1_cluster_resource_quota_selector import V1ClusterResourceQuotaSelector
-from .v1_cluster_resource_quota_spec import V1ClusterResourceQuotaSpec
-from .v1_cluster_resource_quota_status import V1ClusterResourceQuotaStatus
-from .v1_cluster_role import V1ClusterRole
-from .v1_cluster_role_binding import V1ClusterRoleBinding
-from .v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from .v1_cluster_role_list import V1ClusterRoleList
-from .v1_cluster_role_scope_restriction import V1ClusterRoleScopeRestriction
-from .v1_custom_build_strategy import V1CustomBuildStrategy
-from .v1_custom_deployment_strategy_params import V1CustomDeploymentStrategyParams
-from .v1_deployment_cause import V1DeploymentCause
-from .v1_deployment_cause_image_trigger import V1DeploymentCauseImageTrigger
-from .v1_deployment_condition import V1DeploymentCondition
-from .v1_deployment_config import V1DeploymentConfig
-from .v1_deployment_config_list import V1DeploymentConfigList
-from .v1_deployment_config_rollback import V1DeploymentConfigRollback
-from .v1_deployment_config_rollback_spec import V1DeploymentConfigRollbackSpec
-from .v1_deployment_config_spec import V1DeploymentConfigSpec
-from .v1_deployment_config_status import V1DeploymentConfigStatus
-from .v1_deployment_details import V1DeploymentDetails
-from .v1_deployment_log import V1DeploymentLog
-from .v1_deployment_request import V1DeploymentRequest
-from .v1_deployment_strategy import V1DeploymentStrategy
-from .v1_deployment_trigger_image_change_params import V1DeploymentTriggerImageChangeParams
-from .v1_deployment_trigger_policy import V1DeploymentTriggerPolicy
-from .v1_deprecated_downward_api_volume_file import V1DeprecatedDownwardAPIVolumeFile
-from .v1_deprecated_downward_api_volume_source import V1DeprecatedDownwardAPIVolumeSource
-from .v1_docker_build_strategy import V1DockerBuildStrategy
-from .v1_docker_strategy_options import V1DockerStrategyOptions
-from .v1_egress_network_policy import V1EgressNetworkPolicy
-from .v1_egress_network_policy_list import V1EgressNetworkPolicyList
-from .v1_egress_network_policy_peer import V1EgressNetworkPolicyPeer
-from .v1_egress_network_policy_rule import V1EgressNetworkPolicyRule
-from .v1_egress_network_policy_spec import V1EgressNetworkPolicySpec
-from .v1_exec_new_pod_hook import V1ExecNewPodHook
-from .v1_fs_group_strategy_options import V1FSGroupStrategyOptions
-from .v1_generic_web_hook_cause import V1GenericWebHookCause
-from .v1_git_build_source import V1GitBuildSource
-from .v1_git_hub_web_hook_cause import V1GitHubWebHookCause
-from .v1_git_source_revision import V1GitSourceRevision
-from .v1_group import V1Group
-from .v1_group_list import V1GroupList
-from .v1_group_restriction import V1GroupRestriction
-from .v1_host_subnet import V1HostSubnet
-from .v1_host_subnet_list import V1HostSubnetList
-from .v1_id_range import V1IDRange
-from .v1_identity import V1Identity
-from .v1_identity_list import V1IdentityList
-from .v1_image import V1Image
-from .v1_image_change_cause import V1ImageChangeCause
-from .v1_image_change_trigger import V1ImageChangeTrigger
-from .v1_image_import_spec import V1ImageImportSpec
-from .v1_image_import_status import V1ImageImportStatus
-from .v1_image_label import V1ImageLabel
-from .v1_image_layer import V1ImageLayer
-from .v1_image_list import V1ImageList
-from .v1_image_signature import V1ImageSignature
-from .v1_image_source import V1ImageSource
-from .v1_image_source_path import V1ImageSourcePath
-from .v1_image_stream import V1ImageStream
-from .v1_image_stream_image import V1ImageStreamImage
-from .v1_image_stream_import import V1ImageStreamImport
-from .v1_image_stream_import_spec import V1ImageStreamImportSpec
-from .v1_image_stream_import_status import V1ImageStreamImportStatus
-from .v1_image_stream_list import V1ImageStreamList
-from .v1_image_stream_mapping import V1ImageStreamMapping
-from .v1_image_stream_spec import V1ImageStreamSpec
-from .v1_image_stream_status import V1ImageStreamStatus
-from .v1_image_stream_tag import V1ImageStreamTag
-from .v1_image_stream_tag_list import V1ImageStreamTagList
-from .v1_jenkins_pipeline_build_strategy import V1JenkinsPipelineBuildStrategy
-from .v1_lifecycle_hook import V1LifecycleHook
-from .v1_local_resource_access_review import V1LocalResourceAccessReview
-from .v1_local_subject_access_review import V1LocalSubjectAccessReview
-from .v1_named_cluster_role import V1NamedClusterRole
-from .v1_named_cluster_role_binding import V1NamedClusterRoleBinding
-from .v1_named_role import V1NamedRole
-from .v1_named_role_binding import V1NamedRoleBinding
-from .v1_named_tag_event_list import V1NamedTagEventList
-from .v1_net_namespace import V1NetNamespace
-from .v1_net_namespace_list import V1NetNamespaceList
-from .v1_o_auth_access_token import V1OAuthAccessToken
-from .v1_o_auth_access_token_list import V1OAuthAccessTokenList
-from .v1_o_auth_authorize_token import V1OAuthAuthorizeToken
-from .v1_o_auth_authorize_token_list import V1OAuthAuthorizeTokenList
-from .v1_o_auth_client import V1OAuthClient
-from .v1_o_auth_client_authorization import V1OAuthClientAuthorization
-from .v1_o_auth_client_authorization_list import V1OAuthClientAuthorizationList
-from .v1_o_auth_client_list import V1OAuthClientList
-from .v1_parameter import V1Parameter
-from .v1_pod_security_policy_review import V1PodSecurityPolicyReview
-from .v1_pod_security_policy_review_spec import V1PodSecurityPolicyReviewSpec
-from .v1_pod_security_policy_review_status import V1PodSecurityPolicyReviewStatus
-from .v1_pod_security_policy_self_subject_review import V1PodSecurityPolicySelfSubjectReview
-from .v1_pod_security_policy_self_subject_review_spec import V1PodSecurityPolicySelfSubjectReviewSpec
-from .v1_pod_security_policy_subject_review import V1PodSecurityPolicySubjectReview
-from .v1_pod_security_policy_subject_review_spec import V1PodSecurityPolicySubjectReviewSpec
-from .v1_pod_security_policy_subject_review_status import V1PodSecurityPolicySubjectReviewStatus
-from .v1_policy import V1Policy
-from .v1_policy_binding import V1PolicyBinding
-from .v1_policy_binding_list import V1PolicyBindingList
-from .v1_policy_list import V1PolicyList
-from .v1_policy_rule import V1PolicyRule
-from .v1_project import V1Project
-from .v1_project_list import V1ProjectList
-from .v1_project_request import V1ProjectRequest
-from .v1_project_spec import V1ProjectSpec
-from .v1_project_status import V1ProjectStatus
-from .v1_recreate_deployment_strategy_params import V1RecreateDeploymentStrategyParams
-from .v1_repository_import_spec import V1RepositoryImportSpec
-from .v1_repository_import_status import V1RepositoryImportStatus
-from .v1_resource_access_review import V1ResourceAccessReview
-from .v1_resource_quota_status_by_namespace import V1ResourceQuotaStatusByNamespace
-from .v1_role import V1Role
-from .v1_role_binding import V1RoleBinding
-from .v1_role_binding_list import V1RoleBindingList
-from .v1_role_binding_restriction import V1RoleBindingRestriction
-from .v1_role_binding_restriction_list import V1RoleBindingRestrictionList
-from .v1_role_binding_restriction_spec import V1RoleBindingRestrictionSpec
-from .v1_role_list import V1RoleList
-from .v1_rolling_deployment_strategy_params import V1RollingDeploymentStrategyParams
-from .v1_route import V1Route
-from .v1_route_ingress import V1RouteIngress
-from .v1_route_ingress_condition import V1RouteIngressCondition
-from .v1_route_list import V1RouteList
-from .v1_route_port import V1RoutePort
-from .v1_route_spec import V1RouteSpec
-from .v1_route_status import V1RouteStatus
-from .v1_route_target_reference import V1RouteTargetReference
-from .v1_run_as_user_strategy_options import V1RunAsUserStrategyOptions
-from .v1_se_linux_context_strategy_options import V1SELinuxContextStrategyOptions
-from .v1_scope_restriction import V1ScopeRestriction
-from .v1_secret_build_source import V1SecretBuildSource
-from .v1_secret_spec import V1SecretSpec
-from .v1_security_context_constraints import V1SecurityContextConstraints
-from .v1_security_context_constraints_list import V1SecurityContextConstraintsList
-from .v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from .v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from .v1_service_account_pod_security_policy_review_status import V1ServiceAccountPodSecurityPolicyReviewStatus
-from .v1_service_account_reference import V1ServiceAccountReference
-from .v1_service_account_restriction import V1ServiceAccountRestriction
-from .v1_signature_condition import V1SignatureCondition
-from .v1_signature_issuer import V1SignatureIssuer
-from .v1_signature_subject import V1SignatureSubject
-from .v1_source_build_strategy import V1SourceBuildStrategy
-from .v1_source_control_user import V1SourceControlUser
-from .v1_source_revision import V1SourceRevision
-from .v1_subject_access_review import V1SubjectAccessReview
-from .v1_subject_rules_review import V1SubjectRulesReview
-from .v1_subject_rules_review_spec import V1SubjectRulesReviewSpec
-from .v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from .v1_supplemental_groups_strategy_options import V1SupplementalGroupsStrategyOptions
-from .v1_tls_config import V1TLSConfig
-from .v1_tag_event import V1TagEvent
-from .v1_tag_event_condition import V1TagEventCondition
-from .v1_tag_image_hook import V1TagImageHook
-from .v1_tag_import_policy import V1TagImportPolicy
-from .v1_tag_reference import V1TagReference
-from .v1_tag_reference_policy import V1TagReferencePolicy
-from .v1_template import V1Template
-from .v1_template_list import V1TemplateList
-from .v1_user import V1User
-from .v1_user_identity_mapping import V1UserIdentityMapping
-from .v1_user_list import V1UserList
-from .v1_user_restriction import V1UserRestriction
-from .v1_web_hook_trigger import V1WebHookTrigger
-from .v1beta1_fs_group_strategy_options import V1beta1FSGroupStrategyOptions
-from .v1beta1_host_port_range import V1beta1HostPortRange
-from .v1beta1_id_range import V1beta1IDRange
-from .v1beta1_ingress_tls import V1beta1IngressTLS
-from .v1beta1_pod_security_policy import V1beta1PodSecurityPolicy
-from .v1beta1_pod_security_policy_list import V1beta1PodSecurityPolicyList
-from .v1beta1_pod_security_policy_spec import V1beta1PodSecurityPolicySpec
-from .v1beta1_run_as_user_strategy_options import V1beta1RunAsUserStrategyOptions
-from .v1beta1_se_linux_strategy_options import V1beta1SELinuxStrategyOptions
-from .v1beta1_supplemental_groups_strategy_options import V1beta1SupplementalGroupsStrategyOptions
\ No newline at end of file
+from ..lazy import lazy_module
+
+lazy_module(__name__, {
+    'UnversionedServerAddressByClientCIDR': '.unversioned_server_address_by_client_cidr',
+    'V1AppliedClusterResourceQuota': '.v1_applied_cluster_resource_quota',
+    'V1AppliedClusterResourceQuotaList': '.v1_applied_cluster_resource_quota_list',
+    'V1BinaryBuildSource': '.v1_binary_build_source',
+    'V1Build': '.v1_build',
+    'V1BuildConfig': '.v1_build_config',
+    'V1BuildConfigList': '.v1_build_config_list',
+    'V1BuildConfigSpec': '.v1_build_config_spec',
+    'V1BuildConfigStatus': '.v1_build_config_status',
+    'V1BuildList': '.v1_build_list',
+    'V1BuildLog': '.v1_build_log',
+    'V1BuildOutput': '.v1_build_output',
+    'V1BuildPostCommitSpec': '.v1_build_post_commit_spec',
+    'V1BuildRequest': '.v1_build_request',
+    'V1BuildSource': '.v1_build_source',
+    'V1BuildSpec': '.v1_build_spec',
+    'V1BuildStatus': '.v1_build_status',
+    'V1BuildStatusOutput': '.v1_build_status_output',
+    'V1BuildStatusOutputTo': '.v1_build_status_output_to',
+    'V1BuildStrategy': '.v1_build_strategy',
+    'V1BuildTriggerCause': '.v1_build_trigger_cause',
+    'V1BuildTriggerPolicy': '.v1_build_trigger_policy',
+    'V1ClusterNetwork': '.v1_cluster_network',
+    'V1ClusterNetworkList': '.v1_cluster_network_list',
+    'V1ClusterPolicy': '.v1_cluster_policy',
+    'V1ClusterPolicyBinding': '.v1_cluster_policy_binding',
+    'V1ClusterPolicyBindingList': '.v1_cluster_policy_binding_list',
+    'V1ClusterPolicyList': '.v1_cluster_policy_list',
+    'V1ClusterResourceQuota': '.v1_cluster_resource_quota',
+    'V1ClusterResourceQuotaList': '.v1_cluster_resource_quota_list',
+    'V1ClusterResourceQuotaSelector': '.v1_cluster_resource_quota_selector',
+    'V1ClusterResourceQuotaSpec': '.v1_cluster_resource_quota_spec',
+    'V1ClusterResourceQuotaStatus': '.v1_cluster_resource_quota_status',
+    'V1ClusterRole': '.v1_cluster_role',
+    'V1ClusterRoleBinding': '.v1_cluster_role_binding',
+    'V1ClusterRoleBindingList': '.v1_cluster_role_binding_list',
+    'V1ClusterRoleList': '.v1_cluster_role_list',
+    'V1ClusterRoleScopeRestriction': '.v1_cluster_role_scope_restriction',
+    'V1CustomBuildStrategy': '.v1_custom_build_strategy',
+    'V1CustomDeploymentStrategyParams': '.v1_custom_deployment_strategy_params',
+    'V1DeploymentCause': '.v1_deployment_cause',
+    'V1DeploymentCauseImageTrigger': '.v1_deployment_cause_image_trigger',
+    'V1DeploymentCondition': '.v1_deployment_condition',
+    'V1DeploymentConfig': '.v1_deployment_config',
+    'V1DeploymentConfigList': '.v1_deployment_config_list',
+    'V1DeploymentConfigRollback': '.v1_deployment_config_rollback',
+    'V1DeploymentConfigRollbackSpec': '.v1_deployment_config_rollback_spec',
+    'V1DeploymentConfigSpec': '.v1_deployment_config_spec',
+    'V1DeploymentConfigStatus': '.v1_deployment_config_status',
+    'V1DeploymentDetails': '.v1_deployment_details',
+    'V1DeploymentLog': '.v1_deployment_log',
+    'V1DeploymentRequest': '.v1_deployment_request',
+    'V1DeploymentStrategy': '.v1_deployment_strategy',
+    'V1DeploymentTriggerImageChangeParams': '.v1_deployment_trigger_image_change_params',
+    'V1DeploymentTriggerPolicy': '.v1_deployment_trigger_policy',
+    'V1DeprecatedDownwardAPIVolumeFile': '.v1_deprecated_downward_api_volume_file',
+    'V1DeprecatedDownwardAPIVolumeSource': '.v1_deprecated_downward_api_volume_source',
+    'V1DockerBuildStrategy': '.v1_docker_build_strategy',
+    'V1DockerStrategyOptions': '.v1_docker_strategy_options',
+    'V1EgressNetworkPolicy': '.v1_egress_network_policy',
+    'V1EgressNetworkPolicyList': '.v1_egress_network_policy_list',
+    'V1EgressNetworkPolicyPeer': '.v1_egress_network_policy_peer',
+    'V1EgressNetworkPolicyRule': '.v1_egress_network_policy_rule',
+    'V1EgressNetworkPolicySpec': '.v1_egress_network_policy_spec',
+    'V1ExecNewPodHook': '.v1_exec_new_pod_hook',
+    'V1FSGroupStrategyOptions': '.v1_fs_group_strategy_options',
+    'V1GenericWebHookCause': '.v1_generic_web_hook_cause',
+    'V1GitBuildSource': '.v1_git_build_source',
+    'V1GitHubWebHookCause': '.v1_git_hub_web_hook_cause',
+    'V1GitSourceRevision': '.v1_git_source_revision',
+    'V1Group': '.v1_group',
+    'V1GroupList': '.v1_group_list',
+    'V1GroupRestriction': '.v1_group_restriction',
+    'V1HostSubnet': '.v1_host_subnet',
+    'V1HostSubnetList': '.v1_host_subnet_list',
+    'V1IDRange': '.v1_id_range',
+    'V1Identity': '.v1_identity',
+    'V1IdentityList': '.v1_identity_list',
+    'V1Image': '.v1_image',
+    'V1ImageChangeCause': '.v1_image_change_cause',
+    'V1ImageChangeTrigger': '.v1_image_change_trigger',
+    'V1ImageImportSpec': '.v1_image_import_spec',
+    'V1ImageImportStatus': '.v1_image_import_status',
+    'V1ImageLabel': '.v1_image_label',
+    'V1ImageLayer': '.v1_image_layer',
+    'V1ImageList': '.v1_image_list',
+    'V1ImageSignature': '.v1_image_signature',
+    'V1ImageSource': '.v1_image_source',
+    'V1ImageSourcePath': '.v1_image_source_path',
+    'V1ImageStream': '.v1_image_stream',
+    'V1ImageStreamImage': '.v1_image_stream_image',
+    'V1ImageStreamImport': '.v1_image_stream_import',
+    'V1ImageStreamImportSpec': '.v1_image_stream_import_spec',
+    'V1ImageStreamImportStatus': '.v1_image_stream_import_status',
+    'V1ImageStreamList': '.v1_image_stream_list',
+    'V1ImageStreamMapping': '.v1_image_stream_mapping',
+    'V1ImageStreamSpec': '.v1_image_stream_spec',
+    'V1ImageStreamStatus': '.v1_image_stream_status',
+    'V1ImageStreamTag': '.v1_image_stream_tag',
+    'V1ImageStreamTagList': '.v1_image_stream_tag_list',
+    'V1JenkinsPipelineBuildStrategy': '.v1_jenkins_pipeline_build_strategy',
+    'V1LifecycleHook': '.v1_lifecycle_hook',
+    'V1LocalResourceAccessReview': '.v1_local_resource_access_review',
+    'V1LocalSubjectAccessReview': '.v1_local_subject_access_review',
+    'V1NamedClusterRole': '.v1_named_cluster_role',
+    'V1NamedClusterRoleBinding': '.v1_named_cluster_role_binding',
+    'V1NamedRole': '.v1_named_role',
+    'V1NamedRoleBinding': '.v1_named_role_binding',
+    'V1NamedTagEventList': '.v1_named_tag_event_list',
+    'V1NetNamespace': '.v1_net_namespace',
+    'V1NetNamespaceList': '.v1_net_namespace_list',
+    'V1OAuthAccessToken': '.v1_o_auth_access_token',
+    'V1OAuthAccessTokenList': '.v1_o_auth_access_token_list',
+    'V1OAuthAuthorizeToken': '.v1_o_auth_authorize_token',
+    'V1OAuthAuthorizeTokenList': '.v1_o_auth_authorize_token_list',
+    'V1OAuthClient': '.v1_o_auth_client',
+    'V1OAuthClientAuthorization': '.v1_o_auth_client_authorization',
+    'V1OAuthClientAuthorizationList': '.v1_o_auth_client_authorization_list',
+    'V1OAuthClientList': '.v1_o_auth_client_list',
+    'V1Parameter': '.v1_parameter',
+    'V1PodSecurityPolicyReview': '.v1_pod_security_policy_review',
+    'V1PodSecurityPolicyReviewSpec': '.v1_pod_security_policy_review_spec',
+    'V1PodSecurityPolicyReviewStatus': '.v1_pod_security_policy_review_status',
+    'V1PodSecurityPolicySelfSubjectReview': '.v1_pod_security_policy_self_subject_review',
+    'V1PodSecurityPolicySelfSubjectReviewSpec': '.v1_pod_security_policy_self_subject_review_spec',
+    'V1PodSecurityPolicySubjectReview': '.v1_pod_security_policy_subject_review',
+    'V1PodSecurityPolicySubjectReviewSpec': '.v1_pod_security_policy_subject_review_spec',
+    'V1PodSecurityPolicySubjectReviewStatus': '.v1_pod_security_policy_subject_review_status',
+    'V1Policy': '.v1_policy',
+    'V1PolicyBinding': '.v1_policy_binding',
+    'V1PolicyBindingList': '.v1_policy_binding_list',
+    'V1PolicyList': '.v1_policy_list',
+    'V1PolicyRule': '.v1_policy_rule',
+    'V1Project': '.v1_project',
+    'V1ProjectList': '.v1_project_list',
+    'V1ProjectRequest': '.v1_project_request',
+    'V1ProjectSpec': '.v1_project_spec',
+    'V1ProjectStatus': '.v1_project_status',
+    'V1RecreateDeploymentStrategyParams': '.v1_recreate_deployment_strategy_params',
+    'V1RepositoryImportSpec': '.v1_repository_import_spec',
+    'V1RepositoryImportStatus': '.v1_repository_import_status',
+    'V1ResourceAccessReview': '.v1_resource_access_review',
+    'V1ResourceQuotaStatusByNamespace': '.v1_resource_quota_status_by_namespace',
+    'V1Role': '.v1_role',
+    'V1RoleBinding': '.v1_role_binding',
+    'V1RoleBindingList': '.v1_role_binding_list',
+    'V1RoleBindingRestriction': '.v1_role_binding_restriction',
+    'V1RoleBindingRestrictionList': '.v1_role_binding_restriction_list',
+    'V1RoleBindingRestrictionSpec': '.v1_role_binding_restriction_spec',
+    'V1RoleList': '.v1_role_list',
+    'V1RollingDeploymentStrategyParams': '.v1_rolling_deployment_strategy_params',
+    'V1Route': '.v1_route',
+    'V1RouteIngress': '.v1_route_ingress',
+    'V1RouteIngressCondition': '.v1_route_ingress_condition',
+    'V1RouteList': '.v1_route_list',
+    'V1RoutePort': '.v1_route_port',
+    'V1RouteSpec': '.v1_route_spec',
+    'V1RouteStatus': '.v1_route_status',
+    'V1RouteTargetReference': '.v1_route_target_reference',
+    'V1RunAsUserStrategyOptions': '.v1_run_as_user_strategy_options',
+    'V1SELinuxContextStrategyOptions': '.v1_se_linux_context_strategy_options',
+    'V1ScopeRestriction': '.v1_scope_restriction',
+    'V1SecretBuildSource': '.v1_secret_build_source',
+    'V1SecretSpec': '.v1_secret_spec',
+    'V1SecurityContextConstraints': '.v1_security_context_constraints',
+    'V1SecurityContextConstraintsList': '.v1_security_context_constraints_list',
+    'V1SelfSubjectRulesReview': '.v1_self_subject_rules_review',
+    'V1SelfSubjectRulesReviewSpec': '.v1_self_subject_rules_review_spec',
+    'V1ServiceAccountPodSecurityPolicyReviewStatus': '.v1_service_account_pod_security_policy_review_status',
+    'V1ServiceAccountReference': '.v1_service_account_reference',
+    'V1ServiceAccountRestriction': '.v1_service_account_restriction',
+    'V1SignatureCondition': '.v1_signature_condition',
+    'V1SignatureIssuer': '.v1_signature_issuer',
+    'V1SignatureSubject': '.v1_signature_subject',
+    'V1SourceBuildStrategy': '.v1_source_build_strategy',
+    'V1SourceControlUser': '.v1_source_control_user',
+    'V1SourceRevision': '.v1_source_revision',
+    'V1SubjectAccessReview': '.v1_subject_access_review',
+    'V1SubjectRulesReview': '.v1_subject_rules_review',
+    'V1SubjectRulesReviewSpec': '.v1_subject_rules_review_spec',
+    'V1SubjectRulesReviewStatus': '.v1_subject_rules_review_status',
+    'V1SupplementalGroupsStrategyOptions': '.v1_supplemental_groups_strategy_options',
+    'V1TLSConfig': '.v1_tls_config',
+    'V1TagEvent': '.v1_tag_event',
+    'V1TagEventCondition': '.v1_tag_event_condition',
+    'V1TagImageHook': '.v1_tag_image_hook',
+    'V1TagImportPolicy': '.v1_tag_import_policy',
+    'V1TagReference': '.v1_tag_reference',
+    'V1TagReferencePolicy': '.v1_tag_reference_policy',
+    'V1Template': '.v1_template',
+    'V1TemplateList': '.v1_template_list',
+    'V1User': '.v1_user',
+    'V1UserIdentityMapping': '.v1_user_identity_mapping',
+    'V1UserList': '.v1_user_list',
+    'V1UserRestriction': '.v1_user_restriction',
+    'V1WebHookTrigger': '.v1_web_hook_trigger',
+    'V1beta1FSGroupStrategyOptions': '.v1beta1_fs_group_strategy_options',
+    'V1beta1HostPortRange': '.v1beta1_host_port_range',
+    'V1beta1IDRange': '.v1beta1_id_range',
+    'V1beta1IngressTLS': '.v1beta1_ingress_tls',
+    'V1beta1PodSecurityPolicy': '.v1beta1_pod_security_policy',
+    'V1beta1PodSecurityPolicyList': '.v1beta1_pod_security_policy_list',
+    'V1beta1PodSecurityPolicySpec': '.v1beta1_pod_security_policy_spec',
+    'V1beta1RunAsUserStrategyOptions': '.v1beta1_run_as_user_strategy_options',
+    'V1beta1SELinuxStrategyOptions': '.v1beta1_se_linux_strategy_options',
+    'V1beta1SupplementalGroupsStrategyOptions': '.v1beta1_supplemental_groups_strategy_options',
+})
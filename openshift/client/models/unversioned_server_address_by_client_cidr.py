@@ -21,6 +21,21 @@ class UnversionedServerAddressByClientCIDR(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'client_cidr': 'str',
+        'server_address': 'str'
+    }
+
+    attribute_map = {
+        'client_cidr': 'clientCIDR',
+        'server_address': 'serverAddress'
+    }
+
+    __slots__ = (
+        '_client_cidr',
+        '_server_address',
+    )
+
     def __init__(self, client_cidr=None, server_address=None):
         """
         UnversionedServerAddressByClientCIDR - a model defined in Swagger
@@ -30,16 +45,6 @@ class UnversionedServerAddressByClientCIDR(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'client_cidr': 'str',
-            'server_address': 'str'
-        }
-
-        self.attribute_map = {
-            'client_cidr': 'clientCIDR',
-            'server_address': 'serverAddress'
-        }
-
         self._client_cidr = client_cidr
         self._server_address = server_address
 
@@ -138,10 +143,26 @@ class UnversionedServerAddressByClientCIDR(object):
         if not isinstance(other, UnversionedServerAddressByClientCIDR):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,48 @@ class V1BuildConfigSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'completion_deadline_seconds': 'int',
+        'node_selector': 'dict(str, str)',
+        'output': 'V1BuildOutput',
+        'post_commit': 'V1BuildPostCommitSpec',
+        'resources': 'V1ResourceRequirements',
+        'revision': 'V1SourceRevision',
+        'run_policy': 'str',
+        'service_account': 'str',
+        'source': 'V1BuildSource',
+        'strategy': 'V1BuildStrategy',
+        'triggers': 'list[V1BuildTriggerPolicy]'
+    }
+
+    attribute_map = {
+        'completion_deadline_seconds': 'completionDeadlineSeconds',
+        'node_selector': 'nodeSelector',
+        'output': 'output',
+        'post_commit': 'postCommit',
+        'resources': 'resources',
+        'revision': 'revision',
+        'run_policy': 'runPolicy',
+        'service_account': 'serviceAccount',
+        'source': 'source',
+        'strategy': 'strategy',
+        'triggers': 'triggers'
+    }
+
+    __slots__ = (
+        '_completion_deadline_seconds',
+        '_node_selector',
+        '_output',
+        '_post_commit',
+        '_resources',
+        '_revision',
+        '_run_policy',
+        '_service_account',
+        '_source',
+        '_strategy',
+        '_triggers',
+    )
+
     def __init__(self, completion_deadline_seconds=None, node_selector=None, output=None, post_commit=None, resources=None, revision=None, run_policy=None, service_account=None, source=None, strategy=None, triggers=None):
         """
         V1BuildConfigSpec - a model defined in Swagger
@@ -30,34 +72,6 @@ class V1BuildConfigSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'completion_deadline_seconds': 'int',
-            'node_selector': 'dict(str, str)',
-            'output': 'V1BuildOutput',
-            'post_commit': 'V1BuildPostCommitSpec',
-            'resources': 'V1ResourceRequirements',
-            'revision': 'V1SourceRevision',
-            'run_policy': 'str',
-            'service_account': 'str',
-            'source': 'V1BuildSource',
-            'strategy': 'V1BuildStrategy',
-            'triggers': 'list[V1BuildTriggerPolicy]'
-        }
-
-        self.attribute_map = {
-            'completion_deadline_seconds': 'completionDeadlineSeconds',
-            'node_selector': 'nodeSelector',
-            'output': 'output',
-            'post_commit': 'postCommit',
-            'resources': 'resources',
-            'revision': 'revision',
-            'run_policy': 'runPolicy',
-            'service_account': 'serviceAccount',
-            'source': 'source',
-            'strategy': 'strategy',
-            'triggers': 'triggers'
-        }
-
         self._completion_deadline_seconds = completion_deadline_seconds
         self._node_selector = node_selector
         self._output = output
@@ -374,10 +388,26 @@ class V1BuildConfigSpec(object):
         if not isinstance(other, V1BuildConfigSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
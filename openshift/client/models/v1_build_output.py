@@ -21,6 +21,24 @@ class V1BuildOutput(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'image_labels': 'list[V1ImageLabel]',
+        'push_secret': 'V1LocalObjectReference',
+        'to': 'V1ObjectReference'
+    }
+
+    attribute_map = {
+        'image_labels': 'imageLabels',
+        'push_secret': 'pushSecret',
+        'to': 'to'
+    }
+
+    __slots__ = (
+        '_image_labels',
+        '_push_secret',
+        '_to',
+    )
+
     def __init__(self, image_labels=None, push_secret=None, to=None):
         """
         V1BuildOutput - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1BuildOutput(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'image_labels': 'list[V1ImageLabel]',
-            'push_secret': 'V1LocalObjectReference',
-            'to': 'V1ObjectReference'
-        }
-
-        self.attribute_map = {
-            'image_labels': 'imageLabels',
-            'push_secret': 'pushSecret',
-            'to': 'to'
-        }
-
         self._image_labels = image_labels
         self._push_secret = push_secret
         self._to = to
@@ -160,10 +166,26 @@ class V1BuildOutput(object):
         if not isinstance(other, V1BuildOutput):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
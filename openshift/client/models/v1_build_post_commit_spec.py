@@ -21,6 +21,24 @@ class V1BuildPostCommitSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'args': 'list[str]',
+        'command': 'list[str]',
+        'script': 'str'
+    }
+
+    attribute_map = {
+        'args': 'args',
+        'command': 'command',
+        'script': 'script'
+    }
+
+    __slots__ = (
+        '_args',
+        '_command',
+        '_script',
+    )
+
     def __init__(self, args=None, command=None, script=None):
         """
         V1BuildPostCommitSpec - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1BuildPostCommitSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'args': 'list[str]',
-            'command': 'list[str]',
-            'script': 'str'
-        }
-
-        self.attribute_map = {
-            'args': 'args',
-            'command': 'command',
-            'script': 'script'
-        }
-
         self._args = args
         self._command = command
         self._script = script
@@ -160,10 +166,26 @@ class V1BuildPostCommitSpec(object):
         if not isinstance(other, V1BuildPostCommitSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,48 @@ class V1BuildRequest(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'binary': 'V1BinaryBuildSource',
+        'docker_strategy_options': 'V1DockerStrategyOptions',
+        'env': 'list[V1EnvVar]',
+        '_from': 'V1ObjectReference',
+        'kind': 'str',
+        'last_version': 'int',
+        'metadata': 'V1ObjectMeta',
+        'revision': 'V1SourceRevision',
+        'triggered_by': 'list[V1BuildTriggerCause]',
+        'triggered_by_image': 'V1ObjectReference'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'binary': 'binary',
+        'docker_strategy_options': 'dockerStrategyOptions',
+        'env': 'env',
+        '_from': 'from',
+        'kind': 'kind',
+        'last_version': 'lastVersion',
+        'metadata': 'metadata',
+        'revision': 'revision',
+        'triggered_by': 'triggeredBy',
+        'triggered_by_image': 'triggeredByImage'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_binary',
+        '_docker_strategy_options',
+        '_env',
+        '__from',
+        '_kind',
+        '_last_version',
+        '_metadata',
+        '_revision',
+        '_triggered_by',
+        '_triggered_by_image',
+    )
+
     def __init__(self, api_version=None, binary=None, docker_strategy_options=None, env=None, _from=None, kind=None, last_version=None, metadata=None, revision=None, triggered_by=None, triggered_by_image=None):
         """
         V1BuildRequest - a model defined in Swagger
@@ -30,34 +72,6 @@ class V1BuildRequest(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'binary': 'V1BinaryBuildSource',
-            'docker_strategy_options': 'V1DockerStrategyOptions',
-            'env': 'list[V1EnvVar]',
-            '_from': 'V1ObjectReference',
-            'kind': 'str',
-            'last_version': 'int',
-            'metadata': 'V1ObjectMeta',
-            'revision': 'V1SourceRevision',
-            'triggered_by': 'list[V1BuildTriggerCause]',
-            'triggered_by_image': 'V1ObjectReference'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'binary': 'binary',
-            'docker_strategy_options': 'dockerStrategyOptions',
-            'env': 'env',
-            '_from': 'from',
-            'kind': 'kind',
-            'last_version': 'lastVersion',
-            'metadata': 'metadata',
-            'revision': 'revision',
-            'triggered_by': 'triggeredBy',
-            'triggered_by_image': 'triggeredByImage'
-        }
-
         self._api_version = api_version
         self._binary = binary
         self._docker_strategy_options = docker_strategy_options
@@ -370,10 +384,26 @@ class V1BuildRequest(object):
         if not isinstance(other, V1BuildRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,39 @@ class V1BuildSource(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'binary': 'V1BinaryBuildSource',
+        'context_dir': 'str',
+        'dockerfile': 'str',
+        'git': 'V1GitBuildSource',
+        'images': 'list[V1ImageSource]',
+        'secrets': 'list[V1SecretBuildSource]',
+        'source_secret': 'V1LocalObjectReference',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'binary': 'binary',
+        'context_dir': 'contextDir',
+        'dockerfile': 'dockerfile',
+        'git': 'git',
+        'images': 'images',
+        'secrets': 'secrets',
+        'source_secret': 'sourceSecret',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_binary',
+        '_context_dir',
+        '_dockerfile',
+        '_git',
+        '_images',
+        '_secrets',
+        '_source_secret',
+        '_type',
+    )
+
     def __init__(self, binary=None, context_dir=None, dockerfile=None, git=None, images=None, secrets=None, source_secret=None, type=None):
         """
         V1BuildSource - a model defined in Swagger
@@ -30,28 +63,6 @@ class V1BuildSource(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'binary': 'V1BinaryBuildSource',
-            'context_dir': 'str',
-            'dockerfile': 'str',
-            'git': 'V1GitBuildSource',
-            'images': 'list[V1ImageSource]',
-            'secrets': 'list[V1SecretBuildSource]',
-            'source_secret': 'V1LocalObjectReference',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'binary': 'binary',
-            'context_dir': 'contextDir',
-            'dockerfile': 'dockerfile',
-            'git': 'git',
-            'images': 'images',
-            'secrets': 'secrets',
-            'source_secret': 'sourceSecret',
-            'type': 'type'
-        }
-
         self._binary = binary
         self._context_dir = context_dir
         self._dockerfile = dockerfile
@@ -292,10 +303,26 @@ class V1BuildSource(object):
         if not isinstance(other, V1BuildSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,45 @@ class V1BuildSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'completion_deadline_seconds': 'int',
+        'node_selector': 'dict(str, str)',
+        'output': 'V1BuildOutput',
+        'post_commit': 'V1BuildPostCommitSpec',
+        'resources': 'V1ResourceRequirements',
+        'revision': 'V1SourceRevision',
+        'service_account': 'str',
+        'source': 'V1BuildSource',
+        'strategy': 'V1BuildStrategy',
+        'triggered_by': 'list[V1BuildTriggerCause]'
+    }
+
+    attribute_map = {
+        'completion_deadline_seconds': 'completionDeadlineSeconds',
+        'node_selector': 'nodeSelector',
+        'output': 'output',
+        'post_commit': 'postCommit',
+        'resources': 'resources',
+        'revision': 'revision',
+        'service_account': 'serviceAccount',
+        'source': 'source',
+        'strategy': 'strategy',
+        'triggered_by': 'triggeredBy'
+    }
+
+    __slots__ = (
+        '_completion_deadline_seconds',
+        '_node_selector',
+        '_output',
+        '_post_commit',
+        '_resources',
+        '_revision',
+        '_service_account',
+        '_source',
+        '_strategy',
+        '_triggered_by',
+    )
+
     def __init__(self, completion_deadline_seconds=None, node_selector=None, output=None, post_commit=None, resources=None, revision=None, service_account=None, source=None, strategy=None, triggered_by=None):
         """
         V1BuildSpec - a model defined in Swagger
@@ -30,32 +69,6 @@ class V1BuildSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'completion_deadline_seconds': 'int',
-            'node_selector': 'dict(str, str)',
-            'output': 'V1BuildOutput',
-            'post_commit': 'V1BuildPostCommitSpec',
-            'resources': 'V1ResourceRequirements',
-            'revision': 'V1SourceRevision',
-            'service_account': 'str',
-            'source': 'V1BuildSource',
-            'strategy': 'V1BuildStrategy',
-            'triggered_by': 'list[V1BuildTriggerCause]'
-        }
-
-        self.attribute_map = {
-            'completion_deadline_seconds': 'completionDeadlineSeconds',
-            'node_selector': 'nodeSelector',
-            'output': 'output',
-            'post_commit': 'postCommit',
-            'resources': 'resources',
-            'revision': 'revision',
-            'service_account': 'serviceAccount',
-            'source': 'source',
-            'strategy': 'strategy',
-            'triggered_by': 'triggeredBy'
-        }
-
         self._completion_deadline_seconds = completion_deadline_seconds
         self._node_selector = node_selector
         self._output = output
@@ -348,10 +361,26 @@ class V1BuildSpec(object):
         if not isinstance(other, V1BuildSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
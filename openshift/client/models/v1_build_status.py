@@ -21,6 +21,45 @@ class V1BuildStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'cancelled': 'bool',
+        'completion_timestamp': 'UnversionedTime',
+        'config': 'V1ObjectReference',
+        'duration': 'int',
+        'message': 'str',
+        'output': 'V1BuildStatusOutput',
+        'output_docker_image_reference': 'str',
+        'phase': 'str',
+        'reason': 'str',
+        'start_timestamp': 'UnversionedTime'
+    }
+
+    attribute_map = {
+        'cancelled': 'cancelled',
+        'completion_timestamp': 'completionTimestamp',
+        'config': 'config',
+        'duration': 'duration',
+        'message': 'message',
+        'output': 'output',
+        'output_docker_image_reference': 'outputDockerImageReference',
+        'phase': 'phase',
+        'reason': 'reason',
+        'start_timestamp': 'startTimestamp'
+    }
+
+    __slots__ = (
+        '_cancelled',
+        '_completion_timestamp',
+        '_config',
+        '_duration',
+        '_message',
+        '_output',
+        '_output_docker_image_reference',
+        '_phase',
+        '_reason',
+        '_start_timestamp',
+    )
+
     def __init__(self, cancelled=None, completion_timestamp=None, config=None, duration=None, message=None, output=None, output_docker_image_reference=None, phase=None, reason=None, start_timestamp=None):
         """
         V1BuildStatus - a model defined in Swagger
@@ -30,32 +69,6 @@ class V1BuildStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'cancelled': 'bool',
-            'completion_timestamp': 'UnversionedTime',
-            'config': 'V1ObjectReference',
-            'duration': 'int',
-            'message': 'str',
-            'output': 'V1BuildStatusOutput',
-            'output_docker_image_reference': 'str',
-            'phase': 'str',
-            'reason': 'str',
-            'start_timestamp': 'UnversionedTime'
-        }
-
-        self.attribute_map = {
-            'cancelled': 'cancelled',
-            'completion_timestamp': 'completionTimestamp',
-            'config': 'config',
-            'duration': 'duration',
-            'message': 'message',
-            'output': 'output',
-            'output_docker_image_reference': 'outputDockerImageReference',
-            'phase': 'phase',
-            'reason': 'reason',
-            'start_timestamp': 'startTimestamp'
-        }
-
         self._cancelled = cancelled
         self._completion_timestamp = completion_timestamp
         self._config = config
@@ -344,10 +357,26 @@ class V1BuildStatus(object):
         if not isinstance(other, V1BuildStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
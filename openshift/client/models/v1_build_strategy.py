@@ -21,6 +21,30 @@ class V1BuildStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'custom_strategy': 'V1CustomBuildStrategy',
+        'docker_strategy': 'V1DockerBuildStrategy',
+        'jenkins_pipeline_strategy': 'V1JenkinsPipelineBuildStrategy',
+        'source_strategy': 'V1SourceBuildStrategy',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'custom_strategy': 'customStrategy',
+        'docker_strategy': 'dockerStrategy',
+        'jenkins_pipeline_strategy': 'jenkinsPipelineStrategy',
+        'source_strategy': 'sourceStrategy',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_custom_strategy',
+        '_docker_strategy',
+        '_jenkins_pipeline_strategy',
+        '_source_strategy',
+        '_type',
+    )
+
     def __init__(self, custom_strategy=None, docker_strategy=None, jenkins_pipeline_strategy=None, source_strategy=None, type=None):
         """
         V1BuildStrategy - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1BuildStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'custom_strategy': 'V1CustomBuildStrategy',
-            'docker_strategy': 'V1DockerBuildStrategy',
-            'jenkins_pipeline_strategy': 'V1JenkinsPipelineBuildStrategy',
-            'source_strategy': 'V1SourceBuildStrategy',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'custom_strategy': 'customStrategy',
-            'docker_strategy': 'dockerStrategy',
-            'jenkins_pipeline_strategy': 'jenkinsPipelineStrategy',
-            'source_strategy': 'sourceStrategy',
-            'type': 'type'
-        }
-
         self._custom_strategy = custom_strategy
         self._docker_strategy = docker_strategy
         self._jenkins_pipeline_strategy = jenkins_pipeline_strategy
@@ -214,10 +222,26 @@ class V1BuildStrategy(object):
         if not isinstance(other, V1BuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,27 @@ class V1BuildTriggerCause(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'generic_web_hook': 'V1GenericWebHookCause',
+        'github_web_hook': 'V1GitHubWebHookCause',
+        'image_change_build': 'V1ImageChangeCause',
+        'message': 'str'
+    }
+
+    attribute_map = {
+        'generic_web_hook': 'genericWebHook',
+        'github_web_hook': 'githubWebHook',
+        'image_change_build': 'imageChangeBuild',
+        'message': 'message'
+    }
+
+    __slots__ = (
+        '_generic_web_hook',
+        '_github_web_hook',
+        '_image_change_build',
+        '_message',
+    )
+
     def __init__(self, generic_web_hook=None, github_web_hook=None, image_change_build=None, message=None):
         """
         V1BuildTriggerCause - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1BuildTriggerCause(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'generic_web_hook': 'V1GenericWebHookCause',
-            'github_web_hook': 'V1GitHubWebHookCause',
-            'image_change_build': 'V1ImageChangeCause',
-            'message': 'str'
-        }
-
-        self.attribute_map = {
-            'generic_web_hook': 'genericWebHook',
-            'github_web_hook': 'githubWebHook',
-            'image_change_build': 'imageChangeBuild',
-            'message': 'message'
-        }
-
         self._generic_web_hook = generic_web_hook
         self._github_web_hook = github_web_hook
         self._image_change_build = image_change_build
@@ -186,10 +193,26 @@ class V1BuildTriggerCause(object):
         if not isinstance(other, V1BuildTriggerCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
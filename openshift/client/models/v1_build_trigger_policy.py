@@ -21,6 +21,27 @@ class V1BuildTriggerPolicy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'generic': 'V1WebHookTrigger',
+        'github': 'V1WebHookTrigger',
+        'image_change': 'V1ImageChangeTrigger',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'generic': 'generic',
+        'github': 'github',
+        'image_change': 'imageChange',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_generic',
+        '_github',
+        '_image_change',
+        '_type',
+    )
+
     def __init__(self, generic=None, github=None, image_change=None, type=None):
         """
         V1BuildTriggerPolicy - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1BuildTriggerPolicy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'generic': 'V1WebHookTrigger',
-            'github': 'V1WebHookTrigger',
-            'image_change': 'V1ImageChangeTrigger',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'generic': 'generic',
-            'github': 'github',
-            'image_change': 'imageChange',
-            'type': 'type'
-        }
-
         self._generic = generic
         self._github = github
         self._image_change = image_change
@@ -188,10 +195,26 @@ class V1BuildTriggerPolicy(object):
         if not isinstance(other, V1BuildTriggerPolicy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
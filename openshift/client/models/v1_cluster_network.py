@@ -21,6 +21,36 @@ class V1ClusterNetwork(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'hostsubnetlength': 'int',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'network': 'str',
+        'plugin_name': 'str',
+        'service_network': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'hostsubnetlength': 'hostsubnetlength',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'network': 'network',
+        'plugin_name': 'pluginName',
+        'service_network': 'serviceNetwork'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_hostsubnetlength',
+        '_kind',
+        '_metadata',
+        '_network',
+        '_plugin_name',
+        '_service_network',
+    )
+
     def __init__(self, api_version=None, hostsubnetlength=None, kind=None, metadata=None, network=None, plugin_name=None, service_network=None):
         """
         V1ClusterNetwork - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1ClusterNetwork(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'hostsubnetlength': 'int',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'network': 'str',
-            'plugin_name': 'str',
-            'service_network': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'hostsubnetlength': 'hostsubnetlength',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'network': 'network',
-            'plugin_name': 'pluginName',
-            'service_network': 'serviceNetwork'
-        }
-
         self._api_version = api_version
         self._hostsubnetlength = hostsubnetlength
         self._kind = kind
@@ -270,10 +280,26 @@ class V1ClusterNetwork(object):
         if not isinstance(other, V1ClusterNetwork):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
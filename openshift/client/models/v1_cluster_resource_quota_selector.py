@@ -21,6 +21,21 @@ class V1ClusterResourceQuotaSelector(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'annotations': 'dict(str, str)',
+        'labels': 'UnversionedLabelSelector'
+    }
+
+    attribute_map = {
+        'annotations': 'annotations',
+        'labels': 'labels'
+    }
+
+    __slots__ = (
+        '_annotations',
+        '_labels',
+    )
+
     def __init__(self, annotations=None, labels=None):
         """
         V1ClusterResourceQuotaSelector - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ClusterResourceQuotaSelector(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'annotations': 'dict(str, str)',
-            'labels': 'UnversionedLabelSelector'
-        }
-
-        self.attribute_map = {
-            'annotations': 'annotations',
-            'labels': 'labels'
-        }
-
         self._annotations = annotations
         self._labels = labels
 
@@ -138,10 +143,26 @@ class V1ClusterResourceQuotaSelector(object):
         if not isinstance(other, V1ClusterResourceQuotaSelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
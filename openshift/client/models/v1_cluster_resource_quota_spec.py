@@ -21,6 +21,21 @@ class V1ClusterResourceQuotaSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'quota': 'V1ResourceQuotaSpec',
+        'selector': 'V1ClusterResourceQuotaSelector'
+    }
+
+    attribute_map = {
+        'quota': 'quota',
+        'selector': 'selector'
+    }
+
+    __slots__ = (
+        '_quota',
+        '_selector',
+    )
+
     def __init__(self, quota=None, selector=None):
         """
         V1ClusterResourceQuotaSpec - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ClusterResourceQuotaSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'quota': 'V1ResourceQuotaSpec',
-            'selector': 'V1ClusterResourceQuotaSelector'
-        }
-
-        self.attribute_map = {
-            'quota': 'quota',
-            'selector': 'selector'
-        }
-
         self._quota = quota
         self._selector = selector
 
@@ -138,10 +143,26 @@ class V1ClusterResourceQuotaSpec(object):
         if not isinstance(other, V1ClusterResourceQuotaSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,27 @@ class V1ClusterRole(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'rules': 'list[V1PolicyRule]'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'rules': 'rules'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_rules',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, rules=None):
         """
         V1ClusterRole - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1ClusterRole(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'rules': 'list[V1PolicyRule]'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'rules': 'rules'
-        }
-
         self._api_version = api_version
         self._kind = kind
         self._metadata = metadata
@@ -188,10 +195,26 @@ class V1ClusterRole(object):
         if not isinstance(other, V1ClusterRole):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
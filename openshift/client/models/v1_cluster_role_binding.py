@@ -21,6 +21,36 @@ class V1ClusterRoleBinding(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'group_names': 'list[str]',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'role_ref': 'V1ObjectReference',
+        'subjects': 'list[V1ObjectReference]',
+        'user_names': 'list[str]'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'group_names': 'groupNames',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'role_ref': 'roleRef',
+        'subjects': 'subjects',
+        'user_names': 'userNames'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_group_names',
+        '_kind',
+        '_metadata',
+        '_role_ref',
+        '_subjects',
+        '_user_names',
+    )
+
     def __init__(self, api_version=None, group_names=None, kind=None, metadata=None, role_ref=None, subjects=None, user_names=None):
         """
         V1ClusterRoleBinding - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1ClusterRoleBinding(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'group_names': 'list[str]',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'role_ref': 'V1ObjectReference',
-            'subjects': 'list[V1ObjectReference]',
-            'user_names': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'group_names': 'groupNames',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'role_ref': 'roleRef',
-            'subjects': 'subjects',
-            'user_names': 'userNames'
-        }
-
         self._api_version = api_version
         self._group_names = group_names
         self._kind = kind
@@ -272,10 +282,26 @@ class V1ClusterRoleBinding(object):
         if not isinstance(other, V1ClusterRoleBinding):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
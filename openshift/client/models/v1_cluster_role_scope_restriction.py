@@ -21,6 +21,24 @@ class V1ClusterRoleScopeRestriction(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allow_escalation': 'bool',
+        'namespaces': 'list[str]',
+        'role_names': 'list[str]'
+    }
+
+    attribute_map = {
+        'allow_escalation': 'allowEscalation',
+        'namespaces': 'namespaces',
+        'role_names': 'roleNames'
+    }
+
+    __slots__ = (
+        '_allow_escalation',
+        '_namespaces',
+        '_role_names',
+    )
+
     def __init__(self, allow_escalation=None, namespaces=None, role_names=None):
         """
         V1ClusterRoleScopeRestriction - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ClusterRoleScopeRestriction(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allow_escalation': 'bool',
-            'namespaces': 'list[str]',
-            'role_names': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'allow_escalation': 'allowEscalation',
-            'namespaces': 'namespaces',
-            'role_names': 'roleNames'
-        }
-
         self._allow_escalation = allow_escalation
         self._namespaces = namespaces
         self._role_names = role_names
@@ -166,10 +172,26 @@ class V1ClusterRoleScopeRestriction(object):
         if not isinstance(other, V1ClusterRoleScopeRestriction):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,36 @@ class V1CustomBuildStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'build_api_version': 'str',
+        'env': 'list[V1EnvVar]',
+        'expose_docker_socket': 'bool',
+        'force_pull': 'bool',
+        '_from': 'V1ObjectReference',
+        'pull_secret': 'V1LocalObjectReference',
+        'secrets': 'list[V1SecretSpec]'
+    }
+
+    attribute_map = {
+        'build_api_version': 'buildAPIVersion',
+        'env': 'env',
+        'expose_docker_socket': 'exposeDockerSocket',
+        'force_pull': 'forcePull',
+        '_from': 'from',
+        'pull_secret': 'pullSecret',
+        'secrets': 'secrets'
+    }
+
+    __slots__ = (
+        '_build_api_version',
+        '_env',
+        '_expose_docker_socket',
+        '_force_pull',
+        '__from',
+        '_pull_secret',
+        '_secrets',
+    )
+
     def __init__(self, build_api_version=None, env=None, expose_docker_socket=None, force_pull=None, _from=None, pull_secret=None, secrets=None):
         """
         V1CustomBuildStrategy - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1CustomBuildStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'build_api_version': 'str',
-            'env': 'list[V1EnvVar]',
-            'expose_docker_socket': 'bool',
-            'force_pull': 'bool',
-            '_from': 'V1ObjectReference',
-            'pull_secret': 'V1LocalObjectReference',
-            'secrets': 'list[V1SecretSpec]'
-        }
-
-        self.attribute_map = {
-            'build_api_version': 'buildAPIVersion',
-            'env': 'env',
-            'expose_docker_socket': 'exposeDockerSocket',
-            'force_pull': 'forcePull',
-            '_from': 'from',
-            'pull_secret': 'pullSecret',
-            'secrets': 'secrets'
-        }
-
         self._build_api_version = build_api_version
         self._env = env
         self._expose_docker_socket = expose_docker_socket
@@ -266,10 +276,26 @@ class V1CustomBuildStrategy(object):
         if not isinstance(other, V1CustomBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1CustomDeploymentStrategyParams(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'command': 'list[str]',
+        'environment': 'list[V1EnvVar]',
+        'image': 'str'
+    }
+
+    attribute_map = {
+        'command': 'command',
+        'environment': 'environment',
+        'image': 'image'
+    }
+
+    __slots__ = (
+        '_command',
+        '_environment',
+        '_image',
+    )
+
     def __init__(self, command=None, environment=None, image=None):
         """
         V1CustomDeploymentStrategyParams - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1CustomDeploymentStrategyParams(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'command': 'list[str]',
-            'environment': 'list[V1EnvVar]',
-            'image': 'str'
-        }
-
-        self.attribute_map = {
-            'command': 'command',
-            'environment': 'environment',
-            'image': 'image'
-        }
-
         self._command = command
         self._environment = environment
         self._image = image
@@ -160,10 +166,26 @@ class V1CustomDeploymentStrategyParams(object):
         if not isinstance(other, V1CustomDeploymentStrategyParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
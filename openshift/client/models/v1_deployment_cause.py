@@ -21,6 +21,21 @@ class V1DeploymentCause(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'image_trigger': 'V1DeploymentCauseImageTrigger',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'image_trigger': 'imageTrigger',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_image_trigger',
+        '_type',
+    )
+
     def __init__(self, image_trigger=None, type=None):
         """
         V1DeploymentCause - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1DeploymentCause(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'image_trigger': 'V1DeploymentCauseImageTrigger',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'image_trigger': 'imageTrigger',
-            'type': 'type'
-        }
-
         self._image_trigger = image_trigger
         self._type = type
 
@@ -136,10 +141,26 @@ class V1DeploymentCause(object):
         if not isinstance(other, V1DeploymentCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,33 @@ class V1DeploymentConfigRollbackSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        '_from': 'V1ObjectReference',
+        'include_replication_meta': 'bool',
+        'include_strategy': 'bool',
+        'include_template': 'bool',
+        'include_triggers': 'bool',
+        'revision': 'int'
+    }
+
+    attribute_map = {
+        '_from': 'from',
+        'include_replication_meta': 'includeReplicationMeta',
+        'include_strategy': 'includeStrategy',
+        'include_template': 'includeTemplate',
+        'include_triggers': 'includeTriggers',
+        'revision': 'revision'
+    }
+
+    __slots__ = (
+        '__from',
+        '_include_replication_meta',
+        '_include_strategy',
+        '_include_template',
+        '_include_triggers',
+        '_revision',
+    )
+
     def __init__(self, _from=None, include_replication_meta=None, include_strategy=None, include_template=None, include_triggers=None, revision=None):
         """
         V1DeploymentConfigRollbackSpec - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1DeploymentConfigRollbackSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            '_from': 'V1ObjectReference',
-            'include_replication_meta': 'bool',
-            'include_strategy': 'bool',
-            'include_template': 'bool',
-            'include_triggers': 'bool',
-            'revision': 'int'
-        }
-
-        self.attribute_map = {
-            '_from': 'from',
-            'include_replication_meta': 'includeReplicationMeta',
-            'include_strategy': 'includeStrategy',
-            'include_template': 'includeTemplate',
-            'include_triggers': 'includeTriggers',
-            'revision': 'revision'
-        }
-
         self.__from = _from
         self._include_replication_meta = include_replication_meta
         self._include_strategy = include_strategy
@@ -248,10 +257,26 @@ class V1DeploymentConfigRollbackSpec(object):
         if not isinstance(other, V1DeploymentConfigRollbackSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
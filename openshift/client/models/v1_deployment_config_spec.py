@@ -21,6 +21,42 @@ class V1DeploymentConfigSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'min_ready_seconds': 'int',
+        'paused': 'bool',
+        'replicas': 'int',
+        'revision_history_limit': 'int',
+        'selector': 'dict(str, str)',
+        'strategy': 'V1DeploymentStrategy',
+        'template': 'V1PodTemplateSpec',
+        'test': 'bool',
+        'triggers': 'list[V1DeploymentTriggerPolicy]'
+    }
+
+    attribute_map = {
+        'min_ready_seconds': 'minReadySeconds',
+        'paused': 'paused',
+        'replicas': 'replicas',
+        'revision_history_limit': 'revisionHistoryLimit',
+        'selector': 'selector',
+        'strategy': 'strategy',
+        'template': 'template',
+        'test': 'test',
+        'triggers': 'triggers'
+    }
+
+    __slots__ = (
+        '_min_ready_seconds',
+        '_paused',
+        '_replicas',
+        '_revision_history_limit',
+        '_selector',
+        '_strategy',
+        '_template',
+        '_test',
+        '_triggers',
+    )
+
     def __init__(self, min_ready_seconds=None, paused=None, replicas=None, revision_history_limit=None, selector=None, strategy=None, template=None, test=None, triggers=None):
         """
         V1DeploymentConfigSpec - a model defined in Swagger
@@ -30,30 +66,6 @@ class V1DeploymentConfigSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'min_ready_seconds': 'int',
-            'paused': 'bool',
-            'replicas': 'int',
-            'revision_history_limit': 'int',
-            'selector': 'dict(str, str)',
-            'strategy': 'V1DeploymentStrategy',
-            'template': 'V1PodTemplateSpec',
-            'test': 'bool',
-            'triggers': 'list[V1DeploymentTriggerPolicy]'
-        }
-
-        self.attribute_map = {
-            'min_ready_seconds': 'minReadySeconds',
-            'paused': 'paused',
-            'replicas': 'replicas',
-            'revision_history_limit': 'revisionHistoryLimit',
-            'selector': 'selector',
-            'strategy': 'strategy',
-            'template': 'template',
-            'test': 'test',
-            'triggers': 'triggers'
-        }
-
         self._min_ready_seconds = min_ready_seconds
         self._paused = paused
         self._replicas = replicas
@@ -324,10 +336,26 @@ class V1DeploymentConfigSpec(object):
         if not isinstance(other, V1DeploymentConfigSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,42 @@ class V1DeploymentConfigStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'available_replicas': 'int',
+        'conditions': 'list[V1DeploymentCondition]',
+        'details': 'V1DeploymentDetails',
+        'latest_version': 'int',
+        'observed_generation': 'int',
+        'ready_replicas': 'int',
+        'replicas': 'int',
+        'unavailable_replicas': 'int',
+        'updated_replicas': 'int'
+    }
+
+    attribute_map = {
+        'available_replicas': 'availableReplicas',
+        'conditions': 'conditions',
+        'details': 'details',
+        'latest_version': 'latestVersion',
+        'observed_generation': 'observedGeneration',
+        'ready_replicas': 'readyReplicas',
+        'replicas': 'replicas',
+        'unavailable_replicas': 'unavailableReplicas',
+        'updated_replicas': 'updatedReplicas'
+    }
+
+    __slots__ = (
+        '_available_replicas',
+        '_conditions',
+        '_details',
+        '_latest_version',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        '_unavailable_replicas',
+        '_updated_replicas',
+    )
+
     def __init__(self, available_replicas=None, conditions=None, details=None, latest_version=None, observed_generation=None, ready_replicas=None, replicas=None, unavailable_replicas=None, updated_replicas=None):
         """
         V1DeploymentConfigStatus - a model defined in Swagger
@@ -30,30 +66,6 @@ class V1DeploymentConfigStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'available_replicas': 'int',
-            'conditions': 'list[V1DeploymentCondition]',
-            'details': 'V1DeploymentDetails',
-            'latest_version': 'int',
-            'observed_generation': 'int',
-            'ready_replicas': 'int',
-            'replicas': 'int',
-            'unavailable_replicas': 'int',
-            'updated_replicas': 'int'
-        }
-
-        self.attribute_map = {
-            'available_replicas': 'availableReplicas',
-            'conditions': 'conditions',
-            'details': 'details',
-            'latest_version': 'latestVersion',
-            'observed_generation': 'observedGeneration',
-            'ready_replicas': 'readyReplicas',
-            'replicas': 'replicas',
-            'unavailable_replicas': 'unavailableReplicas',
-            'updated_replicas': 'updatedReplicas'
-        }
-
         self._available_replicas = available_replicas
         self._conditions = conditions
         self._details = details
@@ -328,10 +340,26 @@ class V1DeploymentConfigStatus(object):
         if not isinstance(other, V1DeploymentConfigStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1DeploymentDetails(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'causes': 'list[V1DeploymentCause]',
+        'message': 'str'
+    }
+
+    attribute_map = {
+        'causes': 'causes',
+        'message': 'message'
+    }
+
+    __slots__ = (
+        '_causes',
+        '_message',
+    )
+
     def __init__(self, causes=None, message=None):
         """
         V1DeploymentDetails - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1DeploymentDetails(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'causes': 'list[V1DeploymentCause]',
-            'message': 'str'
-        }
-
-        self.attribute_map = {
-            'causes': 'causes',
-            'message': 'message'
-        }
-
         self._causes = causes
         self._message = message
 
@@ -136,10 +141,26 @@ class V1DeploymentDetails(object):
         if not isinstance(other, V1DeploymentDetails):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
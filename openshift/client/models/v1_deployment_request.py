@@ -21,6 +21,30 @@ class V1DeploymentRequest(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'force': 'bool',
+        'kind': 'str',
+        'latest': 'bool',
+        'name': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'force': 'force',
+        'kind': 'kind',
+        'latest': 'latest',
+        'name': 'name'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_force',
+        '_kind',
+        '_latest',
+        '_name',
+    )
+
     def __init__(self, api_version=None, force=None, kind=None, latest=None, name=None):
         """
         V1DeploymentRequest - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1DeploymentRequest(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'force': 'bool',
-            'kind': 'str',
-            'latest': 'bool',
-            'name': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'force': 'force',
-            'kind': 'kind',
-            'latest': 'latest',
-            'name': 'name'
-        }
-
         self._api_version = api_version
         self._force = force
         self._kind = kind
@@ -218,10 +226,26 @@ class V1DeploymentRequest(object):
         if not isinstance(other, V1DeploymentRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
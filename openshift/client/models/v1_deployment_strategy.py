@@ -21,6 +21,39 @@ class V1DeploymentStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'active_deadline_seconds': 'int',
+        'annotations': 'dict(str, str)',
+        'custom_params': 'V1CustomDeploymentStrategyParams',
+        'labels': 'dict(str, str)',
+        'recreate_params': 'V1RecreateDeploymentStrategyParams',
+        'resources': 'V1ResourceRequirements',
+        'rolling_params': 'V1RollingDeploymentStrategyParams',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'active_deadline_seconds': 'activeDeadlineSeconds',
+        'annotations': 'annotations',
+        'custom_params': 'customParams',
+        'labels': 'labels',
+        'recreate_params': 'recreateParams',
+        'resources': 'resources',
+        'rolling_params': 'rollingParams',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_active_deadline_seconds',
+        '_annotations',
+        '_custom_params',
+        '_labels',
+        '_recreate_params',
+        '_resources',
+        '_rolling_params',
+        '_type',
+    )
+
     def __init__(self, active_deadline_seconds=None, annotations=None, custom_params=None, labels=None, recreate_params=None, resources=None, rolling_params=None, type=None):
         """
         V1DeploymentStrategy - a model defined in Swagger
@@ -30,28 +63,6 @@ class V1DeploymentStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'active_deadline_seconds': 'int',
-            'annotations': 'dict(str, str)',
-            'custom_params': 'V1CustomDeploymentStrategyParams',
-            'labels': 'dict(str, str)',
-            'recreate_params': 'V1RecreateDeploymentStrategyParams',
-            'resources': 'V1ResourceRequirements',
-            'rolling_params': 'V1RollingDeploymentStrategyParams',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'active_deadline_seconds': 'activeDeadlineSeconds',
-            'annotations': 'annotations',
-            'custom_params': 'customParams',
-            'labels': 'labels',
-            'recreate_params': 'recreateParams',
-            'resources': 'resources',
-            'rolling_params': 'rollingParams',
-            'type': 'type'
-        }
-
         self._active_deadline_seconds = active_deadline_seconds
         self._annotations = annotations
         self._custom_params = custom_params
@@ -290,10 +301,26 @@ class V1DeploymentStrategy(object):
         if not isinstance(other, V1DeploymentStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,27 @@ class V1DeploymentTriggerImageChangeParams(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'automatic': 'bool',
+        'container_names': 'list[str]',
+        '_from': 'V1ObjectReference',
+        'last_triggered_image': 'str'
+    }
+
+    attribute_map = {
+        'automatic': 'automatic',
+        'container_names': 'containerNames',
+        '_from': 'from',
+        'last_triggered_image': 'lastTriggeredImage'
+    }
+
+    __slots__ = (
+        '_automatic',
+        '_container_names',
+        '__from',
+        '_last_triggered_image',
+    )
+
     def __init__(self, automatic=None, container_names=None, _from=None, last_triggered_image=None):
         """
         V1DeploymentTriggerImageChangeParams - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1DeploymentTriggerImageChangeParams(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'automatic': 'bool',
-            'container_names': 'list[str]',
-            '_from': 'V1ObjectReference',
-            'last_triggered_image': 'str'
-        }
-
-        self.attribute_map = {
-            'automatic': 'automatic',
-            'container_names': 'containerNames',
-            '_from': 'from',
-            'last_triggered_image': 'lastTriggeredImage'
-        }
-
         self._automatic = automatic
         self._container_names = container_names
         self.__from = _from
@@ -188,10 +195,26 @@ class V1DeploymentTriggerImageChangeParams(object):
         if not isinstance(other, V1DeploymentTriggerImageChangeParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
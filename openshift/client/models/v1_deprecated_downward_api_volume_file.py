@@ -21,6 +21,27 @@ class V1DeprecatedDownwardAPIVolumeFile(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'field_ref': 'V1ObjectFieldSelector',
+        'mode': 'int',
+        'name': 'str',
+        'resource_field_ref': 'V1ResourceFieldSelector'
+    }
+
+    attribute_map = {
+        'field_ref': 'fieldRef',
+        'mode': 'mode',
+        'name': 'name',
+        'resource_field_ref': 'resourceFieldRef'
+    }
+
+    __slots__ = (
+        '_field_ref',
+        '_mode',
+        '_name',
+        '_resource_field_ref',
+    )
+
     def __init__(self, field_ref=None, mode=None, name=None, resource_field_ref=None):
         """
         V1DeprecatedDownwardAPIVolumeFile - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1DeprecatedDownwardAPIVolumeFile(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'field_ref': 'V1ObjectFieldSelector',
-            'mode': 'int',
-            'name': 'str',
-            'resource_field_ref': 'V1ResourceFieldSelector'
-        }
-
-        self.attribute_map = {
-            'field_ref': 'fieldRef',
-            'mode': 'mode',
-            'name': 'name',
-            'resource_field_ref': 'resourceFieldRef'
-        }
-
         self._field_ref = field_ref
         self._mode = mode
         self._name = name
@@ -188,10 +195,26 @@ class V1DeprecatedDownwardAPIVolumeFile(object):
         if not isinstance(other, V1DeprecatedDownwardAPIVolumeFile):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
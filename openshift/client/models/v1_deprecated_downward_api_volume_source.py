@@ -21,6 +21,21 @@ class V1DeprecatedDownwardAPIVolumeSource(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'default_mode': 'int',
+        'items': 'list[V1DeprecatedDownwardAPIVolumeFile]'
+    }
+
+    attribute_map = {
+        'default_mode': 'defaultMode',
+        'items': 'items'
+    }
+
+    __slots__ = (
+        '_default_mode',
+        '_items',
+    )
+
     def __init__(self, default_mode=None, items=None):
         """
         V1DeprecatedDownwardAPIVolumeSource - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1DeprecatedDownwardAPIVolumeSource(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'default_mode': 'int',
-            'items': 'list[V1DeprecatedDownwardAPIVolumeFile]'
-        }
-
-        self.attribute_map = {
-            'default_mode': 'defaultMode',
-            'items': 'items'
-        }
-
         self._default_mode = default_mode
         self._items = items
 
@@ -134,10 +139,26 @@ class V1DeprecatedDownwardAPIVolumeSource(object):
         if not isinstance(other, V1DeprecatedDownwardAPIVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
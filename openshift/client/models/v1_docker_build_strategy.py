@@ -21,6 +21,39 @@ class V1DockerBuildStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'build_args': 'list[V1EnvVar]',
+        'dockerfile_path': 'str',
+        'env': 'list[V1EnvVar]',
+        'force_pull': 'bool',
+        '_from': 'V1ObjectReference',
+        'image_optimization_policy': 'str',
+        'no_cache': 'bool',
+        'pull_secret': 'V1LocalObjectReference'
+    }
+
+    attribute_map = {
+        'build_args': 'buildArgs',
+        'dockerfile_path': 'dockerfilePath',
+        'env': 'env',
+        'force_pull': 'forcePull',
+        '_from': 'from',
+        'image_optimization_policy': 'imageOptimizationPolicy',
+        'no_cache': 'noCache',
+        'pull_secret': 'pullSecret'
+    }
+
+    __slots__ = (
+        '_build_args',
+        '_dockerfile_path',
+        '_env',
+        '_force_pull',
+        '__from',
+        '_image_optimization_policy',
+        '_no_cache',
+        '_pull_secret',
+    )
+
     def __init__(self, build_args=None, dockerfile_path=None, env=None, force_pull=None, _from=None, image_optimization_policy=None, no_cache=None, pull_secret=None):
         """
         V1DockerBuildStrategy - a model defined in Swagger
@@ -30,28 +63,6 @@ class V1DockerBuildStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'build_args': 'list[V1EnvVar]',
-            'dockerfile_path': 'str',
-            'env': 'list[V1EnvVar]',
-            'force_pull': 'bool',
-            '_from': 'V1ObjectReference',
-            'image_optimization_policy': 'str',
-            'no_cache': 'bool',
-            'pull_secret': 'V1LocalObjectReference'
-        }
-
-        self.attribute_map = {
-            'build_args': 'buildArgs',
-            'dockerfile_path': 'dockerfilePath',
-            'env': 'env',
-            'force_pull': 'forcePull',
-            '_from': 'from',
-            'image_optimization_policy': 'imageOptimizationPolicy',
-            'no_cache': 'noCache',
-            'pull_secret': 'pullSecret'
-        }
-
         self._build_args = build_args
         self._dockerfile_path = dockerfile_path
         self._env = env
@@ -290,10 +301,26 @@ class V1DockerBuildStrategy(object):
         if not isinstance(other, V1DockerBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,18 @@ class V1EgressNetworkPolicySpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'egress': 'list[V1EgressNetworkPolicyRule]'
+    }
+
+    attribute_map = {
+        'egress': 'egress'
+    }
+
+    __slots__ = (
+        '_egress',
+    )
+
     def __init__(self, egress=None):
         """
         V1EgressNetworkPolicySpec - a model defined in Swagger
@@ -30,14 +42,6 @@ class V1EgressNetworkPolicySpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'egress': 'list[V1EgressNetworkPolicyRule]'
-        }
-
-        self.attribute_map = {
-            'egress': 'egress'
-        }
-
         self._egress = egress
 
     @property
@@ -110,10 +114,26 @@ class V1EgressNetworkPolicySpec(object):
         if not isinstance(other, V1EgressNetworkPolicySpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
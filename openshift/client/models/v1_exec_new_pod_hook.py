@@ -21,6 +21,27 @@ class V1ExecNewPodHook(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'command': 'list[str]',
+        'container_name': 'str',
+        'env': 'list[V1EnvVar]',
+        'volumes': 'list[str]'
+    }
+
+    attribute_map = {
+        'command': 'command',
+        'container_name': 'containerName',
+        'env': 'env',
+        'volumes': 'volumes'
+    }
+
+    __slots__ = (
+        '_command',
+        '_container_name',
+        '_env',
+        '_volumes',
+    )
+
     def __init__(self, command=None, container_name=None, env=None, volumes=None):
         """
         V1ExecNewPodHook - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1ExecNewPodHook(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'command': 'list[str]',
-            'container_name': 'str',
-            'env': 'list[V1EnvVar]',
-            'volumes': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'command': 'command',
-            'container_name': 'containerName',
-            'env': 'env',
-            'volumes': 'volumes'
-        }
-
         self._command = command
         self._container_name = container_name
         self._env = env
@@ -190,10 +197,26 @@ class V1ExecNewPodHook(object):
         if not isinstance(other, V1ExecNewPodHook):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
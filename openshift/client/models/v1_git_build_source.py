@@ -21,6 +21,30 @@ class V1GitBuildSource(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'http_proxy': 'str',
+        'https_proxy': 'str',
+        'no_proxy': 'str',
+        'ref': 'str',
+        'uri': 'str'
+    }
+
+    attribute_map = {
+        'http_proxy': 'httpProxy',
+        'https_proxy': 'httpsProxy',
+        'no_proxy': 'noProxy',
+        'ref': 'ref',
+        'uri': 'uri'
+    }
+
+    __slots__ = (
+        '_http_proxy',
+        '_https_proxy',
+        '_no_proxy',
+        '_ref',
+        '_uri',
+    )
+
     def __init__(self, http_proxy=None, https_proxy=None, no_proxy=None, ref=None, uri=None):
         """
         V1GitBuildSource - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1GitBuildSource(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'http_proxy': 'str',
-            'https_proxy': 'str',
-            'no_proxy': 'str',
-            'ref': 'str',
-            'uri': 'str'
-        }
-
-        self.attribute_map = {
-            'http_proxy': 'httpProxy',
-            'https_proxy': 'httpsProxy',
-            'no_proxy': 'noProxy',
-            'ref': 'ref',
-            'uri': 'uri'
-        }
-
         self._http_proxy = http_proxy
         self._https_proxy = https_proxy
         self._no_proxy = no_proxy
@@ -214,10 +222,26 @@ class V1GitBuildSource(object):
         if not isinstance(other, V1GitBuildSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1GitHubWebHookCause(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'revision': 'V1SourceRevision',
+        'secret': 'str'
+    }
+
+    attribute_map = {
+        'revision': 'revision',
+        'secret': 'secret'
+    }
+
+    __slots__ = (
+        '_revision',
+        '_secret',
+    )
+
     def __init__(self, revision=None, secret=None):
         """
         V1GitHubWebHookCause - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1GitHubWebHookCause(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'revision': 'V1SourceRevision',
-            'secret': 'str'
-        }
-
-        self.attribute_map = {
-            'revision': 'revision',
-            'secret': 'secret'
-        }
-
         self._revision = revision
         self._secret = secret
 
@@ -134,10 +139,26 @@ class V1GitHubWebHookCause(object):
         if not isinstance(other, V1GitHubWebHookCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
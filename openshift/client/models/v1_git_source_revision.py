@@ -21,6 +21,27 @@ class V1GitSourceRevision(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'author': 'V1SourceControlUser',
+        'commit': 'str',
+        'committer': 'V1SourceControlUser',
+        'message': 'str'
+    }
+
+    attribute_map = {
+        'author': 'author',
+        'commit': 'commit',
+        'committer': 'committer',
+        'message': 'message'
+    }
+
+    __slots__ = (
+        '_author',
+        '_commit',
+        '_committer',
+        '_message',
+    )
+
     def __init__(self, author=None, commit=None, committer=None, message=None):
         """
         V1GitSourceRevision - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1GitSourceRevision(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'author': 'V1SourceControlUser',
-            'commit': 'str',
-            'committer': 'V1SourceControlUser',
-            'message': 'str'
-        }
-
-        self.attribute_map = {
-            'author': 'author',
-            'commit': 'commit',
-            'committer': 'committer',
-            'message': 'message'
-        }
-
         self._author = author
         self._commit = commit
         self._committer = committer
@@ -186,10 +193,26 @@ class V1GitSourceRevision(object):
         if not isinstance(other, V1GitSourceRevision):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,33 @@ class V1HostSubnet(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'host': 'str',
+        'host_ip': 'str',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'subnet': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'host': 'host',
+        'host_ip': 'hostIP',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'subnet': 'subnet'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_host',
+        '_host_ip',
+        '_kind',
+        '_metadata',
+        '_subnet',
+    )
+
     def __init__(self, api_version=None, host=None, host_ip=None, kind=None, metadata=None, subnet=None):
         """
         V1HostSubnet - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1HostSubnet(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'host': 'str',
-            'host_ip': 'str',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'subnet': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'host': 'host',
-            'host_ip': 'hostIP',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'subnet': 'subnet'
-        }
-
         self._api_version = api_version
         self._host = host
         self._host_ip = host_ip
@@ -244,10 +253,26 @@ class V1HostSubnet(object):
         if not isinstance(other, V1HostSubnet):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,36 @@ class V1Identity(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'extra': 'dict(str, str)',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'provider_name': 'str',
+        'provider_user_name': 'str',
+        'user': 'V1ObjectReference'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'extra': 'extra',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'provider_name': 'providerName',
+        'provider_user_name': 'providerUserName',
+        'user': 'user'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_extra',
+        '_kind',
+        '_metadata',
+        '_provider_name',
+        '_provider_user_name',
+        '_user',
+    )
+
     def __init__(self, api_version=None, extra=None, kind=None, metadata=None, provider_name=None, provider_user_name=None, user=None):
         """
         V1Identity - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1Identity(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'extra': 'dict(str, str)',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'provider_name': 'str',
-            'provider_user_name': 'str',
-            'user': 'V1ObjectReference'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'extra': 'extra',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'provider_name': 'providerName',
-            'provider_user_name': 'providerUserName',
-            'user': 'user'
-        }
-
         self._api_version = api_version
         self._extra = extra
         self._kind = kind
@@ -270,10 +280,26 @@ class V1Identity(object):
         if not isinstance(other, V1Identity):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
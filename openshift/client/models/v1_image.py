@@ -21,6 +21,51 @@ class V1Image(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'docker_image_config': 'str',
+        'docker_image_layers': 'list[V1ImageLayer]',
+        'docker_image_manifest': 'str',
+        'docker_image_manifest_media_type': 'str',
+        'docker_image_metadata': 'RuntimeRawExtension',
+        'docker_image_metadata_version': 'str',
+        'docker_image_reference': 'str',
+        'docker_image_signatures': 'list[str]',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'signatures': 'list[V1ImageSignature]'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'docker_image_config': 'dockerImageConfig',
+        'docker_image_layers': 'dockerImageLayers',
+        'docker_image_manifest': 'dockerImageManifest',
+        'docker_image_manifest_media_type': 'dockerImageManifestMediaType',
+        'docker_image_metadata': 'dockerImageMetadata',
+        'docker_image_metadata_version': 'dockerImageMetadataVersion',
+        'docker_image_reference': 'dockerImageReference',
+        'docker_image_signatures': 'dockerImageSignatures',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'signatures': 'signatures'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_docker_image_config',
+        '_docker_image_layers',
+        '_docker_image_manifest',
+        '_docker_image_manifest_media_type',
+        '_docker_image_metadata',
+        '_docker_image_metadata_version',
+        '_docker_image_reference',
+        '_docker_image_signatures',
+        '_kind',
+        '_metadata',
+        '_signatures',
+    )
+
     def __init__(self, api_version=None, docker_image_config=None, docker_image_layers=None, docker_image_manifest=None, docker_image_manifest_media_type=None, docker_image_metadata=None, docker_image_metadata_version=None, docker_image_reference=None, docker_image_signatures=None, kind=None, metadata=None, signatures=None):
         """
         V1Image - a model defined in Swagger
@@ -30,36 +75,6 @@ class V1Image(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'docker_image_config': 'str',
-            'docker_image_layers': 'list[V1ImageLayer]',
-            'docker_image_manifest': 'str',
-            'docker_image_manifest_media_type': 'str',
-            'docker_image_metadata': 'RuntimeRawExtension',
-            'docker_image_metadata_version': 'str',
-            'docker_image_reference': 'str',
-            'docker_image_signatures': 'list[str]',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'signatures': 'list[V1ImageSignature]'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'docker_image_config': 'dockerImageConfig',
-            'docker_image_layers': 'dockerImageLayers',
-            'docker_image_manifest': 'dockerImageManifest',
-            'docker_image_manifest_media_type': 'dockerImageManifestMediaType',
-            'docker_image_metadata': 'dockerImageMetadata',
-            'docker_image_metadata_version': 'dockerImageMetadataVersion',
-            'docker_image_reference': 'dockerImageReference',
-            'docker_image_signatures': 'dockerImageSignatures',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'signatures': 'signatures'
-        }
-
         self._api_version = api_version
         self._docker_image_config = docker_image_config
         self._docker_image_layers = docker_image_layers
@@ -396,10 +411,26 @@ class V1Image(object):
         if not isinstance(other, V1Image):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
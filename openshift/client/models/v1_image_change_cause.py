@@ -21,6 +21,21 @@ class V1ImageChangeCause(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'from_ref': 'V1ObjectReference',
+        'image_id': 'str'
+    }
+
+    attribute_map = {
+        'from_ref': 'fromRef',
+        'image_id': 'imageID'
+    }
+
+    __slots__ = (
+        '_from_ref',
+        '_image_id',
+    )
+
     def __init__(self, from_ref=None, image_id=None):
         """
         V1ImageChangeCause - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ImageChangeCause(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'from_ref': 'V1ObjectReference',
-            'image_id': 'str'
-        }
-
-        self.attribute_map = {
-            'from_ref': 'fromRef',
-            'image_id': 'imageID'
-        }
-
         self._from_ref = from_ref
         self._image_id = image_id
 
@@ -134,10 +139,26 @@ class V1ImageChangeCause(object):
         if not isinstance(other, V1ImageChangeCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
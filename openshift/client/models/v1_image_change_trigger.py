@@ -21,6 +21,21 @@ class V1ImageChangeTrigger(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        '_from': 'V1ObjectReference',
+        'last_triggered_image_id': 'str'
+    }
+
+    attribute_map = {
+        '_from': 'from',
+        'last_triggered_image_id': 'lastTriggeredImageID'
+    }
+
+    __slots__ = (
+        '__from',
+        '_last_triggered_image_id',
+    )
+
     def __init__(self, _from=None, last_triggered_image_id=None):
         """
         V1ImageChangeTrigger - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ImageChangeTrigger(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            '_from': 'V1ObjectReference',
-            'last_triggered_image_id': 'str'
-        }
-
-        self.attribute_map = {
-            '_from': 'from',
-            'last_triggered_image_id': 'lastTriggeredImageID'
-        }
-
         self.__from = _from
         self._last_triggered_image_id = last_triggered_image_id
 
@@ -134,10 +139,26 @@ class V1ImageChangeTrigger(object):
         if not isinstance(other, V1ImageChangeTrigger):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,30 @@ class V1ImageImportSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        '_from': 'V1ObjectReference',
+        'import_policy': 'V1TagImportPolicy',
+        'include_manifest': 'bool',
+        'reference_policy': 'V1TagReferencePolicy',
+        'to': 'V1LocalObjectReference'
+    }
+
+    attribute_map = {
+        '_from': 'from',
+        'import_policy': 'importPolicy',
+        'include_manifest': 'includeManifest',
+        'reference_policy': 'referencePolicy',
+        'to': 'to'
+    }
+
+    __slots__ = (
+        '__from',
+        '_import_policy',
+        '_include_manifest',
+        '_reference_policy',
+        '_to',
+    )
+
     def __init__(self, _from=None, import_policy=None, include_manifest=None, reference_policy=None, to=None):
         """
         V1ImageImportSpec - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1ImageImportSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            '_from': 'V1ObjectReference',
-            'import_policy': 'V1TagImportPolicy',
-            'include_manifest': 'bool',
-            'reference_policy': 'V1TagReferencePolicy',
-            'to': 'V1LocalObjectReference'
-        }
-
-        self.attribute_map = {
-            '_from': 'from',
-            'import_policy': 'importPolicy',
-            'include_manifest': 'includeManifest',
-            'reference_policy': 'referencePolicy',
-            'to': 'to'
-        }
-
         self.__from = _from
         self._import_policy = import_policy
         self._include_manifest = include_manifest
@@ -214,10 +222,26 @@ class V1ImageImportSpec(object):
         if not isinstance(other, V1ImageImportSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
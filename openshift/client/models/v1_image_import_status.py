@@ -21,6 +21,24 @@ class V1ImageImportStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'image': 'V1Image',
+        'status': 'UnversionedStatus',
+        'tag': 'str'
+    }
+
+    attribute_map = {
+        'image': 'image',
+        'status': 'status',
+        'tag': 'tag'
+    }
+
+    __slots__ = (
+        '_image',
+        '_status',
+        '_tag',
+    )
+
     def __init__(self, image=None, status=None, tag=None):
         """
         V1ImageImportStatus - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ImageImportStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'image': 'V1Image',
-            'status': 'UnversionedStatus',
-            'tag': 'str'
-        }
-
-        self.attribute_map = {
-            'image': 'image',
-            'status': 'status',
-            'tag': 'tag'
-        }
-
         self._image = image
         self._status = status
         self._tag = tag
@@ -162,10 +168,26 @@ class V1ImageImportStatus(object):
         if not isinstance(other, V1ImageImportStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
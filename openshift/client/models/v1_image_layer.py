@@ -21,6 +21,24 @@ class V1ImageLayer(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'media_type': 'str',
+        'name': 'str',
+        'size': 'int'
+    }
+
+    attribute_map = {
+        'media_type': 'mediaType',
+        'name': 'name',
+        'size': 'size'
+    }
+
+    __slots__ = (
+        '_media_type',
+        '_name',
+        '_size',
+    )
+
     def __init__(self, media_type=None, name=None, size=None):
         """
         V1ImageLayer - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ImageLayer(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'media_type': 'str',
-            'name': 'str',
-            'size': 'int'
-        }
-
-        self.attribute_map = {
-            'media_type': 'mediaType',
-            'name': 'name',
-            'size': 'size'
-        }
-
         self._media_type = media_type
         self._name = name
         self._size = size
@@ -166,10 +172,26 @@ class V1ImageLayer(object):
         if not isinstance(other, V1ImageLayer):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
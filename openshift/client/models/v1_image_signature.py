@@ -21,6 +21,48 @@ class V1ImageSignature(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'conditions': 'list[V1SignatureCondition]',
+        'content': 'str',
+        'created': 'UnversionedTime',
+        'image_identity': 'str',
+        'issued_by': 'V1SignatureIssuer',
+        'issued_to': 'V1SignatureSubject',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'signed_claims': 'dict(str, str)',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'conditions': 'conditions',
+        'content': 'content',
+        'created': 'created',
+        'image_identity': 'imageIdentity',
+        'issued_by': 'issuedBy',
+        'issued_to': 'issuedTo',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'signed_claims': 'signedClaims',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_conditions',
+        '_content',
+        '_created',
+        '_image_identity',
+        '_issued_by',
+        '_issued_to',
+        '_kind',
+        '_metadata',
+        '_signed_claims',
+        '_type',
+    )
+
     def __init__(self, api_version=None, conditions=None, content=None, created=None, image_identity=None, issued_by=None, issued_to=None, kind=None, metadata=None, signed_claims=None, type=None):
         """
         V1ImageSignature - a model defined in Swagger
@@ -30,34 +72,6 @@ class V1ImageSignature(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'conditions': 'list[V1SignatureCondition]',
-            'content': 'str',
-            'created': 'UnversionedTime',
-            'image_identity': 'str',
-            'issued_by': 'V1SignatureIssuer',
-            'issued_to': 'V1SignatureSubject',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'signed_claims': 'dict(str, str)',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'conditions': 'conditions',
-            'content': 'content',
-            'created': 'created',
-            'image_identity': 'imageIdentity',
-            'issued_by': 'issuedBy',
-            'issued_to': 'issuedTo',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'signed_claims': 'signedClaims',
-            'type': 'type'
-        }
-
         self._api_version = api_version
         self._conditions = conditions
         self._content = content
@@ -372,10 +386,26 @@ class V1ImageSignature(object):
         if not isinstance(other, V1ImageSignature):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
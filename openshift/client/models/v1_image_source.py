@@ -21,6 +21,24 @@ class V1ImageSource(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        '_from': 'V1ObjectReference',
+        'paths': 'list[V1ImageSourcePath]',
+        'pull_secret': 'V1LocalObjectReference'
+    }
+
+    attribute_map = {
+        '_from': 'from',
+        'paths': 'paths',
+        'pull_secret': 'pullSecret'
+    }
+
+    __slots__ = (
+        '__from',
+        '_paths',
+        '_pull_secret',
+    )
+
     def __init__(self, _from=None, paths=None, pull_secret=None):
         """
         V1ImageSource - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ImageSource(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            '_from': 'V1ObjectReference',
-            'paths': 'list[V1ImageSourcePath]',
-            'pull_secret': 'V1LocalObjectReference'
-        }
-
-        self.attribute_map = {
-            '_from': 'from',
-            'paths': 'paths',
-            'pull_secret': 'pullSecret'
-        }
-
         self.__from = _from
         self._paths = paths
         self._pull_secret = pull_secret
@@ -164,10 +170,26 @@ class V1ImageSource(object):
         if not isinstance(other, V1ImageSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1ImageSourcePath(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'destination_dir': 'str',
+        'source_path': 'str'
+    }
+
+    attribute_map = {
+        'destination_dir': 'destinationDir',
+        'source_path': 'sourcePath'
+    }
+
+    __slots__ = (
+        '_destination_dir',
+        '_source_path',
+    )
+
     def __init__(self, destination_dir=None, source_path=None):
         """
         V1ImageSourcePath - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ImageSourcePath(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'destination_dir': 'str',
-            'source_path': 'str'
-        }
-
-        self.attribute_map = {
-            'destination_dir': 'destinationDir',
-            'source_path': 'sourcePath'
-        }
-
         self._destination_dir = destination_dir
         self._source_path = source_path
 
@@ -138,10 +143,26 @@ class V1ImageSourcePath(object):
         if not isinstance(other, V1ImageSourcePath):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1ImageStreamImportSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'images': 'list[V1ImageImportSpec]',
+        '_import': 'bool',
+        'repository': 'V1RepositoryImportSpec'
+    }
+
+    attribute_map = {
+        'images': 'images',
+        '_import': 'import',
+        'repository': 'repository'
+    }
+
+    __slots__ = (
+        '_images',
+        '__import',
+        '_repository',
+    )
+
     def __init__(self, images=None, _import=None, repository=None):
         """
         V1ImageStreamImportSpec - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ImageStreamImportSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'images': 'list[V1ImageImportSpec]',
-            '_import': 'bool',
-            'repository': 'V1RepositoryImportSpec'
-        }
-
-        self.attribute_map = {
-            'images': 'images',
-            '_import': 'import',
-            'repository': 'repository'
-        }
-
         self._images = images
         self.__import = _import
         self._repository = repository
@@ -162,10 +168,26 @@ class V1ImageStreamImportSpec(object):
         if not isinstance(other, V1ImageStreamImportSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1ImageStreamImportStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'images': 'list[V1ImageImportStatus]',
+        '_import': 'V1ImageStream',
+        'repository': 'V1RepositoryImportStatus'
+    }
+
+    attribute_map = {
+        'images': 'images',
+        '_import': 'import',
+        'repository': 'repository'
+    }
+
+    __slots__ = (
+        '_images',
+        '__import',
+        '_repository',
+    )
+
     def __init__(self, images=None, _import=None, repository=None):
         """
         V1ImageStreamImportStatus - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1ImageStreamImportStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'images': 'list[V1ImageImportStatus]',
-            '_import': 'V1ImageStream',
-            'repository': 'V1RepositoryImportStatus'
-        }
-
-        self.attribute_map = {
-            'images': 'images',
-            '_import': 'import',
-            'repository': 'repository'
-        }
-
         self._images = images
         self.__import = _import
         self._repository = repository
@@ -160,10 +166,26 @@ class V1ImageStreamImportStatus(object):
         if not isinstance(other, V1ImageStreamImportStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1ImageStreamSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'docker_image_repository': 'str',
+        'tags': 'list[V1TagReference]'
+    }
+
+    attribute_map = {
+        'docker_image_repository': 'dockerImageRepository',
+        'tags': 'tags'
+    }
+
+    __slots__ = (
+        '_docker_image_repository',
+        '_tags',
+    )
+
     def __init__(self, docker_image_repository=None, tags=None):
         """
         V1ImageStreamSpec - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ImageStreamSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'docker_image_repository': 'str',
-            'tags': 'list[V1TagReference]'
-        }
-
-        self.attribute_map = {
-            'docker_image_repository': 'dockerImageRepository',
-            'tags': 'tags'
-        }
-
         self._docker_image_repository = docker_image_repository
         self._tags = tags
 
@@ -134,10 +139,26 @@ class V1ImageStreamSpec(object):
         if not isinstance(other, V1ImageStreamSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
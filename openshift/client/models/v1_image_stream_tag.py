@@ -21,6 +21,36 @@ class V1ImageStreamTag(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'conditions': 'list[V1TagEventCondition]',
+        'generation': 'int',
+        'image': 'V1Image',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'tag': 'V1TagReference'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'conditions': 'conditions',
+        'generation': 'generation',
+        'image': 'image',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'tag': 'tag'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_conditions',
+        '_generation',
+        '_image',
+        '_kind',
+        '_metadata',
+        '_tag',
+    )
+
     def __init__(self, api_version=None, conditions=None, generation=None, image=None, kind=None, metadata=None, tag=None):
         """
         V1ImageStreamTag - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1ImageStreamTag(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'conditions': 'list[V1TagEventCondition]',
-            'generation': 'int',
-            'image': 'V1Image',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'tag': 'V1TagReference'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'conditions': 'conditions',
-            'generation': 'generation',
-            'image': 'image',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'tag': 'tag'
-        }
-
         self._api_version = api_version
         self._conditions = conditions
         self._generation = generation
@@ -270,10 +280,26 @@ class V1ImageStreamTag(object):
         if not isinstance(other, V1ImageStreamTag):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1JenkinsPipelineBuildStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'env': 'list[V1EnvVar]',
+        'jenkinsfile': 'str',
+        'jenkinsfile_path': 'str'
+    }
+
+    attribute_map = {
+        'env': 'env',
+        'jenkinsfile': 'jenkinsfile',
+        'jenkinsfile_path': 'jenkinsfilePath'
+    }
+
+    __slots__ = (
+        '_env',
+        '_jenkinsfile',
+        '_jenkinsfile_path',
+    )
+
     def __init__(self, env=None, jenkinsfile=None, jenkinsfile_path=None):
         """
         V1JenkinsPipelineBuildStrategy - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1JenkinsPipelineBuildStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'env': 'list[V1EnvVar]',
-            'jenkinsfile': 'str',
-            'jenkinsfile_path': 'str'
-        }
-
-        self.attribute_map = {
-            'env': 'env',
-            'jenkinsfile': 'jenkinsfile',
-            'jenkinsfile_path': 'jenkinsfilePath'
-        }
-
         self._env = env
         self._jenkinsfile = jenkinsfile
         self._jenkinsfile_path = jenkinsfile_path
@@ -160,10 +166,26 @@ class V1JenkinsPipelineBuildStrategy(object):
         if not isinstance(other, V1JenkinsPipelineBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1LifecycleHook(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'exec_new_pod': 'V1ExecNewPodHook',
+        'failure_policy': 'str',
+        'tag_images': 'list[V1TagImageHook]'
+    }
+
+    attribute_map = {
+        'exec_new_pod': 'execNewPod',
+        'failure_policy': 'failurePolicy',
+        'tag_images': 'tagImages'
+    }
+
+    __slots__ = (
+        '_exec_new_pod',
+        '_failure_policy',
+        '_tag_images',
+    )
+
     def __init__(self, exec_new_pod=None, failure_policy=None, tag_images=None):
         """
         V1LifecycleHook - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1LifecycleHook(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'exec_new_pod': 'V1ExecNewPodHook',
-            'failure_policy': 'str',
-            'tag_images': 'list[V1TagImageHook]'
-        }
-
-        self.attribute_map = {
-            'exec_new_pod': 'execNewPod',
-            'failure_policy': 'failurePolicy',
-            'tag_images': 'tagImages'
-        }
-
         self._exec_new_pod = exec_new_pod
         self._failure_policy = failure_policy
         self._tag_images = tag_images
@@ -162,10 +168,26 @@ class V1LifecycleHook(object):
         if not isinstance(other, V1LifecycleHook):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,57 @@ class V1LocalSubjectAccessReview(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'content': 'RuntimeRawExtension',
+        'groups': 'list[str]',
+        'is_non_resource_url': 'bool',
+        'kind': 'str',
+        'namespace': 'str',
+        'path': 'str',
+        'resource': 'str',
+        'resource_api_group': 'str',
+        'resource_api_version': 'str',
+        'resource_name': 'str',
+        'scopes': 'list[str]',
+        'user': 'str',
+        'verb': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'content': 'content',
+        'groups': 'groups',
+        'is_non_resource_url': 'isNonResourceURL',
+        'kind': 'kind',
+        'namespace': 'namespace',
+        'path': 'path',
+        'resource': 'resource',
+        'resource_api_group': 'resourceAPIGroup',
+        'resource_api_version': 'resourceAPIVersion',
+        'resource_name': 'resourceName',
+        'scopes': 'scopes',
+        'user': 'user',
+        'verb': 'verb'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_content',
+        '_groups',
+        '_is_non_resource_url',
+        '_kind',
+        '_namespace',
+        '_path',
+        '_resource',
+        '_resource_api_group',
+        '_resource_api_version',
+        '_resource_name',
+        '_scopes',
+        '_user',
+        '_verb',
+    )
+
     def __init__(self, api_version=None, content=None, groups=None, is_non_resource_url=None, kind=None, namespace=None, path=None, resource=None, resource_api_group=None, resource_api_version=None, resource_name=None, scopes=None, user=None, verb=None):
         """
         V1LocalSubjectAccessReview - a model defined in Swagger
@@ -30,40 +81,6 @@ class V1LocalSubjectAccessReview(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'content': 'RuntimeRawExtension',
-            'groups': 'list[str]',
-            'is_non_resource_url': 'bool',
-            'kind': 'str',
-            'namespace': 'str',
-            'path': 'str',
-            'resource': 'str',
-            'resource_api_group': 'str',
-            'resource_api_version': 'str',
-            'resource_name': 'str',
-            'scopes': 'list[str]',
-            'user': 'str',
-            'verb': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'content': 'content',
-            'groups': 'groups',
-            'is_non_resource_url': 'isNonResourceURL',
-            'kind': 'kind',
-            'namespace': 'namespace',
-            'path': 'path',
-            'resource': 'resource',
-            'resource_api_group': 'resourceAPIGroup',
-            'resource_api_version': 'resourceAPIVersion',
-            'resource_name': 'resourceName',
-            'scopes': 'scopes',
-            'user': 'user',
-            'verb': 'verb'
-        }
-
         self._api_version = api_version
         self._content = content
         self._groups = groups
@@ -468,10 +485,26 @@ class V1LocalSubjectAccessReview(object):
         if not isinstance(other, V1LocalSubjectAccessReview):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
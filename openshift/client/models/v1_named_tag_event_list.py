@@ -21,6 +21,24 @@ class V1NamedTagEventList(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'conditions': 'list[V1TagEventCondition]',
+        'items': 'list[V1TagEvent]',
+        'tag': 'str'
+    }
+
+    attribute_map = {
+        'conditions': 'conditions',
+        'items': 'items',
+        'tag': 'tag'
+    }
+
+    __slots__ = (
+        '_conditions',
+        '_items',
+        '_tag',
+    )
+
     def __init__(self, conditions=None, items=None, tag=None):
         """
         V1NamedTagEventList - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1NamedTagEventList(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'conditions': 'list[V1TagEventCondition]',
-            'items': 'list[V1TagEvent]',
-            'tag': 'str'
-        }
-
-        self.attribute_map = {
-            'conditions': 'conditions',
-            'items': 'items',
-            'tag': 'tag'
-        }
-
         self._conditions = conditions
         self._items = items
         self._tag = tag
@@ -164,10 +170,26 @@ class V1NamedTagEventList(object):
         if not isinstance(other, V1NamedTagEventList):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
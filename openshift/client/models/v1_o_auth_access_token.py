@@ -21,6 +21,48 @@ class V1OAuthAccessToken(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'authorize_token': 'str',
+        'client_name': 'str',
+        'expires_in': 'int',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'redirect_uri': 'str',
+        'refresh_token': 'str',
+        'scopes': 'list[str]',
+        'user_name': 'str',
+        'user_uid': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'authorize_token': 'authorizeToken',
+        'client_name': 'clientName',
+        'expires_in': 'expiresIn',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'redirect_uri': 'redirectURI',
+        'refresh_token': 'refreshToken',
+        'scopes': 'scopes',
+        'user_name': 'userName',
+        'user_uid': 'userUID'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_authorize_token',
+        '_client_name',
+        '_expires_in',
+        '_kind',
+        '_metadata',
+        '_redirect_uri',
+        '_refresh_token',
+        '_scopes',
+        '_user_name',
+        '_user_uid',
+    )
+
     def __init__(self, api_version=None, authorize_token=None, client_name=None, expires_in=None, kind=None, metadata=None, redirect_uri=None, refresh_token=None, scopes=None, user_name=None, user_uid=None):
         """
         V1OAuthAccessToken - a model defined in Swagger
@@ -30,34 +72,6 @@ class V1OAuthAccessToken(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'authorize_token': 'str',
-            'client_name': 'str',
-            'expires_in': 'int',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'redirect_uri': 'str',
-            'refresh_token': 'str',
-            'scopes': 'list[str]',
-            'user_name': 'str',
-            'user_uid': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'authorize_token': 'authorizeToken',
-            'client_name': 'clientName',
-            'expires_in': 'expiresIn',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'redirect_uri': 'redirectURI',
-            'refresh_token': 'refreshToken',
-            'scopes': 'scopes',
-            'user_name': 'userName',
-            'user_uid': 'userUID'
-        }
-
         self._api_version = api_version
         self._authorize_token = authorize_token
         self._client_name = client_name
@@ -368,10 +382,26 @@ class V1OAuthAccessToken(object):
         if not isinstance(other, V1OAuthAccessToken):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,51 @@ class V1OAuthAuthorizeToken(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'client_name': 'str',
+        'code_challenge': 'str',
+        'code_challenge_method': 'str',
+        'expires_in': 'int',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'redirect_uri': 'str',
+        'scopes': 'list[str]',
+        'state': 'str',
+        'user_name': 'str',
+        'user_uid': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'client_name': 'clientName',
+        'code_challenge': 'codeChallenge',
+        'code_challenge_method': 'codeChallengeMethod',
+        'expires_in': 'expiresIn',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'redirect_uri': 'redirectURI',
+        'scopes': 'scopes',
+        'state': 'state',
+        'user_name': 'userName',
+        'user_uid': 'userUID'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_client_name',
+        '_code_challenge',
+        '_code_challenge_method',
+        '_expires_in',
+        '_kind',
+        '_metadata',
+        '_redirect_uri',
+        '_scopes',
+        '_state',
+        '_user_name',
+        '_user_uid',
+    )
+
     def __init__(self, api_version=None, client_name=None, code_challenge=None, code_challenge_method=None, expires_in=None, kind=None, metadata=None, redirect_uri=None, scopes=None, state=None, user_name=None, user_uid=None):
         """
         V1OAuthAuthorizeToken - a model defined in Swagger
@@ -30,36 +75,6 @@ class V1OAuthAuthorizeToken(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'client_name': 'str',
-            'code_challenge': 'str',
-            'code_challenge_method': 'str',
-            'expires_in': 'int',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'redirect_uri': 'str',
-            'scopes': 'list[str]',
-            'state': 'str',
-            'user_name': 'str',
-            'user_uid': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'client_name': 'clientName',
-            'code_challenge': 'codeChallenge',
-            'code_challenge_method': 'codeChallengeMethod',
-            'expires_in': 'expiresIn',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'redirect_uri': 'redirectURI',
-            'scopes': 'scopes',
-            'state': 'state',
-            'user_name': 'userName',
-            'user_uid': 'userUID'
-        }
-
         self._api_version = api_version
         self._client_name = client_name
         self._code_challenge = code_challenge
@@ -394,10 +409,26 @@ class V1OAuthAuthorizeToken(object):
         if not isinstance(other, V1OAuthAuthorizeToken):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
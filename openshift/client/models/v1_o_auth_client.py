@@ -21,6 +21,42 @@ class V1OAuthClient(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'additional_secrets': 'list[str]',
+        'api_version': 'str',
+        'grant_method': 'str',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'redirect_ur_is': 'list[str]',
+        'respond_with_challenges': 'bool',
+        'scope_restrictions': 'list[V1ScopeRestriction]',
+        'secret': 'str'
+    }
+
+    attribute_map = {
+        'additional_secrets': 'additionalSecrets',
+        'api_version': 'apiVersion',
+        'grant_method': 'grantMethod',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'redirect_ur_is': 'redirectURIs',
+        'respond_with_challenges': 'respondWithChallenges',
+        'scope_restrictions': 'scopeRestrictions',
+        'secret': 'secret'
+    }
+
+    __slots__ = (
+        '_additional_secrets',
+        '_api_version',
+        '_grant_method',
+        '_kind',
+        '_metadata',
+        '_redirect_ur_is',
+        '_respond_with_challenges',
+        '_scope_restrictions',
+        '_secret',
+    )
+
     def __init__(self, additional_secrets=None, api_version=None, grant_method=None, kind=None, metadata=None, redirect_ur_is=None, respond_with_challenges=None, scope_restrictions=None, secret=None):
         """
         V1OAuthClient - a model defined in Swagger
@@ -30,30 +66,6 @@ class V1OAuthClient(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'additional_secrets': 'list[str]',
-            'api_version': 'str',
-            'grant_method': 'str',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'redirect_ur_is': 'list[str]',
-            'respond_with_challenges': 'bool',
-            'scope_restrictions': 'list[V1ScopeRestriction]',
-            'secret': 'str'
-        }
-
-        self.attribute_map = {
-            'additional_secrets': 'additionalSecrets',
-            'api_version': 'apiVersion',
-            'grant_method': 'grantMethod',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'redirect_ur_is': 'redirectURIs',
-            'respond_with_challenges': 'respondWithChallenges',
-            'scope_restrictions': 'scopeRestrictions',
-            'secret': 'secret'
-        }
-
         self._additional_secrets = additional_secrets
         self._api_version = api_version
         self._grant_method = grant_method
@@ -316,10 +328,26 @@ class V1OAuthClient(object):
         if not isinstance(other, V1OAuthClient):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
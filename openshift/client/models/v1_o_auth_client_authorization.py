@@ -21,6 +21,36 @@ class V1OAuthClientAuthorization(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'client_name': 'str',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'scopes': 'list[str]',
+        'user_name': 'str',
+        'user_uid': 'str'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'client_name': 'clientName',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'scopes': 'scopes',
+        'user_name': 'userName',
+        'user_uid': 'userUID'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_client_name',
+        '_kind',
+        '_metadata',
+        '_scopes',
+        '_user_name',
+        '_user_uid',
+    )
+
     def __init__(self, api_version=None, client_name=None, kind=None, metadata=None, scopes=None, user_name=None, user_uid=None):
         """
         V1OAuthClientAuthorization - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1OAuthClientAuthorization(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'client_name': 'str',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'scopes': 'list[str]',
-            'user_name': 'str',
-            'user_uid': 'str'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'client_name': 'clientName',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'scopes': 'scopes',
-            'user_name': 'userName',
-            'user_uid': 'userUID'
-        }
-
         self._api_version = api_version
         self._client_name = client_name
         self._kind = kind
@@ -264,10 +274,26 @@ class V1OAuthClientAuthorization(object):
         if not isinstance(other, V1OAuthClientAuthorization):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,36 @@ class V1Parameter(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'description': 'str',
+        'display_name': 'str',
+        '_from': 'str',
+        'generate': 'str',
+        'name': 'str',
+        'required': 'bool',
+        'value': 'str'
+    }
+
+    attribute_map = {
+        'description': 'description',
+        'display_name': 'displayName',
+        '_from': 'from',
+        'generate': 'generate',
+        'name': 'name',
+        'required': 'required',
+        'value': 'value'
+    }
+
+    __slots__ = (
+        '_description',
+        '_display_name',
+        '__from',
+        '_generate',
+        '_name',
+        '_required',
+        '_value',
+    )
+
     def __init__(self, description=None, display_name=None, _from=None, generate=None, name=None, required=None, value=None):
         """
         V1Parameter - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1Parameter(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'description': 'str',
-            'display_name': 'str',
-            '_from': 'str',
-            'generate': 'str',
-            'name': 'str',
-            'required': 'bool',
-            'value': 'str'
-        }
-
-        self.attribute_map = {
-            'description': 'description',
-            'display_name': 'displayName',
-            '_from': 'from',
-            'generate': 'generate',
-            'name': 'name',
-            'required': 'required',
-            'value': 'value'
-        }
-
         self._description = description
         self._display_name = display_name
         self.__from = _from
@@ -266,10 +276,26 @@ class V1Parameter(object):
         if not isinstance(other, V1Parameter):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1PodSecurityPolicyReviewSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'service_account_names': 'list[str]',
+        'template': 'V1PodTemplateSpec'
+    }
+
+    attribute_map = {
+        'service_account_names': 'serviceAccountNames',
+        'template': 'template'
+    }
+
+    __slots__ = (
+        '_service_account_names',
+        '_template',
+    )
+
     def __init__(self, service_account_names=None, template=None):
         """
         V1PodSecurityPolicyReviewSpec - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1PodSecurityPolicyReviewSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'service_account_names': 'list[str]',
-            'template': 'V1PodTemplateSpec'
-        }
-
-        self.attribute_map = {
-            'service_account_names': 'serviceAccountNames',
-            'template': 'template'
-        }
-
         self._service_account_names = service_account_names
         self._template = template
 
@@ -136,10 +141,26 @@ class V1PodSecurityPolicyReviewSpec(object):
         if not isinstance(other, V1PodSecurityPolicyReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,27 @@ class V1PodSecurityPolicySelfSubjectReview(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'kind': 'str',
+        'spec': 'V1PodSecurityPolicySelfSubjectReviewSpec',
+        'status': 'V1PodSecurityPolicySubjectReviewStatus'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'kind': 'kind',
+        'spec': 'spec',
+        'status': 'status'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_spec',
+        '_status',
+    )
+
     def __init__(self, api_version=None, kind=None, spec=None, status=None):
         """
         V1PodSecurityPolicySelfSubjectReview - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1PodSecurityPolicySelfSubjectReview(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'kind': 'str',
-            'spec': 'V1PodSecurityPolicySelfSubjectReviewSpec',
-            'status': 'V1PodSecurityPolicySubjectReviewStatus'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'kind': 'kind',
-            'spec': 'spec',
-            'status': 'status'
-        }
-
         self._api_version = api_version
         self._kind = kind
         self._spec = spec
@@ -188,10 +195,26 @@ class V1PodSecurityPolicySelfSubjectReview(object):
         if not isinstance(other, V1PodSecurityPolicySelfSubjectReview):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
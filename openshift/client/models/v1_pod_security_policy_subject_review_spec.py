@@ -21,6 +21,24 @@ class V1PodSecurityPolicySubjectReviewSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'groups': 'list[str]',
+        'template': 'V1PodTemplateSpec',
+        'user': 'str'
+    }
+
+    attribute_map = {
+        'groups': 'groups',
+        'template': 'template',
+        'user': 'user'
+    }
+
+    __slots__ = (
+        '_groups',
+        '_template',
+        '_user',
+    )
+
     def __init__(self, groups=None, template=None, user=None):
         """
         V1PodSecurityPolicySubjectReviewSpec - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1PodSecurityPolicySubjectReviewSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'groups': 'list[str]',
-            'template': 'V1PodTemplateSpec',
-            'user': 'str'
-        }
-
-        self.attribute_map = {
-            'groups': 'groups',
-            'template': 'template',
-            'user': 'user'
-        }
-
         self._groups = groups
         self._template = template
         self._user = user
@@ -162,10 +168,26 @@ class V1PodSecurityPolicySubjectReviewSpec(object):
         if not isinstance(other, V1PodSecurityPolicySubjectReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
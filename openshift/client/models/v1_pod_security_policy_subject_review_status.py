@@ -21,6 +21,24 @@ class V1PodSecurityPolicySubjectReviewStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allowed_by': 'V1ObjectReference',
+        'reason': 'str',
+        'template': 'V1PodTemplateSpec'
+    }
+
+    attribute_map = {
+        'allowed_by': 'allowedBy',
+        'reason': 'reason',
+        'template': 'template'
+    }
+
+    __slots__ = (
+        '_allowed_by',
+        '_reason',
+        '_template',
+    )
+
     def __init__(self, allowed_by=None, reason=None, template=None):
         """
         V1PodSecurityPolicySubjectReviewStatus - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1PodSecurityPolicySubjectReviewStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allowed_by': 'V1ObjectReference',
-            'reason': 'str',
-            'template': 'V1PodTemplateSpec'
-        }
-
-        self.attribute_map = {
-            'allowed_by': 'allowedBy',
-            'reason': 'reason',
-            'template': 'template'
-        }
-
         self._allowed_by = allowed_by
         self._reason = reason
         self._template = template
@@ -160,10 +166,26 @@ class V1PodSecurityPolicySubjectReviewStatus(object):
         if not isinstance(other, V1PodSecurityPolicySubjectReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
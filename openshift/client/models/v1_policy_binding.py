@@ -21,6 +21,33 @@ class V1PolicyBinding(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'kind': 'str',
+        'last_modified': 'UnversionedTime',
+        'metadata': 'V1ObjectMeta',
+        'policy_ref': 'V1ObjectReference',
+        'role_bindings': 'list[V1NamedRoleBinding]'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'kind': 'kind',
+        'last_modified': 'lastModified',
+        'metadata': 'metadata',
+        'policy_ref': 'policyRef',
+        'role_bindings': 'roleBindings'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_last_modified',
+        '_metadata',
+        '_policy_ref',
+        '_role_bindings',
+    )
+
     def __init__(self, api_version=None, kind=None, last_modified=None, metadata=None, policy_ref=None, role_bindings=None):
         """
         V1PolicyBinding - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1PolicyBinding(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'kind': 'str',
-            'last_modified': 'UnversionedTime',
-            'metadata': 'V1ObjectMeta',
-            'policy_ref': 'V1ObjectReference',
-            'role_bindings': 'list[V1NamedRoleBinding]'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'kind': 'kind',
-            'last_modified': 'lastModified',
-            'metadata': 'metadata',
-            'policy_ref': 'policyRef',
-            'role_bindings': 'roleBindings'
-        }
-
         self._api_version = api_version
         self._kind = kind
         self._last_modified = last_modified
@@ -244,10 +253,26 @@ class V1PolicyBinding(object):
         if not isinstance(other, V1PolicyBinding):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
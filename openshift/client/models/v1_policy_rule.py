@@ -21,6 +21,33 @@ class V1PolicyRule(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_groups': 'list[str]',
+        'attribute_restrictions': 'RuntimeRawExtension',
+        'non_resource_ur_ls': 'list[str]',
+        'resource_names': 'list[str]',
+        'resources': 'list[str]',
+        'verbs': 'list[str]'
+    }
+
+    attribute_map = {
+        'api_groups': 'apiGroups',
+        'attribute_restrictions': 'attributeRestrictions',
+        'non_resource_ur_ls': 'nonResourceURLs',
+        'resource_names': 'resourceNames',
+        'resources': 'resources',
+        'verbs': 'verbs'
+    }
+
+    __slots__ = (
+        '_api_groups',
+        '_attribute_restrictions',
+        '_non_resource_ur_ls',
+        '_resource_names',
+        '_resources',
+        '_verbs',
+    )
+
     def __init__(self, api_groups=None, attribute_restrictions=None, non_resource_ur_ls=None, resource_names=None, resources=None, verbs=None):
         """
         V1PolicyRule - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1PolicyRule(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_groups': 'list[str]',
-            'attribute_restrictions': 'RuntimeRawExtension',
-            'non_resource_ur_ls': 'list[str]',
-            'resource_names': 'list[str]',
-            'resources': 'list[str]',
-            'verbs': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'api_groups': 'apiGroups',
-            'attribute_restrictions': 'attributeRestrictions',
-            'non_resource_ur_ls': 'nonResourceURLs',
-            'resource_names': 'resourceNames',
-            'resources': 'resources',
-            'verbs': 'verbs'
-        }
-
         self._api_groups = api_groups
         self._attribute_restrictions = attribute_restrictions
         self._non_resource_ur_ls = non_resource_ur_ls
@@ -244,10 +253,26 @@ class V1PolicyRule(object):
         if not isinstance(other, V1PolicyRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,30 @@ class V1ProjectRequest(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'description': 'str',
+        'display_name': 'str',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'description': 'description',
+        'display_name': 'displayName',
+        'kind': 'kind',
+        'metadata': 'metadata'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_description',
+        '_display_name',
+        '_kind',
+        '_metadata',
+    )
+
     def __init__(self, api_version=None, description=None, display_name=None, kind=None, metadata=None):
         """
         V1ProjectRequest - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1ProjectRequest(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'description': 'str',
-            'display_name': 'str',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'description': 'description',
-            'display_name': 'displayName',
-            'kind': 'kind',
-            'metadata': 'metadata'
-        }
-
         self._api_version = api_version
         self._description = description
         self._display_name = display_name
@@ -212,10 +220,26 @@ class V1ProjectRequest(object):
         if not isinstance(other, V1ProjectRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
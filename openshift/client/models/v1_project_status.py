@@ -21,6 +21,18 @@ class V1ProjectStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'phase': 'str'
+    }
+
+    attribute_map = {
+        'phase': 'phase'
+    }
+
+    __slots__ = (
+        '_phase',
+    )
+
     def __init__(self, phase=None):
         """
         V1ProjectStatus - a model defined in Swagger
@@ -30,14 +42,6 @@ class V1ProjectStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'phase': 'str'
-        }
-
-        self.attribute_map = {
-            'phase': 'phase'
-        }
-
         self._phase = phase
 
     @property
@@ -108,10 +112,26 @@ class V1ProjectStatus(object):
         if not isinstance(other, V1ProjectStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
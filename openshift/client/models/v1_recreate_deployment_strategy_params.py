@@ -21,6 +21,27 @@ class V1RecreateDeploymentStrategyParams(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'mid': 'V1LifecycleHook',
+        'post': 'V1LifecycleHook',
+        'pre': 'V1LifecycleHook',
+        'timeout_seconds': 'int'
+    }
+
+    attribute_map = {
+        'mid': 'mid',
+        'post': 'post',
+        'pre': 'pre',
+        'timeout_seconds': 'timeoutSeconds'
+    }
+
+    __slots__ = (
+        '_mid',
+        '_post',
+        '_pre',
+        '_timeout_seconds',
+    )
+
     def __init__(self, mid=None, post=None, pre=None, timeout_seconds=None):
         """
         V1RecreateDeploymentStrategyParams - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1RecreateDeploymentStrategyParams(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'mid': 'V1LifecycleHook',
-            'post': 'V1LifecycleHook',
-            'pre': 'V1LifecycleHook',
-            'timeout_seconds': 'int'
-        }
-
-        self.attribute_map = {
-            'mid': 'mid',
-            'post': 'post',
-            'pre': 'pre',
-            'timeout_seconds': 'timeoutSeconds'
-        }
-
         self._mid = mid
         self._post = post
         self._pre = pre
@@ -186,10 +193,26 @@ class V1RecreateDeploymentStrategyParams(object):
         if not isinstance(other, V1RecreateDeploymentStrategyParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1RepositoryImportStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'additional_tags': 'list[str]',
+        'images': 'list[V1ImageImportStatus]',
+        'status': 'UnversionedStatus'
+    }
+
+    attribute_map = {
+        'additional_tags': 'additionalTags',
+        'images': 'images',
+        'status': 'status'
+    }
+
+    __slots__ = (
+        '_additional_tags',
+        '_images',
+        '_status',
+    )
+
     def __init__(self, additional_tags=None, images=None, status=None):
         """
         V1RepositoryImportStatus - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1RepositoryImportStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'additional_tags': 'list[str]',
-            'images': 'list[V1ImageImportStatus]',
-            'status': 'UnversionedStatus'
-        }
-
-        self.attribute_map = {
-            'additional_tags': 'additionalTags',
-            'images': 'images',
-            'status': 'status'
-        }
-
         self._additional_tags = additional_tags
         self._images = images
         self._status = status
@@ -160,10 +166,26 @@ class V1RepositoryImportStatus(object):
         if not isinstance(other, V1RepositoryImportStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1ResourceQuotaStatusByNamespace(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'namespace': 'str',
+        'status': 'V1ResourceQuotaStatus'
+    }
+
+    attribute_map = {
+        'namespace': 'namespace',
+        'status': 'status'
+    }
+
+    __slots__ = (
+        '_namespace',
+        '_status',
+    )
+
     def __init__(self, namespace=None, status=None):
         """
         V1ResourceQuotaStatusByNamespace - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ResourceQuotaStatusByNamespace(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'namespace': 'str',
-            'status': 'V1ResourceQuotaStatus'
-        }
-
-        self.attribute_map = {
-            'namespace': 'namespace',
-            'status': 'status'
-        }
-
         self._namespace = namespace
         self._status = status
 
@@ -138,10 +143,26 @@ class V1ResourceQuotaStatusByNamespace(object):
         if not isinstance(other, V1ResourceQuotaStatusByNamespace):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1RoleBindingRestrictionSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'grouprestriction': 'V1GroupRestriction',
+        'serviceaccountrestriction': 'V1ServiceAccountRestriction',
+        'userrestriction': 'V1UserRestriction'
+    }
+
+    attribute_map = {
+        'grouprestriction': 'grouprestriction',
+        'serviceaccountrestriction': 'serviceaccountrestriction',
+        'userrestriction': 'userrestriction'
+    }
+
+    __slots__ = (
+        '_grouprestriction',
+        '_serviceaccountrestriction',
+        '_userrestriction',
+    )
+
     def __init__(self, grouprestriction=None, serviceaccountrestriction=None, userrestriction=None):
         """
         V1RoleBindingRestrictionSpec - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1RoleBindingRestrictionSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'grouprestriction': 'V1GroupRestriction',
-            'serviceaccountrestriction': 'V1ServiceAccountRestriction',
-            'userrestriction': 'V1UserRestriction'
-        }
-
-        self.attribute_map = {
-            'grouprestriction': 'grouprestriction',
-            'serviceaccountrestriction': 'serviceaccountrestriction',
-            'userrestriction': 'userrestriction'
-        }
-
         self._grouprestriction = grouprestriction
         self._serviceaccountrestriction = serviceaccountrestriction
         self._userrestriction = userrestriction
@@ -166,10 +172,26 @@ class V1RoleBindingRestrictionSpec(object):
         if not isinstance(other, V1RoleBindingRestrictionSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,36 @@ class V1RollingDeploymentStrategyParams(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'interval_seconds': 'int',
+        'max_surge': 'IntstrIntOrString',
+        'max_unavailable': 'IntstrIntOrString',
+        'post': 'V1LifecycleHook',
+        'pre': 'V1LifecycleHook',
+        'timeout_seconds': 'int',
+        'update_period_seconds': 'int'
+    }
+
+    attribute_map = {
+        'interval_seconds': 'intervalSeconds',
+        'max_surge': 'maxSurge',
+        'max_unavailable': 'maxUnavailable',
+        'post': 'post',
+        'pre': 'pre',
+        'timeout_seconds': 'timeoutSeconds',
+        'update_period_seconds': 'updatePeriodSeconds'
+    }
+
+    __slots__ = (
+        '_interval_seconds',
+        '_max_surge',
+        '_max_unavailable',
+        '_post',
+        '_pre',
+        '_timeout_seconds',
+        '_update_period_seconds',
+    )
+
     def __init__(self, interval_seconds=None, max_surge=None, max_unavailable=None, post=None, pre=None, timeout_seconds=None, update_period_seconds=None):
         """
         V1RollingDeploymentStrategyParams - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1RollingDeploymentStrategyParams(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'interval_seconds': 'int',
-            'max_surge': 'IntstrIntOrString',
-            'max_unavailable': 'IntstrIntOrString',
-            'post': 'V1LifecycleHook',
-            'pre': 'V1LifecycleHook',
-            'timeout_seconds': 'int',
-            'update_period_seconds': 'int'
-        }
-
-        self.attribute_map = {
-            'interval_seconds': 'intervalSeconds',
-            'max_surge': 'maxSurge',
-            'max_unavailable': 'maxUnavailable',
-            'post': 'post',
-            'pre': 'pre',
-            'timeout_seconds': 'timeoutSeconds',
-            'update_period_seconds': 'updatePeriodSeconds'
-        }
-
         self._interval_seconds = interval_seconds
         self._max_surge = max_surge
         self._max_unavailable = max_unavailable
@@ -264,10 +274,26 @@ class V1RollingDeploymentStrategyParams(object):
         if not isinstance(other, V1RollingDeploymentStrategyParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
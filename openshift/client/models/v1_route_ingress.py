@@ -21,6 +21,30 @@ class V1RouteIngress(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'conditions': 'list[V1RouteIngressCondition]',
+        'host': 'str',
+        'router_canonical_hostname': 'str',
+        'router_name': 'str',
+        'wildcard_policy': 'str'
+    }
+
+    attribute_map = {
+        'conditions': 'conditions',
+        'host': 'host',
+        'router_canonical_hostname': 'routerCanonicalHostname',
+        'router_name': 'routerName',
+        'wildcard_policy': 'wildcardPolicy'
+    }
+
+    __slots__ = (
+        '_conditions',
+        '_host',
+        '_router_canonical_hostname',
+        '_router_name',
+        '_wildcard_policy',
+    )
+
     def __init__(self, conditions=None, host=None, router_canonical_hostname=None, router_name=None, wildcard_policy=None):
         """
         V1RouteIngress - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1RouteIngress(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'conditions': 'list[V1RouteIngressCondition]',
-            'host': 'str',
-            'router_canonical_hostname': 'str',
-            'router_name': 'str',
-            'wildcard_policy': 'str'
-        }
-
-        self.attribute_map = {
-            'conditions': 'conditions',
-            'host': 'host',
-            'router_canonical_hostname': 'routerCanonicalHostname',
-            'router_name': 'routerName',
-            'wildcard_policy': 'wildcardPolicy'
-        }
-
         self._conditions = conditions
         self._host = host
         self._router_canonical_hostname = router_canonical_hostname
@@ -212,10 +220,26 @@ class V1RouteIngress(object):
         if not isinstance(other, V1RouteIngress):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
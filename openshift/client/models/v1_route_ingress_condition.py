@@ -21,6 +21,30 @@ class V1RouteIngressCondition(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'last_transition_time': 'UnversionedTime',
+        'message': 'str',
+        'reason': 'str',
+        'status': 'str',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'last_transition_time': 'lastTransitionTime',
+        'message': 'message',
+        'reason': 'reason',
+        'status': 'status',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_last_transition_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+    )
+
     def __init__(self, last_transition_time=None, message=None, reason=None, status=None, type=None):
         """
         V1RouteIngressCondition - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1RouteIngressCondition(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'last_transition_time': 'UnversionedTime',
-            'message': 'str',
-            'reason': 'str',
-            'status': 'str',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'last_transition_time': 'lastTransitionTime',
-            'message': 'message',
-            'reason': 'reason',
-            'status': 'status',
-            'type': 'type'
-        }
-
         self._last_transition_time = last_transition_time
         self._message = message
         self._reason = reason
@@ -216,10 +224,26 @@ class V1RouteIngressCondition(object):
         if not isinstance(other, V1RouteIngressCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
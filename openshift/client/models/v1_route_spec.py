@@ -21,6 +21,36 @@ class V1RouteSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'alternate_backends': 'list[V1RouteTargetReference]',
+        'host': 'str',
+        'path': 'str',
+        'port': 'V1RoutePort',
+        'tls': 'V1TLSConfig',
+        'to': 'V1RouteTargetReference',
+        'wildcard_policy': 'str'
+    }
+
+    attribute_map = {
+        'alternate_backends': 'alternateBackends',
+        'host': 'host',
+        'path': 'path',
+        'port': 'port',
+        'tls': 'tls',
+        'to': 'to',
+        'wildcard_policy': 'wildcardPolicy'
+    }
+
+    __slots__ = (
+        '_alternate_backends',
+        '_host',
+        '_path',
+        '_port',
+        '_tls',
+        '_to',
+        '_wildcard_policy',
+    )
+
     def __init__(self, alternate_backends=None, host=None, path=None, port=None, tls=None, to=None, wildcard_policy=None):
         """
         V1RouteSpec - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1RouteSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'alternate_backends': 'list[V1RouteTargetReference]',
-            'host': 'str',
-            'path': 'str',
-            'port': 'V1RoutePort',
-            'tls': 'V1TLSConfig',
-            'to': 'V1RouteTargetReference',
-            'wildcard_policy': 'str'
-        }
-
-        self.attribute_map = {
-            'alternate_backends': 'alternateBackends',
-            'host': 'host',
-            'path': 'path',
-            'port': 'port',
-            'tls': 'tls',
-            'to': 'to',
-            'wildcard_policy': 'wildcardPolicy'
-        }
-
         self._alternate_backends = alternate_backends
         self._host = host
         self._path = path
@@ -268,10 +278,26 @@ class V1RouteSpec(object):
         if not isinstance(other, V1RouteSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1RouteTargetReference(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'kind': 'str',
+        'name': 'str',
+        'weight': 'int'
+    }
+
+    attribute_map = {
+        'kind': 'kind',
+        'name': 'name',
+        'weight': 'weight'
+    }
+
+    __slots__ = (
+        '_kind',
+        '_name',
+        '_weight',
+    )
+
     def __init__(self, kind=None, name=None, weight=None):
         """
         V1RouteTargetReference - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1RouteTargetReference(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'kind': 'str',
-            'name': 'str',
-            'weight': 'int'
-        }
-
-        self.attribute_map = {
-            'kind': 'kind',
-            'name': 'name',
-            'weight': 'weight'
-        }
-
         self._kind = kind
         self._name = name
         self._weight = weight
@@ -166,10 +172,26 @@ class V1RouteTargetReference(object):
         if not isinstance(other, V1RouteTargetReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
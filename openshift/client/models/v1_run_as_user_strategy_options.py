@@ -21,6 +21,27 @@ class V1RunAsUserStrategyOptions(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'type': 'str',
+        'uid': 'int',
+        'uid_range_max': 'int',
+        'uid_range_min': 'int'
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'uid': 'uid',
+        'uid_range_max': 'uidRangeMax',
+        'uid_range_min': 'uidRangeMin'
+    }
+
+    __slots__ = (
+        '_type',
+        '_uid',
+        '_uid_range_max',
+        '_uid_range_min',
+    )
+
     def __init__(self, type=None, uid=None, uid_range_max=None, uid_range_min=None):
         """
         V1RunAsUserStrategyOptions - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1RunAsUserStrategyOptions(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'type': 'str',
-            'uid': 'int',
-            'uid_range_max': 'int',
-            'uid_range_min': 'int'
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'uid': 'uid',
-            'uid_range_max': 'uidRangeMax',
-            'uid_range_min': 'uidRangeMin'
-        }
-
         self._type = type
         self._uid = uid
         self._uid_range_max = uid_range_max
@@ -186,10 +193,26 @@ class V1RunAsUserStrategyOptions(object):
         if not isinstance(other, V1RunAsUserStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1ScopeRestriction(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'cluster_role': 'V1ClusterRoleScopeRestriction',
+        'literals': 'list[str]'
+    }
+
+    attribute_map = {
+        'cluster_role': 'clusterRole',
+        'literals': 'literals'
+    }
+
+    __slots__ = (
+        '_cluster_role',
+        '_literals',
+    )
+
     def __init__(self, cluster_role=None, literals=None):
         """
         V1ScopeRestriction - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1ScopeRestriction(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'cluster_role': 'V1ClusterRoleScopeRestriction',
-            'literals': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'cluster_role': 'clusterRole',
-            'literals': 'literals'
-        }
-
         self._cluster_role = cluster_role
         self._literals = literals
 
@@ -134,10 +139,26 @@ class V1ScopeRestriction(object):
         if not isinstance(other, V1ScopeRestriction):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
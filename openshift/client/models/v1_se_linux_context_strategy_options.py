@@ -21,6 +21,21 @@ class V1SELinuxContextStrategyOptions(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'se_linux_options': 'V1SELinuxOptions',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'se_linux_options': 'seLinuxOptions',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_se_linux_options',
+        '_type',
+    )
+
     def __init__(self, se_linux_options=None, type=None):
         """
         V1SELinuxContextStrategyOptions - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1SELinuxContextStrategyOptions(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'se_linux_options': 'V1SELinuxOptions',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'se_linux_options': 'seLinuxOptions',
-            'type': 'type'
-        }
-
         self._se_linux_options = se_linux_options
         self._type = type
 
@@ -134,10 +139,26 @@ class V1SELinuxContextStrategyOptions(object):
         if not isinstance(other, V1SELinuxContextStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
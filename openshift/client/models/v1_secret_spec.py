@@ -21,6 +21,21 @@ class V1SecretSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'mount_path': 'str',
+        'secret_source': 'V1LocalObjectReference'
+    }
+
+    attribute_map = {
+        'mount_path': 'mountPath',
+        'secret_source': 'secretSource'
+    }
+
+    __slots__ = (
+        '_mount_path',
+        '_secret_source',
+    )
+
     def __init__(self, mount_path=None, secret_source=None):
         """
         V1SecretSpec - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1SecretSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'mount_path': 'str',
-            'secret_source': 'V1LocalObjectReference'
-        }
-
-        self.attribute_map = {
-            'mount_path': 'mountPath',
-            'secret_source': 'secretSource'
-        }
-
         self._mount_path = mount_path
         self._secret_source = secret_source
 
@@ -138,10 +143,26 @@ class V1SecretSpec(object):
         if not isinstance(other, V1SecretSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,81 @@ class V1SecurityContextConstraints(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allow_host_dir_volume_plugin': 'bool',
+        'allow_host_ipc': 'bool',
+        'allow_host_network': 'bool',
+        'allow_host_pid': 'bool',
+        'allow_host_ports': 'bool',
+        'allow_privileged_container': 'bool',
+        'allowed_capabilities': 'list[str]',
+        'api_version': 'str',
+        'default_add_capabilities': 'list[str]',
+        'fs_group': 'V1FSGroupStrategyOptions',
+        'groups': 'list[str]',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'priority': 'int',
+        'read_only_root_filesystem': 'bool',
+        'required_drop_capabilities': 'list[str]',
+        'run_as_user': 'V1RunAsUserStrategyOptions',
+        'se_linux_context': 'V1SELinuxContextStrategyOptions',
+        'seccomp_profiles': 'list[str]',
+        'supplemental_groups': 'V1SupplementalGroupsStrategyOptions',
+        'users': 'list[str]',
+        'volumes': 'list[str]'
+    }
+
+    attribute_map = {
+        'allow_host_dir_volume_plugin': 'allowHostDirVolumePlugin',
+        'allow_host_ipc': 'allowHostIPC',
+        'allow_host_network': 'allowHostNetwork',
+        'allow_host_pid': 'allowHostPID',
+        'allow_host_ports': 'allowHostPorts',
+        'allow_privileged_container': 'allowPrivilegedContainer',
+        'allowed_capabilities': 'allowedCapabilities',
+        'api_version': 'apiVersion',
+        'default_add_capabilities': 'defaultAddCapabilities',
+        'fs_group': 'fsGroup',
+        'groups': 'groups',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'priority': 'priority',
+        'read_only_root_filesystem': 'readOnlyRootFilesystem',
+        'required_drop_capabilities': 'requiredDropCapabilities',
+        'run_as_user': 'runAsUser',
+        'se_linux_context': 'seLinuxContext',
+        'seccomp_profiles': 'seccompProfiles',
+        'supplemental_groups': 'supplementalGroups',
+        'users': 'users',
+        'volumes': 'volumes'
+    }
+
+    __slots__ = (
+        '_allow_host_dir_volume_plugin',
+        '_allow_host_ipc',
+        '_allow_host_network',
+        '_allow_host_pid',
+        '_allow_host_ports',
+        '_allow_privileged_container',
+        '_allowed_capabilities',
+        '_api_version',
+        '_default_add_capabilities',
+        '_fs_group',
+        '_groups',
+        '_kind',
+        '_metadata',
+        '_priority',
+        '_read_only_root_filesystem',
+        '_required_drop_capabilities',
+        '_run_as_user',
+        '_se_linux_context',
+        '_seccomp_profiles',
+        '_supplemental_groups',
+        '_users',
+        '_volumes',
+    )
+
     def __init__(self, allow_host_dir_volume_plugin=None, allow_host_ipc=None, allow_host_network=None, allow_host_pid=None, allow_host_ports=None, allow_privileged_container=None, allowed_capabilities=None, api_version=None, default_add_capabilities=None, fs_group=None, groups=None, kind=None, metadata=None, priority=None, read_only_root_filesystem=None, required_drop_capabilities=None, run_as_user=None, se_linux_context=None, seccomp_profiles=None, supplemental_groups=None, users=None, volumes=None):
         """
         V1SecurityContextConstraints - a model defined in Swagger
@@ -30,56 +105,6 @@ class V1SecurityContextConstraints(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allow_host_dir_volume_plugin': 'bool',
-            'allow_host_ipc': 'bool',
-            'allow_host_network': 'bool',
-            'allow_host_pid': 'bool',
-            'allow_host_ports': 'bool',
-            'allow_privileged_container': 'bool',
-            'allowed_capabilities': 'list[str]',
-            'api_version': 'str',
-            'default_add_capabilities': 'list[str]',
-            'fs_group': 'V1FSGroupStrategyOptions',
-            'groups': 'list[str]',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'priority': 'int',
-            'read_only_root_filesystem': 'bool',
-            'required_drop_capabilities': 'list[str]',
-            'run_as_user': 'V1RunAsUserStrategyOptions',
-            'se_linux_context': 'V1SELinuxContextStrategyOptions',
-            'seccomp_profiles': 'list[str]',
-            'supplemental_groups': 'V1SupplementalGroupsStrategyOptions',
-            'users': 'list[str]',
-            'volumes': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'allow_host_dir_volume_plugin': 'allowHostDirVolumePlugin',
-            'allow_host_ipc': 'allowHostIPC',
-            'allow_host_network': 'allowHostNetwork',
-            'allow_host_pid': 'allowHostPID',
-            'allow_host_ports': 'allowHostPorts',
-            'allow_privileged_container': 'allowPrivilegedContainer',
-            'allowed_capabilities': 'allowedCapabilities',
-            'api_version': 'apiVersion',
-            'default_add_capabilities': 'defaultAddCapabilities',
-            'fs_group': 'fsGroup',
-            'groups': 'groups',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'priority': 'priority',
-            'read_only_root_filesystem': 'readOnlyRootFilesystem',
-            'required_drop_capabilities': 'requiredDropCapabilities',
-            'run_as_user': 'runAsUser',
-            'se_linux_context': 'seLinuxContext',
-            'seccomp_profiles': 'seccompProfiles',
-            'supplemental_groups': 'supplementalGroups',
-            'users': 'users',
-            'volumes': 'volumes'
-        }
-
         self._allow_host_dir_volume_plugin = allow_host_dir_volume_plugin
         self._allow_host_ipc = allow_host_ipc
         self._allow_host_network = allow_host_network
@@ -678,10 +703,26 @@ class V1SecurityContextConstraints(object):
         if not isinstance(other, V1SecurityContextConstraints):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,27 @@ class V1ServiceAccountPodSecurityPolicyReviewStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allowed_by': 'V1ObjectReference',
+        'name': 'str',
+        'reason': 'str',
+        'template': 'V1PodTemplateSpec'
+    }
+
+    attribute_map = {
+        'allowed_by': 'allowedBy',
+        'name': 'name',
+        'reason': 'reason',
+        'template': 'template'
+    }
+
+    __slots__ = (
+        '_allowed_by',
+        '_name',
+        '_reason',
+        '_template',
+    )
+
     def __init__(self, allowed_by=None, name=None, reason=None, template=None):
         """
         V1ServiceAccountPodSecurityPolicyReviewStatus - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1ServiceAccountPodSecurityPolicyReviewStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allowed_by': 'V1ObjectReference',
-            'name': 'str',
-            'reason': 'str',
-            'template': 'V1PodTemplateSpec'
-        }
-
-        self.attribute_map = {
-            'allowed_by': 'allowedBy',
-            'name': 'name',
-            'reason': 'reason',
-            'template': 'template'
-        }
-
         self._allowed_by = allowed_by
         self._name = name
         self._reason = reason
@@ -188,10 +195,26 @@ class V1ServiceAccountPodSecurityPolicyReviewStatus(object):
         if not isinstance(other, V1ServiceAccountPodSecurityPolicyReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1SignatureSubject(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'common_name': 'str',
+        'organization': 'str',
+        'public_key_id': 'str'
+    }
+
+    attribute_map = {
+        'common_name': 'commonName',
+        'organization': 'organization',
+        'public_key_id': 'publicKeyID'
+    }
+
+    __slots__ = (
+        '_common_name',
+        '_organization',
+        '_public_key_id',
+    )
+
     def __init__(self, common_name=None, organization=None, public_key_id=None):
         """
         V1SignatureSubject - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1SignatureSubject(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'common_name': 'str',
-            'organization': 'str',
-            'public_key_id': 'str'
-        }
-
-        self.attribute_map = {
-            'common_name': 'commonName',
-            'organization': 'organization',
-            'public_key_id': 'publicKeyID'
-        }
-
         self._common_name = common_name
         self._organization = organization
         self._public_key_id = public_key_id
@@ -162,10 +168,26 @@ class V1SignatureSubject(object):
         if not isinstance(other, V1SignatureSubject):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,39 @@ class V1SourceBuildStrategy(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'env': 'list[V1EnvVar]',
+        'force_pull': 'bool',
+        '_from': 'V1ObjectReference',
+        'incremental': 'bool',
+        'pull_secret': 'V1LocalObjectReference',
+        'runtime_artifacts': 'list[V1ImageSourcePath]',
+        'runtime_image': 'V1ObjectReference',
+        'scripts': 'str'
+    }
+
+    attribute_map = {
+        'env': 'env',
+        'force_pull': 'forcePull',
+        '_from': 'from',
+        'incremental': 'incremental',
+        'pull_secret': 'pullSecret',
+        'runtime_artifacts': 'runtimeArtifacts',
+        'runtime_image': 'runtimeImage',
+        'scripts': 'scripts'
+    }
+
+    __slots__ = (
+        '_env',
+        '_force_pull',
+        '__from',
+        '_incremental',
+        '_pull_secret',
+        '_runtime_artifacts',
+        '_runtime_image',
+        '_scripts',
+    )
+
     def __init__(self, env=None, force_pull=None, _from=None, incremental=None, pull_secret=None, runtime_artifacts=None, runtime_image=None, scripts=None):
         """
         V1SourceBuildStrategy - a model defined in Swagger
@@ -30,28 +63,6 @@ class V1SourceBuildStrategy(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'env': 'list[V1EnvVar]',
-            'force_pull': 'bool',
-            '_from': 'V1ObjectReference',
-            'incremental': 'bool',
-            'pull_secret': 'V1LocalObjectReference',
-            'runtime_artifacts': 'list[V1ImageSourcePath]',
-            'runtime_image': 'V1ObjectReference',
-            'scripts': 'str'
-        }
-
-        self.attribute_map = {
-            'env': 'env',
-            'force_pull': 'forcePull',
-            '_from': 'from',
-            'incremental': 'incremental',
-            'pull_secret': 'pullSecret',
-            'runtime_artifacts': 'runtimeArtifacts',
-            'runtime_image': 'runtimeImage',
-            'scripts': 'scripts'
-        }
-
         self._env = env
         self._force_pull = force_pull
         self.__from = _from
@@ -292,10 +303,26 @@ class V1SourceBuildStrategy(object):
         if not isinstance(other, V1SourceBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
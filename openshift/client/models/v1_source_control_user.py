@@ -21,6 +21,21 @@ class V1SourceControlUser(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'email': 'str',
+        'name': 'str'
+    }
+
+    attribute_map = {
+        'email': 'email',
+        'name': 'name'
+    }
+
+    __slots__ = (
+        '_email',
+        '_name',
+    )
+
     def __init__(self, email=None, name=None):
         """
         V1SourceControlUser - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1SourceControlUser(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'email': 'str',
-            'name': 'str'
-        }
-
-        self.attribute_map = {
-            'email': 'email',
-            'name': 'name'
-        }
-
         self._email = email
         self._name = name
 
@@ -134,10 +139,26 @@ class V1SourceControlUser(object):
         if not isinstance(other, V1SourceControlUser):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1SubjectRulesReviewSpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'groups': 'list[str]',
+        'scopes': 'list[str]',
+        'user': 'str'
+    }
+
+    attribute_map = {
+        'groups': 'groups',
+        'scopes': 'scopes',
+        'user': 'user'
+    }
+
+    __slots__ = (
+        '_groups',
+        '_scopes',
+        '_user',
+    )
+
     def __init__(self, groups=None, scopes=None, user=None):
         """
         V1SubjectRulesReviewSpec - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1SubjectRulesReviewSpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'groups': 'list[str]',
-            'scopes': 'list[str]',
-            'user': 'str'
-        }
-
-        self.attribute_map = {
-            'groups': 'groups',
-            'scopes': 'scopes',
-            'user': 'user'
-        }
-
         self._groups = groups
         self._scopes = scopes
         self._user = user
@@ -166,10 +172,26 @@ class V1SubjectRulesReviewSpec(object):
         if not isinstance(other, V1SubjectRulesReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,21 @@ class V1SubjectRulesReviewStatus(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'evaluation_error': 'str',
+        'rules': 'list[V1PolicyRule]'
+    }
+
+    attribute_map = {
+        'evaluation_error': 'evaluationError',
+        'rules': 'rules'
+    }
+
+    __slots__ = (
+        '_evaluation_error',
+        '_rules',
+    )
+
     def __init__(self, evaluation_error=None, rules=None):
         """
         V1SubjectRulesReviewStatus - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1SubjectRulesReviewStatus(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'evaluation_error': 'str',
-            'rules': 'list[V1PolicyRule]'
-        }
-
-        self.attribute_map = {
-            'evaluation_error': 'evaluationError',
-            'rules': 'rules'
-        }
-
         self._evaluation_error = evaluation_error
         self._rules = rules
 
@@ -136,10 +141,26 @@ class V1SubjectRulesReviewStatus(object):
         if not isinstance(other, V1SubjectRulesReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
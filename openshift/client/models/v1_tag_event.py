@@ -21,6 +21,27 @@ class V1TagEvent(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'created': 'UnversionedTime',
+        'docker_image_reference': 'str',
+        'generation': 'int',
+        'image': 'str'
+    }
+
+    attribute_map = {
+        'created': 'created',
+        'docker_image_reference': 'dockerImageReference',
+        'generation': 'generation',
+        'image': 'image'
+    }
+
+    __slots__ = (
+        '_created',
+        '_docker_image_reference',
+        '_generation',
+        '_image',
+    )
+
     def __init__(self, created=None, docker_image_reference=None, generation=None, image=None):
         """
         V1TagEvent - a model defined in Swagger
@@ -30,20 +51,6 @@ class V1TagEvent(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'created': 'UnversionedTime',
-            'docker_image_reference': 'str',
-            'generation': 'int',
-            'image': 'str'
-        }
-
-        self.attribute_map = {
-            'created': 'created',
-            'docker_image_reference': 'dockerImageReference',
-            'generation': 'generation',
-            'image': 'image'
-        }
-
         self._created = created
         self._docker_image_reference = docker_image_reference
         self._generation = generation
@@ -194,10 +201,26 @@ class V1TagEvent(object):
         if not isinstance(other, V1TagEvent):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
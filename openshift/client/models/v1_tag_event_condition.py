@@ -21,6 +21,33 @@ class V1TagEventCondition(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'generation': 'int',
+        'last_transition_time': 'UnversionedTime',
+        'message': 'str',
+        'reason': 'str',
+        'status': 'str',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'generation': 'generation',
+        'last_transition_time': 'lastTransitionTime',
+        'message': 'message',
+        'reason': 'reason',
+        'status': 'status',
+        'type': 'type'
+    }
+
+    __slots__ = (
+        '_generation',
+        '_last_transition_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+    )
+
     def __init__(self, generation=None, last_transition_time=None, message=None, reason=None, status=None, type=None):
         """
         V1TagEventCondition - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1TagEventCondition(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'generation': 'int',
-            'last_transition_time': 'UnversionedTime',
-            'message': 'str',
-            'reason': 'str',
-            'status': 'str',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'generation': 'generation',
-            'last_transition_time': 'lastTransitionTime',
-            'message': 'message',
-            'reason': 'reason',
-            'status': 'status',
-            'type': 'type'
-        }
-
         self._generation = generation
         self._last_transition_time = last_transition_time
         self._message = message
@@ -244,10 +253,26 @@ class V1TagEventCondition(object):
         if not isinstance(other, V1TagEventCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,36 @@ class V1TagReference(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'annotations': 'dict(str, str)',
+        '_from': 'V1ObjectReference',
+        'generation': 'int',
+        'import_policy': 'V1TagImportPolicy',
+        'name': 'str',
+        'reference': 'bool',
+        'reference_policy': 'V1TagReferencePolicy'
+    }
+
+    attribute_map = {
+        'annotations': 'annotations',
+        '_from': 'from',
+        'generation': 'generation',
+        'import_policy': 'importPolicy',
+        'name': 'name',
+        'reference': 'reference',
+        'reference_policy': 'referencePolicy'
+    }
+
+    __slots__ = (
+        '_annotations',
+        '__from',
+        '_generation',
+        '_import_policy',
+        '_name',
+        '_reference',
+        '_reference_policy',
+    )
+
     def __init__(self, annotations=None, _from=None, generation=None, import_policy=None, name=None, reference=None, reference_policy=None):
         """
         V1TagReference - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1TagReference(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'annotations': 'dict(str, str)',
-            '_from': 'V1ObjectReference',
-            'generation': 'int',
-            'import_policy': 'V1TagImportPolicy',
-            'name': 'str',
-            'reference': 'bool',
-            'reference_policy': 'V1TagReferencePolicy'
-        }
-
-        self.attribute_map = {
-            'annotations': 'annotations',
-            '_from': 'from',
-            'generation': 'generation',
-            'import_policy': 'importPolicy',
-            'name': 'name',
-            'reference': 'reference',
-            'reference_policy': 'referencePolicy'
-        }
-
         self._annotations = annotations
         self.__from = _from
         self._generation = generation
@@ -270,10 +280,26 @@ class V1TagReference(object):
         if not isinstance(other, V1TagReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
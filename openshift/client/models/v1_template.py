@@ -21,6 +21,36 @@ class V1Template(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'kind': 'str',
+        'labels': 'dict(str, str)',
+        'message': 'str',
+        'metadata': 'V1ObjectMeta',
+        'objects': 'list[RuntimeRawExtension]',
+        'parameters': 'list[V1Parameter]'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'kind': 'kind',
+        'labels': 'labels',
+        'message': 'message',
+        'metadata': 'metadata',
+        'objects': 'objects',
+        'parameters': 'parameters'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_labels',
+        '_message',
+        '_metadata',
+        '_objects',
+        '_parameters',
+    )
+
     def __init__(self, api_version=None, kind=None, labels=None, message=None, metadata=None, objects=None, parameters=None):
         """
         V1Template - a model defined in Swagger
@@ -30,26 +60,6 @@ class V1Template(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'kind': 'str',
-            'labels': 'dict(str, str)',
-            'message': 'str',
-            'metadata': 'V1ObjectMeta',
-            'objects': 'list[RuntimeRawExtension]',
-            'parameters': 'list[V1Parameter]'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'kind': 'kind',
-            'labels': 'labels',
-            'message': 'message',
-            'metadata': 'metadata',
-            'objects': 'objects',
-            'parameters': 'parameters'
-        }
-
         self._api_version = api_version
         self._kind = kind
         self._labels = labels
@@ -266,10 +276,26 @@ class V1Template(object):
         if not isinstance(other, V1Template):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,33 @@ class V1TLSConfig(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'ca_certificate': 'str',
+        'certificate': 'str',
+        'destination_ca_certificate': 'str',
+        'insecure_edge_termination_policy': 'str',
+        'key': 'str',
+        'termination': 'str'
+    }
+
+    attribute_map = {
+        'ca_certificate': 'caCertificate',
+        'certificate': 'certificate',
+        'destination_ca_certificate': 'destinationCACertificate',
+        'insecure_edge_termination_policy': 'insecureEdgeTerminationPolicy',
+        'key': 'key',
+        'termination': 'termination'
+    }
+
+    __slots__ = (
+        '_ca_certificate',
+        '_certificate',
+        '_destination_ca_certificate',
+        '_insecure_edge_termination_policy',
+        '_key',
+        '_termination',
+    )
+
     def __init__(self, ca_certificate=None, certificate=None, destination_ca_certificate=None, insecure_edge_termination_policy=None, key=None, termination=None):
         """
         V1TLSConfig - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1TLSConfig(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'ca_certificate': 'str',
-            'certificate': 'str',
-            'destination_ca_certificate': 'str',
-            'insecure_edge_termination_policy': 'str',
-            'key': 'str',
-            'termination': 'str'
-        }
-
-        self.attribute_map = {
-            'ca_certificate': 'caCertificate',
-            'certificate': 'certificate',
-            'destination_ca_certificate': 'destinationCACertificate',
-            'insecure_edge_termination_policy': 'insecureEdgeTerminationPolicy',
-            'key': 'key',
-            'termination': 'termination'
-        }
-
         self._ca_certificate = ca_certificate
         self._certificate = certificate
         self._destination_ca_certificate = destination_ca_certificate
@@ -240,10 +249,26 @@ class V1TLSConfig(object):
         if not isinstance(other, V1TLSConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,33 @@ class V1User(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'full_name': 'str',
+        'groups': 'list[str]',
+        'identities': 'list[str]',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'full_name': 'fullName',
+        'groups': 'groups',
+        'identities': 'identities',
+        'kind': 'kind',
+        'metadata': 'metadata'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_full_name',
+        '_groups',
+        '_identities',
+        '_kind',
+        '_metadata',
+    )
+
     def __init__(self, api_version=None, full_name=None, groups=None, identities=None, kind=None, metadata=None):
         """
         V1User - a model defined in Swagger
@@ -30,24 +57,6 @@ class V1User(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'full_name': 'str',
-            'groups': 'list[str]',
-            'identities': 'list[str]',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'full_name': 'fullName',
-            'groups': 'groups',
-            'identities': 'identities',
-            'kind': 'kind',
-            'metadata': 'metadata'
-        }
-
         self._api_version = api_version
         self._full_name = full_name
         self._groups = groups
@@ -242,10 +251,26 @@ class V1User(object):
         if not isinstance(other, V1User):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
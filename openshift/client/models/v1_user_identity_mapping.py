@@ -21,6 +21,30 @@ class V1UserIdentityMapping(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'api_version': 'str',
+        'identity': 'V1ObjectReference',
+        'kind': 'str',
+        'metadata': 'V1ObjectMeta',
+        'user': 'V1ObjectReference'
+    }
+
+    attribute_map = {
+        'api_version': 'apiVersion',
+        'identity': 'identity',
+        'kind': 'kind',
+        'metadata': 'metadata',
+        'user': 'user'
+    }
+
+    __slots__ = (
+        '_api_version',
+        '_identity',
+        '_kind',
+        '_metadata',
+        '_user',
+    )
+
     def __init__(self, api_version=None, identity=None, kind=None, metadata=None, user=None):
         """
         V1UserIdentityMapping - a model defined in Swagger
@@ -30,22 +54,6 @@ class V1UserIdentityMapping(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'api_version': 'str',
-            'identity': 'V1ObjectReference',
-            'kind': 'str',
-            'metadata': 'V1ObjectMeta',
-            'user': 'V1ObjectReference'
-        }
-
-        self.attribute_map = {
-            'api_version': 'apiVersion',
-            'identity': 'identity',
-            'kind': 'kind',
-            'metadata': 'metadata',
-            'user': 'user'
-        }
-
         self._api_version = api_version
         self._identity = identity
         self._kind = kind
@@ -212,10 +220,26 @@ class V1UserIdentityMapping(object):
         if not isinstance(other, V1UserIdentityMapping):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
@@ -21,6 +21,24 @@ class V1UserRestriction(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'groups': 'list[str]',
+        'labels': 'list[UnversionedLabelSelector]',
+        'users': 'list[str]'
+    }
+
+    attribute_map = {
+        'groups': 'groups',
+        'labels': 'labels',
+        'users': 'users'
+    }
+
+    __slots__ = (
+        '_groups',
+        '_labels',
+        '_users',
+    )
+
     def __init__(self, groups=None, labels=None, users=None):
         """
         V1UserRestriction - a model defined in Swagger
@@ -30,18 +48,6 @@ class V1UserRestriction(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'groups': 'list[str]',
-            'labels': 'list[UnversionedLabelSelector]',
-            'users': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'groups': 'groups',
-            'labels': 'labels',
-            'users': 'users'
-        }
-
         self._groups = groups
         self._labels = labels
         self._users = users
@@ -166,10 +172,26 @@ class V1UserRestriction(object):
         if not isinstance(other, V1UserRestriction):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
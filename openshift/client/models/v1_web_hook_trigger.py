@@ -21,6 +21,21 @@ class V1WebHookTrigger(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allow_env': 'bool',
+        'secret': 'str'
+    }
+
+    attribute_map = {
+        'allow_env': 'allowEnv',
+        'secret': 'secret'
+    }
+
+    __slots__ = (
+        '_allow_env',
+        '_secret',
+    )
+
     def __init__(self, allow_env=None, secret=None):
         """
         V1WebHookTrigger - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1WebHookTrigger(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allow_env': 'bool',
-            'secret': 'str'
-        }
-
-        self.attribute_map = {
-            'allow_env': 'allowEnv',
-            'secret': 'secret'
-        }
-
         self._allow_env = allow_env
         self._secret = secret
 
@@ -134,10 +139,26 @@ class V1WebHookTrigger(object):
         if not isinstance(other, V1WebHookTrigger):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
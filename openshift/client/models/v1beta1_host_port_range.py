@@ -21,6 +21,21 @@ class V1beta1HostPortRange(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'max': 'int',
+        'min': 'int'
+    }
+
+    attribute_map = {
+        'max': 'max',
+        'min': 'min'
+    }
+
+    __slots__ = (
+        '_max',
+        '_min',
+    )
+
     def __init__(self, max=None, min=None):
         """
         V1beta1HostPortRange - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1beta1HostPortRange(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'max': 'int',
-            'min': 'int'
-        }
-
-        self.attribute_map = {
-            'max': 'max',
-            'min': 'min'
-        }
-
         self._max = max
         self._min = min
 
@@ -138,10 +143,26 @@ class V1beta1HostPortRange(object):
         if not isinstance(other, V1beta1HostPortRange):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
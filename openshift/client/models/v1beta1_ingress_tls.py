@@ -21,6 +21,21 @@ class V1beta1IngressTLS(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'hosts': 'list[str]',
+        'secret_name': 'str'
+    }
+
+    attribute_map = {
+        'hosts': 'hosts',
+        'secret_name': 'secretName'
+    }
+
+    __slots__ = (
+        '_hosts',
+        '_secret_name',
+    )
+
     def __init__(self, hosts=None, secret_name=None):
         """
         V1beta1IngressTLS - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1beta1IngressTLS(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'hosts': 'list[str]',
-            'secret_name': 'str'
-        }
-
-        self.attribute_map = {
-            'hosts': 'hosts',
-            'secret_name': 'secretName'
-        }
-
         self._hosts = hosts
         self._secret_name = secret_name
 
@@ -134,10 +139,26 @@ class V1beta1IngressTLS(object):
         if not isinstance(other, V1beta1IngressTLS):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
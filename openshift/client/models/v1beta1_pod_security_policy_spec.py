@@ -21,6 +21,57 @@ class V1beta1PodSecurityPolicySpec(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'allowed_capabilities': 'list[str]',
+        'default_add_capabilities': 'list[str]',
+        'fs_group': 'V1beta1FSGroupStrategyOptions',
+        'host_ipc': 'bool',
+        'host_network': 'bool',
+        'host_pid': 'bool',
+        'host_ports': 'list[V1beta1HostPortRange]',
+        'privileged': 'bool',
+        'read_only_root_filesystem': 'bool',
+        'required_drop_capabilities': 'list[str]',
+        'run_as_user': 'V1beta1RunAsUserStrategyOptions',
+        'se_linux': 'V1beta1SELinuxStrategyOptions',
+        'supplemental_groups': 'V1beta1SupplementalGroupsStrategyOptions',
+        'volumes': 'list[str]'
+    }
+
+    attribute_map = {
+        'allowed_capabilities': 'allowedCapabilities',
+        'default_add_capabilities': 'defaultAddCapabilities',
+        'fs_group': 'fsGroup',
+        'host_ipc': 'hostIPC',
+        'host_network': 'hostNetwork',
+        'host_pid': 'hostPID',
+        'host_ports': 'hostPorts',
+        'privileged': 'privileged',
+        'read_only_root_filesystem': 'readOnlyRootFilesystem',
+        'required_drop_capabilities': 'requiredDropCapabilities',
+        'run_as_user': 'runAsUser',
+        'se_linux': 'seLinux',
+        'supplemental_groups': 'supplementalGroups',
+        'volumes': 'volumes'
+    }
+
+    __slots__ = (
+        '_allowed_capabilities',
+        '_default_add_capabilities',
+        '_fs_group',
+        '_host_ipc',
+        '_host_network',
+        '_host_pid',
+        '_host_ports',
+        '_privileged',
+        '_read_only_root_filesystem',
+        '_required_drop_capabilities',
+        '_run_as_user',
+        '_se_linux',
+        '_supplemental_groups',
+        '_volumes',
+    )
+
     def __init__(self, allowed_capabilities=None, default_add_capabilities=None, fs_group=None, host_ipc=None, host_network=None, host_pid=None, host_ports=None, privileged=None, read_only_root_filesystem=None, required_drop_capabilities=None, run_as_user=None, se_linux=None, supplemental_groups=None, volumes=None):
         """
         V1beta1PodSecurityPolicySpec - a model defined in Swagger
@@ -30,40 +81,6 @@ class V1beta1PodSecurityPolicySpec(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'allowed_capabilities': 'list[str]',
-            'default_add_capabilities': 'list[str]',
-            'fs_group': 'V1beta1FSGroupStrategyOptions',
-            'host_ipc': 'bool',
-            'host_network': 'bool',
-            'host_pid': 'bool',
-            'host_ports': 'list[V1beta1HostPortRange]',
-            'privileged': 'bool',
-            'read_only_root_filesystem': 'bool',
-            'required_drop_capabilities': 'list[str]',
-            'run_as_user': 'V1beta1RunAsUserStrategyOptions',
-            'se_linux': 'V1beta1SELinuxStrategyOptions',
-            'supplemental_groups': 'V1beta1SupplementalGroupsStrategyOptions',
-            'volumes': 'list[str]'
-        }
-
-        self.attribute_map = {
-            'allowed_capabilities': 'allowedCapabilities',
-            'default_add_capabilities': 'defaultAddCapabilities',
-            'fs_group': 'fsGroup',
-            'host_ipc': 'hostIPC',
-            'host_network': 'hostNetwork',
-            'host_pid': 'hostPID',
-            'host_ports': 'hostPorts',
-            'privileged': 'privileged',
-            'read_only_root_filesystem': 'readOnlyRootFilesystem',
-            'required_drop_capabilities': 'requiredDropCapabilities',
-            'run_as_user': 'runAsUser',
-            'se_linux': 'seLinux',
-            'supplemental_groups': 'supplementalGroups',
-            'volumes': 'volumes'
-        }
-
         self._allowed_capabilities = allowed_capabilities
         self._default_add_capabilities = default_add_capabilities
         self._fs_group = fs_group
@@ -454,10 +471,26 @@ class V1beta1PodSecurityPolicySpec(object):
         if not isinstance(other, V1beta1PodSecurityPolicySpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
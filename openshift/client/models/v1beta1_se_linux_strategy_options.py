@@ -21,6 +21,21 @@ class V1beta1SELinuxStrategyOptions(object):
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
     """
+    swagger_types = {
+        'rule': 'str',
+        'se_linux_options': 'V1SELinuxOptions'
+    }
+
+    attribute_map = {
+        'rule': 'rule',
+        'se_linux_options': 'seLinuxOptions'
+    }
+
+    __slots__ = (
+        '_rule',
+        '_se_linux_options',
+    )
+
     def __init__(self, rule=None, se_linux_options=None):
         """
         V1beta1SELinuxStrategyOptions - a model defined in Swagger
@@ -30,16 +45,6 @@ class V1beta1SELinuxStrategyOptions(object):
         :param dict attributeMap: The key is attribute name
                                   and the value is json key in definition.
         """
-        self.swagger_types = {
-            'rule': 'str',
-            'se_linux_options': 'V1SELinuxOptions'
-        }
-
-        self.attribute_map = {
-            'rule': 'rule',
-            'se_linux_options': 'seLinuxOptions'
-        }
-
         self._rule = rule
         self._se_linux_options = se_linux_options
 
@@ -136,10 +141,26 @@ class V1beta1SELinuxStrategyOptions(object):
         if not isinstance(other, V1beta1SELinuxStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
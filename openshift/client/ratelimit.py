@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+READ = 'read'
+WRITE = 'write'
+WATCH = 'watch'
+
+READ_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+# Responses retried after the delay the server asks for in Retry-After
+RETRY_STATUSES = frozenset([429, 503])
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+def verb_class(method, query_params=None):
+    """ Return the budget of a request: WATCH for watches, READ for other reads, WRITE otherwise """
+    for key, value in query_params or ():
+        if key == 'watch' and value and str(value).lower() != 'false':
+            return WATCH
+    return READ if method.upper() in READ_METHODS else WRITE
+
+
+def retry_after(headers, now=None):
+    """ Return the seconds to wait given by a Retry-After header, in seconds or as an HTTP date, or None """
+    value = None
+    for key, header in (headers or {}).items():
+        if key.lower() == 'retry-after':
+            value = header
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, mktime_tz(date) - (now if now is not None else time.time()))
+
+
+class TokenBucket(object):
+    """
+    Allows qps requests per second on average, and bursts of up to burst requests. Callers reserve a token
+    and wait for their turn, so concurrent callers are served in order without polling.
+    """
+
+    def __init__(self, qps, burst=1, clock=_clock):
+        self.qps = float(qps)
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """ Take a token, and return the seconds to wait before using it """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.qps
+
+
+class RateLimiter(object):
+    """
+    Paces the requests of an ApiClient with a token bucket for each of reads, writes and watches, and retries
+    requests the server throttled with a 429 or 503 response, after the delay it gives in Retry-After, or
+    after an exponential backoff.
+
+    Set it as the rate_limiter of an ApiClient. It is shared by the threads and helpers using that client.
+    """
+
+    def __init__(self, read=(50, 100), write=(10, 20), watch=(5, 10), max_retries=5, backoff=1.0, max_retry_wait=60.0,
+                 sleep=time.sleep, clock=_clock):
+        """
+        :param read: (qps, burst) for GET, HEAD and OPTIONS requests, or None for no limit
+        :param write: (qps, burst) for other requests, or None for no limit
+        :param watch: (qps, burst) for starting watches, or None for no limit
+        :param max_retries: most retries of a throttled request
+        :param backoff: first delay when the response has no Retry-After, doubled for each retry
+        :param max_retry_wait: longest delay before a retry
+        """
+        self.buckets = {}
+        for name, budget in ((READ, read), (WRITE, write), (WATCH, watch)):
+            self.buckets[name] = TokenBucket(budget[0], budget[1], clock) if budget else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_retry_wait = max_retry_wait
+        self.sleep = sleep
+        self._counters = dict((name, dict.fromkeys(('requests', 'waited', 'wait_seconds', 'max_wait', 'retries',
+                                                    'retry_wait_seconds'), 0))
+                              for name in self.buckets)
+        self._lock = threading.Lock()
+
+    def acquire(self, verb):
+        """ Wait for the budget of verb, one of READ, WRITE and WATCH. Returns the seconds waited. """
+        bucket = self.buckets[verb]
+        delay = bucket.reserve() if bucket is not None else 0.0
+        with self._lock:
+            counters = self._counters[verb]
+            counters['requests'] += 1
+            if delay:
+                counters['waited'] += 1
+                counters['wait_seconds'] += delay
+                counters['max_wait'] = max(counters['max_wait'], delay)
+        if delay:
+            self.sleep(delay)
+        return delay
+
+    def retry_delay(self, verb, exc, attempt):
+        """
+        Return the seconds to wait before retrying a request of verb that failed with exc, an ApiException,
+        on its attempt-th retry, or None if it should not be retried.
+        """
+        if getattr(exc, 'status', None) not in RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        delay = retry_after(getattr(exc, 'headers', None))
+        if delay is None:
+            delay = self.backoff * 2 ** attempt
+        delay = min(delay, self.max_retry_wait)
+        with self._lock:
+            self._counters[verb]['retries'] += 1
+            self._counters[verb]['retry_wait_seconds'] += delay
+        return delay
+
+    def call(self, method, query_params, request):
+        """ Make a request, request(), within the budget for method and query_params, retrying throttled calls """
+        verb = verb_class(method, query_params)
+        attempt = 0
+        while True:
+            self.acquire(verb)
+            try:
+                return request()
+            except Exception as exc:
+                delay = self.retry_delay(verb, exc, attempt)
+                if delay is None:
+                    raise
+            attempt += 1
+            self.sleep(delay)
+
+    def stats(self):
+        """
+        Return a dict of counters for each of READ, WRITE and WATCH: 'requests' made including retries, requests
+        that 'waited' for the budget, the total and longest waits, in 'wait_seconds' and 'max_wait', 'retries' of
+        throttled requests, and the total 'retry_wait_seconds' before them.
+        """
+        with self._lock:
+            return dict((name, dict(counters)) for name, counters in self._counters.items())
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+
+
+class TypeRegistry(object):
+    """
+    Maps model and API class names to classes for both the OpenShift and Kubernetes clients.
+
+    The name tables are built on first use from the package listings, without importing any
+    OpenShift model or API module. Classes are resolved on first lookup and cached, and an unknown
+    name is a dictionary miss that returns None.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources = None
+        self._resolved = {}
+
+    def model(self, name):
+        """ Return the model class for name, preferring OpenShift models, or None. """
+        return self._lookup('models', name)
+
+    def kubernetes_model(self, name):
+        """ Return the Kubernetes model class for name, or None. """
+        return self._lookup('kubernetes_models', name)
+
+    def api(self, name):
+        """ Return the API class for name, preferring OpenShift APIs, or None. """
+        return self._lookup('apis', name)
+
+    def kubernetes_api(self, name):
+        """ Return the Kubernetes API class for name, or None. """
+        return self._lookup('kubernetes_apis', name)
+
+    def _lookup(self, table, name):
+        key = (table, name)
+        cls = self._resolved.get(key)
+        if cls is None:
+            source = self._tables()[table].get(name)
+            if source is None:
+                return None
+            cls = self._resolved[key] = getattr(source, name)
+        return cls
+
+    def _tables(self):
+        sources = self._sources
+        if sources is None:
+            with self._lock:
+                if self._sources is None:
+                    self._sources = self._build()
+                sources = self._sources
+        return sources
+
+    @staticmethod
+    def _build():
+        """ Return a dict of tables, each mapping a class name to the module that provides it. """
+        from kubernetes.client import apis as k8s_apis
+        from kubernetes.client import models as k8s_models
+        from . import apis, models
+
+        def names(module):
+            if hasattr(module, '__lazy_attributes__'):
+                return module.__all__
+            return [x for x in dir(module) if not x.startswith('_') and isinstance(getattr(module, x), type)]
+
+        tables = {}
+        for table, k8s_module, openshift_module in (('models', k8s_models, models), ('apis', k8s_apis, apis)):
+            k8s_table = dict((x, k8s_module) for x in names(k8s_module))
+            merged = dict(k8s_table)
+            merged.update((x, openshift_module) for x in names(openshift_module))
+            tables[table] = merged
+            tables['kubernetes_' + table] = k8s_table
+        return tables
+
+
+type_registry = TypeRegistry()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import re
+
+from datetime import date, datetime
+from operator import attrgetter
+
+from six import binary_type, integer_types, text_type
+
+from kubernetes.client.rest import ApiException
+
+from .registry import type_registry
+
+DICT_TYPE_RX = re.compile(r'dict\(([^,]*), (.*)\)')
+
+PRIMITIVE_TYPES = {
+    'int': int,
+    'long': integer_types[-1],
+    'float': float,
+    'str': str,
+    'bool': bool,
+}
+
+# Types returned as-is by sanitize_for_serialization
+API_SCALAR_TYPES = (str, float, bool, binary_type, text_type) + tuple(integer_types)
+
+_MISSING = object()
+
+_codecs = {}
+_to_dict_handlers = {}
+_to_api_handlers = {}
+_readers = {}
+
+
+class ModelCodec(object):
+    """
+    Serializer and deserializer for one model class, compiled from its swagger_types and attribute_map.
+
+    to_dict() returns the same result as the model's own to_dict(), to_api_dict() the same as
+    ApiClient.sanitize_for_serialization(), and from_api_dict() the same as the ApiClient model
+    deserializer, without re-reading the type maps or probing values with hasattr().
+    """
+
+    def __init__(self, model_class):
+        sample = model_class()
+        self.model_class = model_class
+        self.attributes = tuple(sample.swagger_types)
+        self.types = tuple(sample.swagger_types[x] for x in self.attributes)
+        self.json_keys = tuple(sample.attribute_map[x] for x in self.attributes)
+
+        # Read and write the private storage directly, bypassing the property accessors
+        if all(hasattr(sample, '_' + x) for x in self.attributes):
+            self.storage = tuple('_' + x for x in self.attributes)
+        else:
+            self.storage = self.attributes
+
+        if len(self.storage) > 1:
+            self.values = attrgetter(*self.storage)
+        elif self.storage:
+            getter = attrgetter(self.storage[0])
+            self.values = lambda obj: (getter(obj),)
+        else:
+            self.values = lambda obj: ()
+        self._readers = None
+
+    def to_dict(self, obj):
+        """ Return obj as a dict keyed by the python attribute names """
+        result = {}
+        handlers = _to_dict_handlers
+        for attr, value in zip(self.attributes, self.values(obj)):
+            if value is not None:
+                handler = handlers.get(type(value), _MISSING)
+                if handler is _MISSING:
+                    handler = _to_dict_handler(value)
+                if handler is not None:
+                    value = handler(value)
+            result[attr] = value
+        return result
+
+    def to_api_dict(self, obj):
+        """ Return obj as a dict keyed by the API (camelCase) names, omitting unset attributes """
+        result = {}
+        handlers = _to_api_handlers
+        for key, value in zip(self.json_keys, self.values(obj)):
+            if value is not None:
+                handler = handlers.get(type(value), _MISSING)
+                if handler is _MISSING:
+                    handler = _to_api_handler(value)
+                result[key] = value if handler is None else handler(value)
+        return result
+
+    def from_api_dict(self, data):
+        """ Return a new model instance populated from API data """
+        if not self.attributes:
+            return data
+        instance = self.model_class()
+        if not isinstance(data, (list, dict)):
+            return instance
+        readers = self._readers
+        if readers is None:
+            readers = self._readers = tuple(
+                (key, storage, _reader(type_name))
+                for key, storage, type_name in zip(self.json_keys, self.storage, self.types)
+            )
+        for key, storage, read in readers:
+            if key in data:
+                setattr(instance, storage, read(data[key]))
+        return instance
+
+
+def get_codec(model_class):
+    """ Return the ModelCodec for model_class, compiling it on first use. """
+    codec = _codecs.get(model_class)
+    if codec is None:
+        codec = _codecs[model_class] = ModelCodec(model_class)
+    return codec
+
+
+def to_dict(obj):
+    """ Equivalent to obj.to_dict() for a model object """
+    return get_codec(type(obj)).to_dict(obj)
+
+
+def to_api_dict(obj):
+    """ Equivalent to ApiClient.sanitize_for_serialization(obj), for models and plain values """
+    if obj is None:
+        return None
+    handler = _to_api_handlers.get(type(obj), _MISSING)
+    if handler is _MISSING:
+        handler = _to_api_handler(obj)
+    return obj if handler is None else handler(obj)
+
+
+def from_api_dict(data, model_class):
+    """ Equivalent to deserializing data into model_class with ApiClient """
+    return get_codec(model_class).from_api_dict(data)
+
+
+def _is_model_class(cls):
+    if not hasattr(cls, 'to_dict'):
+        return False
+    try:
+        sample = cls()
+    except Exception:
+        return False
+    return isinstance(getattr(sample, 'swagger_types', None), dict) and \
+        isinstance(getattr(sample, 'attribute_map', None), dict)
+
+
+def _to_dict_handler(value):
+    """ Return the function that converts values of this type for to_dict(), or None to keep them as-is """
+    cls = type(value)
+    handler = _to_dict_handlers.get(cls, _MISSING)
+    if handler is _MISSING:
+        if isinstance(value, list):
+            handler = _list_to_dict
+        elif _is_model_class(cls):
+            handler = get_codec(cls).to_dict
+        elif hasattr(value, 'to_dict'):
+            handler = _call_to_dict
+        elif isinstance(value, dict):
+            handler = _dict_to_dict
+        else:
+            handler = None
+        _to_dict_handlers[cls] = handler
+    return handler
+
+
+def _to_api_handler(value):
+    """ Return the function that converts values of this type for to_api_dict(), or None to keep them as-is """
+    cls = type(value)
+    handler = _to_api_handlers.get(cls, _MISSING)
+    if handler is _MISSING:
+        if isinstance(value, API_SCALAR_TYPES):
+            handler = None
+        elif isinstance(value, list):
+            handler = _list_to_api
+        elif isinstance(value, tuple):
+            handler = _tuple_to_api
+        elif isinstance(value, (datetime, date)):
+            handler = _isoformat
+        elif isinstance(value, dict):
+            handler = _dict_to_api
+        else:
+            handler = get_codec(cls).to_api_dict
+        _to_api_handlers[cls] = handler
+    return handler
+
+
+def _model_or_value(value):
+    """ Convert a list item or dict value the way the generated to_dict() does, which only converts models """
+    if value is None:
+        return value
+    handler = _to_dict_handler(value)
+    if handler is None or handler is _list_to_dict or handler is _dict_to_dict:
+        return value
+    return handler(value)
+
+
+def _list_to_dict(value):
+    return [_model_or_value(x) for x in value]
+
+
+def _dict_to_dict(value):
+    return dict((k, _model_or_value(v)) for k, v in value.items())
+
+
+def _call_to_dict(value):
+    return value.to_dict()
+
+
+def _list_to_api(value):
+    return [to_api_dict(x) for x in value]
+
+
+def _tuple_to_api(value):
+    return tuple(to_api_dict(x) for x in value)
+
+
+def _dict_to_api(value):
+    return dict((k, to_api_dict(v)) for k, v in value.items())
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def _reader(type_name):
+    """ Return a function that deserializes API data of the named swagger type """
+    read = _readers.get(type_name)
+    if read is None:
+        read = _readers[type_name] = _compile_reader(type_name)
+    return read
+
+
+def _compile_reader(type_name):
+    if type_name.startswith('list['):
+        item_type = type_name[len('list['):-1]
+
+        def read_list(value):
+            if value is None:
+                return None
+            read_item = _reader(item_type)
+            return [read_item(x) for x in value]
+        return read_list
+
+    if type_name.startswith('dict('):
+        value_type = DICT_TYPE_RX.match(type_name).group(2)
+
+        def read_dict(value):
+            if value is None:
+                return None
+            read_value = _reader(value_type)
+            return dict((k, read_value(v)) for k, v in value.items())
+        return read_dict
+
+    if type_name in PRIMITIVE_TYPES:
+        klass = PRIMITIVE_TYPES[type_name]
+
+        def read_primitive(value):
+            if value is None:
+                return None
+            try:
+                return klass(value)
+            except UnicodeEncodeError:
+                return text_type(value)
+            except TypeError:
+                return value
+        return read_primitive
+
+    if type_name == 'object':
+        return lambda value: value
+
+    if type_name in ('date', 'datetime'):
+        def read_date(value):
+            if value is None:
+                return None
+            try:
+                from dateutil.parser import parse
+            except ImportError:
+                return value
+            try:
+                parsed = parse(value)
+            except ValueError:
+                raise ApiException(
+                    status=0,
+                    reason="Failed to parse `{0}` into a {1} object".format(value, type_name)
+                )
+            return parsed.date() if type_name == 'date' else parsed
+        return read_date
+
+    codecs = []
+
+    def read_model(value):
+        if value is None:
+            return None
+        if not codecs:
+            model_class = type_registry.kubernetes_model(type_name) or type_registry.model(type_name)
+            if model_class is None:
+                raise AttributeError("Unable to find a model for {}".format(type_name))
+            codecs.append(get_codec(model_class))
+        return codecs[0].from_api_dict(value)
+    return read_model
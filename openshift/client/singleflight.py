@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import threading
+
+
+class _Call(object):
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, callers with the same key
+    wait for it rather than making their own, and get a deep copy of its result, or its exception. Each
+    caller can change the object it gets without affecting the others.
+    """
+
+    def __init__(self):
+        self.counters = {'calls': 0, 'coalesced': 0}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """ Return fn(), or a copy of the result of the call of fn in flight for key """
+        with self._lock:
+            self.counters['calls'] += 1
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self.counters['coalesced'] += 1
+                call.waiters += 1
+                leader = False
+        return self._lead(key, call, fn) if leader else self._follow(call)
+
+    def _lead(self, key, call, fn):
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        else:
+            call.result = result
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            if waiters and call.error is None:
+                # Copied before the caller gets the result, and may change it
+                call.result = copy.deepcopy(result)
+            call.done.set()
+        return result
+
+    @staticmethod
+    def _follow(call):
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result)
+
+    def stats(self):
+        """ Return a dict of counters: 'calls' made, and calls 'coalesced' with a call in flight """
+        with self._lock:
+            return dict(self.counters)
@@ -1,4 +1,4 @@
 from kubernetes.config.config_exception import ConfigException  # noqa: F401
 from kubernetes.config.incluster_config import load_incluster_config  # noqa: F401
 from kubernetes.config.kube_config import list_kube_config_contexts, load_kube_config  # noqa: F401
-from .kube_config import new_client_from_config  # noqa: F401
+from .kube_config import new_async_client_from_config, new_client_from_config  # noqa: F401
@@ -10,3 +10,14 @@ def new_client_from_config(config_file=None, context=None):
     load_kube_config(config_file=config_file, context=context,
                      client_configuration=client_config)
     return ApiClient(config=client_config)
+
+
+def new_async_client_from_config(config_file=None, context=None, connection_limit=100):
+    """Same as new_client_from_config, but returns an AsyncApiClient for use with
+    asyncio. Requires Python 3.5+ and aiohttp."""
+    from openshift.client.aio import AsyncApiClient
+
+    client_config = ConfigurationObject()
+    load_kube_config(config_file=config_file, context=context,
+                     client_configuration=client_config)
+    return AsyncApiClient(config=client_config, connection_limit=connection_limit)
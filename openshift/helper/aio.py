@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio object helpers. Requires Python 3.5+ and aiohttp.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import copy
+import json
+import threading
+
+import aiohttp
+
+from kubernetes.client.rest import ApiException
+
+from .. import config
+from ..client import apis as openshift_apis
+from ..client import models as openshift_models
+from .fields import get_field
+from .informer import Informer, shared_informer
+from .kubernetes import KubernetesObjectHelper
+from .openshift import OpenShiftObjectHelper
+from .stream import ResilientWatch, new_watch
+from .waiter import Registration, Waiter, WatchMultiplexer, object_deleted
+
+
+class AsyncWatch(ResilientWatch):
+    """
+    Asynchronous counterpart of ResilientWatch for an AsyncApiClient: an endless async iterator of
+    watch events, resumed from the last resourceVersion, retried with backoff, and relisted by
+    awaiting the relist coroutine function when the resourceVersion expires.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncWatch, self).__init__(*args, **kwargs)
+        self._attempt = 0
+        self._received = 0
+        self._watcher = None
+        self._return_type = None
+        self._wakeup = None
+
+    def __aiter__(self):
+        return self
+
+    def stop(self):
+        super(AsyncWatch, self).stop()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def __anext__(self):
+        while not self.stopped:
+            try:
+                if self._response is None:
+                    if self._expired:
+                        await self._relist()
+                    await self._open()
+                line = await self._response.readline()
+                if not line:
+                    await self._closed()
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                event = self._unmarshal(self._watcher, self._return_type, line.decode('utf8'))
+                if event is None:
+                    continue
+                self._received += 1
+                return event
+            except ApiException as exc:
+                self._close()
+                if exc.status == 410:
+                    self._expired = True
+                    continue
+                await self._retry(exc)
+            except asyncio.CancelledError:
+                self._close()
+                raise
+            except Exception as exc:
+                self._close()
+                if self.stopped:
+                    break
+                await self._retry(exc)
+        raise StopAsyncIteration
+
+    async def _relist(self):
+        resource_version = await self.relist() if self.relist is not None else None
+        self.counters['relists'] += 1
+        self.resource_version = resource_version
+        self._expired = False
+
+    async def _open(self):
+        self._watcher = new_watch(self.api_client, self.raw)
+        self._return_type = self._watcher.get_return_type(self.list_method)
+        self._received = 0
+        self._response = await self.list_method(*self.args, **self._watch_kwargs())
+
+    async def _closed(self):
+        """ The server ended the watch. Resume straight away if it was healthy, otherwise back off. """
+        self._close()
+        if self._received:
+            self._attempt = 0
+        else:
+            self._attempt += 1
+            await self._sleep(self.backoff(self._attempt))
+
+    async def _retry(self, exc):
+        self._failed(exc)
+        self._attempt += 1
+        await self._sleep(self.backoff(self._attempt))
+
+    async def _sleep(self, delay):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self.stopped:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _close(self):
+        response, self._response = self._response, None
+        if response is not None:
+            response.close()
+
+
+class AsyncRegistration(Registration):
+    """ A Registration completed through an asyncio.Event """
+
+    def __init__(self, name, predicate, obj):
+        super(AsyncRegistration, self).__init__(name, predicate, obj)
+        self.done = asyncio.Event()
+
+
+class AsyncWatchMultiplexer(WatchMultiplexer):
+    """ WatchMultiplexer following an AsyncWatch in an asyncio task """
+
+    _multiplexers = {}
+    _lock = threading.Lock()
+
+    def stop(self):
+        super(AsyncWatchMultiplexer, self).stop()
+        if self._thread is not None:
+            self._thread.cancel()
+
+    def _start(self):
+        self.watch = AsyncWatch(self.api_client, self._list_method, self._list_args, raw=self.raw,
+                                resource_version=self.start_version, relist=self._relist,
+                                watch_timeout=self.watch_timeout, min_backoff=self.min_backoff,
+                                max_backoff=self.max_backoff)
+        self._thread = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        async for event in self.watch:
+            self._dispatch_event(event)
+
+    async def _relist(self):
+        return self._apply_list(await self._call_method(self._list_method, *self._list_args))
+
+
+class AsyncWaiter(Waiter):
+    """ Waiter for asyncio helpers. Waiters for the same kind and namespace share an AsyncWatchMultiplexer. """
+
+    async def wait(self, obj=None):
+        if get_field(obj, 'metadata', 'resource_version') is None:
+            obj = await self.helper.get_object(self.name, self.namespace)
+        if self.predicate(obj):
+            return obj
+
+        registration = AsyncRegistration(self.name, self.predicate, obj)
+        multiplexer, needs_read = AsyncWatchMultiplexer.join(self.helper, self.namespace, registration)
+        try:
+            if needs_read:
+                registration.offer(await self.helper.get_object(self.name, self.namespace))
+            try:
+                await asyncio.wait_for(registration.done.wait(), self.timeout)
+            except asyncio.TimeoutError:
+                pass
+            return registration.result
+        finally:
+            multiplexer.leave(registration)
+
+
+class AsyncInformer(Informer):
+    """
+    Informer for asyncio helpers, following an AsyncWatch in an asyncio task. Listeners are called
+    from the event loop.
+    """
+
+    def __init__(self, helper, namespace=None, watch_timeout=300):
+        super(AsyncInformer, self).__init__(helper, namespace, watch_timeout)
+        self.watch = AsyncWatch(self.api_client, self._list_method, self._list_args, raw=self.raw,
+                                relist=self._list, watch_timeout=watch_timeout,
+                                min_backoff=self.min_backoff, max_backoff=self.max_backoff)
+        self._synced = asyncio.Event()
+
+    async def wait_for_sync(self, timeout=None):
+        """ Wait until the initial list has been loaded. Returns has_synced(). """
+        try:
+            await asyncio.wait_for(self._synced.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.has_synced()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = asyncio.ensure_future(self._run())
+        return self
+
+    def stop(self, timeout=None):
+        """ Stop following the watch. The store keeps its last contents. """
+        self.watch.stop()
+        if self._thread is not None:
+            self._thread.cancel()
+
+    async def _run(self):
+        async for event in self.watch:
+            self._apply_event(event)
+
+    async def _list(self):
+        return self._apply_list(await self._call_method(self._list_method, *self._list_args))
+
+
+class AsyncObjectHelperMixin(object):
+    """
+    asyncio versions of the object helper methods. get_object(), create_object(), patch_object(),
+    replace_object(), delete_object(), call_method() and use_informer() are coroutine functions, and
+    watch() returns an async iterator of events. Models, lookups, raw mode and object comparison are those of the
+    synchronous helper.
+
+    The helper's AsyncApiClient holds the connection pool: helpers sharing a client share its
+    connections. Close it with close() when done. As the client belongs to one event loop and is
+    closed by its helper, it is not taken from the process wide client_pool.
+    """
+
+    client_pool = None
+
+    @staticmethod
+    def client_from_config(config_file, context):
+        return config.new_async_client_from_config(config_file, context)
+
+    async def use_informer(self, namespace=None):
+        """ Coroutine version of BaseObjectHelper.use_informer(), returning an AsyncInformer """
+        self.informer = shared_informer(self, namespace, AsyncInformer)
+        await self.informer.wait_for_sync(self.timeout)
+        return self.informer
+
+    async def close(self):
+        """ Stop the helper's informer, and close the ApiClient's session and pooled connections """
+        if self.informer is not None:
+            self.informer.stop()
+        if self._api_client is not None:
+            await self._api_client.close()
+
+    async def call_method(self, method, *args, **kwargs):
+        """ Call an API method returned by lookup_method. See BaseObjectHelper.call_method(). """
+        try:
+            if not self.raw:
+                return await method(*args, **kwargs)
+            kwargs['_preload_content'] = False
+            response = await method(*args, **kwargs)
+            data = await response.read()
+        except aiohttp.ClientConnectionError as exc:
+            raise self.get_exception_class()(str(exc))
+        return json.loads(data) if data else None
+
+    async def get_object(self, name, namespace=None):
+        informer = self.informer
+        if informer is not None and name and informer.covers(namespace) and informer.has_synced():
+            return copy.deepcopy(informer.get(name, namespace))
+
+        k8s_obj = None
+        method_name = 'list' if self.kind.endswith('list') else 'read'
+        try:
+            get_method = self.lookup_method(method_name, namespace)
+            k8s_obj = await self.call_method(get_method, *self._get_args(name, namespace))
+        except ApiException as exc:
+            if exc.status != 404:
+                if self.base_model_name == 'Project' and exc.status == 403:
+                    pass
+                else:
+                    raise self.exception_from_api_exception(exc)
+        return k8s_obj
+
+    async def patch_object(self, name, namespace, k8s_obj, existing=None):
+        self.logger.debug('Starting patch object')
+        body = self._patch_body(k8s_obj, existing)
+        if not body and existing is not None:
+            return await self._wait_for_response(name, namespace, 'patch', existing)
+        try:
+            patch_method = self.lookup_method('patch', namespace)
+            patched = await self.call_method(patch_method, *self._patch_args(name, namespace, body))
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        return await self._wait_for_response(name, namespace, 'patch', patched)
+
+    async def create_object(self, namespace=None, k8s_obj=None, body=None):
+        self.logger.debug('Starting create object')
+        name, args, kwargs = self._create_request(namespace, k8s_obj, body)
+        try:
+            create_method = self.lookup_method('create', namespace)
+            created = await self.call_method(create_method, *args, **kwargs)
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        name = get_field(created, 'metadata', 'name') or name
+        return await self._wait_for_response(name, namespace, 'create', created)
+
+    async def delete_object(self, name, namespace):
+        self.logger.debug('Starting delete object {0} {1} {2}'.format(self.kind, name, namespace))
+        delete_method, delete_args = self.lookup_api_method('delete', namespace)
+        args, kwargs = self._delete_request(name, namespace, delete_args)
+        try:
+            status_obj = await self.call_method(delete_method, *args, **kwargs)
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        await self._wait_for_response(name, namespace, 'delete', self._delete_pending(name, namespace, status_obj))
+
+    async def replace_object(self, name, namespace, k8s_obj=None, body=None):
+        self.logger.debug('Starting replace object')
+        existing_obj = await self.get_object(name, namespace)
+        args, kwargs = self._replace_request(name, namespace, existing_obj, k8s_obj, body)
+        try:
+            replace_method = self.lookup_method('replace', namespace)
+            replaced = await self.call_method(replace_method, *args, **kwargs)
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        return await self._wait_for_response(name, namespace, 'replace', replaced)
+
+    def watch(self, namespace=None, resource_version=None, watch_timeout=300):
+        """
+        Return an AsyncWatch of the helper's kind, yielding event dicts with 'type', 'object' and
+        'raw_object' until stopped. Without a resource_version the watch starts with the current
+        objects, reported as ADDED events.
+        """
+        list_method = self.lookup_method('list', namespace)
+        return AsyncWatch(self.api_client, list_method, (namespace,) if namespace else (), raw=self.raw,
+                          resource_version=resource_version, watch_timeout=watch_timeout)
+
+    async def _wait_for_response(self, name, namespace, action, obj=None):
+        predicate = object_deleted if action == 'delete' else self.is_ready
+        return await AsyncWaiter(self, name, namespace, predicate, timeout=self.timeout).wait(obj)
+
+
+class AsyncKubernetesObjectHelper(AsyncObjectHelperMixin, KubernetesObjectHelper):
+    pass
+
+
+class AsyncOpenShiftObjectHelper(AsyncObjectHelperMixin, OpenShiftObjectHelper):
+
+    async def create_project(self, metadata, display_name=None, description=None):
+        """ Creating a project requires using the project_request endpoint. """
+        proj_req = openshift_models.V1ProjectRequest(metadata=metadata, display_name=display_name,
+                                                     description=description)
+        try:
+            created = await self.call_method(openshift_apis.OapiApi(self.api_client).create_project_request,
+                                             proj_req)
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        return await self._wait_for_response(metadata.name, None, 'create', created)
@@ -4,11 +4,20 @@ from __future__ import absolute_import
 import copy
 import json
 import logging
+import threading
+
+from collections import namedtuple
 
 import string_utils
 
+from ruamel.yaml import YAML, YAMLError
+
 from . import PRIMITIVES
+from ..client import serializer
+from .apply import BulkApplier
+from .argspec import load_argspec
 from .kubernetes import KubernetesObjectHelper
+from .merge import LIST_KEYS, list_key, merge_dict, merge_list, merge_object_list
 from .openshift import OpenShiftObjectHelper
 
 # Attributes in argspec not needed by Ansible
@@ -17,19 +26,147 @@ ARG_ATTRIBUTES_BLACKLIST = ('description', 'auth_option', 'property_path')
 logger = logging.getLogger(__name__)
 
 
+# How a ParamSetter applies a param value to its attribute
+SET_VALUE = 'value'
+MERGE_DICT = 'dict'
+MERGE_LIST = 'list'
+MERGE_OBJECT_LIST = 'object_list'
+CREATE_OBJECT = 'object'
+
+ParamSetter = namedtuple('ParamSetter', ['path', 'attribute', 'action', 'item_type'])
+BodySetter = namedtuple('BodySetter', ['keys', 'value_type'])
+
+_camel_names = {}
+
+
+def _snake_to_camel(property_name):
+    """ Memoized camel case form of a snake case property name, without a leading underscore """
+    camel_name = _camel_names.get(property_name)
+    if camel_name is None:
+        camel_name = string_utils.snake_case_to_camel(property_name, upper_case_first=False)
+        if camel_name.startswith('_'):
+            camel_name = camel_name[1:]
+        _camel_names[property_name] = camel_name
+    return camel_name
+
+
+class ParamPlan(object):
+    """
+    Compiled application of Ansible module params for one helper class, API version and kind.
+
+    Indexes the argspec by param name and alias, and compiles, on first use of each param, the
+    steps that apply its value: a ParamSetter, with the model classes along the param's
+    property_path, for object_from_params(), and a BodySetter, with the camel case keys of the
+    path, for request_body_from_params().
+    """
+
+    def __init__(self, helper):
+        self.argspec = helper.argspec
+        self.model = helper.model
+        self.model_class_from_name = helper.model_class_from_name
+        self.specs = {}
+        # Aliases, first match in argspec order, then param names, as find_arg_spec() did
+        for spec in self.argspec.values():
+            if spec:
+                for alias in spec.get('aliases') or ():
+                    self.specs.setdefault(alias, spec)
+        for name, spec in self.argspec.items():
+            if spec:
+                self.specs[name] = spec
+        self._setters = {}
+        self._body_setters = {}
+
+    def setter(self, param_name):
+        """ Return the ParamSetter for a param with a property_path, or None if it cannot be compiled """
+        try:
+            return self._setters[param_name]
+        except KeyError:
+            pass
+        try:
+            setter = self._compile_setter(self.specs[param_name]['property_path'])
+        except (AttributeError, KeyError):
+            setter = None
+        self._setters[param_name] = setter
+        return setter
+
+    def body_setter(self, param_name, property_name_to_camel):
+        """ Return the BodySetter for a param with a property_path """
+        setter = self._body_setters.get(param_name)
+        if setter is None:
+            spec = self.specs[param_name]
+            keys = tuple(property_name_to_camel(param_name, x) for x in spec['property_path'])
+            setter = self._body_setters[param_name] = BodySetter(keys, spec.get('type', 'str'))
+        return setter
+
+    def _compile_setter(self, property_path):
+        model_class = self.model
+        path = []
+        for attribute in property_path[:-1]:
+            kind = _swagger_types(model_class)[attribute]
+            if kind in PRIMITIVES or kind.startswith('dict(') or kind.startswith('list['):
+                return None
+            model_class = self.model_class_from_name(kind)
+            path.append((attribute, model_class))
+
+        attribute = property_path[-1]
+        kind = _swagger_types(model_class)[attribute]
+        if kind in PRIMITIVES:
+            return ParamSetter(tuple(path), attribute, SET_VALUE, None)
+        if kind.startswith('dict('):
+            return ParamSetter(tuple(path), attribute, MERGE_DICT, None)
+        if kind.startswith('list['):
+            item_type = kind.replace('list[', '').replace(']', '')
+            if item_type not in PRIMITIVES and item_type not in ('list', 'dict'):
+                return ParamSetter(tuple(path), attribute, MERGE_OBJECT_LIST, item_type)
+            return ParamSetter(tuple(path), attribute, MERGE_LIST, None)
+        return ParamSetter(tuple(path), attribute, CREATE_OBJECT, self.model_class_from_name(kind))
+
+
+def _swagger_types(model_class):
+    codec = serializer.get_codec(model_class)
+    return dict(zip(codec.attributes, codec.types))
+
+
+_param_plans = {}
+_param_plans_lock = threading.Lock()
+
+
 class AnsibleMixin(object):
     _argspec_cache = None
+    _param_plan = None
+    module_prefix = None  # prefix of the generated module names, and of their precompiled argspecs
+
+    def set_model(self, api_version, kind):
+        super(AnsibleMixin, self).set_model(api_version, kind)
+        self._argspec_cache = None
+        self._param_plan = None
 
     @property
     def argspec(self):
         """
-        Introspect the model properties, and return an Ansible module arg_spec dict.
+        Return the Ansible module arg_spec dict. Loads the precompiled argspec for the module, if
+        there is one for this package version, and otherwise introspects the model properties.
 
         :return: dict
         """
         if self._argspec_cache:
             return self._argspec_cache
 
+        argument_spec = None
+        if self.module_prefix:
+            argument_spec = load_argspec(self.module_prefix, self.api_version, self.kind)
+        if argument_spec is None:
+            argument_spec = self.introspect_argspec()
+        self._argspec_cache = argument_spec
+        self.log_argspec()
+        return self._argspec_cache
+
+    def introspect_argspec(self):
+        """
+        Introspect the model properties, and return an Ansible module arg_spec dict.
+
+        :return: dict
+        """
         argument_spec = {
             'state': {
                 'default': 'present',
@@ -136,7 +273,17 @@ class AnsibleMixin(object):
                 'type': 'path',
                 'description': [
                     "Provide a path to a file containing the YAML definition of the object. Mutually exclusive "
-                    "with I(resource_definition)."
+                    "with I(resource_definition). A file with several YAML documents, or a document of kind "
+                    "C(List), defines several objects, managed as with I(resource_definitions)."
+                ]
+            },
+            'resource_definitions': {
+                'type': 'list',
+                'description': [
+                    "Provide a list of YAML object definitions, to manage many objects in one task. Objects are "
+                    "created, patched, replaced or deleted concurrently, as set by I(state) and I(force), and "
+                    "the result of each is returned in I(results). Definitions without I(kind) or I(apiVersion) "
+                    "are of the module's kind. Mutually exclusive with I(resource_definition) and I(src)."
                 ]
             }
         }
@@ -148,6 +295,7 @@ class AnsibleMixin(object):
             argument_spec.pop('state')
             argument_spec.pop('src')
             argument_spec.pop('resource_definition')
+            argument_spec.pop('resource_definitions')
 
         if self.kind.lower() == 'project':
             argument_spec['display_name'] = {
@@ -161,20 +309,14 @@ class AnsibleMixin(object):
                 ]
             }
 
-        self._argspec_cache = argument_spec
-        self.log_argspec()
-        return self._argspec_cache
+        return argument_spec
 
     def log_argspec(self):
         """ Safely logs the argspec by not including any params with the no_log attribute. """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug("arg_spec:")
-        tmp_arg_spec = copy.deepcopy(self._argspec_cache)
-        pop_keys = []
-        for key, value in tmp_arg_spec.items():
-            if value.get('no_log'):
-                pop_keys.append(key)
-        for key in pop_keys:
-            tmp_arg_spec.pop(key)
+        tmp_arg_spec = dict((key, value) for key, value in self._argspec_cache.items() if not value.get('no_log'))
         logger.debug(json.dumps(tmp_arg_spec, indent=4, sort_keys=True))
 
     def object_from_params(self, module_params, obj=None):
@@ -182,18 +324,25 @@ class AnsibleMixin(object):
         Update a model object with Ansible module param values. Optionally pass an object
         to update, otherwise a new object will be created.
         :param module_params: dict of key:value pairs
-        :param obj: model object to update
+        :param obj: model object, or API dict from raw mode, to update
         :return: updated model object
         """
+        if isinstance(obj, dict):
+            obj = serializer.from_api_dict(obj, self.model)
         if not obj:
             obj = self.model()
             obj.kind = string_utils.snake_case_to_camel(self.kind, upper_case_first=False)
             obj.api_version = self.api_version.lower()
+        plan = self.param_plan
         for param_name, param_value in module_params.items():
             spec = self.find_arg_spec(param_name)
             if param_value is not None and spec.get('property_path'):
-                prop_path = copy.copy(spec['property_path'])
-                self.__set_obj_attribute(obj, prop_path, param_value, param_name)
+                setter = plan.setter(param_name)
+                if setter is not None:
+                    self.__apply_setter(obj, setter, param_value, param_name)
+                else:
+                    prop_path = copy.copy(spec['property_path'])
+                    self.__set_obj_attribute(obj, prop_path, param_value, param_name)
 
         if self.kind.lower() == 'project' and (module_params.get('display_name') or
                                                module_params.get('description')):
@@ -204,18 +353,21 @@ class AnsibleMixin(object):
             if module_params.get('description'):
                 obj.metadata.annotations['openshift.io/description'] = module_params['description']
 
-        logger.debug("Object from params:")
-        logger.debug(json.dumps(obj.to_dict(), indent=4))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Object from params:")
+            logger.debug(json.dumps(serializer.to_dict(obj), indent=4))
         return obj
 
     def request_body_from_params(self, module_params):
         request = {
             'kind': self.base_model_name,
         }
+        plan = self.param_plan
         for param_name, param_value in module_params.items():
             spec = self.find_arg_spec(param_name)
             if spec and spec.get('property_path') and param_value is not None:
-                self.__add_path_to_dict(request, param_name, param_value, spec['property_path'])
+                self.__apply_body_setter(request, plan.body_setter(param_name, self.__property_name_to_camel),
+                                         param_value, param_name)
 
         if self.kind.lower() == 'project' and (module_params.get('display_name') or
                                                module_params.get('description')):
@@ -232,19 +384,106 @@ class AnsibleMixin(object):
         logger.debug(json.dumps(request, indent=4))
         return request
 
+    def resource_definitions_from_params(self, module_params):
+        """
+        Return the API dicts of the objects defined by the resource_definitions param, or by a src file with
+        several YAML documents or a List. Definitions without kind or apiVersion are of the helper's kind.
+        Returns None when the params define a single object. Raises the helper's exception when more than one
+        of resource_definitions, resource_definition and src is set.
+
+        :param module_params: dict of key:value pairs
+        :return: list of API dicts, or None
+        """
+        given = [x for x in ('resource_definitions', 'resource_definition', 'src') if module_params.get(x)]
+        if len(given) > 1:
+            raise self.get_exception_class()(
+                "Error: parameters are mutually exclusive: {}".format(', '.join(given))
+            )
+        definitions = module_params.get('resource_definitions')
+        if definitions is None and module_params.get('src'):
+            try:
+                with open(module_params['src']) as src:
+                    documents = [x for x in YAML(typ='safe').load_all(src) if x]
+            except (IOError, YAMLError) as exc:
+                raise self.get_exception_class()("Error loading resource definitions: {}".format(exc))
+            if len(documents) > 1 or (documents and documents[0].get('kind') == 'List'):
+                definitions = documents
+        if definitions is None:
+            return None
+
+        result = []
+        for definition in definitions:
+            if not isinstance(definition, dict):
+                raise self.get_exception_class()(
+                    "Error: expected resource definitions to be objects, got {}".format(definition)
+                )
+            if definition.get('kind') == 'List':
+                result.extend(self.__with_default_kind(x) for x in definition.get('items') or [])
+            else:
+                result.append(self.__with_default_kind(definition))
+        return result
+
+    def __with_default_kind(self, definition):
+        if definition.get('kind') and definition.get('apiVersion'):
+            return definition
+        return dict(definition, kind=definition.get('kind') or self.base_model_name,
+                    apiVersion=definition.get('apiVersion') or self.api_version.lower())
+
+    def apply_resource_definitions(self, definitions, module_params, check_mode=False, workers=8):
+        """
+        Create, patch, replace or delete the objects of definitions, as the module does for a single object,
+        with up to workers API calls at once. The helpers of each kind share this helper's ApiClient.
+
+        :param definitions: list of API dicts, from resource_definitions_from_params()
+        :param module_params: dict of key:value pairs, for state, force and the default namespace
+        :param check_mode: report what would change without changing anything
+        :param workers: most objects applied at once
+        :return: dict of the module's results: changed, and the results of each definition, in order
+        """
+        applier = BulkApplier(self, workers=workers, replace=bool(module_params.get('force')),
+                              state=module_params.get('state') or 'present', check_mode=check_mode)
+        report = applier.apply(definitions, namespace=module_params.get('namespace'))
+        results = []
+        for item in report.results:
+            result = {
+                'kind': item.kind,
+                'name': item.name,
+                'namespace': item.namespace,
+                'action': item.action,
+                'changed': item.changed,
+            }
+            if item.failed:
+                result['failed'] = True
+                result['msg'] = str(item.error)
+            elif item.object is not None:
+                result['result'] = item.object
+            results.append(result)
+
+        return_attributes = {'changed': report.changed, 'results': results}
+        if report.failed:
+            return_attributes['failed'] = True
+            return_attributes['msg'] = "{} of {} resource definitions failed".format(len(report.failed),
+                                                                                  len(results))
+        return return_attributes
+
+    @property
+    def param_plan(self):
+        """ The ParamPlan for the helper's class, API version and kind, shared by all its helpers """
+        plan = self._param_plan
+        if plan is None:
+            key = (type(self), self.api_version, self.kind)
+            plan = _param_plans.get(key)
+            if plan is None:
+                with _param_plans_lock:
+                    plan = _param_plans.get(key)
+                    if plan is None:
+                        plan = _param_plans[key] = ParamPlan(self)
+            self._param_plan = plan
+        return plan
+
     def find_arg_spec(self, module_param_name):
         """For testing, allow the param_name value to be an alias"""
-        if self.argspec.get(module_param_name):
-            return self.argspec[module_param_name]
-        result = None
-        for key, value in self.argspec.items():
-            if value.get('aliases'):
-                for alias in value['aliases']:
-                    if alias == module_param_name:
-                        result = self.argspec[key]
-                        break
-                if result:
-                    break
+        result = self.param_plan.specs.get(module_param_name)
         if not result:
             raise self.get_exception_class()(
                 "Error: received unrecognized module parameter {}".format(module_param_name)
@@ -267,24 +506,18 @@ class AnsibleMixin(object):
                 choices[x] = snake_case(x)
         return choices
 
-    def __add_path_to_dict(self, request_dict, param_name, param_value, path):
-        local_path = copy.copy(path)
-        spec = self.find_arg_spec(param_name)
-        while len(local_path):
-            p = self.__property_name_to_camel(param_name, local_path.pop(0))
-            if len(local_path):
-                if request_dict.get(p, None) is None:
-                    request_dict[p] = {}
-                self.__add_path_to_dict(request_dict[p], param_name, param_value, local_path)
-                break
-            else:
-                param_type = spec.get('type', 'str')
-                if param_type == 'dict':
-                    request_dict[p] = self.__dict_keys_to_camel(param_name, param_value)
-                elif param_type == 'list':
-                    request_dict[p] = self.__list_keys_to_camel(param_name, param_value)
-                else:
-                    request_dict[p] = param_value
+    def __apply_body_setter(self, request_dict, setter, param_value, param_name):
+        """ Set a param value in a request body, at the path compiled by ParamPlan.body_setter() """
+        for key in setter.keys[:-1]:
+            if request_dict.get(key, None) is None:
+                request_dict[key] = {}
+            request_dict = request_dict[key]
+        if setter.value_type == 'dict':
+            request_dict[setter.keys[-1]] = self.__dict_keys_to_camel(param_name, param_value)
+        elif setter.value_type == 'list':
+            request_dict[setter.keys[-1]] = self.__list_keys_to_camel(param_name, param_value)
+        else:
+            request_dict[setter.keys[-1]] = param_value
 
     def __dict_keys_to_camel(self, param_name, param_dict):
         result = {}
@@ -301,11 +534,9 @@ class AnsibleMixin(object):
 
     @staticmethod
     def __property_name_to_camel(param_name, property_name):
-        new_name = property_name
         if 'annotations' not in param_name and 'labels' not in param_name and 'selector' not in param_name:
-            camel_name = string_utils.snake_case_to_camel(property_name, upper_case_first=False)
-            new_name = camel_name[1:] if camel_name.startswith('_') else camel_name
-        return new_name
+            return _snake_to_camel(property_name)
+        return property_name
 
     def __list_keys_to_camel(self, param_name, param_list):
         result = []
@@ -316,6 +547,49 @@ class AnsibleMixin(object):
             result = param_list
         return result
 
+    def __apply_setter(self, obj, setter, param_value, param_name):
+        """
+        Set a param value on obj, following the steps compiled by ParamPlan.setter(). Equivalent to
+        __set_obj_attribute() with the param's property_path.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("apply_setter {0}, {1} to {2}".format(obj.__class__.__name__, param_name,
+                                                               json.dumps(param_value)))
+        for attribute, model_class in setter.path:
+            sub_obj = getattr(obj, attribute)
+            if not sub_obj:
+                sub_obj = model_class()
+                setattr(obj, attribute, sub_obj)
+            obj = sub_obj
+
+        attribute = setter.attribute
+        if setter.action == SET_VALUE:
+            try:
+                setattr(obj, attribute, param_value)
+            except ValueError as exc:
+                msg = str(exc)
+                if param_value is None and 'None' in msg:
+                    pass
+                else:
+                    raise self.get_exception_class()(
+                        "Error setting {0} to {1}: {2}".format(attribute, param_value, msg)
+                    )
+        elif setter.action == MERGE_DICT:
+            if not getattr(obj, attribute):
+                setattr(obj, attribute, param_value)
+            else:
+                merge_dict(getattr(obj, attribute), param_value)
+        elif setter.action == CREATE_OBJECT:
+            if not getattr(obj, attribute):
+                setattr(obj, attribute, setter.item_type())
+        else:
+            if getattr(obj, attribute) is None:
+                setattr(obj, attribute, [])
+            if setter.action == MERGE_OBJECT_LIST:
+                self.__compare_obj_list(getattr(obj, attribute), param_value, setter.item_type, param_name)
+            else:
+                merge_list(getattr(obj, attribute), param_value)
+
     def __set_obj_attribute(self, obj, property_path, param_value, param_name):
         """
         Recursively set object properties
@@ -347,7 +621,7 @@ class AnsibleMixin(object):
                 if not getattr(obj, prop_name):
                     setattr(obj, prop_name, param_value)
                 else:
-                    self.__compare_dict(getattr(obj, prop_name), param_value, param_name)
+                    merge_dict(getattr(obj, prop_name), param_value)
             elif prop_kind.startswith('list['):
                 if getattr(obj, prop_name) is None:
                     setattr(obj, prop_name, [])
@@ -355,7 +629,7 @@ class AnsibleMixin(object):
                 if obj_type not in PRIMITIVES and obj_type not in ('list', 'dict'):
                     self.__compare_obj_list(getattr(obj, prop_name), param_value, obj_type, param_name)
                 else:
-                    self.__compare_list(getattr(obj, prop_name), param_value, param_name)
+                    merge_list(getattr(obj, prop_name), param_value)
             else:
                 # prop_kind is an object class
                 sub_obj = getattr(obj, prop_name)
@@ -364,188 +638,72 @@ class AnsibleMixin(object):
                 setattr(obj, prop_name, self.__set_obj_attribute(sub_obj, property_path, param_value, param_name))
         return obj
 
-    def __compare_list(self, src_values, request_values, param_name):
-        """
-        Compare src_values list with request_values list, and ppend any missing
-        request_values to src_values.
-        """
-        if not request_values:
-            return
-
-        if not src_values:
-            src_values += request_values
-
-        if type(src_values[0]).__name__ in PRIMITIVES:
-            if set(src_values) >= set(request_values):
-                # src_value list includes request_value list
-                return
-            # append the missing elements from request value
-            src_values += list(set(request_values) - set(src_values))
-        elif type(src_values[0]).__name__ == 'dict':
-            missing = []
-            for request_dict in request_values:
-                match = False
-                for src_dict in src_values:
-                    if '__cmp__' in dir(src_dict):
-                        # python < 3
-                        if src_dict >= request_dict:
-                            match = True
-                            break
-                    elif src_dict.items() == request_dict.items():
-                        # python >= 3
-                        match = True
-                        break
-                if not match:
-                    missing.append(request_dict)
-            src_values += missing
-        elif type(src_values[0]).__name__ == 'list':
-            missing = []
-            for request_list in request_values:
-                match = False
-                for src_list in src_values:
-                    if set(request_list) >= set(src_list):
-                        match = True
-                        break
-                if not match:
-                    missing.append(request_list)
-            src_values += missing
-        else:
-            raise self.get_exception_class()(
-                "Evaluating {0}: encountered unimplemented type {1} in "
-                "__compare_list()".format(param_name, type(src_values[0]).__name__)
-            )
-
-    def __compare_dict(self, src_value, request_value, param_name):
-        """
-        Compare src_value dict with request_value dict, and update src_value with any differences.
-        Does not remove items from src_value dict.
-        """
-        if not request_value:
-            return
-        for item, value in request_value.items():
-            if type(value).__name__ in ('str', 'int', 'bool'):
-                src_value[item] = value
-            elif type(value).__name__ == 'list':
-                self.__compare_list(src_value[item], value, param_name)
-            elif type(value).__name__ == 'dict':
-                self.__compare_dict(src_value[item], value, param_name)
-            else:
-                raise self.get_exception_class()(
-                    "Evaluating {0}: encountered unimplemented type {1} in "
-                    "__compare_dict()".format(param_name, type(value).__name__)
-                )
-
     def __compare_obj_list(self, src_value, request_value, obj_class, param_name):
         """
-        Compare a src_value (list of ojects) with a request_value (list of dicts), and update
-        src_value with differences. Assumes each object and each dict has a 'name' attributes,
-        which can be used for matching. Elements are not removed from the src_value list.
+        Merge a request_value (list of dicts) into src_value (list of objects of obj_class), following
+        merge.merge_object_list(). Items are matched by the first of 'name' and 'type' the model has, if
+        every requested item sets it, or otherwise by all the values an item sets.
         """
         if not request_value:
             return
 
         sample_obj = self.model_class_from_name(obj_class)()
+        key_name = list_key(request_value, [key for key in LIST_KEYS if hasattr(sample_obj, key)][:1])
+
+        def get(obj, key):
+            return getattr(obj, self.attribute_to_snake(key), None)
+
+        def new_item(item):
+            return self.__update_object_properties(self.model_class_from_name(obj_class)(), item)
 
-        # Try to determine the unique key for the array
-        key_names = [
-            'name',
-            'type'
-        ]
-        key_name = None
-        for key in key_names:
-            if hasattr(sample_obj, key):
-                key_name = key
-                break
-
-        if key_name:
-            # If the key doesn't exist in the request values, then ignore it, rather than throwing an error
-            for item in request_value:
-                if not item.get(key_name):
-                    key_name = None
-                    break
-
-        if key_name:
-            # compare by key field
-            for item in request_value:
-                if not item.get(key_name):
-                    # Prevent user from creating something that will be impossible to patch or update later
-                    logger.debug("FAILED on: {}".format(item))
+        def update_item(obj, item):
+            self.__update_obj_list_item(obj, item, sample_obj, obj_class, param_name)
+
+        merge_object_list(src_value, request_value, key_name, get, new_item, update_item)
+
+    def __update_obj_list_item(self, obj, item, sample_obj, obj_class, param_name):
+        """ Update an object of a list from the request item matched to it in __compare_obj_list() """
+        for key, value in item.items():
+            snake_key = self.attribute_to_snake(key)
+            item_kind = sample_obj.swagger_types.get(snake_key)
+            if item_kind and item_kind in PRIMITIVES or type(value).__name__ in PRIMITIVES:
+                setattr(obj, snake_key, value)
+            elif item_kind and item_kind.startswith('list['):
+                obj_type = item_kind.replace('list[', '').replace(']', '')
+                if getattr(obj, snake_key) is None:
+                    setattr(obj, snake_key, [])
+                if obj_type not in ('str', 'int', 'bool'):
+                    self.__compare_obj_list(getattr(obj, snake_key), value, obj_type, param_name)
+                else:
+                    # Straight list comparison
+                    merge_list(getattr(obj, snake_key), value)
+            elif item_kind and item_kind.startswith('dict('):
+                merge_dict(getattr(obj, snake_key), value)
+            elif item_kind and type(value).__name__ == 'dict':
+                # object
+                param_obj = getattr(obj, snake_key)
+                if not param_obj:
+                    setattr(obj, snake_key, self.model_class_from_name(item_kind)())
+                    param_obj = getattr(obj, snake_key)
+                self.__update_object_properties(param_obj, value)
+            else:
+                if item_kind:
                     raise self.get_exception_class()(
-                        "Evaluating {0} - expecting parameter {1} to contain a `{2}` attribute "
-                        "in __compare_obj_list().".format(param_name,
-                                                          self.get_base_model_name_snake(obj_class),
-                                                          key_name)
+                        "Evaluating {0}: encountered unimplemented type {1} in "
+                        "__compare_obj_list() for model {2}".format(
+                            param_name,
+                            item_kind,
+                            self.get_base_model_name_snake(obj_class))
+                    )
+                else:
+                    raise self.get_exception_class()(
+                        "Evaluating {}: unable to get swagger_type for {} in "
+                        "__compare_obj_list() for item {} in model {}".format(
+                            param_name,
+                            snake_key,
+                            str(item),
+                            self.get_base_model_name_snake(obj_class))
                     )
-                found = False
-                for obj in src_value:
-                    if not obj:
-                        continue
-                    if getattr(obj, key_name) == item[key_name]:
-                        # Assuming both the src_value and the request value include a name property
-                        found = True
-                        for key, value in item.items():
-                            snake_key = self.attribute_to_snake(key)
-                            item_kind = sample_obj.swagger_types.get(snake_key)
-                            if item_kind and item_kind in PRIMITIVES or type(value).__name__ in PRIMITIVES:
-                                setattr(obj, snake_key, value)
-                            elif item_kind and item_kind.startswith('list['):
-                                obj_type = item_kind.replace('list[', '').replace(']', '')
-                                if getattr(obj, snake_key) is None:
-                                    setattr(obj, snake_key, [])
-                                if obj_type not in ('str', 'int', 'bool'):
-                                    self.__compare_obj_list(getattr(obj, snake_key), value, obj_type, param_name)
-                                else:
-                                    # Straight list comparison
-                                    self.__compare_list(getattr(obj, snake_key), value, param_name)
-                            elif item_kind and item_kind.startswith('dict('):
-                                self.__compare_dict(getattr(obj, snake_key), value, param_name)
-                            elif item_kind and type(value).__name__ == 'dict':
-                                # object
-                                param_obj = getattr(obj, snake_key)
-                                if not param_obj:
-                                    setattr(obj, snake_key, self.model_class_from_name(item_kind)())
-                                    param_obj = getattr(obj, snake_key)
-                                self.__update_object_properties(param_obj, value)
-                            else:
-                                if item_kind:
-                                    raise self.get_exception_class()(
-                                        "Evaluating {0}: encountered unimplemented type {1} in "
-                                        "__compare_obj_list() for model {2}".format(
-                                            param_name,
-                                            item_kind,
-                                            self.get_base_model_name_snake(obj_class))
-                                    )
-                                else:
-                                    raise self.get_exception_class()(
-                                        "Evaluating {}: unable to get swagger_type for {} in "
-                                        "__compare_obj_list() for item {} in model {}".format(
-                                            param_name,
-                                            snake_key,
-                                            str(item),
-                                            self.get_base_model_name_snake(obj_class))
-                                    )
-                if not found:
-                    # Requested item not found. Adding.
-                    obj = self.__update_object_properties(self.model_class_from_name(obj_class)(), item)
-                    src_value.append(obj)
-        else:
-            # There isn't a key, or we don't know what it is, so check for all properties to match
-            for item in request_value:
-                found = False
-                for obj in src_value:
-                    match = True
-                    for item_key, item_value in item.items():
-                        # TODO: this should probably take the property type into account
-                        snake_key = self.attribute_to_snake(item_key)
-                        if getattr(obj, snake_key) != item_value:
-                            match = False
-                            break
-                    if match:
-                        found = True
-                        break
-                if not found:
-                    obj = self.__update_object_properties(self.model_class_from_name(obj_class)(), item)
-                    src_value.append(obj)
 
     def __update_object_properties(self, obj, item):
         """ Recursively update an object's properties. Returns a pointer to the object. """
@@ -703,8 +861,35 @@ class AnsibleMixin(object):
 
 
 class KubernetesAnsibleModuleHelper(AnsibleMixin, KubernetesObjectHelper):
-    pass
+    module_prefix = 'k8s'
 
 
 class OpenShiftAnsibleModuleHelper(AnsibleMixin, OpenShiftObjectHelper):
-    pass
+    module_prefix = 'openshift'
+
+
+def execute_module(module):
+    """
+    Run a generated Ansible module, as its main() does. The objects of the resource_definitions param, or of a
+    src file with several documents, are applied by apply_resource_definitions(); anything else is left to the
+    module's execute_module().
+
+    :param module: the KubernetesAnsibleModule or OpenShiftAnsibleModule of Ansible's module_utils
+    """
+    helper = module.helper
+    try:
+        definitions = helper.resource_definitions_from_params(module.params)
+    except helper.get_exception_class() as exc:
+        module.fail_json(msg="Module failed!", error=str(exc))
+    if definitions is None:
+        return module.execute_module()
+
+    if module.params.get('debug'):
+        helper.enable_debug(reset_logfile=False)
+    auth = dict((key, module.params[key]) for key, spec in helper.argspec.items()
+                if spec.get('auth_option') and module.params.get(key) is not None)
+    helper.set_client_config(**auth)
+    result = helper.apply_resource_definitions(definitions, module.params, check_mode=module.check_mode)
+    if result.get('failed'):
+        module.fail_json(**result)
+    module.exit_json(**result)
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import logging
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import string_utils
+
+from kubernetes.client.models import V1ObjectMeta
+
+from ..client import serializer
+from .patch import merge_object
+
+logger = logging.getLogger(__name__)
+
+# Kinds in the order their dependencies require. Kinds within a tier are applied concurrently.
+KIND_TIERS = (
+    ('Namespace', 'Project'),
+    ('CustomResourceDefinition', 'PersistentVolume', 'StorageClass', 'ClusterRole', 'ClusterRoleBinding',
+     'ClusterPolicy', 'ClusterPolicyBinding', 'SecurityContextConstraints'),
+    ('ServiceAccount', 'Secret', 'ConfigMap', 'ResourceQuota', 'LimitRange', 'PersistentVolumeClaim',
+     'Role', 'RoleBinding', 'Policy', 'PolicyBinding'),
+    ('ImageStream', 'Template'),
+    ('BuildConfig', 'Service'),
+    ('DeploymentConfig', 'Deployment', 'ReplicationController', 'ReplicaSet', 'StatefulSet', 'DaemonSet',
+     'Job', 'Pod', 'Build'),
+    ('Route', 'Ingress', 'HorizontalPodAutoscaler', 'NetworkPolicy', 'PodDisruptionBudget'),
+)
+
+CREATED = 'created'
+PATCHED = 'patched'
+REPLACED = 'replaced'
+DELETED = 'deleted'
+UNCHANGED = 'unchanged'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+def kind_tier(kind, tiers=KIND_TIERS):
+    """ Return the index of the tier for kind. Kinds not listed in tiers go last. """
+    for index, kinds in enumerate(tiers):
+        if kind in kinds:
+            return index
+    return len(tiers)
+
+
+class ApplyResult(object):
+    """ The outcome of applying one manifest """
+
+    def __init__(self, manifest, index, tier):
+        metadata = manifest.get('metadata') or {}
+        self.manifest = manifest
+        self.index = index
+        self.tier = tier
+        self.kind = manifest.get('kind')
+        self.name = metadata.get('name')
+        self.namespace = metadata.get('namespace')
+        self.action = None
+        self.object = None
+        self.diff = []
+        self.error = None
+        self.duration = 0.0
+
+    @property
+    def changed(self):
+        return self.action in (CREATED, PATCHED, REPLACED, DELETED)
+
+    @property
+    def failed(self):
+        return self.action == FAILED
+
+    def __repr__(self):
+        return '<ApplyResult {0} {1}/{2}: {3}>'.format(self.kind, self.namespace, self.name, self.action)
+
+
+class ApplyReport(object):
+    """ Results of BulkApplier.apply(), in the order the manifests were given, with timing """
+
+    def __init__(self, results, tier_durations, duration):
+        self.results = results
+        self.tier_durations = tier_durations
+        self.duration = duration
+
+    @property
+    def changed(self):
+        return any(x.changed for x in self.results)
+
+    @property
+    def failed(self):
+        return [x for x in self.results if x.failed]
+
+    def by_action(self, action):
+        return [x for x in self.results if x.action == action]
+
+
+class BulkApplier(object):
+    """
+    Applies a list of manifests, as API dicts, with the same semantics as the Ansible modules.
+
+    For state present, a missing object is created. An existing object is replaced when replace is
+    set. Otherwise the manifest is merged into the existing object, compared with objects_match(),
+    and patched only if they differ. For state absent, an existing object is deleted.
+
+    Manifests are grouped into tiers by kind (see KIND_TIERS), so namespaces and projects come first
+    and each kind follows the kinds it depends on. Tiers run one after another. The manifests of a
+    tier are applied concurrently by up to workers threads.
+
+    Each kind is handled by a copy of helper set to that kind and to raw mode. All copies share the
+    helper's ApiClient.
+    """
+
+    def __init__(self, helper, workers=8, tiers=KIND_TIERS, replace=False, state='present', check_mode=False,
+                 fail_fast=False):
+        """
+        :param helper: object helper to copy for each kind, e.g. an OpenShiftObjectHelper
+        :param workers: most objects applied at once
+        :param tiers: sequence of tuples of kinds, in dependency order
+        :param replace: replace existing objects rather than patching them
+        :param state: 'present' or 'absent'. With 'absent' the tiers run in reverse.
+        :param check_mode: report what would change without changing anything
+        :param fail_fast: skip the remaining tiers after a tier with a failure
+        """
+        self.helper = helper
+        self.workers = workers
+        self.tiers = tiers
+        self.replace = replace
+        self.state = state
+        self.check_mode = check_mode
+        self.fail_fast = fail_fast
+        self._helpers = {}
+        self._lock = threading.Lock()
+
+    def plan(self, manifests):
+        """ Return the manifests grouped by tier, as a list of lists of (index, manifest), in run order """
+        grouped = {}
+        for index, manifest in enumerate(manifests):
+            grouped.setdefault(kind_tier(manifest.get('kind'), self.tiers), []).append((index, manifest))
+        return [grouped[tier] for tier in sorted(grouped, reverse=self.state == 'absent')]
+
+    def apply(self, manifests, namespace=None):
+        """
+        Apply manifests.
+
+        :param manifests: list of API dicts, each with apiVersion, kind and metadata.name
+        :param namespace: namespace for namespaced objects whose metadata has none
+        :return: ApplyReport
+        """
+        start = time.time()
+        results = [None] * len(manifests)
+        tier_durations = []
+        stopped = False
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for tier in self.plan(manifests):
+                tier_start = time.time()
+                tier_results = [ApplyResult(manifest, index, kind_tier(manifest.get('kind'), self.tiers))
+                                for index, manifest in tier]
+                if stopped:
+                    for result in tier_results:
+                        result.action = SKIPPED
+                else:
+                    list(executor.map(lambda result: self._apply_one(result, namespace), tier_results))
+                    stopped = self.fail_fast and any(x.failed for x in tier_results)
+                for result in tier_results:
+                    results[result.index] = result
+                tier_durations.append(time.time() - tier_start)
+        return ApplyReport(results, tier_durations, time.time() - start)
+
+    def helper_for(self, api_version, kind):
+        """ Return the helper for a manifest's apiVersion and kind, e.g. 'apps/v1beta1' and 'StatefulSet' """
+        key = (api_version, kind)
+        helper = self._helpers.get(key)
+        if helper is None:
+            with self._lock:
+                helper = self._helpers.get(key)
+                if helper is None:
+                    helper = copy.copy(self.helper)
+                    helper.raw = True
+                    helper.set_model(api_version.split('/')[-1], string_utils.camel_case_to_snake(kind))
+                    self._helpers[key] = helper
+        return helper
+
+    def _apply_one(self, result, default_namespace):
+        start = time.time()
+        try:
+            helper = self.helper_for(result.manifest.get('apiVersion', 'v1'), result.kind)
+            if result.namespace is None and default_namespace and self._namespaced(helper, default_namespace):
+                result.namespace = default_namespace
+            if self.state == 'absent':
+                self._absent(helper, result)
+            else:
+                self._present(helper, result)
+        except Exception as exc:
+            logger.debug('Applying {0} failed: {1}'.format(result, exc))
+            result.action = FAILED
+            result.error = exc
+        result.duration = time.time() - start
+        return result
+
+    @staticmethod
+    def _namespaced(helper, namespace):
+        try:
+            helper.lookup_method('create', namespace)
+        except helper.get_exception_class():
+            return False
+        return True
+
+    def _present(self, helper, result):
+        name, namespace = result.name, result.namespace
+        body = copy.deepcopy(result.manifest)
+        if namespace:
+            body.setdefault('metadata', {})['namespace'] = namespace
+        existing = helper.get_object(name, namespace)
+        if not existing:
+            result.action = CREATED
+            if not self.check_mode:
+                result.object = self._create(helper, namespace, body)
+            return
+
+        if self.replace:
+            result.action = REPLACED
+            if not self.check_mode:
+                result.object = helper.replace_object(name, namespace, body=body)
+            return
+
+        desired = merge_object(existing, body)
+        match, result.diff = helper.objects_match(existing, desired)
+        if match:
+            result.action = UNCHANGED
+            result.object = existing
+            return
+        result.action = PATCHED
+        if not self.check_mode:
+            result.object = helper.patch_object(name, namespace, body, existing=existing)
+
+    def _absent(self, helper, result):
+        existing = helper.get_object(result.name, result.namespace)
+        if not existing:
+            result.action = UNCHANGED
+            return
+        result.action = DELETED
+        if not self.check_mode:
+            helper.delete_object(result.name, result.namespace)
+
+    @staticmethod
+    def _create(helper, namespace, body):
+        if body.get('kind') == 'Project' and hasattr(helper, 'create_project'):
+            metadata = serializer.from_api_dict(body['metadata'], V1ObjectMeta)
+            annotations = metadata.annotations or {}
+            return helper.create_project(metadata, display_name=annotations.get('openshift.io/display-name'),
+                                         description=annotations.get('openshift.io/description'))
+        return helper.create_object(namespace, body=body)
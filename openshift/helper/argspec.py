@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Precompiled Ansible module argspecs.
+
+Building an argspec introspects every nested model of a kind. The argspecs of the generated modules
+are built ahead of time by `openshift-ansible-gen argspecs`, and shipped in ARGSPEC_PATH as one JSON
+file per module, named like the module: <prefix>_<api_version>_<kind>.json. Each file records the
+package version it was built for. Files built for another version are ignored, and the helper
+introspects the models instead.
+"""
+from __future__ import absolute_import
+
+import io
+import json
+import logging
+import os
+
+from six import text_type
+
+from .. import __version__
+
+logger = logging.getLogger(__name__)
+
+ARGSPEC_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), 'argspecs'))
+
+
+def artifact_name(prefix, api_version, kind):
+    """ Return the file name of the argspec for a module prefix ('k8s' or 'openshift'), api_version and kind """
+    return '{0}_{1}_{2}.json'.format(prefix, api_version.lower(), kind)
+
+
+def load_argspec(prefix, api_version, kind, path=ARGSPEC_PATH):
+    """
+    Return the precompiled argspec for a module, or None if there is none for this package version.
+    """
+    file_name = os.path.join(path, artifact_name(prefix, api_version, kind))
+    try:
+        with io.open(file_name, 'r', encoding='utf-8') as artifact:
+            data = json.load(artifact)
+    except IOError:
+        return None
+    except ValueError as exc:
+        logger.debug("Ignoring argspec {0}: {1}".format(file_name, exc))
+        return None
+    if data.get('version') != __version__:
+        logger.debug("Ignoring argspec {0} built for version {1}".format(file_name, data.get('version')))
+        return None
+    return data['argspec']
+
+
+def write_argspec(prefix, api_version, kind, argspec, path=ARGSPEC_PATH):
+    """ Write the argspec for a module to path, and return the file name """
+    file_name = os.path.join(path, artifact_name(prefix, api_version, kind))
+    data = {'version': __version__, 'argspec': argspec}
+    with io.open(file_name, 'w', encoding='utf-8') as artifact:
+        artifact.write(text_type(json.dumps(data, sort_keys=True, separators=(',', ':'))))
+        artifact.write(u'\n')
+    return file_name
@@ -1,43 +1,59 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
-import inspect
+import copy
 import json
 import logging
-import math
 import re
-import time
+import threading
 
 from abc import ABCMeta, abstractmethod
 from logging import config as logging_config
 
 import string_utils
 
-from dictdiffer import diff
-from kubernetes import watch
 from kubernetes.client.models import V1DeleteOptions
 from kubernetes.client.rest import ApiException
-from six import add_metaclass
+from six import add_metaclass, binary_type
 from urllib3.exceptions import MaxRetryError
 
-from . import VERSION_RX
+from . import VERSION_RX, diff
+from ..client import serializer
+from .dispatch import MethodIndex
 from .exceptions import KubernetesException
+from .fields import get_field
+from .informer import shared_informer
+from .patch import minimal_patch, without_server_fields
+from .pool import CREDENTIAL_KEYS, client_key, client_pool
+from .sanitize import sanitize
+from .waiter import Waiter, object_deleted, object_ready
 
+_method_index_lock = threading.Lock()
 
 @add_metaclass(ABCMeta)
 class BaseObjectHelper(object):
     model = None
-    properties = None
+    _properties = None
     base_model_name = None
     base_model_name_snake = None
+    _method_index = None
+    informer = None
+    _api_client = None
+    _auth = {}
+
+    # ClientPool sharing ApiClients between helpers, or None for a client per helper
+    client_pool = client_pool
+    # RateLimiter set on the helper's ApiClient, shared by the helpers using the client
+    rate_limiter = None
 
     logger = logging.getLogger(__name__)
 
-    def __init__(self, api_version=None, kind=None, debug=False, reset_logfile=True, timeout=20, **auth):
-        self.version_rx = re.compile("V\d((alpha|beta)\d)?")
+    def __init__(self, api_version=None, kind=None, debug=False, reset_logfile=True, timeout=20, raw=False,
+                 **auth):
         self.api_version = api_version
         self.kind = kind
         self.timeout = timeout  # number of seconds to wait for an API request
+        self.raw = raw  # return API dicts rather than model objects
 
         if api_version and kind:
             self.set_model(api_version, kind)
@@ -78,28 +94,61 @@ class BaseObjectHelper(object):
         self.api_version = api_version
         self.kind = kind
         self.model = self.get_model(api_version, kind)
-        self.properties = self.properties_from_model_obj(self.model())
+        self.informer = None
+        self._properties = None
         self.base_model_name = self.get_base_model_name(self.model.__name__)
         self.base_model_name_snake = self.get_base_model_name_snake(self.base_model_name)
 
+    @property
+    def properties(self):
+        """ The model's properties, from properties_from_model_obj(), introspected on first use """
+        if self._properties is None and self.model is not None:
+            self._properties = self.properties_from_model_obj(self.model())
+        return self._properties
+
     def set_client_config(self, **auth):
-        """ Convenience method for updating the configuration object, and instantiating a new client """
-        config_file = auth.get('kubeconfig')
-        context = auth.get('context')
+        """
+        Convenience method for updating the configuration. The client is created on first use, see
+        api_client.
+        """
+        self._auth = auth
+        self._api_client = None
 
-        self.api_client = self.client_from_config(config_file, context)
+    @property
+    def api_client(self):
+        """
+        The ApiClient for the configuration, created on first use. Helpers with the same
+        configuration share the client of client_pool, if set.
+        """
+        if self._api_client is None:
+            if self.client_pool is None:
+                self._api_client = self.new_client()
+            else:
+                key = client_key(type(self).client_from_config, self._auth) + (self.rate_limiter,)
+                self._api_client = self.client_pool.get(key, self.new_client)
+        return self._api_client
 
-        if auth.get('host') is not None:
-            self.api_client.host = auth['host']
+    @api_client.setter
+    def api_client(self, api_client):
+        self._api_client = api_client
 
-        auth_keys = ['api_key', 'ssl_ca_cert', 'cert_file', 'key_file', 'verify_ssl']
+    def new_client(self):
+        """ Return a new ApiClient for the configuration """
+        auth = self._auth
+        api_client = self.client_from_config(auth.get('kubeconfig'), auth.get('context'))
 
-        for key in auth_keys:
+        if auth.get('host') is not None:
+            api_client.host = auth['host']
+
+        for key in CREDENTIAL_KEYS:
             if auth.get(key, None) is not None:
                 if key == 'api_key':
-                    self.api_client.config.api_key = {'authorization': auth[key]}
+                    api_client.config.api_key = {'authorization': auth[key]}
                 else:
-                    setattr(self.api_client.config, key, auth[key])
+                    setattr(api_client.config, key, auth[key])
+        if self.rate_limiter is not None:
+            api_client.rate_limiter = self.rate_limiter
+        return api_client
 
     @staticmethod
     def enable_debug(to_file=True, filename='KubeObjHelper.log', reset_logfile=True):
@@ -151,55 +200,61 @@ class BaseObjectHelper(object):
                 return False
         return method is not None
 
+    def use_informer(self, namespace=None):
+        """
+        Serve get_object() for the current kind from a shared informer cache, kept current by a
+        watch, rather than sending a GET for each read.
+
+        :param namespace: cache a single namespace. The default caches all namespaces.
+        :return: the Informer
+        """
+        self.informer = shared_informer(self, namespace)
+        self.informer.wait_for_sync(self.timeout)
+        return self.informer
+
     def get_object(self, name, namespace=None):
+        informer = self.informer
+        if informer is not None and name and informer.covers(namespace) and informer.has_synced():
+            # Copy, since the cached object is shared and callers modify what they get
+            return copy.deepcopy(informer.get(name, namespace))
+
         k8s_obj = None
         method_name = 'list' if self.kind.endswith('list') else 'read'
         try:
             get_method = self.lookup_method(method_name, namespace)
-            if name and namespace is None:
-                k8s_obj = get_method(name)
-            elif namespace and not name:
-                k8s_obj = get_method(namespace)
-            else:
-                k8s_obj = get_method(name, namespace)
+            k8s_obj = self.call_method(get_method, *self._get_args(name, namespace))
         except ApiException as exc:
             if exc.status != 404:
                 if self.base_model_name == 'Project'and exc.status == 403:
                     pass
                 else:
-                    msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-                    raise self.get_exception_class()(msg, status=exc.status)
+                    raise self.exception_from_api_exception(exc)
         except MaxRetryError as ex:
             raise self.get_exception_class()(str(ex.reason))
 
         return k8s_obj
 
-    def patch_object(self, name, namespace, k8s_obj):
+    def patch_object(self, name, namespace, k8s_obj, existing=None):
+        """
+        Send a PATCH request to the API. With existing, only the fields of k8s_obj that differ from it
+        are sent, and no request is made when nothing differs; see patch.minimal_patch(). Without it,
+        k8s_obj is sent whole, less the fields maintained by the server, and nothing is read first.
+
+        :param k8s_obj: desired state, a model object or API dict
+        :param existing: the live object, if the caller has read it
+        """
         self.logger.debug('Starting patch object')
-        empty_status = self.properties['status']['class']()
-        k8s_obj.status = empty_status
-        k8s_obj.metadata.resource_version = None
-        self.__remove_creation_timestamps(k8s_obj)
-        w, stream = self._create_stream(namespace)
-        return_obj = None
-        self.logger.debug("Patching object: {}".format(json.dumps(k8s_obj.to_dict())))
+        body = self._patch_body(k8s_obj, existing)
+        if not body and existing is not None:
+            self.logger.debug('Skipping empty patch')
+            return self._wait_for_response(name, namespace, 'patch', existing)
         try:
             patch_method = self.lookup_method('patch', namespace)
-            if namespace:
-                patch_method(name, namespace, k8s_obj)
-            else:
-                patch_method(name, k8s_obj)
+            patched = self.call_method(patch_method, *self._patch_args(name, namespace, body))
         except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
+            raise self.exception_from_api_exception(exc)
 
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
-
-        if not return_obj or self.kind in ('project', 'namespace'):
-            return_obj = self._wait_for_response(name, namespace, 'patch')
-
-        return return_obj
+        return self._wait_for_response(name, namespace, 'patch', patched)
 
     def create_object(self, namespace=None, k8s_obj=None, body=None):
         """
@@ -210,74 +265,31 @@ class BaseObjectHelper(object):
         :return: new object returned from the API
         """
         self.logger.debug('Starting create object')
-        w, stream = self._create_stream(namespace)
-        return_obj = None
-        name = None
-        if k8s_obj:
-            name = k8s_obj.metadata.name
-        elif body:
-            name = body.get('metadata', {}).get('name', None)
+        name, args, kwargs = self._create_request(namespace, k8s_obj, body)
         try:
             create_method = self.lookup_method('create', namespace)
-            if namespace:
-                if k8s_obj:
-                    create_method(namespace, k8s_obj)
-                else:
-                    create_method(namespace, body=body)
-            else:
-                if k8s_obj:
-                    create_method(k8s_obj)
-                else:
-                    create_method(body=body)
+            created = self.call_method(create_method, *args, **kwargs)
         except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
+            raise self.exception_from_api_exception(exc)
         except MaxRetryError as ex:
             raise self.get_exception_class()(str(ex.reason))
 
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
-
-        if not return_obj or self.kind in ('project', 'namespace'):
-            return_obj = self._wait_for_response(name, namespace, 'create')
-
-        return return_obj
+        # The server may have generated the name
+        name = get_field(created, 'metadata', 'name') or name
+        return self._wait_for_response(name, namespace, 'create', created)
 
     def delete_object(self, name, namespace):
         self.logger.debug('Starting delete object {0} {1} {2}'.format(self.kind, name, namespace))
-        delete_method = self.lookup_method('delete', namespace)
-
-        if not namespace:
-            try:
-                if 'body' in inspect.getargspec(delete_method).args:
-                    status_obj = delete_method(name, body=V1DeleteOptions())
-                else:
-                    status_obj = delete_method(name)
-            except ApiException as exc:
-                msg = json.loads(exc.body).get('message', exc.reason)
-                raise self.get_exception_class()(msg, status=exc.status)
-            except MaxRetryError as ex:
-                raise self.get_exception_class()(str(ex.reason))
-        else:
-            try:
-                if 'body' in inspect.getargspec(delete_method).args:
-                    status_obj = delete_method(name, namespace, body=V1DeleteOptions())
-                else:
-                    status_obj = delete_method(name, namespace)
-            except ApiException as exc:
-                msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-                raise self.get_exception_class()(msg, status=exc.status)
-            except MaxRetryError as ex:
-                raise self.get_exception_class()(str(ex.reason))
-
-        if status_obj is None or status_obj.status == 'Failure':
-            msg = 'Failed to delete {}'.format(name)
-            if namespace is not None:
-                msg += ' in namespace {}'.format(namespace)
-            msg += ' status: {}'.format(status_obj)
-            raise self.get_exception_class()(msg)
+        delete_method, delete_args = self.lookup_api_method('delete', namespace)
+        args, kwargs = self._delete_request(name, namespace, delete_args)
+        try:
+            status_obj = self.call_method(delete_method, *args, **kwargs)
+        except ApiException as exc:
+            raise self.exception_from_api_exception(exc)
+        except MaxRetryError as ex:
+            raise self.get_exception_class()(str(ex.reason))
 
-        self._wait_for_response(name, namespace, 'delete')
+        self._wait_for_response(name, namespace, 'delete', self._delete_pending(name, namespace, status_obj))
 
     def replace_object(self, name, namespace, k8s_obj=None, body=None):
         """ Replace an existing object. Pass in a model object or request dict().
@@ -286,65 +298,161 @@ class BaseObjectHelper(object):
         """
         self.logger.debug('Starting replace object')
 
-        existing_obj = self.get_object(name, namespace)
-        if not existing_obj:
-            msg = "Error: Replacing object. Unable to find {}".format(name)
-            msg += " in namespace {}".format(namespace) if namespace else ""
-            raise self.get_exception_class()(msg)
-
-        if k8s_obj:
-            k8s_obj.status = self.properties['status']['class']()
-            self.__remove_creation_timestamps(k8s_obj)
-            k8s_obj.metadata.resource_version = existing_obj.metadata.resource_version
-        elif body:
-            body['metadata']['resourceVersion'] = existing_obj.metadata.resource_version
-
-        w, stream = self._create_stream(namespace)
-        return_obj = None
-
+        # The resourceVersion must be read after the caller's own writes, not from a read in flight
+        with self.api_client.fresh_reads():
+            existing_obj = self.get_object(name, namespace)
+        args, kwargs = self._replace_request(name, namespace, existing_obj, k8s_obj, body)
         try:
             replace_method = self.lookup_method('replace', namespace)
-            if k8s_obj:
-                if namespace is None:
-                    replace_method(name, k8s_obj)
-                else:
-                    replace_method(name, namespace, k8s_obj)
-            else:
-                if namespace is None:
-                    replace_method(name, body=body)
-                else:
-                    replace_method(name, namespace, body=body)
+            replaced = self.call_method(replace_method, *args, **kwargs)
         except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
+            raise self.exception_from_api_exception(exc)
         except MaxRetryError as ex:
             raise self.get_exception_class()(str(ex.reason))
 
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
+        return self._wait_for_response(name, namespace, 'replace', replaced)
 
-        if not return_obj or self.kind in ('project', 'namespace'):
-            return_obj = self._wait_for_response(name, namespace, 'replace')
+    @staticmethod
+    def _get_args(name, namespace):
+        """ Positional arguments of a read or list call """
+        if name and namespace is None:
+            return (name,)
+        if namespace and not name:
+            return (namespace,)
+        return (name, namespace)
+
+    def _patch_body(self, k8s_obj, existing=None):
+        """
+        Return the patch for k8s_obj, a model object or API dict: the minimal patch from the existing
+        object when there is one, otherwise the whole object without server maintained fields
+        """
+        desired = k8s_obj if isinstance(k8s_obj, dict) else serializer.to_api_dict(k8s_obj)
+        if existing is None:
+            body = without_server_fields(desired, self.model)
+        else:
+            live = existing if isinstance(existing, dict) else serializer.to_api_dict(existing)
+            body = minimal_patch(live, desired, self.model)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Patching object: {}".format(json.dumps(body)))
+        return body
+
+    @staticmethod
+    def _patch_args(name, namespace, body):
+        return (name, namespace, body) if namespace else (name, body)
+
+    @staticmethod
+    def _create_request(namespace, k8s_obj, body):
+        """ Return the object name, and the positional and keyword arguments of a create call """
+        if isinstance(k8s_obj, dict):
+            k8s_obj, body = None, k8s_obj
+        name = None
+        if k8s_obj:
+            name = k8s_obj.metadata.name
+        elif body:
+            name = body.get('metadata', {}).get('name', None)
+        args = (namespace,) if namespace else ()
+        if k8s_obj:
+            return name, args + (k8s_obj,), {}
+        return name, args, {'body': body}
+
+    @staticmethod
+    def _delete_request(name, namespace, delete_args):
+        """ Return the positional and keyword arguments of a delete call """
+        args = (name, namespace) if namespace else (name,)
+        kwargs = {'body': V1DeleteOptions()} if 'body' in delete_args else {}
+        return args, kwargs
+
+    def _delete_pending(self, name, namespace, status_obj):
+        """
+        Check the response to a delete. Returns the object if deletion is pending, or None if the
+        response is a Status.
+        """
+        if status_obj is None or get_field(status_obj, 'status') == 'Failure':
+            msg = 'Failed to delete {}'.format(name)
+            if namespace is not None:
+                msg += ' in namespace {}'.format(namespace)
+            msg += ' status: {}'.format(status_obj)
+            raise self.get_exception_class()(msg)
+
+        # The response is the object itself while deletion is pending, otherwise a Status
+        return status_obj if get_field(status_obj, 'metadata', 'name') == name else None
+
+    def _replace_request(self, name, namespace, existing_obj, k8s_obj, body):
+        """
+        Strip server maintained fields from the replacement, set the resource version of the existing
+        object on it, and return the positional and keyword arguments of a replace call
+        """
+        if not existing_obj:
+            msg = "Error: Replacing object. Unable to find {}".format(name)
+            msg += " in namespace {}".format(namespace) if namespace else ""
+            raise self.get_exception_class()(msg)
 
-        return return_obj
+        if isinstance(k8s_obj, dict):
+            k8s_obj, body = None, k8s_obj
+        resource_version = get_field(existing_obj, 'metadata', 'resource_version')
+        args = (name,) if namespace is None else (name, namespace)
+        if k8s_obj:
+            sanitize(k8s_obj)
+            k8s_obj.metadata.resource_version = resource_version
+            return args + (k8s_obj,), {}
+        if body:
+            body = sanitize(body, self.model)
+            body['metadata']['resourceVersion'] = resource_version
+        return args, {'body': body}
+
+    def call_method(self, method, *args, **kwargs):
+        """
+        Call an API method returned by lookup_method. In raw mode the response is not deserialized
+        into a model; the JSON body is parsed once and returned as a dict.
+        """
+        if not self.raw:
+            return method(*args, **kwargs)
+        kwargs['_preload_content'] = False
+        response = method(*args, **kwargs)
+        data = response.data
+        if isinstance(data, binary_type):
+            data = data.decode('utf8')
+        return json.loads(data) if data else None
+
+    def exception_from_api_exception(self, exc):
+        """ Return the helper's exception for an ApiException, using the message from the Status body if any """
+        body = exc.body
+        if isinstance(body, binary_type):
+            body = body.decode('utf8')
+        if body and body.startswith('{'):
+            msg = json.loads(body).get('message', exc.reason)
+        else:
+            msg = body
+        return self.get_exception_class()(msg, status=exc.status)
+
+    @staticmethod
+    def _loggable(obj):
+        """ Return obj in a form suitable for json.dumps() """
+        return obj if isinstance(obj, dict) else serializer.to_dict(obj)
 
     @staticmethod
     def objects_match(obj_a, obj_b):
-        """ Test the equality of two objects. Returns bool, list(differences). """
-        match = False
-        diffs = []
+        """
+        Test the equality of two objects. Returns bool, list(differences), with the differences in
+        the form of dictdiffer.diff(). Either object may be an API dict, in which case both are
+        compared as API dicts. Equality is tested with diff.equal(), which stops at the first
+        difference; the differences are only worked out for objects that do not match. See
+        diff.diff().
+        """
         if obj_a is None and obj_b is None:
-            match = True
-        elif not obj_a or not obj_b:
-            pass
+            return True, []
+        if not obj_a or not obj_b:
+            return False, []
+        if isinstance(obj_a, dict) or isinstance(obj_b, dict):
+            obj_a = obj_a if isinstance(obj_a, dict) else serializer.to_api_dict(obj_a)
+            obj_b = obj_b if isinstance(obj_b, dict) else serializer.to_api_dict(obj_b)
         elif type(obj_a).__name__ != type(obj_b).__name__:
-            pass
-        else:
-            dict_a = obj_a.to_dict()
-            dict_b = obj_b.to_dict()
-            diffs = list(diff(dict_a, dict_b))
-            match = len(diffs) == 0
-        return match, diffs
+            return False, []
+        if diff.equal(obj_a, obj_b):
+            return True, []
+        diffs = diff.diff(obj_a, obj_b)
+        BaseObjectHelper.logger.debug('Objects differ: {0}'.format(diffs))
+        return False, diffs
 
     @classmethod
     def properties_from_model_obj(cls, model_obj):
@@ -386,6 +494,21 @@ class BaseObjectHelper(object):
             }
         return result
 
+    @classmethod
+    def method_index(cls):
+        """
+        Return the MethodIndex for this helper class, building it on first use. The index is shared
+        by every instance of the class.
+        """
+        index = cls.__dict__.get('_method_index')
+        if index is None:
+            with _method_index_lock:
+                index = cls.__dict__.get('_method_index')
+                if index is None:
+                    index = MethodIndex(cls.available_apis(), cls.api_class_from_name)
+                    cls._method_index = index
+        return index
+
     def lookup_method(self, operation=None, namespace=None, method_name=None):
         """
         Get the requested method (e.g. create, delete, patch, update) for
@@ -394,25 +517,26 @@ class BaseObjectHelper(object):
         :param namespace: optional name of the namespace.
         :return: pointer to the method
         """
+        return self.lookup_api_method(operation, namespace, method_name).method
+
+    def lookup_api_method(self, operation=None, namespace=None, method_name=None):
+        """
+        Same as lookup_method, but returns an ApiMethod tuple of (method, args), where args is the
+        list of argument names accepted by the method.
+        """
         if not method_name:
             method_name = operation
             method_name += '_namespaced_' if namespace else '_'
             method_name += self.kind.replace('_list', '') if self.kind.endswith('_list') else self.kind
 
-        method = None
-        for api in self.available_apis():
-            api_class = self.api_class_from_name(api)
-
-            method = getattr(api_class(self.api_client), method_name, None)
-            if method is not None:
-                break
+        api_method = self.method_index().resolve(self.api_client, self.kind, operation, bool(namespace), method_name)
 
-        if method is None:
+        if api_method is None:
             msg = "Did you forget to include the namespace?" if not namespace else ""
             raise self.get_exception_class()(
                 "Error: method {0} not found for model {1}. {2}".format(method_name, self.kind, msg)
             )
-        return method
+        return api_method
 
     @classmethod
     def get_base_model_name(cls, model_name):
@@ -461,123 +585,21 @@ class BaseObjectHelper(object):
             )
         return model
 
-    def __remove_creation_timestamps(self, obj):
-        """ Recursively look for creation_timestamp property, and set it to None """
-        if hasattr(obj, 'swagger_types'):
-            for key, value in obj.swagger_types.items():
-                if key == 'creation_timestamp':
-                    obj.creation_timestamp = None
-                    continue
-                if value.startswith('dict(') or value.startswith('list['):
-                    continue
-                if value in ('str', 'int', 'bool'):
-                    continue
-                if getattr(obj, key) is not None:
-                    self.__remove_creation_timestamps(getattr(obj, key))
-
-    def _wait_for_response(self, name, namespace, action):
-        """ Wait for an API response """
-        tries = 0
-        half = math.ceil(self.timeout / 2)
-        obj = None
-
-        if self.kind in ('project', 'namespace'):
-            # Wait for annotations to be applied
-            time.sleep(1)
-
-        while tries <= half:
-            obj = self.get_object(name, namespace)
-            if action == 'delete':
-                if not obj:
-                    break
-            elif obj and obj.status and hasattr(obj.status, 'phase'):
-                if obj.status.phase == 'Active':
-                    break
-            elif obj and obj.status:
-                break
-            tries += 2
-            time.sleep(2)
-        return obj
-
-    def _create_stream(self, namespace):
-        """ Create a stream that gets events for the our model """
-        w = None
-        stream = None
-        exception_class = self.get_exception_class()
-
-        try:
-            list_method = self.lookup_method('list', namespace)
-            w = watch.Watch()
-            w._api_client = self.api_client  # monkey patch for access to OpenShift models
-            if namespace:
-                stream = w.stream(list_method, namespace, _request_timeout=self.timeout)
-            else:
-                stream = w.stream(list_method, _request_timeout=self.timeout)
-        except exception_class:
-            pass
-        except Exception:
-            raise
-
-        return w, stream
-
-    def _read_stream(self, watcher, stream, name):
-
-        return_obj = None
+    def is_ready(self, obj):
+        """
+        Return True if obj, as returned by create, patch or replace, needs no further waiting.
+        Kinds without a status are ready immediately; see waiter.object_ready() for the others.
+        """
+        if obj is None:
+            return False
+        if 'status' not in self.properties:
+            return True
+        return object_ready(obj)
 
-        try:
-            for event in stream:
-                obj = None
-                if event.get('object'):
-                    obj_json = json.dumps(event['object'].to_dict())
-                    self.logger.debug(
-                        "EVENT type: {0} object: {1}".format(event['type'], obj_json)
-                    )
-                    obj = event['object']
-                else:
-                    self.logger.debug(repr(event))
-
-                if event['object'].metadata.name == name:
-                    if event['type'] == 'DELETED':
-                        # Object was deleted
-                        return_obj = obj
-                        watcher.stop()
-                        break
-                    elif obj is not None:
-                        # Object is either added or modified. Check the status and determine if we
-                        #  should continue waiting
-                        if hasattr(obj, 'status'):
-                            status = getattr(obj, 'status')
-                            if hasattr(status, 'phase'):
-                                if status.phase == 'Active':
-                                    # TODO other phase values ??
-                                    # TODO test namespaces for OpenShift annotations if needed
-                                    return_obj = obj
-                                    watcher.stop()
-                                    break
-                            elif hasattr(status, 'conditions'):
-                                conditions = getattr(status, 'conditions')
-                                if conditions and len(conditions) > 0:
-                                    # We know there is a status, but it's up to the user to determine meaning.
-                                    return_obj = obj
-                                    watcher.stop()
-                                    break
-                            elif obj.kind == 'Service' and status is not None:
-                                return_obj = obj
-                                watcher.stop()
-                                break
-                            elif obj.kind == 'Route':
-                                route_statuses = set()
-                                for route_ingress in status.ingress:
-                                    for condition in route_ingress.conditions:
-                                        route_statuses.add(condition.type)
-                                if route_statuses <= {'Ready', 'Admitted'}:
-                                    return_obj = obj
-                                    watcher.stop()
-                                    break
-
-        except Exception as exc:
-            # A timeout occurred
-            self.logger.debug('STREAM FAILED: {}'.format(exc))
-            pass
-
-        return return_obj
+    def _wait_for_response(self, name, namespace, action, obj=None):
+        """
+        Wait for the object to be ready, or to be gone when action is 'delete', by following watch
+        events from the resourceVersion of obj, the object returned by the request.
+        """
+        predicate = object_deleted if action == 'delete' else self.is_ready
+        return Waiter(self, name, namespace, predicate, timeout=self.timeout).wait(obj)
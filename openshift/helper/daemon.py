@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+Helper daemon for the generated Ansible modules.
+
+A module process imports the client, builds the argspec, loads the kubeconfig and opens new
+connections before making any request. When OPENSHIFT_HELPER_DAEMON is set in the module's
+environment, the generated modules forward their parameters instead to a daemon listening on a Unix
+socket, which runs the module in a long running process: imports, argspecs, param plans, the client
+pool and its connections stay warm between tasks.
+
+There is one daemon per kubeconfig file, Python interpreter and package version; a daemon only runs
+modules for its own kubeconfig. The first module to need one starts it. The daemon runs each module
+in its own thread, so the modules of parallel tasks run concurrently, and exits after
+OPENSHIFT_HELPER_DAEMON_IDLE_TIMEOUT seconds without requests (600 by default). When no daemon can be
+reached, the module runs in its own process as before.
+
+The socket lives in a directory only the user can access, under $XDG_RUNTIME_DIR or the temporary
+directory.
+"""
+from __future__ import absolute_import
+
+import argparse
+import errno
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+from six import StringIO
+
+from .. import __version__
+from .kubeconfig import kubeconfig_path
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV = 'OPENSHIFT_HELPER_DAEMON'
+IDLE_TIMEOUT_ENV = 'OPENSHIFT_HELPER_DAEMON_IDLE_TIMEOUT'
+IDLE_TIMEOUT = 600
+
+# Seconds to wait for a new daemon to listen, and for a request to be read
+START_TIMEOUT = 10
+READ_TIMEOUT = 10
+
+MODULE_CLASSES = {
+    'openshift': ('ansible.module_utils.openshift_common', 'OpenShiftAnsibleModule', 'OpenShiftAnsibleException'),
+    'k8s': ('ansible.module_utils.k8s_common', 'KubernetesAnsibleModule', 'KubernetesAnsibleException'),
+}
+
+
+class DaemonUnavailable(Exception):
+    """ No daemon could be reached, and the request was not sent """
+
+
+def socket_path(kubeconfig):
+    """ Return the socket of the daemon for a kubeconfig path """
+    key = '\0'.join((kubeconfig, sys.executable, __version__)).encode('utf-8')
+    directory = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                             'openshift-helper-{0}'.format(os.getuid()))
+    return os.path.join(directory, hashlib.sha1(key).hexdigest()[:16] + '.sock')
+
+
+def _private_directory(directory):
+    try:
+        os.makedirs(directory, 0o700)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+    info = os.stat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise OSError(errno.EPERM, 'Refusing to use a directory other users can access', directory)
+
+
+def _read_all(conn):
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def _failure(msg, **kwargs):
+    return json.dumps(dict(kwargs, failed=True, msg=msg))
+
+
+class _ModuleOutput(object):
+    """ Stands in for sys.stdout, sending what each module thread writes to the buffer it captures to """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self):
+        """ Send the writes of the current thread to a new buffer, and return it """
+        self._local.buffer = StringIO()
+        return self._local.buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, data):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(data)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+# Held while a module reads its params from the global basic._ANSIBLE_ARGS
+_params_lock = threading.Lock()
+
+
+def run_module(prefix, kind, api_version, params):
+    """
+    Run a generated module in this process with params, as the module's main() does, and return its exit
+    code and output. Modules may run in several threads at once.
+    """
+    from ansible.module_utils import basic
+
+    from .ansible import execute_module
+
+    module_name, module_class_name, exception_class_name = MODULE_CLASSES[prefix]
+    module_utils = __import__(module_name, fromlist=[module_class_name])
+    module_class = getattr(module_utils, module_class_name)
+    exception_class = getattr(module_utils, exception_class_name)
+
+    with _params_lock:
+        if not isinstance(sys.stdout, _ModuleOutput):
+            sys.stdout = _ModuleOutput(sys.stdout)
+    output = sys.stdout
+    buffer = output.capture()
+    rc = 0
+    try:
+        try:
+            with _params_lock:
+                basic._ANSIBLE_ARGS = json.dumps({'ANSIBLE_MODULE_ARGS': params}).encode('utf-8')
+                try:
+                    module = module_class(kind, api_version)
+                finally:
+                    basic._ANSIBLE_ARGS = None
+        except exception_class as exc:
+            # The helper failed to init, so there is no module object
+            raise Exception(str(exc))
+        try:
+            execute_module(module)
+        except exception_class as exc:
+            module.fail_json(msg="Module failed!", error=str(exc))
+    except SystemExit as exc:
+        rc = exc.code or 0
+    except Exception as exc:
+        buffer = output.capture()
+        buffer.write(_failure('MODULE FAILURE: {0}'.format(exc), exception=traceback.format_exc()))
+        rc = 1
+    finally:
+        output.release()
+    return rc, buffer.getvalue()
+
+
+class HelperDaemon(object):
+    """
+    Serve the module requests for one kubeconfig on a Unix socket, each in its own thread, until idle
+    for idle_timeout seconds. runner(prefix, kind, api_version, params) returns the exit code and output
+    of a module, and must be safe to call from several threads at once.
+    """
+
+    def __init__(self, kubeconfig, path=None, idle_timeout=IDLE_TIMEOUT, runner=run_module):
+        self.kubeconfig = kubeconfig
+        self.path = path or socket_path(kubeconfig)
+        self.idle_timeout = idle_timeout
+        self.runner = runner
+        self.listening = threading.Event()
+        self._lock_file = None
+        self._socket = None
+        self._handlers = set()
+        self._handlers_lock = threading.Lock()
+
+    def bind(self):
+        """
+        Listen on the socket. Returns False if another daemon holds it.
+        """
+        _private_directory(os.path.dirname(self.path))
+        self._lock_file = open(self.path + '.lock', 'a')
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError:
+            self._lock_file.close()
+            return False
+        # Left by a daemon that did not exit cleanly
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._socket.listen(16)
+        self._socket.settimeout(self.idle_timeout)
+        self.listening.set()
+        return True
+
+    def serve(self):
+        """ Serve requests until idle for idle_timeout seconds, and wait for the requests in progress """
+        if self._socket is None and not self.bind():
+            logger.debug("A daemon is already serving {0}".format(self.path))
+            return
+        try:
+            while True:
+                try:
+                    conn, _ = self._socket.accept()
+                except socket.timeout:
+                    with self._handlers_lock:
+                        busy = bool(self._handlers)
+                    if busy:
+                        continue
+                    logger.debug("Idle for {0} seconds, exiting".format(self.idle_timeout))
+                    self.decline_pending()
+                    return
+                thread = threading.Thread(target=self._handle_connection, args=(conn,))
+                with self._handlers_lock:
+                    self._handlers.add(thread)
+                thread.start()
+        finally:
+            with self._handlers_lock:
+                handlers = list(self._handlers)
+            for thread in handlers:
+                thread.join()
+            self.close()
+
+    def _handle_connection(self, conn):
+        try:
+            self.handle(conn)
+        except Exception:
+            logger.exception("Failed to handle a request")
+        finally:
+            conn.close()
+            with self._handlers_lock:
+                self._handlers.discard(threading.current_thread())
+
+    def handle(self, conn):
+        conn.settimeout(READ_TIMEOUT)
+        request = json.loads(_read_all(conn).decode('utf-8'))
+        conn.settimeout(None)
+        params = request['params']
+        if kubeconfig_path(params.get('kubeconfig')) != self.kubeconfig:
+            response = {'error': 'This daemon serves {0}'.format(self.kubeconfig)}
+        else:
+            rc, output = self.runner(request['prefix'], request['kind'], request['api_version'], params)
+            response = {'rc': rc, 'stdout': output}
+        conn.sendall(json.dumps(response).encode('utf-8'))
+
+    def decline_pending(self):
+        """ Stop accepting connections, and send the modules already connected back to run in process """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._socket.setblocking(False)
+        while True:
+            try:
+                conn, _ = self._socket.accept()
+            except socket.error:
+                return
+            try:
+                conn.setblocking(True)
+                conn.sendall(json.dumps({'error': 'The daemon is exiting'}).encode('utf-8'))
+            except socket.error:
+                pass
+            finally:
+                conn.close()
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+def package_paths(packages=('openshift', 'kubernetes', 'ansible')):
+    """
+    Return the directories of sys.path the packages are installed in. Zip files and the directory of the
+    running script are left out: a module's AnsiballZ payload is removed when its task ends, while the
+    daemon outlives it.
+    """
+    script_dir = os.path.dirname(os.path.abspath(sys.argv[0])) if sys.argv and sys.argv[0] else None
+    paths = []
+    for entry in sys.path:
+        if not entry or not os.path.isdir(entry):
+            continue
+        entry = os.path.abspath(entry)
+        if entry == script_dir or entry in paths:
+            continue
+        if any(os.path.isdir(os.path.join(entry, package)) for package in packages):
+            paths.append(entry)
+    return paths
+
+
+def start_daemon(kubeconfig, idle_timeout=IDLE_TIMEOUT):
+    """ Start a daemon for kubeconfig in a new session, importing the installed packages """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(package_paths()))
+    env.pop(DAEMON_ENV, None)
+    with open(os.devnull, 'r+') as devnull:
+        subprocess.Popen([sys.executable, '-m', 'openshift.helper.daemon', '--kubeconfig', kubeconfig,
+                          '--idle-timeout', str(idle_timeout)],
+                         stdin=devnull, stdout=devnull, stderr=devnull, env=env, cwd='/', close_fds=True,
+                         preexec_fn=os.setsid)
+
+
+def _connect(path):
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+    except socket.error:
+        conn.close()
+        raise
+    return conn
+
+
+def request(kubeconfig, message, start=False, idle_timeout=IDLE_TIMEOUT):
+    """
+    Send a module request to the daemon for kubeconfig, starting one if there is none and start is set,
+    and return the response. Raises DaemonUnavailable when the request could not be sent.
+    """
+    path = socket_path(kubeconfig)
+    try:
+        conn = _connect(path)
+    except socket.error as exc:
+        if not start:
+            raise DaemonUnavailable(str(exc))
+        try:
+            start_daemon(kubeconfig, idle_timeout)
+        except OSError as exc:
+            raise DaemonUnavailable(str(exc))
+        deadline = time.time() + START_TIMEOUT
+        while True:
+            time.sleep(0.05)
+            try:
+                conn = _connect(path)
+                break
+            except socket.error as exc:
+                if time.time() > deadline:
+                    raise DaemonUnavailable(str(exc))
+    try:
+        try:
+            conn.sendall(json.dumps(message).encode('utf-8'))
+            conn.shutdown(socket.SHUT_WR)
+        except socket.error as exc:
+            raise DaemonUnavailable(str(exc))
+        try:
+            return json.loads(_read_all(conn).decode('utf-8'))
+        except (socket.error, ValueError) as exc:
+            # The module may have run, so it must not run again
+            return {'rc': 1, 'stdout': _failure('Lost the connection to the helper daemon: {0}'.format(exc))}
+    finally:
+        conn.close()
+
+
+def forward_module(prefix, kind, api_version):
+    """
+    Run a generated module in the helper daemon when OPENSHIFT_HELPER_DAEMON is set, write its output and
+    exit. Returns when the daemon is not enabled or cannot be reached, for the module to run in process.
+    """
+    if not os.environ.get(DAEMON_ENV):
+        return
+    try:
+        from ansible.module_utils.basic import _load_params
+    except ImportError:
+        return
+    params = _load_params()
+    kubeconfig = kubeconfig_path(params.get('kubeconfig'))
+    message = {'prefix': prefix, 'kind': kind, 'api_version': api_version, 'params': params}
+    try:
+        response = request(kubeconfig, message, start=True,
+                           idle_timeout=int(os.environ.get(IDLE_TIMEOUT_ENV, IDLE_TIMEOUT)))
+    except DaemonUnavailable as exc:
+        logger.debug("Running in process, the helper daemon is unavailable: {0}".format(exc))
+        return
+    if 'error' in response:
+        logger.debug("Running in process: {0}".format(response['error']))
+        return
+    sys.stdout.write(response['stdout'])
+    sys.stdout.flush()
+    sys.exit(response['rc'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Helper daemon for the generated Ansible modules')
+    parser.add_argument('--kubeconfig', required=True, help='Absolute path of the kubeconfig file served')
+    parser.add_argument('--idle-timeout', type=int, default=IDLE_TIMEOUT,
+                        help='Seconds without requests before exiting')
+    args = parser.parse_args(argv)
+
+    daemon = HelperDaemon(args.kubeconfig, idle_timeout=args.idle_timeout)
+    if not daemon.bind():
+        return
+    # Warm up while the first request waits
+    for module_name, _, _ in MODULE_CLASSES.values():
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+    daemon.serve()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+from six import string_types
+
+from ..client import serializer
+
+ADD = 'add'
+CHANGE = 'change'
+REMOVE = 'remove'
+
+_MAPPING = 1
+_SEQUENCE = 2
+
+_codecs = {}
+
+
+def _codec(cls):
+    """ Return the ModelCodec for a model class, or None for any other type """
+    codec = _codecs.get(cls, False)
+    if codec is False:
+        codec = _codecs[cls] = serializer.get_codec(cls) if serializer._is_model_class(cls) else None
+    return codec
+
+
+def _shape(value):
+    """ Return the container kind of value, and its items for a mapping """
+    if isinstance(value, dict):
+        return _MAPPING, value
+    if isinstance(value, list):
+        return _SEQUENCE, value
+    codec = _codec(type(value))
+    if codec is not None:
+        return _MAPPING, dict(zip(codec.attributes, codec.values(value)))
+    return None, value
+
+
+def equal(a, b):
+    """
+    Return True if a and b hold the same data. Models compare equal to models of the same class with
+    equal attributes, and to dicts of their attribute values, as their to_dict() would. Stops at the
+    first difference, without converting anything to dicts.
+    """
+    if a is b:
+        return True
+    type_a, type_b = type(a), type(b)
+    if type_a is type_b:
+        if type_a is dict or type_a is list:
+            # Compared without calling back into Python. Unequal containers are walked, as they may
+            # hold models and dicts that are equal, and that some models fail to compare.
+            try:
+                if a == b:
+                    return True
+            except AttributeError:
+                pass
+        if type_a is dict:
+            if len(a) != len(b):
+                return False
+            for key, value in a.items():
+                if key not in b or not equal(value, b[key]):
+                    return False
+            return True
+        if type_a is list:
+            if len(a) != len(b):
+                return False
+            for x, y in zip(a, b):
+                if not equal(x, y):
+                    return False
+            return True
+        codec = _codec(type_a)
+        if codec is not None:
+            for x, y in zip(codec.values(a), codec.values(b)):
+                if not equal(x, y):
+                    return False
+            return True
+        return a == b
+    shape_a, items_a = _shape(a)
+    shape_b, items_b = _shape(b)
+    if shape_a is None or shape_b is None or shape_a != shape_b:
+        return shape_a is None and shape_b is None and a == b
+    return equal(dict(items_a) if shape_a == _MAPPING else list(items_a),
+                 dict(items_b) if shape_b == _MAPPING else list(items_b))
+
+
+def diff(a, b, dot_notation=True):
+    """
+    Return the differences between a and b, each a dict, list or model, in the form of
+    dictdiffer.diff(): a list of (action, path, change) tuples, with models compared as their
+    to_dict().
+
+    :param dot_notation: report each path as a dotted string when every part is a string without a
+        dot, as dictdiffer does. When False, paths are tuples of keys and list indexes.
+    """
+    differ = _Differ(dot_notation)
+    if differ.same(a, b):
+        return []
+    differ.diff(a, b, ())
+    return differ.result
+
+
+def plain(value):
+    """ Return a deep copy of value with models converted to dicts, as to_dict() does """
+    if isinstance(value, dict):
+        return dict((k, plain(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [plain(x) for x in value]
+    if _codec(type(value)) is not None:
+        return serializer.to_dict(value)
+    return copy.deepcopy(value)
+
+
+class _Differ(object):
+    """
+    One diff. Plain dicts and lists that are equal are skipped with a single == test, which runs
+    without calling back into Python. Anything else is walked once, and only differing values are
+    converted with plain().
+    """
+
+    def __init__(self, dot_notation):
+        self.dot_notation = dot_notation
+        self.result = []
+
+    def path(self, node):
+        if self.dot_notation and all(isinstance(x, string_types) and '.' not in x for x in node):
+            return '.'.join(node)
+        return node if not self.dot_notation else list(node)
+
+    @staticmethod
+    def same(a, b):
+        if a is b:
+            return True
+        type_a = type(a)
+        return type_a is type(b) and (type_a is dict or type_a is list) and a == b
+
+    def diff(self, a, b, node):
+        shape_a, items_a = _shape(a)
+        shape_b, items_b = _shape(b)
+        if shape_a == _MAPPING and shape_b == _MAPPING:
+            intersection = [k for k in items_a if k in items_b]
+            addition = [k for k in items_b if k not in items_a]
+            deletion = [k for k in items_a if k not in items_b]
+        elif shape_a == _SEQUENCE and shape_b == _SEQUENCE:
+            common = min(len(items_a), len(items_b))
+            intersection = range(common)
+            addition = range(common, len(items_b))
+            deletion = list(reversed(range(common, len(items_a))))
+        else:
+            if not equal(a, b):
+                self.result.append((CHANGE, self.path(node), (plain(a), plain(b))))
+            return
+
+        for key in intersection:
+            value_a, value_b = items_a[key], items_b[key]
+            if not self.same(value_a, value_b):
+                self.diff(value_a, value_b, node + (key,))
+        if addition:
+            self.result.append((ADD, self.path(node), [(k, plain(items_b[k])) for k in addition]))
+        if deletion:
+            self.result.append((REMOVE, self.path(node), [(k, plain(items_a[k])) for k in deletion]))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+
+from collections import namedtuple
+
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:
+    # python < 3
+    from inspect import getargspec
+
+ApiMethod = namedtuple('ApiMethod', ['method', 'args'])
+
+# Attribute of an ApiClient holding the API objects and methods resolved for it
+CACHE_ATTRIBUTE = '_api_method_cache'
+
+
+class MethodIndex(object):
+    """
+    Dispatch index for the generated API methods available to a helper class.
+
+    The index maps each method name to the first API class, in available_apis() order, that defines it.
+    Bound methods are resolved once per ApiClient and memoized by (kind, operation, namespaced), along
+    with the method's argument names, so repeated lookups cost a couple of dictionary reads. The memo is
+    kept on the ApiClient itself, so the bound methods it holds do not keep the client alive.
+    """
+
+    def __init__(self, api_names, api_class_from_name):
+        """
+        :param api_names: list of API class names, in lookup order
+        :param api_class_from_name: function that returns the API class for a name
+        """
+        self._api_classes = {}
+        for api_name in api_names:
+            api_class = api_class_from_name(api_name)
+            for attr in dir(api_class):
+                if attr.startswith('_') or attr in self._api_classes:
+                    continue
+                self._api_classes[attr] = api_class
+        self._signatures = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, method_name):
+        return method_name in self._api_classes
+
+    def signature(self, method_name):
+        """ Return the argument names, minus self, of a generated API method. """
+        args = self._signatures.get(method_name)
+        if args is None:
+            func = getattr(self._api_classes[method_name], method_name)
+            args = tuple(getargspec(func).args[1:])
+            self._signatures[method_name] = args
+        return args
+
+    def resolve(self, api_client, kind, operation, namespaced, method_name):
+        """
+        Return an ApiMethod bound to api_client, or None if no API defines method_name.
+
+        :param api_client: ApiClient instance the API object should use
+        :param kind: snake case kind the method operates on
+        :param operation: one of create, delete, list, patch, read, replace
+        :param namespaced: bool, True if the namespaced variant was requested
+        :param method_name: name of the generated API method
+        """
+        key = (self, kind, operation, namespaced, method_name)
+        cache = getattr(api_client, CACHE_ATTRIBUTE, None)
+        if cache is None:
+            with self._lock:
+                cache = api_client.__dict__.setdefault(CACHE_ATTRIBUTE, {'apis': {}, 'methods': {}})
+        api_method = cache['methods'].get(key)
+        if api_method is not None:
+            return api_method
+
+        api_class = self._api_classes.get(method_name)
+        if api_class is None:
+            return None
+        with self._lock:
+            api = cache['apis'].get(api_class)
+            if api is None:
+                api = cache['apis'][api_class] = api_class(api_client)
+        api_method = ApiMethod(getattr(api, method_name), self.signature(method_name))
+        cache['methods'][key] = api_method
+        return api_method
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import re
+
+CAMEL_RX = re.compile(r'_([a-z])')
+
+_api_keys = {}
+
+
+def api_key(name):
+    """ Convert a model attribute name to the key used for it in API data """
+    key = _api_keys.get(name)
+    if key is None:
+        key = _api_keys[name] = CAMEL_RX.sub(lambda m: m.group(1).upper(), name)
+    return key
+
+
+def has_field(obj, name):
+    """ hasattr() for model objects, and the equivalent key test for API dicts """
+    if isinstance(obj, dict):
+        return api_key(name) in obj
+    return hasattr(obj, name)
+
+
+def get_field(obj, *path):
+    """
+    Return the value found by following path, a list of model attribute names, through a model
+    object or the equivalent API dict. Returns None if any step is missing.
+    """
+    for name in path:
+        if obj is None:
+            return None
+        if isinstance(obj, dict):
+            obj = obj.get(api_key(name))
+        else:
+            obj = getattr(obj, name, None)
+    return obj
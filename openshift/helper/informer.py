@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import logging
+import threading
+
+from .fields import get_field
+from .stream import ResilientWatch
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE_INDEX = 'namespace'
+LABEL_INDEX = 'label'
+OWNER_INDEX = 'owner'
+
+_informers = {}
+_informers_lock = threading.Lock()
+
+
+def object_key(obj):
+    """ Return the (namespace, name) store key for a model object or API dict """
+    metadata = get_field(obj, 'metadata')
+    return get_field(metadata, 'namespace'), get_field(metadata, 'name')
+
+
+def namespace_index(obj):
+    """ Index function returning the object's namespace """
+    namespace = get_field(obj, 'metadata', 'namespace')
+    return (namespace,) if namespace else ()
+
+
+def label_index(obj):
+    """ Index function returning 'key=value' for each of the object's labels """
+    labels = get_field(obj, 'metadata', 'labels')
+    return ['{}={}'.format(k, v) for k, v in labels.items()] if labels else ()
+
+
+def owner_index(obj):
+    """ Index function returning the uid of each of the object's owners """
+    owners = get_field(obj, 'metadata', 'owner_references')
+    return [get_field(x, 'uid') for x in owners] if owners else ()
+
+
+class Store(object):
+    """
+    Thread-safe local cache of API objects keyed by (namespace, name), with secondary indexes.
+
+    An index function takes an object and returns the keys it should be found under. Each index
+    is an inverted map from key to the set of store keys, updated incrementally as objects are
+    added, modified and deleted, so by_index() costs a dictionary lookup plus the size of the
+    result. Namespace, label and owner indexes are registered by default.
+
+    Objects are stored as received, either models or API dicts, and are shared with every reader.
+    Callers must copy an object before modifying it.
+    """
+
+    def __init__(self, indexers=None):
+        """
+        :param indexers: dict of index name to index function, replacing the default indexes
+        """
+        self._lock = threading.RLock()
+        self._objects = {}
+        self._indexers = {}
+        self._indices = {}
+        self._indexed = {}
+        if indexers is None:
+            indexers = {NAMESPACE_INDEX: namespace_index, LABEL_INDEX: label_index, OWNER_INDEX: owner_index}
+        for name, func in indexers.items():
+            self.add_index(name, func)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, name, namespace=None):
+        return self._objects.get((namespace, name))
+
+    def list(self, namespace=None):
+        """ Return all objects, or only those in namespace """
+        with self._lock:
+            if namespace is None:
+                return list(self._objects.values())
+            if NAMESPACE_INDEX in self._indexers:
+                return self.by_index(NAMESPACE_INDEX, namespace)
+            return [obj for key, obj in self._objects.items() if key[0] == namespace]
+
+    def keys(self):
+        with self._lock:
+            return list(self._objects)
+
+    def add_index(self, name, func):
+        """ Register index function func as name, and index the objects already stored """
+        with self._lock:
+            self._indexers[name] = func
+            self._indices[name] = {}
+            self._indexed[name] = {}
+            for key, obj in self._objects.items():
+                self._index(name, key, obj)
+
+    def index_keys(self, name):
+        """ Return the keys present in index name """
+        with self._lock:
+            return list(self._indices[name])
+
+    def by_index(self, name, value):
+        """ Return the objects found under value in index name """
+        with self._lock:
+            keys = self._indices[name].get(value)
+            if not keys:
+                return []
+            return [self._objects[key] for key in keys]
+
+    def update(self, obj):
+        """ Add or replace obj, returning the object it replaced, if any """
+        key = object_key(obj)
+        with self._lock:
+            old = self._objects.get(key)
+            self._objects[key] = obj
+            for name in self._indexers:
+                self._unindex(name, key)
+                self._index(name, key, obj)
+        return old
+
+    def delete(self, obj):
+        """ Remove obj, returning the stored object, if any """
+        key = object_key(obj)
+        with self._lock:
+            for name in self._indexers:
+                self._unindex(name, key)
+            return self._objects.pop(key, None)
+
+    def replace(self, objects):
+        """
+        Replace the contents of the store with objects, e.g. after a list.
+
+        :return: list of (event type, object) tuples describing the change, as a watch would have
+            reported it
+        """
+        changes = []
+        with self._lock:
+            new_objects = dict((object_key(obj), obj) for obj in objects)
+            for key, obj in self._objects.items():
+                if key not in new_objects:
+                    changes.append(('DELETED', obj))
+            for key, obj in new_objects.items():
+                changes.append(('MODIFIED' if key in self._objects else 'ADDED', obj))
+            self._objects = new_objects
+            for name in self._indexers:
+                self._indices[name] = {}
+                self._indexed[name] = {}
+                for key, obj in new_objects.items():
+                    self._index(name, key, obj)
+        return changes
+
+    def _index(self, name, key, obj):
+        values = tuple(self._indexers[name](obj))
+        if not values:
+            return
+        self._indexed[name][key] = values
+        index = self._indices[name]
+        for value in values:
+            keys = index.get(value)
+            if keys is None:
+                keys = index[value] = set()
+            keys.add(key)
+
+    def _unindex(self, name, key):
+        values = self._indexed[name].pop(key, None)
+        if not values:
+            return
+        index = self._indices[name]
+        for value in values:
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+
+class Informer(object):
+    """
+    Keeps a Store of one kind current by listing once, then following a watch resumed from the
+    last resourceVersion seen. The list is repeated only when the server reports that the
+    resourceVersion is too old (410 Gone).
+
+    The informer runs in a daemon thread once started. Listeners registered with add_listener()
+    are called from that thread with (event type, object) for each change. The watch, a
+    ResilientWatch, is available as the watch attribute along with its counters.
+    """
+
+    min_backoff = 0.5
+    max_backoff = 30
+
+    def __init__(self, helper, namespace=None, watch_timeout=300):
+        """
+        :param helper: object helper with the api_version and kind to cache
+        :param namespace: limit the cache to one namespace. The default caches all namespaces.
+        :param watch_timeout: seconds after which the server closes each watch, before it is resumed
+        """
+        self.api_client = helper.api_client
+        self.kind = helper.kind
+        self.namespace = namespace
+        self.raw = helper.raw
+        self.store = Store()
+
+        if namespace:
+            self._list_method = helper.lookup_method('list', namespace)
+            self._list_args = (namespace,)
+        else:
+            try:
+                self._list_method = helper.lookup_method(method_name='list_{}_for_all_namespaces'.format(self.kind))
+            except helper.get_exception_class():
+                self._list_method = helper.lookup_method('list')
+            self._list_args = ()
+        self._call_method = helper.call_method
+        self.watch = ResilientWatch(self.api_client, self._list_method, self._list_args, raw=self.raw,
+                                    relist=self._list, watch_timeout=watch_timeout,
+                                    min_backoff=self.min_backoff, max_backoff=self.max_backoff)
+
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._thread = None
+
+    @property
+    def resource_version(self):
+        """ The last resourceVersion seen """
+        return self.watch.resource_version
+
+    def covers(self, namespace):
+        """ True if objects in namespace are cached by this informer """
+        return self.namespace is None or self.namespace == namespace
+
+    def has_synced(self):
+        """ True once the initial list has been loaded into the store """
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        """ Block until the initial list has been loaded. Returns has_synced(). """
+        return self._synced.wait(timeout)
+
+    def get(self, name, namespace=None):
+        """ Return the cached object, or None. The object is shared and must not be modified. """
+        return self.store.get(name, namespace)
+
+    def list(self, namespace=None):
+        """ Return the cached objects, optionally limited to one namespace """
+        return self.store.list(namespace)
+
+    def add_index(self, name, func):
+        """ Register a custom index on the store. See Store.add_index(). """
+        self.store.add_index(name, func)
+
+    def by_index(self, name, value):
+        """ Return the cached objects found under value in index name """
+        return self.store.by_index(name, value)
+
+    def by_label(self, key, value):
+        """ Return the cached objects labelled key=value """
+        return self.store.by_index(LABEL_INDEX, '{}={}'.format(key, value))
+
+    def by_owner(self, uid):
+        """ Return the cached objects with an owner reference to uid """
+        return self.store.by_index(OWNER_INDEX, uid)
+
+    def add_listener(self, listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='informer-{}'.format(self.kind))
+                self._thread.daemon = True
+                self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """
+        Stop following the watch. The store keeps its last contents.
+
+        :param timeout: seconds to wait for the informer thread to exit. The thread exits once its
+            current watch read returns, so by default stop() does not wait.
+        """
+        self.watch.stop()
+        if timeout and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _notify(self, event_type, obj):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event_type, obj)
+            except Exception:
+                logger.exception('Informer listener failed')
+
+    def _run(self):
+        for event in self.watch:
+            self._apply_event(event)
+
+    def _apply_event(self, event):
+        obj = event['object']
+        if event['type'] == 'DELETED':
+            self.store.delete(obj)
+        else:
+            self.store.update(obj)
+        self._notify(event['type'], obj)
+
+    def _list(self):
+        """ Load the full list into the store, returning its resourceVersion """
+        return self._apply_list(self._call_method(self._list_method, *self._list_args))
+
+    def _apply_list(self, result):
+        changes = self.store.replace(get_field(result, 'items') or [])
+        for event_type, obj in changes:
+            self._notify(event_type, obj)
+        self._synced.set()
+        return get_field(result, 'metadata', 'resource_version')
+
+
+def shared_informer(helper, namespace=None, informer_class=Informer):
+    """
+    Return the started informer for the helper's kind and namespace, creating it on first use.
+    Informers are shared by every helper using the same ApiClient, and run until stopped.
+    """
+    key = (informer_class, helper.api_client, helper.api_version, helper.kind, namespace, helper.raw)
+    with _informers_lock:
+        informer = _informers.get(key)
+        if informer is None:
+            informer = _informers[key] = informer_class(helper, namespace)
+    return informer.start()
+
+
+def stop_shared_informers():
+    """ Stop and forget all shared informers """
+    with _informers_lock:
+        informers = list(_informers.values())
+        _informers.clear()
+    for informer in informers:
+        informer.stop()
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Kubeconfig file locations. Imports nothing from kubernetes, so that the generated modules can find
+their helper daemon without loading the client.
+"""
+from __future__ import absolute_import
+
+import os
+
+# kubernetes.config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION
+KUBE_CONFIG_DEFAULT_LOCATION = '~/.kube/config'
+
+
+def kubeconfig_path(config_file=None):
+    """ Return the path of the kubeconfig file load_kube_config reads """
+    return os.path.abspath(os.path.expanduser(config_file or KUBE_CONFIG_DEFAULT_LOCATION))
@@ -2,10 +2,10 @@
 from __future__ import absolute_import
 
 from kubernetes import config
-from kubernetes.client import models as k8s_models
 from kubernetes.client import apis as k8s_apis
 
 from . import VERSION_RX
+from ..client.registry import type_registry
 from .base import BaseObjectHelper
 from .exceptions import KubernetesException
 
@@ -25,8 +25,14 @@ class KubernetesObjectHelper(BaseObjectHelper):
 
     @staticmethod
     def model_class_from_name(model_name):
-        return getattr(k8s_models, model_name)
+        model_class = type_registry.kubernetes_model(model_name)
+        if model_class is None:
+            raise AttributeError("Unable to find model {}".format(model_name))
+        return model_class
 
     @staticmethod
     def api_class_from_name(api_name):
-        return getattr(k8s_apis, api_name)
+        api_class = type_registry.kubernetes_api(api_name)
+        if api_class is None:
+            raise AttributeError("Unable to find API {}".format(api_name))
+        return api_class
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Merge rules shared by the Ansible param handling, which merges params into model objects, and by
+patch.merge_object(), which merges API dicts. Nothing is ever removed:
+
+- dict values are merged key by key; None is skipped, other values replace the current ones
+- lists of objects are matched on the first of LIST_KEYS every requested item sets, and matched
+  items are updated; without such a key an item matches when it has all of the requested values.
+  Unmatched items are appended.
+- other lists gain the values they are missing, once each
+
+Functions change their target in place.
+"""
+from __future__ import absolute_import
+
+import copy
+
+# Keys identifying the items of a list of objects, in order of preference
+LIST_KEYS = ('name', 'type')
+
+
+def canonical(value):
+    """
+    Return a hashable form of value, equal for values that compare equal. Raises TypeError for
+    values without one, such as model objects.
+    """
+    if isinstance(value, dict):
+        return 'dict', frozenset((k, canonical(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return 'list', tuple(canonical(x) for x in value)
+    if isinstance(value, tuple):
+        return 'tuple', tuple(canonical(x) for x in value)
+    if hasattr(value, 'swagger_types'):
+        raise TypeError('unhashable model {0}'.format(type(value).__name__))
+    hash(value)
+    return value
+
+
+class ValueIndex(object):
+    """ A collection of values, searched by the hash of their canonical form rather than one by one """
+
+    def __init__(self, values=()):
+        self._keys = set()
+        self._values = []
+        self._unhashable = []
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        self._values.append(value)
+        try:
+            self._keys.add(canonical(value))
+        except TypeError:
+            self._unhashable.append(value)
+
+    def __contains__(self, value):
+        try:
+            key = canonical(value)
+        except TypeError:
+            return any(value == x for x in self._values)
+        return key in self._keys or any(value == x for x in self._unhashable)
+
+
+def list_key(requested, keys=LIST_KEYS):
+    """ Return the first of keys set in every requested item, or None """
+    for key in keys:
+        if all(item.get(key) for item in requested):
+            return key
+    return None
+
+
+def merge_dict(target, requested):
+    """ Merge the dict requested into the dict target """
+    for key, value in requested.items():
+        if value is None:
+            continue
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge_dict(current, value)
+        elif isinstance(value, list) and isinstance(current, list):
+            merge_list(current, value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def merge_list(items, requested):
+    """ Merge the list requested into the list items, both plain data such as API dicts """
+    if all(isinstance(x, dict) for x in requested) and all(isinstance(x, dict) for x in items):
+        merge_object_list(items, requested, list_key(requested), _get_item, copy.deepcopy, merge_dict)
+    else:
+        merge_values(items, requested)
+
+
+def merge_values(items, requested):
+    """
+    Append the requested values missing from items, once each. Values are found through an index of
+    items, rather than by comparing every pair. A list of lists gains the requested lists that do not
+    hold all the values of one of its lists.
+    """
+    if not requested:
+        return
+    if not items:
+        items.extend(copy.deepcopy(requested))
+        return
+    if isinstance(items[0], list):
+        try:
+            item_sets = [set(x) for x in items]
+            requested_sets = [set(x) for x in requested]
+        except TypeError:
+            pass
+        else:
+            items.extend(copy.deepcopy(x) for x, x_set in zip(requested, requested_sets)
+                         if not any(x_set >= item_set for item_set in item_sets))
+            return
+    present = ValueIndex(items)
+    for value in requested:
+        if value not in present:
+            present.add(value)
+            items.append(copy.deepcopy(value))
+
+
+def merge_object_list(items, requested, key, get, new_item, update_item):
+    """
+    Merge requested, a list of dicts, into items, a list of objects.
+
+    :param key: key matching items to requested items, or None to match on all requested values
+    :param get: function returning the value of an item for a requested key
+    :param new_item: function returning the item to append for a requested dict
+    :param update_item: function updating a matched item from a requested dict
+    """
+    if not requested:
+        return
+    if key:
+        index = {}
+        for item in items:
+            if item:
+                index.setdefault(get(item, key), []).append(item)
+        for request in requested:
+            try:
+                matches = index.get(request[key])
+            except TypeError:
+                matches = None
+            if matches:
+                for item in matches:
+                    update_item(item, request)
+            else:
+                item = new_item(request)
+                items.append(item)
+                index.setdefault(get(item, key), []).append(item)
+        return
+
+    # Items are indexed by their values for each set of keys the requested items set
+    indexes = {}
+    for request in requested:
+        keys = tuple(request)
+        present = indexes.get(keys)
+        if present is None:
+            present = indexes[keys] = ValueIndex(tuple(get(item, x) for x in keys) for item in items)
+        if tuple(request[x] for x in keys) not in present:
+            item = new_item(request)
+            items.append(item)
+            for other_keys, other in indexes.items():
+                other.add(tuple(get(item, x) for x in other_keys))
+
+
+def _get_item(item, key):
+    return item.get(key)
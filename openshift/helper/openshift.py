@@ -1,9 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
-import json
-
-from kubernetes.client import models as k8s_models
 from kubernetes.client import apis as k8s_apis
 from kubernetes.client.rest import ApiException
 from urllib3.exceptions import MaxRetryError
@@ -12,6 +9,7 @@ from . import VERSION_RX
 from .. import config
 from ..client import models as openshift_models
 from ..client import apis as openshift_apis
+from ..client.registry import type_registry
 from .base import BaseObjectHelper
 from .exceptions import OpenShiftException
 
@@ -34,33 +32,30 @@ class OpenShiftObjectHelper(BaseObjectHelper):
 
     @staticmethod
     def model_class_from_name(model_name):
-        try:
-            return getattr(openshift_models, model_name)
-        except AttributeError:
-            return getattr(k8s_models, model_name)
+        model_class = type_registry.model(model_name)
+        if model_class is None:
+            raise AttributeError("Unable to find model {}".format(model_name))
+        return model_class
 
     @staticmethod
     def api_class_from_name(api_name):
-        try:
-            return getattr(openshift_apis, api_name)
-        except AttributeError:
-            return getattr(k8s_apis, api_name)
+        api_class = type_registry.api(api_name)
+        if api_class is None:
+            raise AttributeError("Unable to find API {}".format(api_name))
+        return api_class
 
     def create_project(self, metadata, display_name=None, description=None):
         """ Creating a project requires using the project_request endpoint. """
 
         # TODO: handle admin-level project creation
 
-        w, stream = self._create_stream(None)
         try:
             proj_req = openshift_models.V1ProjectRequest(metadata=metadata, display_name=display_name, description=description)
-            openshift_apis.OapiApi(self.api_client).create_project_request(proj_req)
+            created = openshift_apis.OapiApi(self.api_client).create_project_request(proj_req)
         except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise OpenShiftException(msg, status=exc.status)
+            raise self.exception_from_api_exception(exc)
         except MaxRetryError as ex:
             raise OpenShiftException(str(ex.reason))
 
-        self._read_stream(w, stream, metadata.name)
-
-        return self._wait_for_response(metadata.name, None, 'create')
+        # The server responds with the new Project, whose resourceVersion is where waiting starts
+        return self._wait_for_response(metadata.name, None, 'create', created)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+from .merge import merge_dict
+from .sanitize import sanitize
+
+
+def merge_object(live, desired):
+    """
+    Return a copy of the API dict live with desired applied, following the merge rules of the Ansible
+    modules. See merge.
+    """
+    result = copy.deepcopy(live)
+    merge_dict(result, desired)
+    return result
+
+
+def changes(live, desired):
+    """
+    Return a dict holding only the values of desired that differ from live, recursing into dicts.
+    A list that differs is included whole.
+    """
+    result = {}
+    for key, value in desired.items():
+        current = live.get(key)
+        if value == current:
+            continue
+        if isinstance(value, dict) and isinstance(current, dict):
+            nested = changes(current, value)
+            if nested:
+                result[key] = nested
+        else:
+            result[key] = value
+    return result
+
+
+def without_server_fields(obj, model_class=None):
+    """ Return a copy of an API dict without the fields maintained by the server. See sanitize. """
+    return sanitize(obj, model_class)
+
+
+def minimal_patch(live, desired, model_class=None):
+    """
+    Return the smallest patch that brings the API dict live to desired, as applied by merge_object().
+    Server maintained fields are left out. An empty dict means there is nothing to change.
+
+    Lists that change are sent whole, so the patch has the same effect as a JSON merge patch and as a
+    strategic merge patch, whatever the merge strategy of each list.
+    """
+    live = without_server_fields(live, model_class)
+    return changes(live, merge_object(live, without_server_fields(desired, model_class)))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Process wide pool of ApiClients, shared by the helpers with the same configuration.
+
+Loading a kubeconfig parses YAML, writes certificate files, and builds a connection pool. Helpers
+create their client on first use through a ClientPool, which returns the client already built for
+the same client factory, kubeconfig file and modification time, context, host and credentials. The
+least recently used clients are dropped beyond maxsize; helpers holding them keep using them.
+"""
+from __future__ import absolute_import
+
+import os
+import threading
+
+from collections import OrderedDict
+
+from .kubeconfig import kubeconfig_path
+
+# Keyword arguments of a helper, applied to the client's configuration
+CREDENTIAL_KEYS = ('api_key', 'ssl_ca_cert', 'cert_file', 'key_file', 'verify_ssl')
+
+
+def client_key(factory, auth):
+    """
+    Return the pool key of a client built by factory, a helper's client_from_config, and configured
+    with auth, the keyword arguments of the helper. A changed kubeconfig file gives a new key.
+    """
+    path = kubeconfig_path(auth.get('kubeconfig'))
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    return (factory, path, mtime, auth.get('context'), auth.get('host'),
+            tuple(auth.get(key) for key in CREDENTIAL_KEYS))
+
+
+class ClientPool(object):
+    """ LRU cache of ApiClients by client_key() """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        """ Return the client for key, calling create() to build it when there is none """
+        with self._lock:
+            client = self._clients.pop(key, None)
+            if client is None:
+                self.misses += 1
+                client = create()
+            else:
+                self.hits += 1
+            self._clients[key] = client
+            while len(self._clients) > self.maxsize:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self):
+        """ Drop every client, and reset the hit and miss counts """
+        with self._lock:
+            self._clients.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._clients)
+
+
+client_pool = ClientPool()
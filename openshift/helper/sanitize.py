@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Removal of server maintained fields from objects before they are written.
+
+A Sanitizer strips the top level fields in `fields` from an object, and the fields in
+`metadata_fields` from every metadata attribute found in it, including the metadata of nested
+templates. For each model class it compiles, once, the attributes that can lead to such a field,
+so a single pass visits only those subtrees. It handles model objects, and API dicts when their
+model class is known. Other API dicts are walked whole.
+"""
+from __future__ import absolute_import
+
+import re
+import threading
+
+from openshift.client import serializer
+from openshift.client.registry import type_registry
+
+# Fields maintained by the server, never written
+SERVER_FIELDS = frozenset(['status'])
+SERVER_METADATA_FIELDS = frozenset(['creationTimestamp', 'resourceVersion', 'uid', 'selfLink', 'generation'])
+
+LIST_TYPE_RX = re.compile(r'list\[(.*)\]')
+
+
+class _Plan(object):
+    """ The attributes of one model class to strip and to descend into """
+
+    __slots__ = ('strip', 'keys', 'children')
+
+    def __init__(self, strip=()):
+        # (storage, json_key) of the fields to remove
+        self.strip = strip
+        self.keys = frozenset(key for _, key in strip)
+        # (storage, json_key, container, node) of the attributes leading to fields to remove
+        self.children = ()
+
+
+def _item_type(type_name):
+    """ Return the container ('list', 'dict' or None) and the item type of a swagger type """
+    match = LIST_TYPE_RX.match(type_name)
+    if match:
+        return 'list', match.group(1)
+    match = serializer.DICT_TYPE_RX.match(type_name)
+    if match:
+        return 'dict', match.group(2)
+    return None, type_name
+
+
+def _model_class(type_name):
+    if type_name in serializer.PRIMITIVE_TYPES or type_name in ('object', 'date', 'datetime'):
+        return None
+    return type_registry.kubernetes_model(type_name) or type_registry.model(type_name)
+
+
+class Sanitizer(object):
+    """
+    Strip server maintained fields from model objects and API dicts. Fields are given by their
+    API (camel case) names.
+    """
+
+    def __init__(self, fields=SERVER_FIELDS, metadata_fields=SERVER_METADATA_FIELDS):
+        self.fields = frozenset(fields)
+        self.metadata_fields = frozenset(metadata_fields)
+        # (model class, is metadata) -> _Plan, or None when nothing below needs stripping
+        self._plans = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, value, model_class=None):
+        """
+        Strip server maintained fields from value. Model objects are changed in place and returned.
+        For an API dict a copy is returned, that shares the subtrees it leaves unchanged. model_class
+        is the model of an API dict, if known.
+        """
+        if isinstance(value, dict):
+            return self.sanitize_dict(value, model_class)
+        return self.sanitize_model(value)
+
+    def sanitize_model(self, obj):
+        """ Strip server maintained fields from a model object, in place, and return it """
+        root = self._root(type(obj))
+        for storage, _ in root.strip:
+            setattr(obj, storage, None)
+        self._strip_model(obj, root)
+        return obj
+
+    def sanitize_dict(self, data, model_class=None):
+        """ Return a copy of an API dict without server maintained fields """
+        result = dict((k, v) for k, v in data.items() if k not in self.fields)
+        if model_class is None:
+            return self._strip_any(result)
+        plan = self._root(model_class)
+        for key in plan.keys:
+            result.pop(key, None)
+        return self._strip_dict(result, plan)
+
+    def _root(self, model_class):
+        """ Return the plan of a top level object: its own fields, then what its attributes lead to """
+        key = (model_class, 'root')
+        root = self._plans.get(key)
+        if root is None:
+            codec = serializer.get_codec(model_class)
+            root = _Plan(tuple((s, k) for s, k in zip(codec.storage, codec.json_keys) if k in self.fields))
+            node = self._plan(model_class, False)
+            root.children = node.children if node else ()
+            self._plans[key] = root
+        return root
+
+    def _plan(self, model_class, is_metadata):
+        node = (model_class, is_metadata)
+        if node not in self._plans:
+            with self._lock:
+                if node not in self._plans:
+                    self._compile(node)
+        return self._plans[node]
+
+    def _compile(self, start):
+        """
+        Compile the plans of every model reachable from start. A node needs a plan when it has fields
+        to strip, or an attribute leading to a node that does. Model graphs may have cycles, so this
+        is settled by propagating back from the nodes with fields to strip.
+        """
+        edges = {}
+        strip = {}
+        pending = [start]
+        while pending:
+            node = pending.pop()
+            if node in edges or node in self._plans:
+                continue
+            model_class, is_metadata = node
+            codec = serializer.get_codec(model_class)
+            strip[node] = tuple((s, k) for s, k in zip(codec.storage, codec.json_keys)
+                                if is_metadata and k in self.metadata_fields)
+            edges[node] = []
+            for attribute, storage, key, type_name in zip(codec.attributes, codec.storage, codec.json_keys,
+                                                          codec.types):
+                container, item_type = _item_type(type_name)
+                item_class = _model_class(item_type)
+                if item_class is None:
+                    continue
+                child = (item_class, attribute == 'metadata')
+                edges[node].append((storage, key, container, child))
+                pending.append(child)
+
+        needed = set(node for node in edges if strip[node])
+        needed.update(node for node in self._plans if node[1] != 'root' and self._plans[node] is not None)
+        changed = True
+        while changed:
+            changed = False
+            for node, children in edges.items():
+                if node not in needed and any(child in needed for _, _, _, child in children):
+                    needed.add(node)
+                    changed = True
+
+        plans = dict((node, _Plan(strip[node])) for node in edges if node in needed)
+        for node, plan in plans.items():
+            plan.children = tuple((storage, key, container, plans.get(child) or self._plans[child])
+                                  for storage, key, container, child in edges[node] if child in needed)
+        for node in edges:
+            self._plans[node] = plans.get(node)
+
+    def _strip_model(self, obj, plan):
+        for storage, key, container, child in plan.children:
+            value = getattr(obj, storage)
+            if value is None:
+                continue
+            if container is None:
+                items = (value,)
+            elif container == 'list':
+                items = value
+            else:
+                items = value.values()
+            for item in items:
+                if item is None:
+                    continue
+                for field, _ in child.strip:
+                    setattr(item, field, None)
+                if child.children:
+                    self._strip_model(item, child)
+
+    def _strip_dict(self, data, plan):
+        """ Strip a copy of data, already copied at the top, following plan """
+        for _, key, container, child in plan.children:
+            value = data.get(key)
+            if value is None:
+                continue
+            if container is None:
+                data[key] = self._strip_child(value, child)
+            elif container == 'list':
+                data[key] = [self._strip_child(x, child) for x in value]
+            else:
+                data[key] = dict((k, self._strip_child(v, child)) for k, v in value.items())
+        return data
+
+    def _strip_child(self, value, plan):
+        if not isinstance(value, dict):
+            return value
+        if plan.keys:
+            value = dict((k, v) for k, v in value.items() if k not in plan.keys)
+        else:
+            value = dict(value)
+        return self._strip_dict(value, plan)
+
+    def _strip_any(self, value):
+        """ Strip a copy of data, already copied at the top, without type information """
+        for key, item in value.items():
+            if key == 'metadata' and isinstance(item, dict):
+                item = dict((k, v) for k, v in item.items() if k not in self.metadata_fields)
+                value[key] = self._strip_any(item)
+            elif isinstance(item, dict):
+                value[key] = self._strip_any(dict(item))
+            elif isinstance(item, list):
+                value[key] = [self._strip_any(dict(x)) if isinstance(x, dict) else x for x in item]
+        return value
+
+
+_default = Sanitizer()
+
+
+def sanitize(value, model_class=None):
+    """ Strip the default server maintained fields from a model object in place, or from a copy of an API dict """
+    return _default(value, model_class)
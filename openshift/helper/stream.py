@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+import logging
+import random
+import threading
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from kubernetes.watch.watch import iter_resp_lines
+
+from ..client import serializer
+from .fields import get_field
+
+logger = logging.getLogger(__name__)
+
+
+class RawWatch(watch.Watch):
+    """ A Watch that leaves each event's object as the dict parsed from the API response """
+
+    def get_return_type(self, func):
+        return None
+
+
+def new_watch(api_client, raw=False):
+    """ Return a Watch that deserializes with api_client, or a RawWatch """
+    watcher = RawWatch() if raw else watch.Watch()
+    watcher._api_client = api_client  # monkey patch for access to OpenShift models
+    return watcher
+
+
+class ResilientWatch(object):
+    """
+    An endless stream of watch events for one list method, built on kubernetes.watch.Watch.
+
+    The resourceVersion of each event is tracked, and when the server closes the watch it is
+    resumed from there. Failed connections are retried after an exponential backoff with jitter.
+    Only an expired resourceVersion (410 Gone) causes a relist: the relist function is called and
+    returns the resourceVersion to resume from. Without a relist function the watch restarts
+    from the current state, which the server reports as ADDED events.
+
+    ERROR events are handled here and never yielded. BOOKMARK events, from servers that send
+    them, only advance the resourceVersion.
+
+    The counters attributes record reconnects, relists, failures, bookmarks and events.
+    """
+
+    def __init__(self, api_client, list_method, args=(), raw=False, resource_version=None, relist=None,
+                 watch_timeout=300, min_backoff=0.1, max_backoff=30):
+        """
+        :param api_client: ApiClient used to deserialize events
+        :param list_method: generated list method to watch
+        :param args: positional arguments for list_method, e.g. the namespace
+        :param raw: yield API dicts rather than models
+        :param resource_version: where to start. If None and relist is given, relist first.
+        :param relist: function that reloads the full state and returns its resourceVersion
+        :param watch_timeout: seconds the server keeps each watch open
+        :param min_backoff: seconds to wait after the first failure
+        :param max_backoff: most seconds to wait between attempts
+        """
+        self.api_client = api_client
+        self.list_method = list_method
+        self.args = tuple(args)
+        self.raw = raw
+        self.resource_version = resource_version
+        self.relist = relist
+        self.watch_timeout = watch_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.counters = {'reconnects': 0, 'relists': 0, 'failures': 0, 'bookmarks': 0, 'events': 0}
+        self._expired = resource_version is None and relist is not None
+        self._connections = 0
+        self._response = None
+        self._stopping = threading.Event()
+
+    def __iter__(self):
+        return self.stream()
+
+    def stop(self):
+        """ End the stream, closing the current connection """
+        self._stopping.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+
+    @property
+    def stopped(self):
+        return self._stopping.is_set()
+
+    def backoff(self, attempt):
+        """ Return the seconds to wait before retry number attempt, counting from 1 """
+        delay = min(self.min_backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(delay / 2, delay)
+
+    def stream(self):
+        """ Yield watch events until stop() is called """
+        attempt = 0
+        while not self._stopping.is_set():
+            events = 0
+            try:
+                if self._expired:
+                    resource_version = self.relist() if self.relist is not None else None
+                    self.counters['relists'] += 1
+                    self.resource_version = resource_version
+                    self._expired = False
+                for event in self._connect():
+                    events += 1
+                    yield event
+                    if self._stopping.is_set():
+                        return
+            except ApiException as exc:
+                if exc.status == 410:
+                    logger.debug('Resource version {} too old'.format(self.resource_version))
+                    self._expired = True
+                    continue
+                self._failed(exc)
+                events = 0
+            except Exception as exc:
+                if self._stopping.is_set():
+                    return
+                self._failed(exc)
+                events = 0
+
+            if events:
+                # The server closed a healthy watch; resume straight away
+                attempt = 0
+            else:
+                attempt += 1
+                self._stopping.wait(self.backoff(attempt))
+
+    def _failed(self, exc):
+        self.counters['failures'] += 1
+        logger.debug('Watch failed: {}'.format(exc))
+
+    def _connect(self):
+        """ Open one watch connection and yield its events """
+        watcher = new_watch(self.api_client, self.raw)
+        return_type = watcher.get_return_type(self.list_method)
+        response = self._response = self.list_method(*self.args, **self._watch_kwargs())
+        try:
+            for line in iter_resp_lines(response):
+                if self._stopping.is_set():
+                    return
+                event = self._unmarshal(watcher, return_type, line)
+                if event is not None:
+                    yield event
+        finally:
+            self._response = None
+            response.close()
+            response.release_conn()
+
+    def _watch_kwargs(self):
+        """ Return the list method keyword arguments for the next watch connection """
+        kwargs = {'watch': True, '_preload_content': False, 'timeout_seconds': self.watch_timeout}
+        if self.resource_version is not None:
+            kwargs['resource_version'] = self.resource_version
+        if self._connections:
+            self.counters['reconnects'] += 1
+        self._connections += 1
+        return kwargs
+
+    def _unmarshal(self, watcher, return_type, line):
+        """
+        Decode one line of the stream and track its resourceVersion. Returns the event, or None for a
+        BOOKMARK, and raises ApiException for an ERROR event.
+        """
+        event = watcher.unmarshal_event(line, return_type)
+        if event['type'] == 'ERROR':
+            status = event['raw_object']
+            raise ApiException(status=status.get('code'), reason=status.get('message'))
+        resource_version = get_field(event['raw_object'], 'metadata', 'resource_version')
+        if resource_version is not None:
+            self.resource_version = resource_version
+        if event['type'] == 'BOOKMARK':
+            self.counters['bookmarks'] += 1
+            return None
+        self.counters['events'] += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            obj = event['object']
+            logger.debug("EVENT type: {0} object: {1}".format(
+                event['type'], json.dumps(obj if isinstance(obj, dict) else serializer.to_dict(obj))
+            ))
+        return event
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import logging
+import threading
+
+from .fields import get_field, has_field
+from .stream import ResilientWatch
+
+logger = logging.getLogger(__name__)
+
+ROUTE_READY_CONDITIONS = frozenset(['Ready', 'Admitted'])
+
+
+def object_ready(obj):
+    """
+    Default readiness test for an object returned by create, patch or replace. An object with a
+    status phase is ready once Active, a Route once every ingress condition is Ready or Admitted,
+    and anything else once it has a status.
+    """
+    if obj is None:
+        return False
+    status = get_field(obj, 'status')
+    if status is None:
+        return False
+    if has_field(status, 'phase'):
+        return get_field(status, 'phase') == 'Active'
+    if get_field(obj, 'kind') == 'Route':
+        ingress = get_field(status, 'ingress')
+        if ingress is None:
+            return False
+        conditions = set()
+        for route_ingress in ingress:
+            for condition in get_field(route_ingress, 'conditions') or []:
+                conditions.add(get_field(condition, 'type'))
+        return conditions <= ROUTE_READY_CONDITIONS
+    return True
+
+
+def object_deleted(obj):
+    """ Readiness test when waiting for a delete to complete """
+    return obj is None
+
+
+def _newer(version, other):
+    """ True if resourceVersion version is known to be later than other """
+    try:
+        return int(version) > int(other)
+    except (TypeError, ValueError):
+        return False
+
+
+class Waiter(object):
+    """
+    Waits for one object to satisfy a predicate by following watch events, rather than polling.
+
+    Waiters for the same kind and namespace share a single watch, see WatchMultiplexer. The watch
+    starts at the resourceVersion of the object returned by the request being waited on, so no
+    intervening event is missed.
+    """
+
+    def __init__(self, helper, name, namespace=None, predicate=object_ready, timeout=20):
+        """
+        :param helper: object helper for the object's kind
+        :param name: name of the object
+        :param namespace: namespace of the object, or None
+        :param predicate: function called with the latest object, or None once it is deleted, and
+            returning True when the wait is over
+        :param timeout: seconds to wait
+        """
+        self.helper = helper
+        self.name = name
+        self.namespace = namespace
+        self.predicate = predicate
+        self.timeout = timeout
+
+    def wait(self, obj=None):
+        """
+        Wait until the predicate is satisfied or the timeout expires.
+
+        :param obj: the object returned by the API request being waited on, if any
+        :return: the last version of the object seen, or None if it was deleted
+        """
+        if get_field(obj, 'metadata', 'resource_version') is None:
+            obj = self.helper.get_object(self.name, self.namespace)
+        if self.predicate(obj):
+            return obj
+
+        registration = Registration(self.name, self.predicate, obj)
+        multiplexer, needs_read = WatchMultiplexer.join(self.helper, self.namespace, registration)
+        try:
+            if needs_read:
+                registration.offer(self.helper.get_object(self.name, self.namespace))
+            registration.done.wait(self.timeout)
+            return registration.result
+        finally:
+            multiplexer.leave(registration)
+
+
+class Registration(object):
+    """ A waiter registered with a WatchMultiplexer """
+
+    def __init__(self, name, predicate, obj):
+        self.name = name
+        self.predicate = predicate
+        self.result = obj
+        self.resource_version = get_field(obj, 'metadata', 'resource_version')
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def offer(self, obj):
+        """ Record the latest version of the object, and finish if it satisfies the predicate """
+        with self._lock:
+            if self.done.is_set():
+                return
+            self.result = obj
+            try:
+                ready = self.predicate(obj)
+            except Exception:
+                logger.exception('Waiter predicate failed')
+                ready = False
+            if ready:
+                self.done.set()
+
+
+class WatchMultiplexer(object):
+    """
+    One watch on a kind and namespace, shared by every Registration waiting on objects of that
+    kind and namespace. Events are dispatched to the registrations for the object's name, and
+    the watch is stopped when the last registration leaves.
+
+    The watch is a ResilientWatch. If the resourceVersion expires (410 Gone), the kind is listed
+    again to bring every waiter up to date.
+    """
+
+    min_backoff = 0.05
+    max_backoff = 2
+    watch_timeout = 300
+
+    _multiplexers = {}
+    _lock = threading.Lock()
+
+    def __init__(self, helper, namespace, key):
+        self.api_client = helper.api_client
+        self.kind = helper.kind
+        self.namespace = namespace
+        self.raw = helper.raw
+        self.key = key
+        self.start_version = None
+        self.watch = None
+        self._list_method = helper.lookup_method('list', namespace)
+        self._list_args = (namespace,) if namespace else ()
+        self._call_method = helper.call_method
+        self._registrations = {}
+        self._latest = {}
+        self._state_lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def join(cls, helper, namespace, registration):
+        """
+        Add registration to the shared multiplexer for the helper's kind and namespace, starting it
+        if needed.
+
+        :return: tuple of the multiplexer, and True if the object may have changed before the
+            watch position and must be read to bring the registration up to date
+        """
+        key = (helper.api_client, helper.api_version, helper.kind, namespace, helper.raw)
+        with cls._lock:
+            multiplexer = cls._multiplexers.get(key)
+            if multiplexer is None:
+                multiplexer = cls._multiplexers[key] = cls(helper, namespace, key)
+            needs_read = multiplexer._add(registration)
+        return multiplexer, needs_read
+
+    def leave(self, registration):
+        """ Remove registration, stopping the watch if it was the last one """
+        cls = type(self)
+        with cls._lock:
+            with self._state_lock:
+                registrations = self._registrations.get(registration.name)
+                if registrations is not None:
+                    registrations.discard(registration)
+                    if not registrations:
+                        del self._registrations[registration.name]
+                last = not self._registrations
+            if last and cls._multiplexers.get(self.key) is self:
+                del cls._multiplexers[self.key]
+                self.stop()
+
+    def waiting(self):
+        """ Return the number of registrations """
+        with self._state_lock:
+            return sum(len(x) for x in self._registrations.values())
+
+    def stop(self):
+        if self.watch is not None:
+            self.watch.stop()
+
+    def _add(self, registration):
+        with self._state_lock:
+            self._registrations.setdefault(registration.name, set()).add(registration)
+            if self.watch is None:
+                self.start_version = registration.resource_version
+                self._start()
+                return False
+            latest = self._latest.get(registration.name)
+        if latest is not None and _newer(latest[1], registration.resource_version):
+            registration.offer(latest[0])
+            return False
+        return registration.resource_version is None or _newer(self.start_version, registration.resource_version)
+
+    def _start(self):
+        """ Start following the watch from start_version """
+        self.watch = ResilientWatch(self.api_client, self._list_method, self._list_args, raw=self.raw,
+                                    resource_version=self.start_version, relist=self._relist,
+                                    watch_timeout=self.watch_timeout, min_backoff=self.min_backoff,
+                                    max_backoff=self.max_backoff)
+        self._thread = threading.Thread(target=self._run, name='watch-{}'.format(self.kind))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _dispatch(self, name, obj, resource_version):
+        with self._state_lock:
+            self._latest[name] = (obj, resource_version)
+            registrations = list(self._registrations.get(name, ()))
+        for registration in registrations:
+            registration.offer(obj)
+
+    def _dispatch_event(self, event):
+        obj = event['object']
+        self._dispatch(get_field(obj, 'metadata', 'name'), None if event['type'] == 'DELETED' else obj,
+                       self.watch.resource_version)
+
+    def _run(self):
+        for event in self.watch:
+            self._dispatch_event(event)
+
+    def _relist(self):
+        """ Bring every registration up to date from a full list, returning its resourceVersion """
+        return self._apply_list(self._call_method(self._list_method, *self._list_args))
+
+    def _apply_list(self, result):
+        resource_version = get_field(result, 'metadata', 'resource_version')
+        items = dict((get_field(x, 'metadata', 'name'), x) for x in get_field(result, 'items') or [])
+        with self._state_lock:
+            names = set(self._registrations) | set(self._latest)
+        for name in names:
+            obj = items.get(name)
+            self._dispatch(name, obj, get_field(obj, 'metadata', 'resource_version') or resource_version)
+        self.start_version = resource_version
+        return resource_version
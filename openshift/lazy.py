@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    A module whose public attributes are imported on first access.
+
+    Attribute access, `from package import Name`, dir() and inspect.getmembers() behave as they
+    would for a package that imports everything eagerly, but each submodule is only loaded when
+    one of its names is requested.
+    """
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails
+        try:
+            module_name = self.__dict__['__lazy_attributes__'][name]
+        except KeyError:
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(self.__name__, name))
+        module = importlib.import_module(module_name, self.__name__)
+        if module.__name__.rsplit('.', 1)[-1] == name:
+            # The attribute is the submodule itself
+            value = module
+        else:
+            value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__lazy_attributes__))
+
+
+def lazy_module(name, attributes):
+    """
+    Replace the module registered as `name` in sys.modules with a LazyModule.
+
+    :param name: name of the module being initialized, normally __name__
+    :param attributes: dict mapping each attribute name to the module, absolute or relative to
+        `name`, that defines it
+    :return: the LazyModule
+    """
+    module = sys.modules[name]
+    lazy = LazyModule(name, module.__doc__)
+    lazy.__dict__.update(module.__dict__)
+    lazy.__lazy_attributes__ = attributes
+    lazy.__all__ = sorted(attributes)
+    sys.modules[name] = lazy
+    return lazy
@@ -95,5 +95,9 @@ find "${CLIENT_ROOT}/client/apis" -type f -name \*.py -exec sed -i "s/auth_setti
 echo "--- Post processing of generated packages"
 python "${SCRIPT_ROOT}/update_generated.py"
 
+echo "--- Generating Ansible module argspecs"
+rm -f "${CLIENT_ROOT}/helper/argspecs/"*.json
+(cd "${SCRIPT_ROOT}/.." && python -c "from openshift.ansiblegen.cli import commandline; commandline()" argspecs -o "${CLIENT_ROOT}/helper/argspecs")
+
 
 echo "---Done."
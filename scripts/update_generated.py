@@ -1,5 +1,6 @@
 import io
 import os
+import re
 import sys
 
 from constants import PACKAGE_NAME
@@ -29,7 +30,120 @@ def module_name_from_import(line, idx):
     return line.split(' ')[1].split('.')[idx]
 
 
-def process_package(package_file, skip_method):
+def lazy_import_lines(lines, lazy_import):
+    """
+    Replace `from <module> import <names>` lines with a call to lazy_module(), so that the
+    package only imports a submodule when one of its names is first accessed.
+    """
+    if lazy_import in lines:
+        # already processed
+        return lines
+
+    output_lines = []
+    attributes = []
+    for line in lines:
+        if line.startswith('from ') and ' import ' in line and '__future__' not in line:
+            module, names = line[len('from '):].split(' import ', 1)
+            attributes.extend((name.strip(), module) for name in names.split(','))
+            if module.startswith('.') and module.count('.') > 1:
+                # expose the subpackage as well, e.g. client.models
+                subpackage = '.' + module.split('.')[1]
+                attributes.append((subpackage[1:], subpackage))
+        elif line.startswith('# import ') or (not line and output_lines and not output_lines[-1]):
+            continue
+        else:
+            output_lines.append(line)
+
+    output_lines.append(lazy_import)
+    output_lines.append('')
+    output_lines.append('lazy_module(__name__, {')
+    for name, module in sorted(set(attributes)):
+        output_lines.append("    '{0}': '{1}',".format(name, module))
+    output_lines.append('})')
+    output_lines.append('')
+    return output_lines
+
+
+TYPE_MAPS_RX = re.compile(
+    r'\n        self\.swagger_types = (\{\n.*?\n        \})\n\n        self\.attribute_map = (\{\n.*?\n        \})\n\n',
+    re.DOTALL
+)
+
+DICT_EQ = '        return self.__dict__ == other.__dict__'
+
+SLOTS_EQ = '''        for attr in self.__slots__:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True'''
+
+
+def compact_model(source):
+    """
+    Move swagger_types and attribute_map from each instance to the class, and declare __slots__
+    for the attribute storage, so model instances do not carry a __dict__ and two dicts each.
+    """
+    match = TYPE_MAPS_RX.search(source)
+    if not match:
+        return source
+    swagger_types = match.group(1).replace('\n    ', '\n')
+    attribute_map = match.group(2).replace('\n    ', '\n')
+    slots = ["'_{}'".format(name) for name in re.findall(r"^\s+'(\w+)':", match.group(1), re.MULTILINE)]
+    if slots:
+        slots_decl = '__slots__ = (\n' + ''.join('        {},\n'.format(x) for x in slots) + '    )'
+    else:
+        slots_decl = '__slots__ = ()'
+
+    source = source[:match.start()] + '\n' + source[match.end():]
+    class_attributes = '    swagger_types = {0}\n\n    attribute_map = {1}\n\n    {2}\n\n'.format(
+        swagger_types, attribute_map, slots_decl
+    )
+    init = source.index('    def __init__(')
+    source = source[:init] + class_attributes + source[init:]
+    return source.replace(DICT_EQ, SLOTS_EQ)
+
+
+NE_RETURN = '        return not self == other\n'
+
+PICKLE_METHODS = '''
+    def __getstate__(self):
+        """
+        Returns the attribute values, for pickle
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """
+        Restores the attribute values, for pickle
+        """
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
+'''
+
+
+def picklable_model(source):
+    """
+    Add __getstate__ and __setstate__ over the slots of a compact model. Without them, pickle protocols
+    0 and 1, the Python 2 default, refuse classes with __slots__.
+    """
+    if '__slots__' not in source or '    def __getstate__(' in source:
+        return source
+    end = source.rindex(NE_RETURN) + len(NE_RETURN)
+    return source[:end] + PICKLE_METHODS + source[end:]
+
+
+def process_models():
+    model_dir = os.path.join(LIB_DIR, 'client', 'models')
+    for filename in sorted(os.listdir(model_dir)):
+        if not filename.endswith('.py') or filename == '__init__.py':
+            continue
+        model_file = os.path.join(model_dir, filename)
+        with io.open(model_file) as f:
+            source = f.read()
+        with io.open(model_file, mode='w') as f:
+            f.write(picklable_model(compact_model(source)))
+
+
+def process_package(package_file, skip_method, lazy_import):
     with io.open(package_file) as f:
         lines = f.read().splitlines()
 
@@ -41,6 +155,8 @@ def process_package(package_file, skip_method):
 
         output_lines.append(line)
 
+    output_lines = lazy_import_lines(output_lines, lazy_import)
+
     with io.open(package_file, mode='w') as f:
         f.write('\n'.join(output_lines))
 
@@ -52,7 +168,8 @@ def process_client_package():
         elif line.startswith('from .apis') and not api_exists(module_name_from_import(line, 2)):
             return True
         return False
-    process_package(os.path.join(LIB_DIR, 'client', '__init__.py'), skip_method)
+    process_package(os.path.join(LIB_DIR, 'client', '__init__.py'), skip_method,
+                    'from .lazy import lazy_module')
 
 
 def process_models_package():
@@ -60,7 +177,8 @@ def process_models_package():
         if line.startswith('from .') and not model_exists(module_name_from_import(line, 1)):
             return True
         return False
-    process_package(os.path.join(LIB_DIR, 'client', 'models', '__init__.py'), skip_method)
+    process_package(os.path.join(LIB_DIR, 'client', 'models', '__init__.py'), skip_method,
+                    'from ..lazy import lazy_module')
 
 
 def process_apis_package():
@@ -68,13 +186,15 @@ def process_apis_package():
         if line.startswith('from .') and not api_exists(module_name_from_import(line, 1)):
             return True
         return False
-    process_package(os.path.join(LIB_DIR, 'client', 'apis', '__init__.py'), skip_method)
+    process_package(os.path.join(LIB_DIR, 'client', 'apis', '__init__.py'), skip_method,
+                    'from ..lazy import lazy_module')
 
 
 def main():
     process_client_package()
     process_apis_package()
     process_models_package()
+    process_models()
 
     return 0
 
@@ -47,7 +47,11 @@ setup(
     url="https://github.com/openshift/openshift-restclient-python",
     keywords=["Swagger", "OpenAPI", "Kubernetes", "OpenShift"],
     install_requires=extract_requirements('requirements.txt'),
+    extras_require={
+        'async:python_version >= "3.5"': ['aiohttp>=3.0'],
+    },
     packages=find_packages(include='openshift.*'),
+    package_data={'openshift.helper': ['argspecs/*.json']},
     include_package_data=True,
     long_description='Python client for OpenShift http://openshift.redhat.com/',
     classifiers=[
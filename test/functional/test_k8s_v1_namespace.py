@@ -63,7 +63,7 @@ def test_patch_namespace(admin_k8s_ansible_helper, k8s_namespace, patch_params,
     admin_k8s_ansible_helper.object_from_params(patch_params, obj=updated_obj)
     match, _ = admin_k8s_ansible_helper.objects_match(existing_obj, updated_obj)
     assert not match
-    new_obj = admin_k8s_ansible_helper.patch_object(name, None, updated_obj)
+    new_obj = admin_k8s_ansible_helper.patch_object(name, None, updated_obj, existing=existing_obj)
     assert new_obj is not None
     obj_compare(admin_k8s_ansible_helper, new_obj, patch_params)
 
@@ -69,7 +69,7 @@ def test_patch_service(k8s_ansible_helper, service, patch_params, obj_compare):
     k8s_ansible_helper.object_from_params(patch_params, obj=updated_obj)
     match, _ = k8s_ansible_helper.objects_match(existing_obj, updated_obj)
     assert not match
-    new_obj = k8s_ansible_helper.patch_object(name, namespace, updated_obj)
+    new_obj = k8s_ansible_helper.patch_object(name, namespace, updated_obj, existing=existing_obj)
     assert new_obj is not None
     obj_compare(k8s_ansible_helper, new_obj, patch_params)
 
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+import sys
+import time
+
+import pytest
+
+from six.moves import queue
+
+from kubernetes.client.rest import ApiException
+from openshift.client import ApiClient, ConfigurationObject
+from openshift.helper.ansible import KubernetesAnsibleModuleHelper, OpenShiftAnsibleModuleHelper
+
+# asyncio tests use syntax that needs Python 3.5+
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 5) else []
+
+
+def offline_helper_class(helper_class):
+    """ Return a subclass of helper_class that builds its ApiClient without reading a kubeconfig. """
+
+    class OfflineHelper(helper_class):
+        @staticmethod
+        def client_from_config(config_file, context):
+            config = ConfigurationObject()
+            config.host = 'http://127.0.0.1:8443'
+            return ApiClient(config=config)
+
+    OfflineHelper.__name__ = 'Offline' + helper_class.__name__
+    return OfflineHelper
+
+
+@pytest.fixture(scope='session')
+def openshift_helper_class():
+    return offline_helper_class(OpenShiftAnsibleModuleHelper)
+
+
+@pytest.fixture(scope='session')
+def k8s_helper_class():
+    return offline_helper_class(KubernetesAnsibleModuleHelper)
+
+
+class FakeHTTPResponse(object):
+    """ Stand-in for the urllib3 response returned by the REST client """
+
+    def __init__(self, status, data):
+        self.status = status
+        self.reason = 'OK' if status < 400 else 'Error'
+        self.data = json.dumps(data).encode('utf8')
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+
+class FakeWatchResponse(object):
+    """ Streams the events pushed to a FakeApi watch until ended, timed out, or the FakeApi is closed """
+
+    def __init__(self, api, events, timeout=None):
+        self.api = api
+        self.events = events
+        self.deadline = time.time() + timeout if timeout else None
+        self.closed = False
+
+    def read_chunked(self, decode_content=True):
+        while True:
+            try:
+                event = self.events.get(timeout=0.02)
+            except queue.Empty:
+                if self.closed or self.api.closed or (self.deadline and time.time() > self.deadline):
+                    return
+                continue
+            if event is None:
+                return
+            yield (json.dumps(event) + '\n').encode('utf8')
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+class FakeApi(object):
+    """
+    Replaces ApiClient.request with canned responses keyed by (method, path), and records each request.
+    Watch requests stream the events pushed for their path, unless a failure was added for
+    ('WATCH', path).
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        self.watches = {}
+        self.closed = False
+
+    def add(self, method, path, data, status=200):
+        self.responses[(method, path)] = (status, data)
+
+    def watch_events(self, path):
+        return self.watches.setdefault(path, queue.Queue())
+
+    def push_event(self, path, event_type, obj):
+        self.watch_events(path).put({'type': event_type, 'object': obj})
+
+    def end_watch(self, path):
+        """ Close the current watch connection on path """
+        self.watch_events(path).put(None)
+
+    def requests_for(self, method, path, watch=False):
+        return [x for x in self.requests
+                if x['method'] == method and x['path'] == path and x['watch'] == watch]
+
+    def request(self, api_client, method, url, query_params=None, headers=None, post_params=None, body=None,
+                _preload_content=True, _request_timeout=None):
+        path = url[len(api_client.host):]
+        query = dict(query_params or [])
+        self.requests.append({'method': method, 'path': path, 'body': body, 'query': query,
+                              'watch': bool(query.get('watch')), '_preload_content': _preload_content})
+        if query.get('watch'):
+            if ('WATCH', path) not in self.responses:
+                return FakeWatchResponse(self, self.watch_events(path), query.get('timeoutSeconds'))
+            # A failure added for the watch is returned once
+            status, data = self.responses.pop(('WATCH', path))
+        else:
+            status, data = self.responses.get((method, path), (404, {'kind': 'Status', 'message': 'not found'}))
+        response = FakeHTTPResponse(status, data)
+        if status >= 300:
+            raise ApiException(http_resp=response)
+        return response
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    api = FakeApi()
+    monkeypatch.setattr(ApiClient, 'request', lambda self, *args, **kwargs: api.request(self, *args, **kwargs))
+    yield api
+    api.closed = True
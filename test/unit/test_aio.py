@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from kubernetes.client.models import V1ConfigMap, V1ObjectMeta  # noqa: E402
+from openshift.client import ConfigurationObject  # noqa: E402
+from openshift.client.aio import AsyncApiClient  # noqa: E402
+from openshift.helper.aio import AsyncInformer, AsyncKubernetesObjectHelper, AsyncWatchMultiplexer  # noqa: E402
+from openshift.helper.exceptions import KubernetesException  # noqa: E402
+
+KINDS = {'configmaps': 'ConfigMap', 'namespaces': 'Namespace'}
+
+
+def merge(target, patch):
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+class StandIn(object):
+    """ A small in-memory API server for namespaces and config maps, with watches """
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.version = 0
+        self.objects = {}
+        self.history = []
+        self.watchers = []
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.peers = set()
+        self.app = web.Application(client_max_size=2 ** 24)
+        self.app.router.add_route('*', '/api/v1/{path:.*}', self.handle)
+
+    def store(self, collection, event_type, obj):
+        self.version += 1
+        obj['metadata']['resourceVersion'] = str(self.version)
+        key = (collection, obj['metadata']['name'])
+        if event_type == 'DELETED':
+            self.objects.pop(key, None)
+        else:
+            self.objects[key] = obj
+        self.history.append((self.version, collection, event_type, obj))
+        for watched, queue in self.watchers:
+            if watched == collection:
+                queue.put_nowait((self.version, event_type, obj))
+        return obj
+
+    def update(self, collection, name, patch):
+        obj = json.loads(json.dumps(self.objects[(collection, name)]))
+        return self.store(collection, 'MODIFIED', merge(obj, patch))
+
+    def shutdown(self):
+        for _, queue in self.watchers:
+            queue.put_nowait(None)
+
+    @staticmethod
+    def status(code, message):
+        return web.json_response({'kind': 'Status', 'status': 'Failure', 'code': code, 'message': message},
+                                 status=code)
+
+    async def handle(self, request):
+        self.requests.append((request.method, request.path, dict(request.query)))
+        self.peers.add(request.transport.get_extra_info('peername'))
+        parts = request.match_info['path'].split('/')
+        if parts[0] == 'namespaces' and len(parts) >= 3:
+            collection, name = '/'.join(parts[:3]), (parts[3] if len(parts) > 3 else None)
+        else:
+            collection, name = parts[0], (parts[1] if len(parts) > 1 else None)
+        kind = KINDS[collection.split('/')[-1]]
+
+        if request.method == 'GET' and name is None and request.query.get('watch') == 'true':
+            return await self.watch(request, collection)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return await self.crud(request, collection, name, kind)
+        finally:
+            self.in_flight -= 1
+
+    async def crud(self, request, collection, name, kind):
+        key = (collection, name)
+        if request.method == 'GET' and name is None:
+            items = [obj for (coll, _), obj in sorted(self.objects.items()) if coll == collection]
+            return web.json_response({'kind': kind + 'List', 'apiVersion': 'v1', 'items': items,
+                                      'metadata': {'resourceVersion': str(self.version)}})
+        if request.method == 'POST':
+            obj = await request.json()
+            obj.update(kind=kind, apiVersion='v1')
+            if (collection, obj['metadata']['name']) in self.objects:
+                return self.status(409, 'already exists')
+            if kind == 'Namespace':
+                obj['status'] = {'phase': 'Pending'}
+            return web.json_response(self.store(collection, 'ADDED', obj), status=201)
+        if key not in self.objects:
+            return self.status(404, '{} not found'.format(name))
+        if request.method == 'GET':
+            return web.json_response(self.objects[key])
+        if request.method == 'PATCH':
+            return web.json_response(self.update(collection, name, await request.json()))
+        if request.method == 'PUT':
+            obj = await request.json()
+            if obj['metadata'].get('resourceVersion') != self.objects[key]['metadata']['resourceVersion']:
+                return self.status(409, 'conflict')
+            obj.update(kind=kind, apiVersion='v1')
+            return web.json_response(self.store(collection, 'MODIFIED', obj))
+        if request.method == 'DELETE':
+            self.store(collection, 'DELETED', self.objects[key])
+            return web.json_response({'kind': 'Status', 'apiVersion': 'v1', 'status': 'Success'})
+
+    async def watch(self, request, collection):
+        since = int(request.query.get('resourceVersion') or 0)
+        timeout = float(request.query.get('timeoutSeconds') or 300)
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        await response.prepare(request)
+        queue = asyncio.Queue()
+        self.watchers.append((collection, queue))
+
+        async def send(event_type, obj):
+            line = json.dumps({'type': event_type, 'object': obj}) + '\n'
+            await response.write(line.encode('utf8'))
+
+        sent = since
+        try:
+            if not since:
+                for (coll, _), obj in sorted(self.objects.items()):
+                    if coll == collection:
+                        await send('ADDED', obj)
+                sent = self.version
+            else:
+                for version, coll, event_type, obj in list(self.history):
+                    if coll == collection and version > since:
+                        await send(event_type, obj)
+                        sent = version
+            loop = asyncio.get_event_loop()
+            deadline = loop.time() + timeout
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    break
+                version, event_type, obj = item
+                if version > sent:
+                    await send(event_type, obj)
+                    sent = version
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            self.watchers.remove((collection, queue))
+        return response
+
+
+def run(test, delay=0, connection_limit=100):
+    """ Run the coroutine function test(standin, helper) against a stand-in API server """
+
+    async def main():
+        standin = StandIn(delay)
+        server = TestServer(standin.app)
+        await server.start_server()
+        helpers = []
+
+        def helper(api_version, kind, **kwargs):
+            class StandInHelper(AsyncKubernetesObjectHelper):
+                @staticmethod
+                def client_from_config(config_file, context):
+                    config = ConfigurationObject()
+                    config.host = str(server.make_url('')).rstrip('/')
+                    return AsyncApiClient(config=config, connection_limit=connection_limit)
+            result = StandInHelper(api_version, kind, **kwargs)
+            helpers.append(result)
+            return result
+
+        try:
+            await test(standin, helper)
+        finally:
+            standin.shutdown()
+            for each in helpers:
+                await each.close()
+            await server.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def config_map(name, **data):
+    return V1ConfigMap(metadata=V1ObjectMeta(name=name, namespace='test'), data=data)
+
+
+def test_crud_returns_models():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map')
+        created = await h.create_object('test', config_map('one', a='1'))
+        assert isinstance(created, V1ConfigMap)
+        assert created.metadata.resource_version == '1'
+
+        fetched = await h.get_object('one', 'test')
+        assert fetched.data == {'a': '1'}
+
+        patched = await h.patch_object('one', 'test', {'data': {'b': '2'}})
+        assert patched.data == {'a': '1', 'b': '2'}
+
+        replaced = await h.replace_object('one', 'test', {'metadata': {'name': 'one'}, 'data': {'c': '3'}})
+        assert replaced.data == {'c': '3'}
+
+        await h.delete_object('one', 'test')
+        assert await h.get_object('one', 'test') is None
+        assert ('one' not in [key[1] for key in standin.objects])
+
+    run(test)
+
+
+def test_raw_mode_returns_dicts():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map', raw=True)
+        created = await h.create_object('test', body={'metadata': {'name': 'one'}, 'data': {'a': '1'}})
+        assert created['metadata']['name'] == 'one'
+        assert (await h.get_object('one', 'test'))['data'] == {'a': '1'}
+
+    run(test)
+
+
+def test_api_errors_raise_helper_exception():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map')
+        await h.create_object('test', config_map('one'))
+        with pytest.raises(KubernetesException) as excinfo:
+            await h.create_object('test', config_map('one'))
+        assert excinfo.value.value['status'] == 409
+        assert excinfo.value.value['message'] == 'already exists'
+
+    run(test)
+
+
+def test_wait_follows_watch_events():
+    async def test(standin, helper):
+        h = helper('v1', 'namespace', timeout=5)
+
+        async def activate():
+            await asyncio.sleep(0.1)
+            standin.update('namespaces', 'project', {'status': {'phase': 'Active'}})
+
+        asyncio.ensure_future(activate())
+        created = await h.create_object(body={'metadata': {'name': 'project'}})
+        assert created.status.phase == 'Active'
+        watches = [x for x in standin.requests if x[2].get('watch') == 'true']
+        assert len(watches) == 1
+        assert watches[0][2]['resourceVersion'] == '1'
+        assert not AsyncWatchMultiplexer._multiplexers
+
+    run(test)
+
+
+def test_watch_is_async_iterator_and_resumes():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map', raw=True)
+        await h.create_object('test', body={'metadata': {'name': 'one'}})
+        watch = h.watch('test', watch_timeout=1)
+        events = []
+
+        async def follow():
+            async for event in watch:
+                events.append((event['type'], event['object']['metadata']['name']))
+                if len(events) == 3:
+                    watch.stop()
+
+        task = asyncio.ensure_future(follow())
+        await asyncio.sleep(0.1)
+        # Large enough to span many reads of the response
+        await h.create_object('test', body={'metadata': {'name': 'two'}, 'data': {'big': 'x' * 2 ** 20}})
+        await asyncio.sleep(1.2)
+        await h.delete_object('one', 'test')
+        await asyncio.wait_for(task, 5)
+
+        assert events == [('ADDED', 'one'), ('ADDED', 'two'), ('DELETED', 'one')]
+        assert watch.counters['reconnects'] >= 1
+        assert watch.counters['relists'] == 0
+
+    run(test)
+
+
+def test_connections_are_pooled_and_limited():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map')
+        await h.create_object('test', config_map('one'))
+        for _ in range(10):
+            await h.get_object('one', 'test')
+        assert len(standin.peers) == 1
+
+        results = await asyncio.gather(*[h.get_object('one', 'test') for _ in range(40)])
+        assert all(x.metadata.name == 'one' for x in results)
+        assert standin.max_in_flight == 4
+        assert len(standin.peers) <= 4
+
+    run(test, delay=0.02, connection_limit=4)
+
+
+def test_informer_serves_reads_from_cache():
+    async def test(standin, helper):
+        h = helper('v1', 'config_map')
+        await h.create_object('test', config_map('one', a='1'))
+        events = []
+        informer = await h.use_informer('test')
+        informer.add_listener(lambda event_type, obj: events.append((event_type, obj.metadata.name)))
+        assert isinstance(informer, AsyncInformer) and informer.has_synced()
+
+        def reads():
+            return len([x for x in standin.requests if x[2].get('watch') != 'true'])
+
+        before = reads()
+        fetched = await h.get_object('one', 'test')
+        assert fetched.data == {'a': '1'}
+        assert reads() == before
+
+        standin.update('namespaces/test/configmaps', 'one', {'data': {'a': '2'}})
+        for _ in range(50):
+            if events:
+                break
+            await asyncio.sleep(0.02)
+        assert events == [('MODIFIED', 'one')]
+        assert (await h.get_object('one', 'test')).data == {'a': '2'}
+        assert reads() == before
+
+    run(test)
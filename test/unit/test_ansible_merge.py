@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+from openshift.client import serializer
+from openshift.helper.patch import merge_object
+
+LIVE = {
+    'apiVersion': 'v1',
+    'kind': 'DeploymentConfig',
+    'metadata': {'name': 'web', 'namespace': 'test'},
+    'spec': {'template': {'spec': {'containers': [{
+        'name': 'web',
+        'image': 'web:1',
+        'args': ['--verbose'],
+        'env': [{'name': 'A', 'value': '1'}, {'name': 'B', 'value': '2'}],
+        'ports': [{'containerPort': 8080, 'protocol': 'TCP'}],
+    }]}}},
+}
+
+
+def merged_container(helper_class, container):
+    helper = helper_class('v1', 'deployment_config')
+    obj = helper.object_from_params({'spec_template_spec_containers': [container]}, obj=copy.deepcopy(LIVE))
+    containers = serializer.to_api_dict(obj)['spec']['template']['spec']['containers']
+    assert len(containers) == 1
+    return containers[0]
+
+
+def test_keyed_items_are_updated_or_appended(openshift_helper_class):
+    container = merged_container(openshift_helper_class, {
+        'name': 'web',
+        'env': [{'name': 'B', 'value': 'changed'}, {'name': 'C', 'value': '3'}, {'name': 'C', 'value': '4'}],
+    })
+    assert container['image'] == 'web:1'
+    assert container['env'] == [{'name': 'A', 'value': '1'}, {'name': 'B', 'value': 'changed'},
+                                {'name': 'C', 'value': '4'}]
+
+
+def test_unkeyed_items_match_on_all_given_values(openshift_helper_class):
+    container = merged_container(openshift_helper_class, {
+        'name': 'web',
+        'ports': [{'containerPort': 8080}, {'containerPort': 8080, 'protocol': 'UDP'},
+                  {'containerPort': 8443}, {'containerPort': 8443}],
+    })
+    assert container['ports'] == [{'containerPort': 8080, 'protocol': 'TCP'},
+                                  {'containerPort': 8080, 'protocol': 'UDP'},
+                                  {'containerPort': 8443}]
+
+
+def test_primitive_lists_append_missing_values_once(openshift_helper_class):
+    container = merged_container(openshift_helper_class, {'name': 'web', 'args': ['--port', '--verbose', '--port']})
+    assert container['args'] == ['--verbose', '--port']
+
+
+def test_params_and_patches_merge_alike(openshift_helper_class):
+    container = {
+        'name': 'web',
+        'args': ['--port', '--verbose'],
+        'env': [{'name': 'B', 'value': 'changed'}, {'name': 'C', 'value': '3'}],
+        'ports': [{'containerPort': 8080}, {'containerPort': 8443, 'protocol': 'TCP'}],
+    }
+    patched = merge_object(LIVE, {'spec': {'template': {'spec': {'containers': [container]}}}})
+    assert merged_container(openshift_helper_class, container) == patched['spec']['template']['spec']['containers'][0]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+import pytest
+
+from openshift.helper.ansible import execute_module
+from openshift.helper.apply import CREATED, FAILED, UNCHANGED
+
+from .test_registry import ROUTE
+
+
+def route(name, host):
+    return {'metadata': {'name': name}, 'spec': {'host': host, 'to': {'kind': 'Service', 'name': name}}}
+
+
+@pytest.fixture
+def helper(openshift_helper_class):
+    return openshift_helper_class('v1', 'route', timeout=1)
+
+
+def test_definitions_default_to_the_module_kind(helper):
+    definitions = helper.resource_definitions_from_params({'resource_definitions': [
+        route('web', 'web.example.com'),
+        {'kind': 'List', 'items': [route('api', 'api.example.com'), {'apiVersion': 'v1', 'kind': 'Service'}]},
+    ]})
+    assert [(x['apiVersion'], x['kind']) for x in definitions] == [('v1', 'Route')] * 2 + [('v1', 'Service')]
+    assert definitions[1]['spec']['host'] == 'api.example.com'
+
+    assert helper.resource_definitions_from_params({'resource_definition': route('web', 'x')}) is None
+    with pytest.raises(helper.get_exception_class()):
+        helper.resource_definitions_from_params({'resource_definitions': ['web']})
+
+
+def test_definition_params_are_mutually_exclusive(helper, tmpdir):
+    src = tmpdir.join('routes.yml')
+    src.write('metadata: {name: web}\n---\nmetadata: {name: api}\n')
+    definitions = [route('web', 'web.example.com')]
+    for params in ({'resource_definitions': definitions, 'resource_definition': definitions[0]},
+                   {'resource_definitions': definitions, 'src': str(src)},
+                   {'resource_definition': definitions[0], 'src': str(src)}):
+        with pytest.raises(helper.get_exception_class()) as exc:
+            helper.resource_definitions_from_params(params)
+        assert 'mutually exclusive' in str(exc.value)
+
+
+def test_src_with_several_documents(helper, tmpdir):
+    src = tmpdir.join('routes.yml')
+    src.write('metadata: {name: web}\n---\nkind: Route\nmetadata: {name: api}\n')
+    definitions = helper.resource_definitions_from_params({'src': str(src)})
+    assert [x['metadata']['name'] for x in definitions] == ['web', 'api']
+
+    src.write('kind: Route\nmetadata: {name: web}\n')
+    assert helper.resource_definitions_from_params({'src': str(src)}) is None
+
+    src.write('metadata: {name: web\n')
+    with pytest.raises(helper.get_exception_class()):
+        helper.resource_definitions_from_params({'src': str(src)})
+
+
+def test_apply_aggregates_results(helper, fake_api):
+    existing = copy.deepcopy(ROUTE)
+    existing['metadata']['resourceVersion'] = '1'
+    fake_api.add('GET', '/oapi/v1/namespaces/test/routes/web', existing)
+    created = copy.deepcopy(ROUTE)
+    created['metadata'].update(name='api', resourceVersion='1')
+    fake_api.add('POST', '/oapi/v1/namespaces/test/routes', created)
+    fake_api.add('GET', '/oapi/v1/namespaces/test/routes/broken', {'kind': 'Status', 'message': 'denied'}, 403)
+
+    params = {'namespace': 'test', 'state': 'present', 'force': False, 'resource_definitions': [
+        route('web', 'web.example.com'),
+        route('api', 'api.example.com'),
+        route('broken', 'broken.example.com'),
+    ]}
+    result = helper.apply_resource_definitions(helper.resource_definitions_from_params(params), params)
+
+    assert result['changed'] and result['failed']
+    assert result['msg'] == '1 of 3 resource definitions failed'
+    web, api, broken = result['results']
+    assert (web['name'], web['action'], web['changed']) == ('web', UNCHANGED, False)
+    assert (api['name'], api['action'], api['changed'], api['namespace']) == ('api', CREATED, True, 'test')
+    assert api['result'] == created
+    assert (broken['action'], broken['failed']) == (FAILED, True)
+    assert 'result' not in broken
+
+
+def test_check_mode_changes_nothing(helper, fake_api):
+    params = {'namespace': 'test', 'resource_definitions': [route('web', 'web.example.com')]}
+    result = helper.apply_resource_definitions(helper.resource_definitions_from_params(params), params,
+                                               check_mode=True)
+    assert result == {'changed': True, 'results': [
+        {'kind': 'Route', 'name': 'web', 'namespace': 'test', 'action': CREATED, 'changed': True}]}
+    assert not fake_api.requests_for('POST', '/oapi/v1/namespaces/test/routes')
+
+
+class Module(object):
+    """ Stand-in for the Ansible module of a generated module, exiting with its result """
+
+    def __init__(self, helper, params, check_mode=False):
+        self.helper = helper
+        self.params = params
+        self.check_mode = check_mode
+        self.executed = False
+
+    def execute_module(self):
+        self.executed = True
+
+    def exit_json(self, **result):
+        self.result = result
+        raise SystemExit(0)
+
+    def fail_json(self, **result):
+        self.result = result
+        raise SystemExit(1)
+
+
+def test_modules_apply_resource_definitions(helper, fake_api):
+    module = Module(helper, {'namespace': 'test', 'resource_definitions': [route('web', 'web.example.com')],
+                             'api_key': 'secret'}, check_mode=True)
+    with pytest.raises(SystemExit) as exc:
+        execute_module(module)
+    assert exc.value.code == 0 and not module.executed
+    assert module.result['changed'] and module.result['results'][0]['action'] == CREATED
+    assert helper._auth == {'api_key': 'secret'}
+
+    module = Module(helper, {'src': '/no/such/file'})
+    with pytest.raises(SystemExit) as exc:
+        execute_module(module)
+    assert exc.value.code == 1 and 'Error loading resource definitions' in module.result['error']
+
+    module = Module(helper, {'resource_definition': route('web', 'web.example.com')})
+    execute_module(module)
+    assert module.executed
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import threading
+import time
+
+import pytest
+
+from openshift.helper.apply import CREATED, FAILED, PATCHED, SKIPPED, UNCHANGED, BulkApplier, kind_tier
+
+from .test_registry import ROUTE
+
+NAMESPACE = {'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': {'name': 'test'}}
+SERVICE = {'apiVersion': 'v1', 'kind': 'Service', 'metadata': {'name': 'web'},
+           'spec': {'ports': [{'port': 8080}], 'selector': {'app': 'web'}}}
+
+
+def config_map(name, **data):
+    return {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'name': name}, 'data': data}
+
+
+def stored(manifest, namespace='test', **extra):
+    """ The object the server returns for manifest """
+    obj = copy.deepcopy(manifest)
+    obj['metadata'].setdefault('namespace', namespace)
+    obj['metadata']['resourceVersion'] = '1'
+    obj.update(extra)
+    return obj
+
+
+@pytest.fixture
+def applier(openshift_helper_class):
+    return BulkApplier(openshift_helper_class(timeout=1), workers=4)
+
+
+def manifests():
+    route = copy.deepcopy(ROUTE)
+    del route['metadata']['namespace']
+    return [route, SERVICE, config_map('settings', a='1'), NAMESPACE]
+
+
+def serve_creates(fake_api):
+    route = copy.deepcopy(ROUTE)
+    route['metadata']['resourceVersion'] = '1'
+    fake_api.add('POST', '/oapi/v1/namespaces/test/routes', route)
+    fake_api.add('POST', '/api/v1/namespaces/test/services', stored(SERVICE, status={'loadBalancer': {}}))
+    fake_api.add('POST', '/api/v1/namespaces/test/configmaps', stored(config_map('settings', a='1')))
+    fake_api.add('POST', '/api/v1/namespaces', stored(NAMESPACE, None, status={'phase': 'Active'}))
+
+
+def test_kind_tiers():
+    assert kind_tier('Namespace') < kind_tier('ServiceAccount') < kind_tier('ImageStream')
+    assert kind_tier('ImageStream') < kind_tier('BuildConfig') < kind_tier('DeploymentConfig')
+    assert kind_tier('Service') < kind_tier('Route')
+    assert kind_tier('SomethingElse') == kind_tier('Route') + 1
+
+
+def test_apply_creates_in_dependency_order(applier, fake_api):
+    serve_creates(fake_api)
+    report = applier.apply(manifests(), namespace='test')
+
+    assert [x.action for x in report.results] == [CREATED] * 4
+    assert [x.kind for x in report.results] == ['Route', 'Service', 'ConfigMap', 'Namespace']
+    assert report.results[0].object['metadata']['name'] == 'web'
+    assert report.results[3].namespace is None
+    assert report.changed and not report.failed
+    assert len(report.tier_durations) == 4
+    assert all(x.duration >= 0 for x in report.results)
+
+    posts = [x['path'] for x in fake_api.requests if x['method'] == 'POST']
+    assert posts == ['/api/v1/namespaces', '/api/v1/namespaces/test/configmaps',
+                     '/api/v1/namespaces/test/services', '/oapi/v1/namespaces/test/routes']
+    created_map = [x for x in fake_api.requests if x['method'] == 'POST'][1]
+    assert created_map['body']['metadata']['namespace'] == 'test'
+
+
+def test_existing_objects_are_patched_only_when_different(applier, fake_api):
+    fake_api.add('GET', '/api/v1/namespaces/test/configmaps/same', stored(config_map('same', a='1')))
+    fake_api.add('GET', '/api/v1/namespaces/test/configmaps/different', stored(config_map('different', a='1')))
+    fake_api.add('PATCH', '/api/v1/namespaces/test/configmaps/different', stored(config_map('different', a='2')))
+
+    report = applier.apply([config_map('same', a='1'), config_map('different', a='2')], namespace='test')
+
+    assert [x.action for x in report.results] == [UNCHANGED, PATCHED]
+    assert report.results[1].diff
+    patches = [x for x in fake_api.requests if x['method'] == 'PATCH']
+    assert len(patches) == 1
+    assert patches[0]['body']['data'] == {'a': '2'}
+
+
+def test_check_mode_makes_no_changes(openshift_helper_class, fake_api):
+    fake_api.add('GET', '/api/v1/namespaces/test/configmaps/different', stored(config_map('different', a='1')))
+    applier = BulkApplier(openshift_helper_class(), check_mode=True)
+    report = applier.apply([config_map('different', a='2'), config_map('new')], namespace='test')
+    assert [x.action for x in report.results] == [PATCHED, CREATED]
+    assert set(x['method'] for x in fake_api.requests) == set(['GET'])
+
+
+def test_tier_runs_concurrently_with_worker_limit(openshift_helper_class, fake_api):
+    lock = threading.Lock()
+    running = [0, 0]
+    request = fake_api.request
+
+    def slow_request(*args, **kwargs):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.05)
+        try:
+            return request(*args, **kwargs)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    fake_api.request = slow_request
+    maps = [config_map('map{}'.format(n)) for n in range(12)]
+    for manifest in maps:
+        fake_api.add('GET', '/api/v1/namespaces/test/configmaps/' + manifest['metadata']['name'], stored(manifest))
+
+    report = BulkApplier(openshift_helper_class(), workers=3).apply(maps, namespace='test')
+    assert [x.action for x in report.results] == [UNCHANGED] * 12
+    assert running[1] == 3
+
+
+def test_failures_are_reported_and_fail_fast_skips_later_tiers(openshift_helper_class, fake_api):
+    fake_api.add('POST', '/api/v1/namespaces', {'kind': 'Status', 'message': 'forbidden'}, status=403)
+    applier = BulkApplier(openshift_helper_class(), fail_fast=True)
+    report = applier.apply([NAMESPACE, config_map('settings')], namespace='test')
+
+    assert [x.action for x in report.results] == [FAILED, SKIPPED]
+    assert report.failed == [report.results[0]]
+    assert 'forbidden' in str(report.results[0].error)
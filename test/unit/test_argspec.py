@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+import os
+
+import pytest
+
+from openshift.helper import argspec
+from openshift.helper.ansible import KubernetesAnsibleModuleHelper, OpenShiftAnsibleModuleHelper
+
+from .conftest import offline_helper_class
+
+HELPER_CLASSES = dict((x.module_prefix, offline_helper_class(x))
+                      for x in (KubernetesAnsibleModuleHelper, OpenShiftAnsibleModuleHelper))
+
+
+def artifacts():
+    for file_name in sorted(os.listdir(argspec.ARGSPEC_PATH)):
+        prefix, api_version, kind = file_name[:-len('.json')].split('_', 2)
+        yield prefix, api_version, kind
+
+
+def test_artifacts_are_shipped():
+    names = set(artifacts())
+    assert ('openshift', 'v1', 'deployment_config') in names
+    assert ('k8s', 'v1beta1', 'stateful_set') in names
+
+
+@pytest.mark.parametrize('prefix, api_version, kind', list(artifacts()))
+def test_artifact_matches_introspection(prefix, api_version, kind):
+    """ Fails when the models change without regenerating: openshift-ansible-gen argspecs """
+    helper = HELPER_CLASSES[prefix](api_version, kind)
+    introspected = json.loads(json.dumps(helper.introspect_argspec()))
+    assert argspec.load_argspec(prefix, api_version, kind) == introspected
+
+
+def test_helper_loads_artifact(openshift_helper_class, monkeypatch):
+    helper = openshift_helper_class('v1', 'route')
+    monkeypatch.setattr(helper, 'introspect_argspec', None)
+    assert helper.argspec['spec_host']['property_path'] == ['spec', 'host']
+    # the models were not introspected
+    assert helper._properties is None
+
+
+def test_other_versions_fall_back_to_introspection(openshift_helper_class, tmpdir, monkeypatch):
+    helper = openshift_helper_class('v1', 'route')
+    spec = helper.introspect_argspec()
+    path = str(tmpdir)
+    argspec.write_argspec('openshift', 'v1', 'route', spec, path)
+    assert argspec.load_argspec('openshift', 'V1', 'route', path) == json.loads(json.dumps(spec))
+
+    monkeypatch.setattr(argspec, '__version__', 'other')
+    assert argspec.load_argspec('openshift', 'v1', 'route', path) is None
+    assert argspec.load_argspec('openshift', 'v1', 'missing', path) is None
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import types
+import time
+
+import pytest
+
+from openshift.helper import daemon
+
+
+@pytest.fixture
+def runtime_dir(monkeypatch):
+    # Unix socket paths are short, so not under pytest's tmpdir
+    path = tempfile.mkdtemp()
+    monkeypatch.setenv('XDG_RUNTIME_DIR', path)
+    yield path
+    shutil.rmtree(path)
+
+
+@pytest.fixture
+def serve(runtime_dir):
+    threads = []
+
+    def start(kubeconfig, idle_timeout=5):
+        runs = []
+
+        def runner(prefix, kind, api_version, params):
+            runs.append((prefix, kind, api_version, params))
+            return 0, json.dumps({'changed': False, 'kind': kind})
+
+        server = daemon.HelperDaemon(kubeconfig, idle_timeout=idle_timeout, runner=runner)
+        thread = threading.Thread(target=server.serve)
+        thread.start()
+        threads.append(thread)
+        server.listening.wait(5)
+        return server, thread, runs
+
+    yield start
+    for thread in threads:
+        thread.join(10)
+
+
+def message(kubeconfig=None):
+    return {'prefix': 'openshift', 'kind': 'route', 'api_version': 'v1',
+            'params': {'name': 'web', 'kubeconfig': kubeconfig}}
+
+
+def test_modules_run_in_the_daemon(serve):
+    server, _, runs = serve('/config/a', idle_timeout=0.5)
+    assert os.stat(server.path).st_mode & 0o777 == 0o600
+    for _ in range(2):
+        response = daemon.request('/config/a', message('/config/a'))
+        assert response == {'rc': 0, 'stdout': json.dumps({'changed': False, 'kind': 'route'})}
+    assert runs == [('openshift', 'route', 'v1', message('/config/a')['params'])] * 2
+
+
+def test_daemons_are_isolated_by_kubeconfig(serve, monkeypatch):
+    server, _, runs = serve('/config/a', idle_timeout=0.5)
+    assert daemon.socket_path('/config/b') != server.path
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.request('/config/b', message('/config/b'))
+
+    # A request for another kubeconfig on this socket is declined
+    monkeypatch.setattr(daemon, 'socket_path', lambda kubeconfig: server.path)
+    assert 'error' in daemon.request('/config/b', message('/config/b'))
+    assert runs == []
+
+
+def test_daemon_exits_when_idle(serve):
+    server, thread, _ = serve('/config/a', idle_timeout=0.1)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not os.path.exists(server.path)
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.request('/config/a', message('/config/a'))
+
+
+def test_one_daemon_per_socket(serve):
+    server, _, _ = serve('/config/a', idle_timeout=0.5)
+    assert not daemon.HelperDaemon('/config/a', path=server.path).bind()
+
+
+def test_forward_module_is_opt_in(monkeypatch):
+    monkeypatch.delenv(daemon.DAEMON_ENV, raising=False)
+    monkeypatch.setattr(daemon, 'request', None)
+    assert daemon.forward_module('openshift', 'route', 'v1') is None
+
+
+def test_request_starts_a_daemon(runtime_dir):
+    response = daemon.request('/config/a', message('/config/b'), start=True, idle_timeout=1)
+    assert response == {'error': 'This daemon serves /config/a'}
+    assert os.path.exists(daemon.socket_path('/config/a'))
+
+
+def test_requests_are_served_concurrently(runtime_dir):
+    started = {'a': threading.Event(), 'b': threading.Event()}
+
+    def runner(prefix, kind, api_version, params):
+        started[kind].set()
+        # Only true if the other module starts while this one runs
+        concurrent = started['b' if kind == 'a' else 'a'].wait(2)
+        # Outlasts the idle timeout
+        time.sleep(0.3)
+        return 0, json.dumps(concurrent)
+
+    server = daemon.HelperDaemon('/config/a', idle_timeout=0.2, runner=runner)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    server.listening.wait(5)
+    responses = {}
+
+    def send(kind):
+        responses[kind] = daemon.request('/config/a', dict(message('/config/a'), kind=kind))
+
+    clients = [threading.Thread(target=send, args=(kind,)) for kind in started]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join(10)
+    thread.join(10)
+    assert responses == {'a': {'rc': 0, 'stdout': 'true'}, 'b': {'rc': 0, 'stdout': 'true'}}
+
+
+# A generated module up to its daemon request, with a stand-in for Ansible's param loading
+FORWARD_SCRIPT = """
+import json, sys, types
+basic = types.ModuleType('ansible.module_utils.basic')
+basic._load_params = lambda: {'name': 'web', 'kubeconfig': '/config/a'}
+for name, module in (('ansible', types.ModuleType('ansible')), ('ansible.module_utils', types.ModuleType('ansible.module_utils')),
+                     ('ansible.module_utils.basic', basic)):
+    sys.modules[name] = module
+from openshift.helper.daemon import forward_module
+try:
+    forward_module('openshift', 'route', 'v1')
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps(sorted(name for name in ('kubernetes', 'openshift.client') if name in sys.modules)))
+"""
+
+
+def test_forward_module_loads_no_client(serve):
+    _, _, runs = serve('/config/a', idle_timeout=0.5)
+    env = dict(os.environ, **{daemon.DAEMON_ENV: '1'})
+    process = subprocess.Popen([sys.executable, '-c', FORWARD_SCRIPT], env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+    assert json.loads(stdout.decode('utf-8')) == {'changed': False, 'kind': 'route'}
+    assert len(runs) == 1
+    assert json.loads(stderr.decode('utf-8').splitlines()[-1]) == []
+
+
+def test_daemon_path_leaves_out_the_module_payload(tmpdir, monkeypatch):
+    payload = tmpdir.mkdir('ansible_payload')
+    payload.mkdir('ansible')
+    modlib = tmpdir.join('ansible_modlib.zip')
+    modlib.write('')
+    installed = tmpdir.mkdir('site-packages')
+    installed.mkdir('openshift')
+    installed.mkdir('ansible')
+    monkeypatch.setattr(sys, 'path', [str(modlib), str(payload), '', str(installed), str(installed)])
+    monkeypatch.setattr(sys, 'argv', [str(payload.join('module.py'))])
+    assert daemon.package_paths() == [str(installed)]
+
+
+@pytest.fixture
+def module_utils(monkeypatch):
+    """ Stand-ins for the Ansible module_utils run_module imports. Modules print their name param twice. """
+    started = []
+    both_started = threading.Event()
+    web_done = threading.Event()
+    basic = types.ModuleType('ansible.module_utils.basic')
+    basic._ANSIBLE_ARGS = None
+
+    class OpenShiftAnsibleException(Exception):
+        pass
+
+    class Helper(object):
+        def resource_definitions_from_params(self, params):
+            return None
+
+    class OpenShiftAnsibleModule(object):
+        def __init__(self, kind, api_version):
+            self.params = json.loads(basic._ANSIBLE_ARGS.decode('utf-8'))['ANSIBLE_MODULE_ARGS']
+            self.helper = Helper()
+
+        def execute_module(self):
+            name = self.params['name']
+            sys.stdout.write(name)
+            started.append(self)
+            if len(started) == 2:
+                both_started.set()
+            both_started.wait(5)
+            # The module that started first finishes first
+            if name == 'api':
+                web_done.wait(5)
+            print(json.dumps({'name': name}))
+            if name == 'web':
+                web_done.set()
+            sys.exit(0)
+
+    common = types.ModuleType('ansible.module_utils.openshift_common')
+    common.OpenShiftAnsibleModule = OpenShiftAnsibleModule
+    common.OpenShiftAnsibleException = OpenShiftAnsibleException
+    package = types.ModuleType('ansible.module_utils')
+    package.basic = basic
+    for name, module in (('ansible', types.ModuleType('ansible')), ('ansible.module_utils', package),
+                         ('ansible.module_utils.basic', basic), ('ansible.module_utils.openshift_common', common)):
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    return both_started
+
+
+def test_modules_capture_their_own_output(module_utils):
+    results = {}
+
+    def run(name):
+        results[name] = daemon.run_module('openshift', 'route', 'v1', {'name': name})
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ('web', 'api')]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join(10)
+    assert module_utils.is_set()
+    assert results == {name: (0, name + json.dumps({'name': name}) + '\n') for name in ('web', 'api')}
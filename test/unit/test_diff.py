@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+import dictdiffer
+import pytest
+
+from openshift.client import models, serializer
+from openshift.helper import diff as diff_module
+from openshift.helper.diff import diff, equal
+
+from .test_patch import DC
+from .test_registry import ROUTE
+
+
+def variants():
+    """ Pairs of API dicts with assorted differences """
+    changed = copy.deepcopy(DC)
+    changed['spec']['replicas'] = 2
+    changed['spec']['template']['spec']['containers'][1]['image'] = 'proxy:2'
+    changed['metadata']['labels']['tier'] = 'frontend'
+    del changed['status']
+
+    lists = copy.deepcopy(DC)
+    lists['spec']['template']['spec']['containers'].append({'name': 'sidecar'})
+    lists['spec']['template']['spec']['containers'][0]['args'] = []
+    lists['spec']['triggers'] = None
+
+    dotted = {'metadata': {'annotations': {'openshift.io/display-name': 'a', 'plain': 1}}}
+    dotted_changed = {'metadata': {'annotations': {'openshift.io/display-name': 'b', 'plain': 1.0}}}
+
+    return [
+        (DC, copy.deepcopy(DC)),
+        (DC, changed),
+        (changed, DC),
+        (DC, lists),
+        (lists, DC),
+        (dotted, dotted_changed),
+        ({'a': [1, 2, 3]}, {'a': (1, 2)}),
+        ({'a': {'b': 1}}, {'a': [1]}),
+        ({}, DC),
+    ]
+
+
+@pytest.mark.parametrize('pair', variants())
+def test_diff_matches_dictdiffer(pair):
+    a, b = pair
+    assert diff(a, b) == list(dictdiffer.diff(a, b))
+    assert equal(a, b) == (not list(dictdiffer.diff(a, b)))
+
+
+def test_diff_models_as_to_dict():
+    route_a = serializer.from_api_dict(ROUTE, models.V1Route)
+    other = copy.deepcopy(ROUTE)
+    other['spec']['to']['weight'] = 50
+    other['status']['ingress'][0]['conditions'].append({'type': 'Ready', 'status': 'False'})
+    del other['metadata']['labels']
+    route_b = serializer.from_api_dict(other, models.V1Route)
+
+    assert diff(route_a, route_b) == list(dictdiffer.diff(route_a.to_dict(), route_b.to_dict()))
+    assert diff(route_a, copy.deepcopy(route_a)) == []
+    assert equal(route_a, route_a.to_dict())
+    assert not equal(route_a, route_b)
+
+
+def test_compact_paths():
+    changed = copy.deepcopy(DC)
+    changed['spec']['template']['spec']['containers'][0]['image'] = 'web:2'
+    assert diff(DC, changed, dot_notation=False) == [
+        ('change', ('spec', 'template', 'spec', 'containers', 0, 'image'), ('web:1', 'web:2'))
+    ]
+
+
+def test_objects_match(openshift_helper_class):
+    route_a = serializer.from_api_dict(ROUTE, models.V1Route)
+    route_b = copy.deepcopy(route_a)
+    assert openshift_helper_class.objects_match(route_a, route_b) == (True, [])
+    route_b.spec.host = 'other.example.com'
+    assert openshift_helper_class.objects_match(route_a, route_b) == (
+        False, [('change', 'spec.host', ('web.example.com', 'other.example.com'))]
+    )
+
+
+def test_objects_match_only_diffs_objects_that_differ(openshift_helper_class, monkeypatch):
+    calls = []
+    monkeypatch.setattr(diff_module, 'diff', lambda a, b: calls.append((a, b)) or [('change', 'x', (1, 2))])
+    route_a = serializer.from_api_dict(ROUTE, models.V1Route)
+    assert openshift_helper_class.objects_match(route_a, copy.deepcopy(route_a)) == (True, [])
+    assert openshift_helper_class.objects_match(route_a, ROUTE) == (True, [])
+    assert not calls
+    assert not openshift_helper_class.objects_match(route_a, dict(ROUTE, kind='Other'))[0]
+    assert len(calls) == 1
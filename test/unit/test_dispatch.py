@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import gc
+import weakref
+
+import pytest
+
+from openshift.helper.exceptions import OpenShiftException
+
+
+def test_lookup_method_is_memoized(openshift_helper_class):
+    helper = openshift_helper_class('v1', 'route')
+    first = helper.lookup_api_method('read', 'namespace')
+    second = helper.lookup_api_method('read', 'namespace')
+    assert first is second
+    assert first.method.__name__ == 'read_namespaced_route'
+    assert first.args[:2] == ('name', 'namespace')
+
+
+def test_lookup_method_matches_available_apis_order(openshift_helper_class):
+    helper = openshift_helper_class('v1', 'route')
+    method = helper.lookup_method('create', 'namespace')
+    for api_name in helper.available_apis():
+        api_class = helper.api_class_from_name(api_name)
+        if hasattr(api_class, 'create_namespaced_route'):
+            break
+    assert type(method.__self__) is api_class
+    assert method.__self__.api_client is helper.api_client
+
+
+def test_lookup_method_per_api_client(openshift_helper_class):
+    first = openshift_helper_class('v1', 'route')
+    second = openshift_helper_class('v1', 'route')
+    assert first.method_index() is second.method_index()
+    assert first.lookup_method('read', 'ns').__self__.api_client is first.api_client
+    assert second.lookup_method('read', 'ns').__self__.api_client is second.api_client
+
+
+def test_delete_signature_includes_body(k8s_helper_class):
+    helper = k8s_helper_class('v1', 'namespace')
+    assert 'body' in helper.lookup_api_method('delete').args
+
+
+def test_lookup_missing_method(openshift_helper_class):
+    helper = openshift_helper_class('v1', 'route')
+    with pytest.raises(OpenShiftException):
+        helper.lookup_method('read')
+
+
+def test_resolved_methods_do_not_keep_the_client_alive(openshift_helper_class):
+    helper = openshift_helper_class('v1', 'route')
+    # Not from the client pool, which keeps its clients
+    helper.api_client = helper.client_from_config(None, None)
+    helper.lookup_method('read', 'ns')
+    client = weakref.ref(helper.api_client)
+    del helper
+    gc.collect()
+    assert client() is None
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from openshift.client import ApiClient, ConfigurationObject, OapiApi, models
+from openshift.client.executor import ClientExecutor
+
+from .test_registry import ROUTE
+
+ROUTE_PATH = '/oapi/v1/namespaces/test/routes/web'
+
+
+@pytest.fixture
+def pool():
+    executor = ThreadPoolExecutor(max_workers=8)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def client():
+    config = ConfigurationObject()
+    config.host = 'http://127.0.0.1:8443'
+    return ApiClient(config=config)
+
+
+def test_concurrency_is_limited_per_client(pool):
+    executor = ClientExecutor(pool, max_concurrency=2)
+    release = threading.Event()
+    running = []
+
+    def call(n):
+        running.append(n)
+        release.wait(5)
+        return n * 2
+
+    futures = [executor.submit(call, n) for n in range(10)]
+    stats = executor.stats()
+    assert stats['running'] == 2
+    assert stats['queued'] == 8
+    assert stats['max_queued'] == 8
+
+    release.set()
+    assert [f.result(5) for f in futures] == [n * 2 for n in range(10)]
+    stats = executor.stats()
+    assert (stats['submitted'], stats['completed'], stats['running'], stats['queued']) == (10, 10, 0, 0)
+
+
+def test_busy_client_does_not_block_others(pool):
+    busy = ClientExecutor(pool, max_concurrency=2)
+    other = ClientExecutor(pool, max_concurrency=2)
+    release = threading.Event()
+    blocked = [busy.submit(release.wait, 5) for _ in range(20)]
+    try:
+        assert other.submit(lambda: 'done').result(5) == 'done'
+    finally:
+        release.set()
+    assert all(f.result(5) for f in blocked)
+
+
+def test_failures_and_cancellation(pool):
+    executor = ClientExecutor(pool, max_concurrency=1)
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError('boom')
+
+    failing = executor.submit(fail)
+    queued = executor.submit(lambda: 'never')
+    assert queued.cancel()
+    release.set()
+    with pytest.raises(ValueError):
+        failing.result(5)
+    assert executor.submit(lambda: 'after').result(5) == 'after'
+    stats = executor.stats()
+    assert (stats['failed'], stats['cancelled'], stats['completed']) == (1, 1, 1)
+
+
+def test_callback_runs_on_client_executor(client, fake_api):
+    fake_api.add('GET', ROUTE_PATH, copy.deepcopy(ROUTE))
+    results = []
+    done = threading.Event()
+
+    def callback(result):
+        results.append((result, threading.current_thread().name))
+        done.set()
+
+    future = OapiApi(client).read_namespaced_route('web', 'test', callback=callback)
+    assert future.result(5).metadata.name == 'web'
+    assert done.wait(5)
+    route, thread_name = results[0]
+    assert isinstance(route, models.V1Route)
+    assert thread_name != threading.current_thread().name
+    assert client.executor.stats()['completed'] == 1
+
+
+def test_submit_returns_future(client, fake_api):
+    fake_api.add('GET', ROUTE_PATH, copy.deepcopy(ROUTE))
+    client.executor = ClientExecutor(max_concurrency=2)
+    api = OapiApi(client)
+    futures = [client.submit(api.read_namespaced_route, 'web', 'test') for _ in range(5)]
+    assert all(f.result(5).metadata.name == 'web' for f in futures)
+    assert client.executor.stats()['max_queued'] <= 3
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import time
+
+import pytest
+
+from kubernetes.client import models as k8s_models
+
+from openshift.client import models
+from openshift.helper.informer import LABEL_INDEX, OWNER_INDEX, Store, stop_shared_informers
+
+from .test_registry import ROUTE
+
+ROUTES_PATH = '/oapi/v1/routes'
+
+
+def route(name, resource_version, namespace='test', host='web.example.com'):
+    obj = copy.deepcopy(ROUTE)
+    obj['metadata'].update(name=name, namespace=namespace, resourceVersion=resource_version)
+    obj['spec']['host'] = host
+    return obj
+
+
+def route_list(resource_version, *items):
+    return {'kind': 'RouteList', 'apiVersion': 'v1', 'metadata': {'resourceVersion': resource_version},
+            'items': list(items)}
+
+
+def wait_until(condition, timeout=2):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('condition not met')
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def informer_helper(openshift_helper_class, fake_api):
+    def make(raw=False):
+        helper = openshift_helper_class('v1', 'route', raw=raw)
+        helper.informer = None
+        return helper
+    yield make
+    stop_shared_informers()
+
+
+def test_store_replace_reports_changes():
+    store = Store()
+    store.update(route('a', '1'))
+    store.update(route('b', '1'))
+    changes = store.replace([route('b', '2'), route('c', '2')])
+    assert sorted((t, o['metadata']['name']) for t, o in changes) == [
+        ('ADDED', 'c'), ('DELETED', 'a'), ('MODIFIED', 'b')
+    ]
+    assert sorted(store.keys()) == [('test', 'b'), ('test', 'c')]
+    assert store.list('other') == []
+
+
+def test_store_indexes_follow_changes():
+    store = Store()
+    web = route('web', '1')
+    web['metadata']['ownerReferences'] = [{'kind': 'Service', 'name': 'web', 'uid': 'uid-1'}]
+    store.update(web)
+    store.update(route('api', '1', namespace='other'))
+
+    assert len(store.by_index(LABEL_INDEX, 'app=web')) == 2
+    assert store.by_index(OWNER_INDEX, 'uid-1') == [web]
+    assert store.list('other') == [route('api', '1', namespace='other')]
+
+    relabelled = route('web', '2')
+    relabelled['metadata']['labels'] = {'app': 'frontend'}
+    store.update(relabelled)
+    assert store.by_index(LABEL_INDEX, 'app=frontend') == [relabelled]
+    assert store.by_index(OWNER_INDEX, 'uid-1') == []
+    assert sorted(store.index_keys(LABEL_INDEX)) == ['app=frontend', 'app=web']
+
+    store.delete(relabelled)
+    assert store.by_index(LABEL_INDEX, 'app=frontend') == []
+    assert 'app=frontend' not in store.index_keys(LABEL_INDEX)
+
+    store.add_index('host', lambda obj: [obj['spec']['host']])
+    assert store.by_index('host', 'web.example.com') == [route('api', '1', namespace='other')]
+    store.replace([route('db', '3', host='db.example.com')])
+    assert store.by_index('host', 'web.example.com') == []
+    assert [x['metadata']['name'] for x in store.by_index('host', 'db.example.com')] == ['db']
+
+
+def test_store_indexes_models():
+    store = Store()
+    store.update(models.V1DeploymentConfig(metadata={'name': 'web'}))
+    meta = k8s_models.V1ObjectMeta(name='web-1', namespace='test', labels={'app': 'web'},
+                                   owner_references=[k8s_models.V1OwnerReference(uid='uid-1')])
+    rc = k8s_models.V1ReplicationController(metadata=meta)
+    store.update(rc)
+    assert store.by_index(OWNER_INDEX, 'uid-1') == [rc]
+    assert store.by_index(LABEL_INDEX, 'app=web') == [rc]
+    assert store.list('test') == [rc]
+
+
+def test_informer_follows_watch(informer_helper, fake_api):
+    fake_api.add('GET', ROUTES_PATH, route_list('10', route('web', '5')))
+    helper = informer_helper()
+    informer = helper.use_informer()
+    assert informer.has_synced()
+    assert isinstance(informer.get('web', 'test'), models.V1Route)
+
+    events = []
+    informer.add_listener(lambda event_type, obj: events.append((event_type, obj.metadata.name)))
+    fake_api.push_event(ROUTES_PATH, 'ADDED', route('api', '11'))
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route('web', '12', host='new.example.com'))
+    fake_api.push_event(ROUTES_PATH, 'DELETED', route('api', '13'))
+    wait_until(lambda: len(events) == 3)
+
+    assert events == [('ADDED', 'api'), ('MODIFIED', 'web'), ('DELETED', 'api')]
+    assert informer.get('api', 'test') is None
+    assert informer.get('web', 'test').spec.host == 'new.example.com'
+    assert informer.resource_version == '13'
+    assert [x.metadata.name for x in informer.by_label('app', 'web')] == ['web']
+    assert len(fake_api.requests_for('GET', ROUTES_PATH)) == 1
+
+
+def test_informer_resumes_and_relists(informer_helper, fake_api):
+    fake_api.add('GET', ROUTES_PATH, route_list('10', route('web', '5')))
+    informer = informer_helper(raw=True).use_informer()
+    wait_until(lambda: fake_api.requests_for('GET', ROUTES_PATH, watch=True))
+
+    # A closed connection resumes from the last resourceVersion without listing
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route('web', '11'))
+    fake_api.end_watch(ROUTES_PATH)
+    wait_until(lambda: len(fake_api.requests_for('GET', ROUTES_PATH, watch=True)) == 2)
+    assert fake_api.requests_for('GET', ROUTES_PATH, watch=True)[1]['query']['resourceVersion'] == '11'
+    assert len(fake_api.requests_for('GET', ROUTES_PATH)) == 1
+
+    # 410 Gone relists, and drops objects deleted in the meantime
+    fake_api.add('GET', ROUTES_PATH, route_list('20', route('api', '19')))
+    fake_api.push_event(ROUTES_PATH, 'ERROR', {'kind': 'Status', 'code': 410, 'message': 'too old resource version'})
+    wait_until(lambda: len(fake_api.requests_for('GET', ROUTES_PATH)) == 2)
+    wait_until(lambda: informer.get('web', 'test') is None)
+    assert informer.get('api', 'test') == route('api', '19')
+    wait_until(lambda: fake_api.requests_for('GET', ROUTES_PATH, watch=True)[-1]['query']['resourceVersion'] == '20')
+
+
+def test_get_object_uses_informer(informer_helper, fake_api):
+    fake_api.add('GET', ROUTES_PATH, route_list('10', route('web', '5')))
+    helper = informer_helper(raw=True)
+    helper.use_informer()
+
+    obj = helper.get_object('web', 'test')
+    assert obj == route('web', '5')
+    obj['spec']['host'] = 'changed'
+    assert helper.get_object('web', 'test')['spec']['host'] == 'web.example.com'
+    assert helper.get_object('missing', 'test') is None
+    assert not fake_api.requests_for('GET', ROUTES_PATH + '/web')
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import inspect
+
+import openshift.client
+from openshift.client import models
+from openshift.client.lazy import LazyModule
+
+
+def test_client_packages_are_lazy():
+    assert isinstance(openshift.client, LazyModule)
+    assert isinstance(openshift.client.models, LazyModule)
+    assert isinstance(openshift.client.apis, LazyModule)
+
+
+def test_lazy_attribute_resolution():
+    from openshift.client import V1Route
+    from openshift.client.models.v1_route import V1Route as RouteFromModule
+    assert V1Route is RouteFromModule
+    assert openshift.client.apis.OapiApi.__name__ == 'OapiApi'
+
+
+def test_dir_lists_unloaded_names():
+    assert 'V1DeploymentConfig' in dir(models)
+    assert 'ApiClient' in dir(openshift.client)
+    members = dict(inspect.getmembers(models, inspect.isclass))
+    assert 'V1BuildList' in members
+
+
+def test_missing_attribute():
+    try:
+        models.V1DoesNotExist
+    except AttributeError:
+        pass
+    else:
+        assert False, 'expected AttributeError'
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import pickle
+
+from openshift.client import models
+
+
+def test_type_maps_are_shared_by_the_class():
+    first, second = models.V1Build(), models.V1Build()
+    assert first.swagger_types is second.swagger_types is models.V1Build.swagger_types
+    assert first.attribute_map is models.V1Build.attribute_map
+    assert not hasattr(first, '__dict__')
+
+
+def test_slots_cover_every_attribute():
+    for name in ('V1Build', 'V1BuildList', 'V1ImageList', 'V1RouteSpec'):
+        cls = getattr(models, name)
+        assert set(cls.__slots__) == set('_' + x for x in cls.swagger_types)
+
+
+def test_equality_copy_and_pickle():
+    build = models.V1Build(kind='Build', metadata={'name': 'test'})
+    assert build == models.V1Build(kind='Build', metadata={'name': 'test'})
+    assert build != models.V1Build(kind='Build')
+    assert copy.deepcopy(build) == build
+    # Protocols 0 and 1, the Python 2 default, need __getstate__ for classes with __slots__
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(build, protocol)) == build
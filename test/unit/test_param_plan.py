@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import pytest
+
+from openshift.client import models, serializer
+from openshift.helper.ansible import MERGE_OBJECT_LIST, SET_VALUE
+
+PARAMS = {
+    'name': 'web',
+    'namespace': 'test',
+    'labels': {'app': 'web'},
+    'replicas': 2,
+    'spec_template_metadata_labels': {'app': 'web'},
+    'containers': [{'name': 'web', 'image': 'web:1', 'env': [{'name': 'A', 'value': '1'}]}],
+    'spec_strategy_type': 'Rolling',
+}
+
+
+@pytest.fixture
+def helper(openshift_helper_class):
+    return openshift_helper_class('v1', 'deployment_config')
+
+
+def test_specs_are_indexed_by_name_and_alias(helper):
+    # shared by helpers for the same kind
+    assert type(helper)('v1', 'deployment_config').param_plan is helper.param_plan
+    assert helper.find_arg_spec('containers') is helper.find_arg_spec('spec_template_spec_containers')
+    with pytest.raises(helper.get_exception_class()):
+        helper.find_arg_spec('unknown')
+
+
+def test_setters_resolve_model_classes(helper):
+    plan = helper.param_plan
+    replicas = plan.setter('replicas')
+    assert (replicas.path, replicas.attribute, replicas.action) == ((('spec', models.V1DeploymentConfigSpec),),
+                                                                    'replicas', SET_VALUE)
+    containers = plan.setter('containers')
+    assert [x[0] for x in containers.path] == ['spec', 'template', 'spec']
+    assert (containers.action, containers.item_type) == (MERGE_OBJECT_LIST, 'V1Container')
+
+
+def test_object_from_params(helper):
+    obj = helper.object_from_params(PARAMS)
+    assert serializer.to_api_dict(obj) == {
+        'apiVersion': 'v1',
+        'kind': 'deploymentConfig',
+        'metadata': {'name': 'web', 'namespace': 'test', 'labels': {'app': 'web'}},
+        'spec': {
+            'replicas': 2,
+            'strategy': {'type': 'Rolling'},
+            'template': {
+                'metadata': {'labels': {'app': 'web'}},
+                'spec': {'containers': [{'name': 'web', 'image': 'web:1', 'env': [{'name': 'A', 'value': '1'}]}]},
+            },
+        },
+    }
+
+
+def test_request_body_from_params(helper):
+    body = helper.request_body_from_params(dict(PARAMS, annotations={'some_key': 'x'}))
+    assert body == {
+        'kind': 'DeploymentConfig',
+        'metadata': {'name': 'web', 'namespace': 'test', 'labels': {'app': 'web'},
+                     'annotations': {'some_key': 'x'}},
+        'spec': {
+            'replicas': 2,
+            'strategy': {'type': 'Rolling'},
+            'template': {
+                'metadata': {'labels': {'app': 'web'}},
+                'spec': {'containers': [{'name': 'web', 'image': 'web:1', 'env': [{'name': 'A', 'value': '1'}]}]},
+            },
+        },
+    }
+
+
+def test_set_model_resets_the_plan(helper):
+    plan = helper.param_plan
+    helper.set_model('v1', 'route')
+    assert helper.param_plan is not plan
+    assert helper.find_arg_spec('spec_host')['property_path'] == ['spec', 'host']
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+from openshift.client import models
+from openshift.helper.patch import merge_object, minimal_patch
+
+from .test_registry import ROUTE
+
+DC = {
+    'apiVersion': 'v1',
+    'kind': 'DeploymentConfig',
+    'metadata': {'name': 'web', 'namespace': 'test', 'resourceVersion': '7', 'labels': {'app': 'web'}},
+    'spec': {
+        'replicas': 1,
+        'triggers': [{'type': 'ConfigChange'}],
+        'template': {'spec': {'containers': [
+            {'name': 'web', 'image': 'web:1', 'ports': [{'containerPort': 8080}], 'args': ['--verbose']},
+            {'name': 'proxy', 'image': 'proxy:1'},
+        ]}},
+    },
+    'status': {'latestVersion': 3},
+}
+
+
+def test_unchanged_object_gives_empty_patch():
+    desired = copy.deepcopy(DC)
+    desired['status'] = {'latestVersion': 4}
+    desired['metadata']['resourceVersion'] = '8'
+    desired['metadata']['creationTimestamp'] = '2017-05-01T00:00:00Z'
+    assert minimal_patch(DC, desired) == {}
+
+
+def test_only_changed_fields_are_sent():
+    assert minimal_patch(DC, {'spec': {'replicas': 3}, 'metadata': {'labels': {'tier': 'frontend'}}}) == {
+        'spec': {'replicas': 3},
+        'metadata': {'labels': {'tier': 'frontend'}},
+    }
+
+
+def test_nothing_is_removed():
+    assert minimal_patch(DC, {'metadata': {'name': 'web'}, 'spec': {'template': {}}}) == {}
+    assert minimal_patch(DC, {'spec': {'replicas': None}}) == {}
+
+
+def test_keyed_lists_merge_by_name_and_are_sent_whole():
+    desired = {'spec': {'template': {'spec': {'containers': [{'name': 'proxy', 'image': 'proxy:2'},
+                                                             {'name': 'sidecar', 'image': 'log:1'}]}}}}
+    patch = minimal_patch(DC, desired)
+    containers = patch['spec']['template']['spec']['containers']
+    assert containers == [
+        DC['spec']['template']['spec']['containers'][0],
+        {'name': 'proxy', 'image': 'proxy:2'},
+        {'name': 'sidecar', 'image': 'log:1'},
+    ]
+    assert list(patch['spec']) == ['template']
+
+
+def test_lists_keyed_by_type_and_plain_lists():
+    desired = {'spec': {'triggers': [{'type': 'ImageChange', 'imageChangeParams': {'automatic': True}},
+                                     {'type': 'ConfigChange'}]}}
+    assert minimal_patch(DC, desired)['spec']['triggers'] == [
+        {'type': 'ConfigChange'}, {'type': 'ImageChange', 'imageChangeParams': {'automatic': True}}
+    ]
+
+    merged = merge_object({'args': ['a', 'b'], 'ports': [{'containerPort': 80}]},
+                          {'args': ['b', 'c'], 'ports': [{'containerPort': 80}, {'containerPort': 443}]})
+    assert merged == {'args': ['a', 'b', 'c'], 'ports': [{'containerPort': 80}, {'containerPort': 443}]}
+
+
+def test_merge_leaves_inputs_untouched():
+    live = copy.deepcopy(DC)
+    desired = {'spec': {'template': {'spec': {'containers': [{'name': 'web', 'image': 'web:2'}]}}}}
+    merge_object(live, desired)
+    assert live == DC
+    assert desired == {'spec': {'template': {'spec': {'containers': [{'name': 'web', 'image': 'web:2'}]}}}}
+
+
+def test_patch_object_sends_minimal_patch_for_models(openshift_helper_class, fake_api):
+    path = '/oapi/v1/namespaces/test/routes/web'
+    route = copy.deepcopy(ROUTE)
+    route['metadata']['resourceVersion'] = '42'
+    fake_api.add('GET', path, route)
+    fake_api.add('PATCH', path, route)
+    helper = openshift_helper_class('v1', 'route', timeout=1)
+
+    existing = helper.get_object('web', 'test')
+    desired = copy.deepcopy(existing)
+    desired.spec.port.target_port = 8443
+    result = helper.patch_object('web', 'test', desired, existing=existing)
+    assert isinstance(result, models.V1Route)
+
+    patches = [x for x in fake_api.requests if x['method'] == 'PATCH']
+    assert [x['body'] for x in patches] == [{'spec': {'port': {'targetPort': 8443}}}]
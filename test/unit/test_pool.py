@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from openshift.client import ApiClient, ConfigurationObject
+from openshift.helper.openshift import OpenShiftObjectHelper
+from openshift.helper.pool import ClientPool, client_key
+
+
+class CountingHelper(OpenShiftObjectHelper):
+    created = []
+    client_pool = ClientPool(maxsize=2)
+
+    @staticmethod
+    def client_from_config(config_file, context):
+        config = ConfigurationObject()
+        config.host = 'http://127.0.0.1:8443'
+        client = ApiClient(config=config)
+        CountingHelper.created.append((config_file, context))
+        return client
+
+
+@pytest.fixture
+def helper_class(tmpdir):
+    kubeconfig = tmpdir.join('config')
+    kubeconfig.write('')
+    CountingHelper.created = []
+    CountingHelper.client_pool.clear()
+    CountingHelper.kubeconfig = str(kubeconfig)
+    return CountingHelper
+
+
+def test_client_is_created_on_first_use(helper_class):
+    helper = helper_class('v1', 'route', kubeconfig=helper_class.kubeconfig)
+    helper.set_model('v1', 'deployment_config')
+    assert helper.properties
+    assert helper_class.created == []
+    assert helper.api_client.host == 'http://127.0.0.1:8443'
+    assert helper_class.created == [(helper_class.kubeconfig, None)]
+
+
+def test_helpers_with_the_same_configuration_share_a_client(helper_class):
+    auth = {'kubeconfig': helper_class.kubeconfig, 'api_key': 'Bearer x'}
+    route = helper_class('v1', 'route', **auth)
+    service = helper_class('v1', 'service', **auth)
+    assert route.api_client is service.api_client
+    assert route.api_client.config.api_key == {'authorization': 'Bearer x'}
+
+    other = helper_class('v1', 'route', host='https://other:8443', **auth)
+    assert other.api_client is not route.api_client
+    assert other.api_client.host == 'https://other:8443'
+    assert len(helper_class.created) == 2
+
+
+def test_changed_kubeconfig_gives_a_new_client(helper_class):
+    auth = {'kubeconfig': helper_class.kubeconfig}
+    first = helper_class('v1', 'route', **auth).api_client
+    key = client_key(helper_class.client_from_config, auth)
+    stat = os.stat(helper_class.kubeconfig)
+    os.utime(helper_class.kubeconfig, (stat.st_atime, stat.st_mtime + 10))
+    assert client_key(helper_class.client_from_config, auth) != key
+    assert helper_class('v1', 'route', **auth).api_client is not first
+
+
+def test_least_recently_used_clients_are_evicted(helper_class):
+    pool = helper_class.client_pool
+    clients = dict((host, helper_class('v1', 'route', host=host).api_client) for host in ('a', 'b'))
+    assert helper_class('v1', 'route', host='a').api_client is clients['a']
+    helper_class('v1', 'route', host='c').api_client
+    assert len(pool) == 2
+    assert helper_class('v1', 'route', host='a').api_client is clients['a']
+    assert helper_class('v1', 'route', host='b').api_client is not clients['b']
+    assert (pool.hits, pool.misses) == (2, 4)
+
+
+def test_pool_can_be_disabled(helper_class, monkeypatch):
+    monkeypatch.setattr(helper_class, 'client_pool', None)
+    assert helper_class('v1', 'route').api_client is not helper_class('v1', 'route').api_client
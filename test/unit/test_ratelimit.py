@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+from kubernetes.client.rest import ApiException
+from openshift.client import ApiClient, ConfigurationObject, OapiApi
+from openshift.client.ratelimit import READ, WATCH, WRITE, RateLimiter, TokenBucket, retry_after, verb_class
+
+from .conftest import FakeHTTPResponse
+from .test_registry import ROUTE
+
+
+class ThrottledResponse(FakeHTTPResponse):
+    def __init__(self, status, headers):
+        super(ThrottledResponse, self).__init__(status, {'kind': 'Status', 'code': status})
+        self.headers = headers
+
+    def getheaders(self):
+        return self.headers
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def client():
+    config = ConfigurationObject()
+    config.host = 'http://127.0.0.1:8443'
+    return ApiClient(config=config)
+
+
+def test_verb_classes():
+    assert verb_class('GET') == READ
+    assert verb_class('GET', [('watch', 'True')]) == WATCH
+    assert verb_class('GET', [('watch', False)]) == READ
+    assert verb_class('PATCH', [('pretty', 'true')]) == WRITE
+
+
+def test_retry_after():
+    assert retry_after({'Retry-After': '3'}) == 3
+    assert retry_after({'retry-after': 'Thu, 01 Jan 1970 00:01:00 GMT'}, now=50) == 10
+    assert retry_after({'Content-Type': 'application/json'}) is None
+
+
+def test_token_bucket_allows_bursts_then_paces():
+    clock = Clock()
+    bucket = TokenBucket(qps=10, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    # Waiting callers queue up behind each other
+    assert [round(bucket.reserve(), 3) for _ in range(2)] == [0.1, 0.2]
+    clock.now = 1.0
+    assert bucket.reserve() == 0
+
+
+def test_budgets_are_separate_and_measured():
+    clock = Clock()
+    limiter = RateLimiter(read=(10, 1), write=(1, 1), watch=None, sleep=clock.sleep, clock=clock)
+    for _ in range(3):
+        limiter.acquire(READ)
+    limiter.acquire(WRITE)
+    limiter.acquire(WATCH)
+    stats = limiter.stats()
+    assert stats[READ]['requests'] == 3 and stats[READ]['waited'] == 2
+    assert round(stats[READ]['max_wait'], 3) == 0.1
+    assert round(clock.now, 3) == 0.2
+    assert stats[WRITE]['waited'] == 0 and stats[WATCH]['requests'] == 1
+
+
+def test_throttled_requests_are_retried(client, monkeypatch):
+    clock = Clock()
+    client.rate_limiter = RateLimiter(sleep=clock.sleep, clock=clock, max_retries=2)
+    responses = [ThrottledResponse(429, {'Retry-After': '2'}), ThrottledResponse(503, {}),
+                 FakeHTTPResponse(200, ROUTE)]
+
+    def request(self, *args, **kwargs):
+        response = responses.pop(0)
+        if response.status >= 300:
+            raise ApiException(http_resp=response)
+        return response
+
+    monkeypatch.setattr(K8sApiClient, 'request', request)
+    route = OapiApi(client).read_namespaced_route('web', 'test')
+    assert route.spec.host == 'web.example.com'
+    stats = client.rate_limiter.stats()[READ]
+    assert (stats['requests'], stats['retries'], stats['retry_wait_seconds']) == (3, 2, 4)
+
+    responses[:] = [ThrottledResponse(429, {})] * 3
+    with pytest.raises(ApiException):
+        OapiApi(client).read_namespaced_route('web', 'test')
+    assert client.rate_limiter.stats()[READ]['retries'] == 4
+
+
+def test_budget_is_shared_by_threads(client, monkeypatch):
+    client.rate_limiter = RateLimiter(read=(50, 1))
+    client.coalesce_reads = False
+    monkeypatch.setattr(K8sApiClient, 'request', lambda self, *args, **kwargs: FakeHTTPResponse(200, ROUTE))
+    threads = [threading.Thread(target=OapiApi(client).read_namespaced_route, args=('web', 'test'))
+               for _ in range(6)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.time() - start >= 0.09
+    assert client.rate_limiter.stats()[READ]['waited'] == 5
+
+
+def test_helpers_set_their_rate_limiter(openshift_helper_class, monkeypatch):
+    limiter = RateLimiter()
+    monkeypatch.setattr(openshift_helper_class, 'rate_limiter', limiter)
+    assert openshift_helper_class('v1', 'route').api_client.rate_limiter is limiter
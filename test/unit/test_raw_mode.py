@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+import pytest
+
+from openshift.client import models
+from openshift.helper.exceptions import OpenShiftException
+
+from .test_registry import ROUTE
+
+ROUTE_PATH = '/oapi/v1/namespaces/test/routes/web'
+
+
+@pytest.fixture
+def route(fake_api):
+    route = copy.deepcopy(ROUTE)
+    route['metadata']['resourceVersion'] = '42'
+    fake_api.add('GET', ROUTE_PATH, route)
+    return route
+
+
+def test_get_object_raw(openshift_helper_class, fake_api, route):
+    helper = openshift_helper_class('v1', 'route', raw=True)
+    obj = helper.get_object('web', 'test')
+    assert obj == route
+    assert fake_api.requests[-1]['_preload_content'] is False
+
+
+def test_get_object_models(openshift_helper_class, fake_api, route):
+    helper = openshift_helper_class('v1', 'route')
+    obj = helper.get_object('web', 'test')
+    assert isinstance(obj, models.V1Route)
+    assert obj.metadata.resource_version == '42'
+
+
+def test_get_object_raw_errors(openshift_helper_class, fake_api):
+    helper = openshift_helper_class('v1', 'route', raw=True)
+    assert helper.get_object('web', 'test') is None
+
+    fake_api.add('GET', ROUTE_PATH, {'kind': 'Status', 'message': 'forbidden'}, status=500)
+    with pytest.raises(OpenShiftException) as exc:
+        helper.get_object('web', 'test')
+    assert exc.value.value == {'status': 500, 'message': 'forbidden'}
+
+
+def test_patch_object_raw(openshift_helper_class, fake_api, route):
+    helper = openshift_helper_class('v1', 'route', raw=True, timeout=1)
+    fake_api.add('PATCH', ROUTE_PATH, route)
+
+    desired = copy.deepcopy(route)
+    desired['spec']['host'] = 'other.example.com'
+    result = helper.patch_object('web', 'test', desired, existing=route)
+    assert result == route
+
+    patch = [x for x in fake_api.requests if x['method'] == 'PATCH'][0]
+    assert patch['body'] == {'spec': {'host': 'other.example.com'}}
+    # the caller's dict is left untouched
+    assert desired['metadata']['resourceVersion'] == '42'
+
+
+def test_patch_object_without_existing_reads_nothing(openshift_helper_class, fake_api, route):
+    helper = openshift_helper_class('v1', 'route', raw=True, timeout=1)
+    fake_api.add('PATCH', ROUTE_PATH, route)
+
+    desired = copy.deepcopy(route)
+    desired['spec']['host'] = 'other.example.com'
+    assert helper.patch_object('web', 'test', desired) == route
+
+    assert [x['method'] for x in fake_api.requests] == ['PATCH']
+    body = fake_api.requests[0]['body']
+    assert body['spec'] == desired['spec']
+    assert 'resourceVersion' not in body['metadata'] and 'status' not in body
+
+
+def test_patch_object_skips_empty_patch(openshift_helper_class, fake_api, route):
+    helper = openshift_helper_class('v1', 'route', raw=True, timeout=1)
+    unchanged = copy.deepcopy(route)
+    unchanged['metadata']['creationTimestamp'] = '2017-05-01T00:00:00Z'
+    unchanged['status'] = {}
+
+    assert helper.patch_object('web', 'test', unchanged, existing=route) == route
+    assert not fake_api.requests
+
+
+def test_objects_match_dicts(openshift_helper_class):
+    objects_match = openshift_helper_class.objects_match
+    model = models.V1Route(kind='Route', spec=models.V1RouteSpec(host='web.example.com'))
+    assert objects_match(model, {'kind': 'Route', 'spec': {'host': 'web.example.com'}}) == (True, [])
+
+    match, diffs = objects_match({'kind': 'Route', 'spec': {'host': 'a'}}, {'kind': 'Route', 'spec': {'host': 'b'}})
+    assert not match
+    assert diffs == [('change', 'spec.host', ('a', 'b'))]
+
+
+def test_object_from_params_accepts_dicts(openshift_helper_class, route):
+    helper = openshift_helper_class('v1', 'route')
+    obj = helper.object_from_params({'spec_host': 'other.example.com'}, obj=route)
+    assert isinstance(obj, models.V1Route)
+    assert obj.spec.host == 'other.example.com'
+    assert obj.metadata.resource_version == '42'
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import json
+
+import pytest
+
+from kubernetes.client import models as k8s_models
+
+from openshift.client import ApiClient, models
+from openshift.client.registry import type_registry
+from openshift.helper.kubernetes import KubernetesObjectHelper
+from openshift.helper.openshift import OpenShiftObjectHelper
+
+ROUTE = {
+    'apiVersion': 'v1',
+    'kind': 'Route',
+    'metadata': {'name': 'web', 'namespace': 'test', 'labels': {'app': 'web'},
+                 'creationTimestamp': '2017-04-14T12:00:00Z'},
+    'spec': {'host': 'web.example.com', 'to': {'kind': 'Service', 'name': 'web', 'weight': 100},
+             'port': {'targetPort': 8080}},
+    'status': {'ingress': [{'host': 'web.example.com', 'routerName': 'router',
+                            'conditions': [{'type': 'Admitted', 'status': 'True'}]}]}
+}
+
+
+class FakeResponse(object):
+    def __init__(self, data):
+        self.data = json.dumps(data)
+
+
+def test_registry_lookups():
+    assert type_registry.model('V1Route') is models.V1Route
+    assert type_registry.model('V1Pod') is k8s_models.V1Pod
+    assert type_registry.kubernetes_model('V1Route') is None
+    assert type_registry.model('V1DoesNotExist') is None
+    assert type_registry.api('OapiApi').__name__ == 'OapiApi'
+    assert type_registry.api('CoreV1Api').__name__ == 'CoreV1Api'
+
+
+def test_helpers_raise_attribute_error_for_unknown_names():
+    with pytest.raises(AttributeError):
+        OpenShiftObjectHelper.model_class_from_name('V1DoesNotExist')
+    with pytest.raises(AttributeError):
+        KubernetesObjectHelper.model_class_from_name('V1Route')
+    assert OpenShiftObjectHelper.api_class_from_name('CoreV1Api').__name__ == 'CoreV1Api'
+
+
+def test_deserialize_mixed_models():
+    route = ApiClient().deserialize(FakeResponse(ROUTE), 'V1Route')
+    assert isinstance(route, models.V1Route)
+    assert isinstance(route.metadata, k8s_models.V1ObjectMeta)
+    assert route.metadata.labels == {'app': 'web'}
+    assert route.metadata.creation_timestamp == '2017-04-14T12:00:00Z'
+    assert isinstance(route.spec.to, models.V1RouteTargetReference)
+    assert route.spec.to.weight == 100
+    assert route.status.ingress[0].conditions[0].type == 'Admitted'
+
+
+def test_deserialize_unknown_model():
+    with pytest.raises(AttributeError):
+        ApiClient().deserialize(FakeResponse({}), 'V1DoesNotExist')
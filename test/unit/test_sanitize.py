@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+
+import pytest
+
+from openshift.client import models, serializer
+from openshift.helper.sanitize import Sanitizer, sanitize
+
+SERVER_METADATA = {
+    'creationTimestamp': '2017-05-01T00:00:00Z',
+    'resourceVersion': '7',
+    'uid': 'a1',
+    'selfLink': '/oapi/v1/namespaces/test/deploymentconfigs/web',
+    'generation': 3,
+}
+
+DC = {
+    'apiVersion': 'v1',
+    'kind': 'DeploymentConfig',
+    'metadata': dict(SERVER_METADATA, name='web', namespace='test', labels={'app': 'web'},
+                     ownerReferences=[{'apiVersion': 'v1', 'kind': 'Project', 'name': 'test', 'uid': 'b2'}]),
+    'spec': {
+        'replicas': 1,
+        'triggers': [{'type': 'ConfigChange'}],
+        'template': {
+            'metadata': {'labels': {'app': 'web'}, 'creationTimestamp': '2017-05-01T00:00:00Z'},
+            'spec': {'containers': [{'name': 'web', 'image': 'web:1', 'ports': [{'containerPort': 8080}]}]},
+        },
+    },
+    'status': {'latestVersion': 3, 'conditions': [{'type': 'Available', 'status': 'True'}]},
+}
+
+EXPECTED = {
+    'apiVersion': 'v1',
+    'kind': 'DeploymentConfig',
+    'metadata': {'name': 'web', 'namespace': 'test', 'labels': {'app': 'web'},
+                 'ownerReferences': [{'apiVersion': 'v1', 'kind': 'Project', 'name': 'test', 'uid': 'b2'}]},
+    'spec': {
+        'replicas': 1,
+        'triggers': [{'type': 'ConfigChange'}],
+        'template': {
+            'metadata': {'labels': {'app': 'web'}},
+            'spec': {'containers': [{'name': 'web', 'image': 'web:1', 'ports': [{'containerPort': 8080}]}]},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize('model_class', [None, models.V1DeploymentConfig])
+def test_dicts_are_copied(model_class):
+    data = copy.deepcopy(DC)
+    assert sanitize(data, model_class) == EXPECTED
+    assert data == DC
+
+
+def test_models_are_stripped_in_place():
+    obj = serializer.from_api_dict(DC, models.V1DeploymentConfig)
+    assert sanitize(obj) is obj
+    assert serializer.to_api_dict(obj) == EXPECTED
+
+
+def test_only_paths_to_server_fields_are_visited():
+    plan = Sanitizer()._root(models.V1DeploymentConfig)
+    assert [x[1] for x in plan.strip] == ['status']
+    assert sorted(x[1] for x in plan.children) == ['metadata', 'spec']
+    spec = dict((x[1], x[3]) for x in plan.children)['spec']
+    assert [x[1] for x in spec.children] == ['template']
+
+
+def test_fields_are_configurable():
+    sanitizer = Sanitizer(fields=(), metadata_fields=['resourceVersion'])
+    result = sanitizer(DC, models.V1DeploymentConfig)
+    assert result['status'] == DC['status']
+    assert result['metadata']['uid'] == 'a1'
+    assert 'resourceVersion' not in result['metadata']
+    assert result == sanitizer(DC)
+
+
+def test_list_items_are_stripped():
+    data = {'kind': 'RouteList', 'metadata': {'resourceVersion': '9'},
+            'items': [{'metadata': dict(SERVER_METADATA, name='web'), 'spec': {'host': 'example.com'}}]}
+    obj = sanitize(serializer.from_api_dict(data, models.V1RouteList))
+    expected = {'kind': 'RouteList', 'metadata': {}, 'items': [{'metadata': {'name': 'web'}, 'spec': {'host': 'example.com'}}]}
+    assert serializer.to_api_dict(obj) == expected
+    assert sanitize(data, models.V1RouteList) == expected
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import datetime
+
+from kubernetes.client import V1ObjectMeta
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+
+from openshift.client import models, serializer
+
+from .test_registry import ROUTE
+
+
+def test_from_api_dict_round_trip():
+    route = serializer.from_api_dict(ROUTE, models.V1Route)
+    assert route.spec.to.name == 'web'
+    assert serializer.to_api_dict(route) == ROUTE
+
+
+def test_to_dict_matches_generated():
+    route = serializer.from_api_dict(ROUTE, models.V1Route)
+    assert serializer.to_dict(route) == route.to_dict()
+
+
+def test_to_api_dict_matches_sanitize():
+    meta = V1ObjectMeta(name='web', labels={'app': 'web'}, deletion_timestamp=datetime.datetime(2017, 4, 14))
+    obj = {'items': [meta, (1, 'two')], 'when': datetime.date(2017, 4, 14), 'empty': None}
+    assert serializer.to_api_dict(obj) == K8sApiClient().sanitize_for_serialization(obj)
+
+
+def test_to_dict_keeps_nested_containers():
+    status = models.V1RouteStatus(ingress=[models.V1RouteIngress(host='a'), [models.V1RouteIngress(host='b')]])
+    result = serializer.to_dict(status)
+    assert result == status.to_dict()
+    assert isinstance(result['ingress'][1][0], models.V1RouteIngress)
+
+
+def test_from_api_dict_keeps_nulls():
+    data = {
+        'metadata': {'name': None, 'creationTimestamp': None},
+        'spec': {
+            'replicas': 1,
+            'template': {'metadata': {'creationTimestamp': None, 'labels': None}, 'spec': None},
+        },
+        'status': None,
+    }
+    config = serializer.from_api_dict(data, models.V1DeploymentConfig)
+    assert config.metadata.name is None
+    assert config.metadata.creation_timestamp is None
+    assert config.spec.template.metadata.creation_timestamp is None
+    assert config.spec.template.metadata.labels is None
+    assert config.spec.template.spec is None
+    assert config.status is None
+    assert serializer.to_api_dict(config) == {'metadata': {}, 'spec': {'replicas': 1, 'template': {'metadata': {}}}}
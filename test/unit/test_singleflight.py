@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+from openshift.client import ApiClient, ConfigurationObject, OapiApi
+from openshift.client.singleflight import SingleFlight
+
+from .conftest import FakeHTTPResponse
+from .test_registry import ROUTE
+
+
+@pytest.fixture
+def client():
+    config = ConfigurationObject()
+    config.host = 'http://127.0.0.1:8443'
+    return ApiClient(config=config)
+
+
+@pytest.fixture
+def slow_api(monkeypatch):
+    """ Holds every request until released, and records the URLs requested """
+    api = {'requests': [], 'entered': threading.Event(), 'release': threading.Event()}
+
+    def request(self, method, url, *args, **kwargs):
+        api['requests'].append((method, url))
+        api['entered'].set()
+        api['release'].wait(5)
+        return FakeHTTPResponse(200, ROUTE)
+
+    monkeypatch.setattr(K8sApiClient, 'request', request)
+    return api
+
+
+def run_concurrently(calls, slow_api):
+    results = [None] * len(calls)
+
+    def run(index):
+        results[index] = calls[index]()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(calls))]
+    threads[0].start()
+    slow_api['entered'].wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Let the others join the call in flight
+    time.sleep(0.1)
+    slow_api['release'].set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_identical_reads_share_one_request(client, slow_api):
+    api = OapiApi(client)
+    routes = run_concurrently([lambda: api.read_namespaced_route('web', 'test')] * 4, slow_api)
+
+    assert len(slow_api['requests']) == 1
+    assert all(x.spec.host == 'web.example.com' for x in routes)
+    # Each caller gets its own object
+    assert len(set(id(x) for x in routes)) == 4
+    routes[0].spec.host = 'changed'
+    assert routes[1].spec.host == 'web.example.com'
+    assert client.singleflight.stats() == {'calls': 4, 'coalesced': 3}
+
+
+def test_different_reads_are_not_coalesced(client, slow_api):
+    api = OapiApi(client)
+    run_concurrently([lambda: api.read_namespaced_route('web', 'test'),
+                      lambda: api.read_namespaced_route('web', 'other'),
+                      lambda: api.read_namespaced_route('web', 'test', pretty='true'),
+                      lambda: api.read_namespaced_route('web', 'test', _request_timeout=1)], slow_api)
+    assert len(slow_api['requests']) == 4
+
+
+def test_coalescing_can_be_turned_off(client, slow_api):
+    client.coalesce_reads = False
+    api = OapiApi(client)
+    run_concurrently([lambda: api.read_namespaced_route('web', 'test')] * 3, slow_api)
+    assert len(slow_api['requests']) == 3
+
+
+def test_fresh_reads_do_not_join_a_call_in_flight(client, slow_api):
+    api = OapiApi(client)
+
+    def fresh_read():
+        with client.fresh_reads():
+            return api.read_namespaced_route('web', 'test')
+
+    run_concurrently([lambda: api.read_namespaced_route('web', 'test'), fresh_read], slow_api)
+    assert len(slow_api['requests']) == 2
+    assert client.singleflight.stats() == {'calls': 1, 'coalesced': 0}
+
+
+def test_errors_are_shared():
+    flight = SingleFlight()
+    entered, release = threading.Event(), threading.Event()
+    errors = []
+
+    def fail():
+        entered.set()
+        release.wait(5)
+        raise ValueError('failed')
+
+    def call():
+        try:
+            flight.do('key', fail)
+        except ValueError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    entered.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert len(errors) == 2 and errors[0] is errors[1]
+    # Nothing is cached once the call is done
+    assert flight.do('key', lambda: 1) == 1
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import threading
+
+import pytest
+
+from openshift.client import models
+from openshift.helper.stream import ResilientWatch
+
+from .test_registry import ROUTE
+
+ROUTES_PATH = '/oapi/v1/namespaces/test/routes'
+
+
+def route(resource_version):
+    obj = copy.deepcopy(ROUTE)
+    obj['metadata']['resourceVersion'] = resource_version
+    return obj
+
+
+@pytest.fixture
+def list_routes(openshift_helper_class, fake_api):
+    helper = openshift_helper_class('v1', 'route')
+    return helper.api_client, helper.lookup_method('list', 'test')
+
+
+def collect(watch, count):
+    """ Read count events from watch in a thread, then stop it """
+    events = []
+
+    def read():
+        for event in watch:
+            events.append(event)
+            if len(events) == count:
+                watch.stop()
+    thread = threading.Thread(target=read)
+    thread.start()
+    return thread, events
+
+
+def test_resumes_and_counts(list_routes, fake_api):
+    api_client, list_method = list_routes
+    relists = []
+
+    def relist():
+        relists.append(True)
+        return '50'
+
+    watch = ResilientWatch(api_client, list_method, ('test',), resource_version='10', relist=relist,
+                           min_backoff=0.01, max_backoff=0.02)
+    thread, events = collect(watch, 3)
+
+    fake_api.push_event(ROUTES_PATH, 'ADDED', route('11'))
+    fake_api.end_watch(ROUTES_PATH)
+    fake_api.push_event(ROUTES_PATH, 'BOOKMARK', {'kind': 'Route', 'metadata': {'resourceVersion': '12'}})
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route('13'))
+    fake_api.push_event(ROUTES_PATH, 'ERROR', {'kind': 'Status', 'code': 500, 'message': 'internal error'})
+    fake_api.push_event(ROUTES_PATH, 'ERROR', {'kind': 'Status', 'code': 410, 'message': 'too old resource version'})
+    fake_api.push_event(ROUTES_PATH, 'DELETED', route('51'))
+    thread.join(5)
+
+    assert [x['type'] for x in events] == ['ADDED', 'MODIFIED', 'DELETED']
+    assert isinstance(events[0]['object'], models.V1Route)
+    assert len(relists) == 1
+    assert watch.resource_version == '51'
+    assert watch.counters == {'reconnects': 3, 'relists': 1, 'failures': 1, 'bookmarks': 1, 'events': 3}
+
+    versions = [x['query'].get('resourceVersion') for x in fake_api.requests_for('GET', ROUTES_PATH, watch=True)]
+    assert versions == ['10', '11', '13', '50']
+
+
+def test_failures_back_off_without_relisting(list_routes, fake_api):
+    api_client, list_method = list_routes
+    fake_api.add('WATCH', ROUTES_PATH, {'kind': 'Status', 'message': 'unavailable'}, status=503)
+    watch = ResilientWatch(api_client, list_method, ('test',), raw=True, resource_version='10',
+                           min_backoff=0.01, max_backoff=0.02)
+    thread, events = collect(watch, 1)
+    fake_api.push_event(ROUTES_PATH, 'ADDED', route('11'))
+    thread.join(5)
+
+    assert events[0]['object'] == route('11')
+    assert watch.counters['failures'] == 1
+    assert watch.counters['relists'] == 0
+    assert [x['query']['resourceVersion'] for x in fake_api.requests_for('GET', ROUTES_PATH, watch=True)] == \
+        ['10', '10']
+
+
+def test_backoff_is_bounded_and_jittered(list_routes):
+    api_client, list_method = list_routes
+    watch = ResilientWatch(api_client, list_method, min_backoff=1, max_backoff=8)
+    for attempt, ceiling in ((1, 1), (2, 2), (4, 8), (10, 8)):
+        delays = [watch.backoff(attempt) for _ in range(50)]
+        assert all(ceiling / 2.0 <= x <= ceiling for x in delays)
+        assert len(set(delays)) > 1
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import copy
+import threading
+import time
+
+import pytest
+
+from openshift.helper.waiter import Waiter, WatchMultiplexer, object_deleted, object_ready
+
+from .test_registry import ROUTE
+
+ROUTES_PATH = '/oapi/v1/namespaces/test/routes'
+
+
+def pending_route(resource_version):
+    obj = copy.deepcopy(ROUTE)
+    obj['metadata']['resourceVersion'] = resource_version
+    obj['status'] = {'ingress': None}
+    return obj
+
+
+def admitted_route(resource_version):
+    obj = copy.deepcopy(ROUTE)
+    obj['metadata']['resourceVersion'] = resource_version
+    return obj
+
+
+@pytest.fixture
+def route_helper(openshift_helper_class, fake_api):
+    return openshift_helper_class('v1', 'route', raw=True, timeout=5)
+
+
+def test_object_ready():
+    assert object_ready(admitted_route('1'))
+    assert not object_ready(pending_route('1'))
+    assert not object_ready({'kind': 'Namespace', 'status': {'phase': 'Terminating'}})
+    assert object_ready({'kind': 'Namespace', 'status': {'phase': 'Active'}})
+    assert object_ready({'kind': 'Service', 'status': {}})
+    assert not object_ready({'kind': 'Service'})
+
+
+def test_create_waits_for_watch_event(route_helper, fake_api):
+    fake_api.add('POST', ROUTES_PATH, pending_route('10'))
+    other = admitted_route('11')
+    other['metadata']['name'] = 'other'
+    fake_api.push_event(ROUTES_PATH, 'ADDED', other)
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', pending_route('12'))
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', admitted_route('13'))
+
+    start = time.time()
+    result = route_helper.create_object('test', body=copy.deepcopy(ROUTE))
+    assert time.time() - start < 1
+    assert result == admitted_route('13')
+
+    watches = fake_api.requests_for('GET', ROUTES_PATH, watch=True)
+    assert len(watches) == 1
+    assert watches[0]['query']['resourceVersion'] == '10'
+    assert not fake_api.requests_for('GET', ROUTES_PATH + '/web')
+
+
+def test_ready_response_needs_no_watch(route_helper, k8s_helper_class, fake_api):
+    fake_api.add('POST', ROUTES_PATH, admitted_route('10'))
+    assert route_helper.create_object('test', body=copy.deepcopy(ROUTE)) == admitted_route('10')
+
+    config_map = {'kind': 'ConfigMap', 'metadata': {'name': 'settings', 'namespace': 'test', 'resourceVersion': '3'}}
+    fake_api.add('POST', '/api/v1/namespaces/test/configmaps', config_map)
+    helper = k8s_helper_class('v1', 'config_map', raw=True)
+    assert helper.create_object('test', body=copy.deepcopy(config_map)) == config_map
+
+    namespace = {'kind': 'Namespace', 'metadata': {'name': 'test', 'resourceVersion': '4'},
+                 'status': {'phase': 'Active'}}
+    fake_api.add('POST', '/api/v1/namespaces', namespace)
+    helper = k8s_helper_class('v1', 'namespace', raw=True)
+    start = time.time()
+    assert helper.create_object(body={'metadata': {'name': 'test'}}) == namespace
+    assert time.time() - start < 0.5
+
+    assert not [x for x in fake_api.requests if x['watch']]
+
+
+def test_delete_waits_for_deleted_event(route_helper, fake_api):
+    fake_api.add('DELETE', ROUTES_PATH + '/web', {'kind': 'Status', 'status': 'Success'})
+    fake_api.add('GET', ROUTES_PATH + '/web', admitted_route('20'))
+    fake_api.push_event(ROUTES_PATH, 'DELETED', admitted_route('21'))
+
+    assert route_helper.delete_object('web', 'test') is None
+    assert fake_api.requests_for('GET', ROUTES_PATH, watch=True)[0]['query']['resourceVersion'] == '20'
+
+
+def test_resumes_after_failures_and_expired_version(route_helper, fake_api):
+    fake_api.add('WATCH', ROUTES_PATH, {'kind': 'Status', 'message': 'unavailable'}, status=503)
+    fake_api.push_event(ROUTES_PATH, 'ERROR', {'kind': 'Status', 'code': 410, 'message': 'too old resource version'})
+    fake_api.add('GET', ROUTES_PATH, {'kind': 'RouteList', 'metadata': {'resourceVersion': '30'},
+                                      'items': [pending_route('29')]})
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', admitted_route('31'))
+
+    waiter = Waiter(route_helper, 'web', 'test', timeout=5)
+    assert waiter.wait(pending_route('10')) == admitted_route('31')
+
+    versions = [x['query']['resourceVersion'] for x in fake_api.requests_for('GET', ROUTES_PATH, watch=True)]
+    assert versions == ['10', '10', '30']
+
+
+def test_timeout_returns_last_object(route_helper, fake_api):
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', pending_route('11'))
+    waiter = Waiter(route_helper, 'web', 'test', timeout=0.3)
+    start = time.time()
+    assert waiter.wait(pending_route('10')) == pending_route('11')
+    assert time.time() - start < 1.5
+
+
+def route_named(name, resource_version, ready):
+    obj = admitted_route(resource_version) if ready else pending_route(resource_version)
+    obj['metadata']['name'] = name
+    return obj
+
+
+def test_concurrent_waiters_share_one_watch(route_helper, fake_api):
+    names = ['web-{}'.format(i) for i in range(20)]
+    results = {}
+
+    def wait(name):
+        results[name] = Waiter(route_helper, name, 'test', timeout=5).wait(route_named(name, '10', False))
+
+    threads = [threading.Thread(target=wait, args=(name,)) for name in names]
+    for thread in threads:
+        thread.start()
+    for i, name in enumerate(reversed(names)):
+        fake_api.push_event(ROUTES_PATH, 'MODIFIED', route_named(name, str(11 + i), True))
+    for thread in threads:
+        thread.join(5)
+
+    assert sorted(results) == sorted(names)
+    assert all(object_ready(x) for x in results.values())
+    assert len(fake_api.requests_for('GET', ROUTES_PATH, watch=True)) == 1
+    assert not WatchMultiplexer._multiplexers
+
+
+def test_waiters_have_their_own_predicate_and_timeout(route_helper, fake_api):
+    results = {}
+
+    def wait(key, name, predicate, timeout):
+        results[key] = Waiter(route_helper, name, 'test', predicate, timeout).wait(route_named(name, '10', False))
+
+    threads = [
+        threading.Thread(target=wait, args=('ready', 'web', object_ready, 5)),
+        threading.Thread(target=wait, args=('deleted', 'web', object_deleted, 5)),
+        threading.Thread(target=wait, args=('timeout', 'api', object_ready, 0.2)),
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.4)
+    assert results == {'timeout': route_named('api', '10', False)}
+
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route_named('web', '11', True))
+    threads[0].join(5)
+    assert results['ready'] == route_named('web', '11', True)
+    assert 'deleted' not in results
+
+    fake_api.push_event(ROUTES_PATH, 'DELETED', route_named('web', '12', True))
+    threads[1].join(5)
+    assert results['deleted'] is None
+    assert not WatchMultiplexer._multiplexers
+
+
+def test_late_waiter_catches_up(route_helper, fake_api):
+    first = threading.Thread(target=Waiter(route_helper, 'web', 'test', timeout=5).wait,
+                             args=(route_named('web', '10', False),))
+    first.start()
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route_named('api', '12', True))
+    time.sleep(0.2)
+
+    # The event for api arrived before this waiter joined, with a later resourceVersion
+    start = time.time()
+    assert Waiter(route_helper, 'api', 'test', timeout=5).wait(route_named('api', '11', False)) == \
+        route_named('api', '12', True)
+    assert time.time() - start < 0.5
+
+    fake_api.push_event(ROUTES_PATH, 'MODIFIED', route_named('web', '13', True))
+    first.join(5)
+    assert len(fake_api.requests_for('GET', ROUTES_PATH, watch=True)) == 1